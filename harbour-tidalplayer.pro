@@ -27,6 +27,7 @@ OTHER_FILES += harbour-tidalplayer.desktop \
         qml/pages/Personal.qml\
         qml/pages/Settings.qml\
         qml/tidal.py \
+        qml/backend/*.py \
         qml/modules/Opal/*.* \
         qml/modules/Opal/*/*.* \
         qml/modules/Opal/*/*/*.* \
@@ -2,21 +2,88 @@
 
 # Copyright (C) 2023- The Tidalapi Developers
 
-from .album import Album  # noqa: F401
-from .artist import Artist, Role  # noqa: F401
-from .genre import Genre  # noqa: F401
-from .media import Quality, Track, Video, VideoQuality  # noqa: F401
-from .mix import Mix, MixV2  # noqa: F401
-from .page import Page  # noqa: F401
-from .playlist import Playlist, UserPlaylist  # noqa: F401
-from .request import Requests  # noqa: F401
-from .session import Config, Session  # noqa: F401
-from .user import (  # noqa: F401
-    Favorites,
-    FetchedUser,
-    LoggedInUser,
-    PlaylistCreator,
-    User,
-)
+# The public names are resolved on first access (PEP 562) so that importing
+# the package stays cheap; requests, session handling and the models are
+# only loaded once something actually uses them.
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .album import Album  # noqa: F401
+    from .artist import Artist, Role  # noqa: F401
+    from .genre import Genre  # noqa: F401
+    from .media import Quality, Track, Video, VideoQuality  # noqa: F401
+    from .mix import Mix, MixV2  # noqa: F401
+    from .page import Page  # noqa: F401
+    from .playlist import Playlist, UserPlaylist  # noqa: F401
+    from .request import Requests  # noqa: F401
+    from .session import Config, Session  # noqa: F401
+    from .user import (  # noqa: F401
+        Favorites,
+        FetchedUser,
+        LoggedInUser,
+        PlaylistCreator,
+        User,
+    )
 
 __version__ = "0.8.8"
+
+_EXPORTS = {
+    "Album": "album",
+    "Artist": "artist",
+    "Role": "artist",
+    "Genre": "genre",
+    "Quality": "media",
+    "Track": "media",
+    "Video": "media",
+    "VideoQuality": "media",
+    "Mix": "mix",
+    "MixV2": "mix",
+    "Page": "page",
+    "Playlist": "playlist",
+    "UserPlaylist": "playlist",
+    "Requests": "request",
+    "Config": "session",
+    "Session": "session",
+    "Favorites": "user",
+    "FetchedUser": "user",
+    "LoggedInUser": "user",
+    "PlaylistCreator": "user",
+    "User": "user",
+}
+
+_SUBMODULES = {
+    "album",
+    "artist",
+    "exceptions",
+    "genre",
+    "identity",
+    "media",
+    "mix",
+    "page",
+    "playlist",
+    "request",
+    "session",
+    "tokens",
+    "transport",
+    "types",
+    "user",
+    "workers",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module("." + _EXPORTS[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module("." + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | _SUBMODULES)
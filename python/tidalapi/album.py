@@ -22,7 +22,7 @@ from typing import TYPE_CHECKING, List, Optional, Union, cast
 
 
 from tidalapi.exceptions import MetadataNotAvailable, ObjectNotFound, TooManyRequests
-from tidalapi.types import JsonObj, parse_iso_date
+from tidalapi.types import JsonObj, LazyField, lazy_date, set_json
 
 if TYPE_CHECKING:
     from tidalapi.artist import Artist
@@ -56,26 +56,38 @@ class Album:
     num_tracks: Optional[int] = -1
     num_videos: Optional[int] = -1
     num_volumes: Optional[int] = -1
-    tidal_release_date: Optional[datetime] = None
-    release_date: Optional[datetime] = None
+    # Dates, tags and URLs are decoded from the raw JSON on first access
+    tidal_release_date: Optional[datetime] = lazy_date("streamStartDate")
+    release_date: Optional[datetime] = lazy_date("releaseDate")
     copyright = None
     upc = None
     version = None
     explicit: Optional[bool] = True
     universal_product_number: Optional[int] = -1
     popularity: Optional[int] = -1
-    user_date_added: Optional[datetime] = None
+    user_date_added: Optional[datetime] = lazy_date("dateAdded")
     audio_quality: Optional[str] = ""
     audio_modes: Optional[List[str]] = [""]
-    media_metadata_tags: Optional[List[str]] = [""]
+    media_metadata_tags: Optional[List[str]] = LazyField(
+        lambda album, json_obj: (
+            json_obj["mediaMetadata"]["tags"] if "mediaMetadata" in json_obj else [""]
+        ),
+        default=[""],
+    )
 
     artist: Optional["Artist"] = None
     artists: Optional[List["Artist"]] = None
 
     # Direct URL to https://listen.tidal.com/album/<album_id>
-    listen_url: str = ""
+    listen_url: str = LazyField(
+        lambda album, _: f"{album.session.config.listen_base_url}/album/{album.id}",
+        default="",
+    )
     # Direct URL to https://tidal.com/browse/album/<album_id>
-    share_url: str = ""
+    share_url: str = LazyField(
+        lambda album, _: f"{album.session.config.share_base_url}/album/{album.id}",
+        default="",
+    )
 
     def __init__(self, session: "Session", album_id: Optional[str]):
         self.session = session
@@ -101,6 +113,7 @@ class Album:
         artist: Optional["Artist"] = None,
         artists: Optional[List["Artist"]] = None,
     ) -> "Album":
+        set_json(self, json_obj)
         if artists is None:
             artists = self.session.parse_artists(json_obj["artists"])
 
@@ -135,29 +148,9 @@ class Album:
         self.audio_quality = json_obj.get("audioQuality")
         self.audio_modes = json_obj.get("audioModes")
 
-        if "mediaMetadata" in json_obj:
-            self.media_metadata_tags = json_obj.get("mediaMetadata")["tags"]
-
         self.artist = artist
         self.artists = artists
 
-        release_date = json_obj.get("releaseDate")
-        self.release_date = (
-            parse_iso_date(release_date) if release_date else None
-        )
-
-        tidal_release_date = json_obj.get("streamStartDate")
-        self.tidal_release_date = (
-            parse_iso_date(tidal_release_date) if tidal_release_date else None
-        )
-
-        user_date_added = json_obj.get("dateAdded")
-        self.user_date_added = (
-            parse_iso_date(user_date_added) if user_date_added else None
-        )
-        self.listen_url = f"{self.session.config.listen_base_url}/album/{self.id}"
-        self.share_url = f"{self.session.config.share_base_url}/album/{self.id}"
-
         return copy.copy(self)
 
     @property
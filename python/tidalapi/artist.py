@@ -25,7 +25,7 @@ from warnings import warn
 from typing import NoReturn
 
 from tidalapi.exceptions import MetadataNotAvailable, ObjectNotFound, TooManyRequests
-from tidalapi.types import JsonObj, parse_iso_date
+from tidalapi.types import JsonObj, LazyField, lazy_date, set_json
 
 from . import mix
 
@@ -38,19 +38,35 @@ if TYPE_CHECKING:
 DEFAULT_ARTIST_IMG = "1e01cdb6-f15d-4d8b-8440-a047976c1cac"
 
 
+def _parse_roles(artist: "Artist", json_obj: JsonObj) -> Optional[List["Role"]]:
+    # Artists do not have roles as playlist creators.
+    if json_obj.get("type") or json_obj.get("artistTypes"):
+        return [Role(role) for role in json_obj.get("artistTypes", [json_obj.get("type")])]
+    return None
+
+
 class Artist:
     id: Optional[int] = -1
     name: Optional[str] = None
-    roles: Optional[List["Role"]] = None
-    role: Optional["Role"] = None
+    # Roles, dates and URLs are decoded from the raw JSON on first access
+    roles: Optional[List["Role"]] = LazyField(_parse_roles)
+    role: Optional["Role"] = LazyField(
+        lambda artist, _: artist.roles[0] if artist.roles else None
+    )
     picture: Optional[str] = None
-    user_date_added: Optional[datetime] = None
+    user_date_added: Optional[datetime] = lazy_date("dateAdded")
     bio: Optional[str] = None
 
     # Direct URL to https://listen.tidal.com/artist/<artist_id>
-    listen_url: str = ""
+    listen_url: str = LazyField(
+        lambda artist, _: f"{artist.session.config.listen_base_url}/artist/{artist.id}",
+        default="",
+    )
     # Direct URL to https://tidal.com/browse/artist/<artist_id>
-    share_url: str = ""
+    share_url: str = LazyField(
+        lambda artist, _: f"{artist.session.config.share_base_url}/artist/{artist.id}",
+        default="",
+    )
 
     def __init__(self, session: "Session", artist_id: Optional[str]):
         """Initialize the :class:`Artist` object, given a TIDAL artist ID :param
@@ -79,33 +95,15 @@ class Artist:
         :param json_obj: :class:`JsonObj` containing the artist metadata
         :return: Returns a copy of the :class:`Artist` object
         """
+        set_json(self, json_obj)
         self.id = json_obj["id"]
         self.name = json_obj["name"]
 
-        # Artists do not have roles as playlist creators.
-        self.roles = None
-        self.role = None
-        if json_obj.get("type") or json_obj.get("artistTypes"):
-            roles: List["Role"] = []
-            for role in json_obj.get("artistTypes", [json_obj.get("type")]):
-                roles.append(Role(role))
-
-            self.roles = roles
-            self.role = roles[0]
-
         # Get artist picture or use default
         self.picture = json_obj.get("picture")
         if self.picture is None:
             self.picture = DEFAULT_ARTIST_IMG
 
-        user_date_added = json_obj.get("dateAdded")
-        self.user_date_added = (
-            parse_iso_date(user_date_added) if user_date_added else None
-        )
-
-        self.listen_url = f"{self.session.config.listen_base_url}/artist/{self.id}"
-        self.share_url = f"{self.session.config.share_base_url}/artist/{self.id}"
-
         return copy.copy(self)
 
     def parse_artists(self, json_obj: List[JsonObj]) -> List["Artist"]:
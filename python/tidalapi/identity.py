@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Sharing of the artist and album objects embedded in media lists.
+
+Classes: :class:`IdentityMap`
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Hashable, MutableMapping
+from weakref import WeakValueDictionary
+
+
+class IdentityMap:
+    """Maps a key to the one object parsed for it.
+
+    Track lists repeat the same artists and albums over and over; with an
+    identity map each of them is parsed once and the object is shared by all
+    tracks that reference it. Shared objects must be treated as read-only.
+
+    :param weak: Hold the objects weakly, so a long-lived (per session) map
+        does not keep anything alive that is no longer referenced elsewhere.
+    """
+
+    def __init__(self, weak: bool = False):
+        self._items: MutableMapping[Hashable, Any] = (
+            WeakValueDictionary() if weak else {}
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable, parse: Callable[[], Any]) -> Any:
+        """Return the object for key, calling ``parse()`` if there is none yet."""
+        obj = self._items.get(key)
+        if obj is not None:
+            self.hits += 1
+            return obj
+        obj = parse()
+        with self._lock:
+            # Another thread may have parsed the same key in the meantime
+            obj = self._items.setdefault(key, obj)
+        self.misses += 1
+        return obj
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
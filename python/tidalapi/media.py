@@ -25,7 +25,7 @@ import copy
 from abc import abstractmethod
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import TYPE_CHECKING, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union, cast
 
 
 if TYPE_CHECKING:
@@ -45,7 +45,7 @@ from tidalapi.exceptions import (
     UnknownManifestFormat,
     URLNotAvailable,
 )
-from tidalapi.types import JsonObj, parse_iso_date
+from tidalapi.types import JsonObj, LazyField, lazy_date, parse_iso_date, set_json
 
 from . import mix
 
@@ -190,10 +190,11 @@ class Media:
     dj_ready: bool = False
     ad_supported_stream_ready: bool = False
 
-    stream_start_date: Optional[datetime] = None
-    tidal_release_date: Optional[datetime] = None  # aka. streamStartDate
-    date_added: Optional[datetime] = None
-    user_date_added: Optional[datetime] = None  # aka. dateAdded
+    # Dates are decoded from the raw JSON on first access
+    stream_start_date: Optional[datetime] = lazy_date("streamStartDate")
+    tidal_release_date: Optional[datetime] = lazy_date("streamStartDate")
+    date_added: Optional[datetime] = lazy_date("dateAdded")
+    user_date_added: Optional[datetime] = lazy_date("dateAdded")  # aka. dateAdded
     track_num: int = 1  # trackNumber
     volume_num: int = 1  # volumeNumber
 
@@ -232,16 +233,18 @@ class Media:
         :param album: The (optional) album to use, instead of parsing the JSON object
         :return:
         """
-        artists = self.session.parse_artists(json_obj["artists"])
+        set_json(self, json_obj)
+        # Embedded artists and albums are shared within an identity scope
+        artists = self.session.parse_shared_artists(json_obj["artists"])
 
         # Sometimes the artist field is not filled, example: 62300893
         if "artist" in json_obj:
-            artist = self.session.parse_artist(json_obj["artist"])
+            artist = self.session.parse_shared_artist(json_obj["artist"])
         else:
             artist = artists[0]
 
         if album is None and json_obj["album"]:
-            album = self.session.album().parse(json_obj["album"], artist, artists)
+            album = self.session.parse_shared_album(json_obj["album"], artist, artists)
         self.album = album
 
         self.id = json_obj["id"]
@@ -258,17 +261,9 @@ class Media:
         self.dj_ready = bool(json_obj["djReady"])
         self.ad_supported_stream_ready = bool(json_obj["adSupportedStreamReady"])
 
-        # Removed media does not have a release date
-        stream_start_date = json_obj.get("streamStartDate")
-        self.stream_start_date = (
-            parse_iso_date(stream_start_date) if stream_start_date else None
-        )
-        self.tidal_release_date = self.stream_start_date
-
-        # When getting items from playlists they have a date added attribute, same with favorites.
-        date_added = json_obj.get("dateAdded")
-        self.date_added = parse_iso_date(date_added) if date_added else None
-        self.user_date_added = self.date_added
+        # Removed media does not have a release date (streamStartDate). When
+        # getting items from playlists they have a date added attribute, same
+        # with favorites. Both are lazy fields.
 
         self.track_num = json_obj["trackNumber"]
         self.volume_num = json_obj["volumeNumber"]
@@ -308,7 +303,28 @@ class Track(Media):
     # Audio quality and metadata
     audio_quality: Optional[str] = None
     audio_modes: Optional[List[str]] = None
-    media_metadata_tags = None
+    # Only set for available tracks
+    media_metadata_tags = LazyField(
+        lambda track, json_obj: (
+            json_obj.get("mediaMetadata", {}).get("tags", {})
+            if track.available
+            else None
+        )
+    )
+
+    # Direct URLs to the track, generated on first access
+    listen_url: str = LazyField(
+        lambda track, _: (
+            f"{track.session.config.listen_base_url}/album/{track.album.id}/track/{track.id}"
+            if track.album
+            else f"{track.session.config.listen_base_url}/track/{track.id}"
+        ),
+        default="",
+    )
+    share_url: str = LazyField(
+        lambda track, _: f"{track.session.config.share_base_url}/track/{track.id}",
+        default="",
+    )
 
     # Identification
     index: Optional[int] = None
@@ -316,7 +332,7 @@ class Track(Media):
     isrc: Optional[str] = None
 
     # Track info
-    date_added: Optional[datetime] = None
+    date_added: Optional[datetime] = lazy_date("dateAdded")
     description: Optional[str] = None
     version: Optional[str] = None
     copyright: str = ""
@@ -340,13 +356,8 @@ class Track(Media):
         self.upload = json_obj.get("upload")
         self.spotlighted = json_obj.get("spotlighted")
 
-        # Generate share URLs from track ID and album (if it exists)
+        # Share URLs are generated from track ID and album on first access
         self.url = json_obj.get("url")
-        if self.album:
-            self.listen_url = f"{self.session.config.listen_base_url}/album/{self.album.id}/track/{self.id}"
-        else:
-            self.listen_url = f"{self.session.config.listen_base_url}/track/{self.id}"
-        self.share_url = f"{self.session.config.share_base_url}/track/{self.id}"
 
         self.audio_quality = json_obj.get("audioQuality")
         self.audio_modes = json_obj.get("audioModes")
@@ -355,13 +366,10 @@ class Track(Media):
         if self.available:
             self.access_type = json_obj.get("accessType", "None")
 
-            self.media_metadata_tags = json_obj.get("mediaMetadata", {}).get("tags", {})
-
             self.index = json_obj.get("index")
             self.item_uuid = json_obj.get("itemUuid")
             self.isrc = json_obj.get("isrc")
 
-            self.date_added = self.user_date_added
             self.description = json_obj.get("description")
             self.version = json_obj.get("version")
             self.copyright = json_obj.get("copyright")
@@ -737,6 +745,117 @@ class StreamManifest:
         return True if ManifestMimeType.BTS in self.manifest_mime_type else False
 
 
+# Manifests are fed to the parser in pieces so parsing can stop early.
+_MPD_CHUNK = 8192
+
+
+def _int_attr(value: Optional[str]) -> Optional[int]:
+    return int(value) if value is not None else None
+
+
+def _parse_mpd(mpd_xml: str) -> Dict[str, object]:
+    """Extract the fields :class:`DashInfo` needs from an MPD manifest.
+
+    Only the first Period / AdaptationSet / Representation / SegmentTemplate
+    is of interest, so the document is parsed incrementally and parsing
+    stops as soon as the first SegmentTimeline is complete. No element tree
+    is kept around; the timeline is returned as a list of (d, r) tuples.
+    """
+    from xml.etree.ElementTree import XMLPullParser
+
+    # The declaration carries an encoding, which the parser refuses for
+    # already decoded text.
+    if mpd_xml.lstrip().startswith("<?xml"):
+        mpd_xml = mpd_xml[mpd_xml.index("?>") + 2 :]
+
+    wanted = {
+        "MPD": ("mediaPresentationDuration",),
+        "AdaptationSet": ("contentType", "mimeType"),
+        "Representation": ("codecs", "audioSamplingRate"),
+        "SegmentTemplate": ("initialization", "media", "timescale"),
+    }
+    info: Dict[str, object] = {}
+    seen = set()
+    timeline: List[tuple] = []
+    in_timeline = False
+    done = False
+    parser = XMLPullParser(events=("start", "end"))
+    for pos in range(0, len(mpd_xml), _MPD_CHUNK):
+        parser.feed(mpd_xml[pos : pos + _MPD_CHUNK])
+        for event, elem in parser.read_events():
+            tag = elem.tag.rpartition("}")[2]
+            if event == "start":
+                if tag in wanted and tag not in seen:
+                    seen.add(tag)
+                    for name in wanted[tag]:
+                        info[name] = elem.get(name)
+                elif tag == "SegmentTimeline" and not timeline:
+                    in_timeline = True
+                elif tag == "S" and in_timeline:
+                    repeat = elem.get("r")
+                    timeline.append(
+                        (_int_attr(elem.get("d")), int(repeat) if repeat else 0)
+                    )
+            elif tag == "SegmentTimeline" and in_timeline:
+                done = True
+                break
+        if done:
+            break
+    if not timeline:
+        raise ManifestDecodeError
+    for names in wanted.values():
+        for name in names:
+            info.setdefault(name, None)
+    info["timeline"] = timeline
+    return info
+
+
+class SegmentUrls(Sequence):
+    """The segment URLs of a DASH stream, generated on access.
+
+    Behaves like a read-only list of ``count`` URLs where entry ``n`` is the
+    media template with ``$Number$`` replaced by ``n``. Slicing returns a
+    plain list.
+    """
+
+    __slots__ = ("template", "count")
+
+    def __init__(self, template: str, count: int):
+        self.template = template
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._url(i) for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("segment index out of range")
+        return self._url(index)
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self._url(i)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SegmentUrls):
+            return (self.template, self.count) == (other.template, other.count)
+        if isinstance(other, (list, tuple)):
+            return len(other) == self.count and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return "SegmentUrls(%r, %d)" % (self.template, self.count)
+
+    def _url(self, index: int) -> str:
+        return self.template.replace("$Number$", str(index))
+
+
 class DashInfo:
     """An object containing the decoded MPEG-DASH / MPD manifest."""
 
@@ -768,68 +887,39 @@ class DashInfo:
             raise ManifestDecodeError
 
     def __init__(self, mpd_xml):
-        # Lazy imports: mpegdash pulls xml.dom.minidom and isodate is only
-        # needed for DASH manifests - keep both off the startup import path.
+        # Lazy import: isodate is only needed for DASH manifests - keep it off
+        # the startup import path.
         from isodate import parse_duration
-        from mpegdash.parser import MPEGDASHParser
 
-        mpd = MPEGDASHParser.parse(
-            mpd_xml.split("<?xml version='1.0' encoding='UTF-8'?>")[1]
-        )
+        mpd = _parse_mpd(mpd_xml)
+
+        self.duration = parse_duration(mpd["mediaPresentationDuration"])
+        self.content_type = mpd["contentType"]
+        self.mime_type = mpd["mimeType"]
+        self.codecs = mpd["codecs"]
+        self.first_url = mpd["initialization"]
+        self.media_url = mpd["media"]
+        self.timescale = _int_attr(mpd["timescale"])
+        self.audio_sampling_rate = int(mpd["audioSamplingRate"])
+        timeline = mpd["timeline"]
+        self.chunk_size = timeline[0][0]
+        # Always use last element in segment timeline.
+        self.last_chunk_size = timeline[-1][0]
 
-        self.duration = parse_duration(mpd.media_presentation_duration)
-        self.content_type = mpd.periods[0].adaptation_sets[0].content_type
-        self.mime_type = mpd.periods[0].adaptation_sets[0].mime_type
-        self.codecs = mpd.periods[0].adaptation_sets[0].representations[0].codecs
-        self.first_url = (
-            mpd.periods[0]
-            .adaptation_sets[0]
-            .representations[0]
-            .segment_templates[0]
-            .initialization
-        )
-        self.media_url = (
-            mpd.periods[0]
-            .adaptation_sets[0]
-            .representations[0]
-            .segment_templates[0]
-            .media
-        )
-        # self.startNumber = mpd.periods[0].adaptation_sets[0].representations[0].segment_templates[0].start_number
-        self.timescale = (
-            mpd.periods[0]
-            .adaptation_sets[0]
-            .representations[0]
-            .segment_templates[0]
-            .timescale
-        )
-        self.audio_sampling_rate = int(
-            mpd.periods[0].adaptation_sets[0].representations[0].audio_sampling_rate
-        )
-        self.chunk_size = (
-            mpd.periods[0]
-            .adaptation_sets[0]
-            .representations[0]
-            .segment_templates[0]
-            .segment_timelines[0]
-            .Ss[0]
-            .d
-        )
-        # self.chunkcount = mpd.periods[0].adaptation_sets[0].representations[0].segment_templates[0].segment_timelines[0].Ss[0].r + 1
-        self.last_chunk_size = (
-            mpd.periods[0]
-            .adaptation_sets[0]
-            .representations[0]
-            .segment_templates[0]
-            .segment_timelines[0]
-            .Ss[-1]  # Always use last element in segment timeline.
-            .d
-        )
-
-        self.urls = self.get_urls(mpd)
+        # min segments count; i.e. .initialization + the very first of .media;
+        # See https://developers.broadpeak.io/docs/foundations-dash
+        segments_count = 1 + 1
+        for _, repeat in timeline:
+            segments_count += repeat if repeat else 1
+        self.urls = SegmentUrls(self.media_url, segments_count)
 
     @staticmethod
     def get_urls(mpd) -> list[str]:
+        """Expand the segment URLs of an :mod:`mpegdash` MPD object.
+
+        Kept for callers that parse manifests with mpegdash themselves;
+        :class:`DashInfo` uses the lazy :class:`SegmentUrls` instead.
+        """
         # min segments count; i.e. .initialization + the very first of .media;
         # See https://developers.broadpeak.io/docs/foundations-dash
         segments_count = 1 + 1
@@ -21,11 +21,11 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
 
 
 from tidalapi.exceptions import ObjectNotFound, TooManyRequests
-from tidalapi.types import JsonObj, parse_iso_date
+from tidalapi.types import JsonObj, LazyField, lazy_date, set_json
 
 if TYPE_CHECKING:
     from tidalapi.media import Track, Video
@@ -70,7 +70,14 @@ class Mix:
     mix_type: Optional[MixType] = None
     content_behaviour: str = ""
     short_subtitle: str = ""
-    images: Optional[ImageResponse] = None
+    # Decoded from the raw JSON on first access
+    images: Optional[ImageResponse] = LazyField(
+        lambda mix, json_obj: ImageResponse(
+            small=json_obj["images"]["SMALL"]["url"],
+            medium=json_obj["images"]["MEDIUM"]["url"],
+            large=json_obj["images"]["LARGE"]["url"],
+        )
+    )
     _retrieved = False
     _items: Optional[List[Union["Video", "Track"]]] = None
 
@@ -118,6 +125,7 @@ class Mix:
         :param json_obj: The json of a mix to be parsed
         :return: A copy of the parsed mix
         """
+        set_json(self, json_obj)
         self.id = json_obj["id"]
         self.title = json_obj["title"]
         self.sub_title = json_obj["subTitle"]
@@ -125,12 +133,6 @@ class Mix:
         self.mix_type = MixType(json_obj["mixType"])
         self.content_behaviour = json_obj["contentBehavior"]
         self.short_subtitle = json_obj["shortSubtitle"]
-        images = json_obj["images"]
-        self.images = ImageResponse(
-            small=images["SMALL"]["url"],
-            medium=images["MEDIUM"]["url"],
-            large=images["LARGE"]["url"],
-        )
 
         return copy.copy(self)
 
@@ -146,6 +148,22 @@ class Mix:
             raise ValueError("Retrieved items missing")
         return self._items
 
+    def items_pages(
+        self, page_size: int = 100
+    ) -> Iterator[List[Union["Video", "Track"]]]:
+        """Returns the items in the mix in pages of page_size, the same interface as
+        :meth:`Playlist.tracks_pages <tidalapi.playlist.Playlist.tracks_pages>`.
+
+        The mix page delivers all items in one response, so only the first page
+        causes a request.
+
+        :param page_size: The amount of items per page
+        :return: An iterator over lists of videos and/or tracks from the mix
+        """
+        items = self.items()
+        for offset in range(0, len(items), page_size):
+            yield items[offset : offset + page_size]
+
     def image(self, dimensions: int = 320) -> str:
         """A URL to a Mix picture.
 
@@ -179,7 +197,8 @@ class MixV2:
 
     mix_type: Optional[MixType] = None
     country_code: Optional[str] = None
-    date_added: Optional[datetime] = None
+    # Decoded from the raw JSON on first access
+    date_added: Optional[datetime] = lazy_date("dateAdded")
     id: Optional[str] = None
     artifact_id_type: Optional[str] = None
     content_behavior: Optional[str] = None
@@ -193,7 +212,7 @@ class MixV2:
     title_text_info: Optional[TextInfo] = None
     sub_title_text_info: Optional[TextInfo] = None
     short_subtitle_text_info: Optional[TextInfo] = None
-    updated: Optional[datetime] = None
+    updated: Optional[datetime] = lazy_date("updated")
     _retrieved = False
     _items: Optional[List[Union["Video", "Track"]]] = None
 
@@ -242,12 +261,9 @@ class MixV2:
         :return: A copy of the parsed mix
         """
 
+        set_json(self, json_obj)
         self.id = json_obj["id"]
         if json_obj.get("mixType"):
-            date_added = json_obj.get("dateAdded")
-            self.date_added = (
-                parse_iso_date(date_added) if date_added else None
-            )
             self.title = json_obj["title"]
             self.sub_title = json_obj["subTitle"]
             images = json_obj["images"]
@@ -273,8 +289,6 @@ class MixV2:
                 text=sub_title_text_info["text"],
                 color=sub_title_text_info["color"],
             )
-            updated = json_obj.get("updated")
-            self.updated = parse_iso_date(updated) if updated else None
         elif json_obj.get("type"):
             # Certain mix types (e.g. when returned from Page) must be parsed differently. Why, TIDAL?
             self.country_code = json_obj.get("countryCode", None)
@@ -317,8 +331,12 @@ class MixV2:
             )
             self.short_subtitle = short_subtitle_text_info["text"]
 
-            if json_obj.get("updated"):
-                self.updated = datetime.fromtimestamp(json_obj["updated"] / 1000)
+            # Page mixes carry "updated" as epoch milliseconds
+            self.updated = (
+                datetime.fromtimestamp(json_obj["updated"] / 1000)
+                if json_obj.get("updated")
+                else None
+            )
 
         return copy.copy(self)
 
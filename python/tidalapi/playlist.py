@@ -20,12 +20,20 @@ from __future__ import annotations
 
 import copy
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional, Sequence, Union, cast
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Union, cast
 
 from tidalapi.exceptions import ObjectNotFound, TooManyRequests
-from tidalapi.types import ItemOrder, JsonObj, OrderDirection, parse_iso_date
+from tidalapi.types import (
+    ItemOrder,
+    JsonObj,
+    LazyField,
+    OrderDirection,
+    lazy_date,
+    parse_iso_date,
+    set_json,
+)
 from tidalapi.user import LoggedInUser
-from tidalapi.workers import get_items
+from tidalapi.workers import get_items, iter_pages
 
 if TYPE_CHECKING:
     from tidalapi.artist import Artist
@@ -55,22 +63,36 @@ class Playlist:
     creator: Optional[Union["Artist", "User"]] = None
     description: Optional[str] = None
     duration: int = -1
-    last_updated: Optional[datetime] = None
-    created: Optional[datetime] = None
+    # Dates, promoted artists and URLs are decoded from the raw JSON on
+    # first access. These can be missing on from the /pages endpoints
+    last_updated: Optional[datetime] = lazy_date("lastUpdated")
+    created: Optional[datetime] = lazy_date("created")
     type = None
     public: Optional[bool] = False
     popularity: Optional[int] = None
-    promoted_artists: Optional[List["Artist"]] = None
-    last_item_added_at: Optional[datetime] = None
+    promoted_artists: Optional[List["Artist"]] = LazyField(
+        lambda playlist, json_obj: (
+            playlist.session.parse_artists(json_obj["promotedArtists"])
+            if json_obj.get("promotedArtists")
+            else None
+        )
+    )
+    last_item_added_at: Optional[datetime] = lazy_date("lastItemAddedAt")
     picture: Optional[str] = None
     square_picture: Optional[str] = None
-    user_date_added: Optional[datetime] = None
+    user_date_added: Optional[datetime] = lazy_date("dateAdded")
     _etag: Optional[str] = None
 
     # Direct URL to https://listen.tidal.com/playlist/<playlist_id>
-    listen_url: str = ""
+    listen_url: str = LazyField(
+        lambda playlist, _: f"{playlist.session.config.listen_base_url}/playlist/{playlist.id}",
+        default="",
+    )
     # Direct URL to https://tidal.com/browse/playlist/<playlist_id>
-    share_url: str = ""
+    share_url: str = LazyField(
+        lambda playlist, _: f"{playlist.session.config.share_base_url}/playlist/{playlist.id}",
+        default="",
+    )
 
     def __init__(self, session: "Session", playlist_id: Optional[str]):
         self.id = playlist_id
@@ -97,6 +119,7 @@ class Playlist:
         :return: Returns a copy of the original :exc: 'Playlist': object
         """
         json_obj = obj.get("data", obj)
+        set_json(self, json_obj)
 
         self.id = json_obj["uuid"]
         self.trn = f"trn:playlist:{self.id}"
@@ -106,13 +129,6 @@ class Playlist:
         self.description = json_obj["description"]
         self.duration = int(json_obj["duration"])
 
-        # These can be missing on from the /pages endpoints
-        last_updated = json_obj.get("lastUpdated")
-        self.last_updated = (
-            parse_iso_date(last_updated) if last_updated else None
-        )
-        created = json_obj.get("created")
-        self.created = parse_iso_date(created) if created else None
         public = json_obj.get("publicPlaylist")
         self.public = None if public is None else bool(public)
         popularity = json_obj.get("popularity")
@@ -122,30 +138,12 @@ class Playlist:
         self.picture = json_obj["image"]
         self.square_picture = json_obj["squareImage"]
 
-        promoted_artists = json_obj["promotedArtists"]
-        self.promoted_artists = (
-            self.session.parse_artists(promoted_artists) if promoted_artists else None
-        )
-
-        last_item_added_at = json_obj.get("lastItemAddedAt")
-        self.last_item_added_at = (
-            parse_iso_date(last_item_added_at) if last_item_added_at else None
-        )
-
-        user_date_added = json_obj.get("dateAdded")
-        self.user_date_added = (
-            parse_iso_date(user_date_added) if user_date_added else None
-        )
-
         creator = json_obj.get("creator")
         if self.type == "ARTIST" and creator and creator.get("id"):
             self.creator = self.session.parse_artist(creator)
         else:
             self.creator = self.session.parse_user(creator) if creator else None
 
-        self.listen_url = f"{self.session.config.listen_base_url}/playlist/{self.id}"
-        self.share_url = f"{self.session.config.share_base_url}/playlist/{self.id}"
-
         return copy.copy(self)
 
     def factory(self) -> Union["Playlist", "UserPlaylist"]:
@@ -245,6 +243,33 @@ class Playlist:
         count = self.get_tracks_count()
         return get_items(self.tracks, count, order, order_direction)
 
+    def tracks_pages(
+        self,
+        page_size: int = 100,
+        first_page_size: Optional[int] = None,
+        offset: int = 0,
+        order: Optional[ItemOrder] = None,
+        order_direction: Optional[OrderDirection] = None,
+    ) -> Iterator[List["Track"]]:
+        """Get the tracks in the playlist page by page, fetching each page only when
+        the previous one has been consumed.
+
+        :param page_size: The amount of tracks per page
+        :param first_page_size: Optional; A different size for the first page, e.g. to show the first rows quickly
+        :param offset: The index of the first track you want included.
+        :param order: Optional; A :class:`ItemOrder` describing the ordering type when returning the playlist tracks. eg.: "NAME, "DATE"
+        :param order_direction: Optional; A :class:`OrderDirection` describing the ordering direction when sorting by `order`. eg.: "ASC", "DESC"
+        :return: An iterator over lists of :class:`Tracks <.Track>`
+        """
+        return iter_pages(
+            self.tracks,
+            order,
+            order_direction,
+            page_size=page_size,
+            first_page_size=first_page_size,
+            offset=offset,
+        )
+
     def items(
         self,
         limit: int = 100,
@@ -18,8 +18,13 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """A module containing functions relating to TIDAL api requests."""
 
+import hashlib
 import json
 import logging
+import re
+import sqlite3
+import threading
+import time
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -29,12 +34,15 @@ from typing import (
     Mapping,
     MutableMapping,
     Optional,
+    Sequence,
+    Tuple,
     Union,
     cast,
 )
 from urllib.parse import urljoin
 
 import requests
+from requests.structures import CaseInsensitiveDict
 
 from tidalapi.exceptions import http_error_to_tidal_error
 from tidalapi.types import JsonObj
@@ -48,6 +56,209 @@ Methods = Literal["GET", "POST", "PUT", "DELETE"]
 if TYPE_CHECKING:
     from tidalapi.session import Session
 
+#: Default time-to-live in seconds for cached GET responses, matched in order
+#: against the request path. ``None`` means the endpoint is never cached, ``0``
+#: means the response is stored but revalidated on every use.
+DEFAULT_CACHE_TTLS: Sequence[Tuple[str, Optional[int]]] = (
+    (r"(urlpostpaywall|playbackinfo|playbackinfopostpaywall)", None),
+    (r"^sessions", None),
+    (r"/subscription$", None),
+    (r"^users/", 0),
+    (r"^my-collection/", 0),
+    (r"^playlists/", 0),
+    (r"^pages/", 15 * 60),
+    (r"^search", 10 * 60),
+    (r"^mixes/", 60 * 60),
+    (r"^artists/", 24 * 60 * 60),
+    (r"^tracks/", 24 * 60 * 60),
+    (r"^videos/", 24 * 60 * 60),
+    (r"^albums/", 7 * 24 * 60 * 60),
+)
+
+
+class CacheEntry(object):
+    """A stored GET response."""
+
+    def __init__(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        body: bytes,
+        stored_at: float,
+        ttl: int,
+    ):
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+        self.ttl = ttl
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() - self.stored_at < self.ttl
+
+    def conditional_headers(self) -> MutableMapping[str, str]:
+        """Headers that turn a GET into a revalidation of this entry."""
+        conditional = {}
+        etag = self.headers.get("etag")
+        if etag:
+            conditional["If-None-Match"] = etag
+        last_modified = self.headers.get("last-modified")
+        if last_modified:
+            conditional["If-Modified-Since"] = last_modified
+        return conditional
+
+    def to_response(self, prepared: requests.PreparedRequest) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.body
+        response.encoding = "utf-8"
+        response.request = prepared
+        return response
+
+
+class ResponseCache(object):
+    """A persistent SQLite store of GET responses.
+
+    Entries are keyed by url, normalized parameters and the logged in user, so
+    the volatile ``sessionId`` does not split the cache. Responses carrying an
+    ``etag`` or ``last-modified`` header are revalidated with a conditional
+    request once their TTL has passed instead of being downloaded again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttls: Optional[Sequence[Tuple[str, Optional[int]]]] = None,
+        max_entries: int = 5000,
+    ):
+        self.path = path
+        self.ttls = [
+            (re.compile(pattern), ttl)
+            for pattern, ttl in (DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        ]
+        self.max_entries = max_entries
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.stores = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT, path TEXT, headers TEXT, body BLOB, "
+            "stored_at REAL, ttl INTEGER)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_stored_at ON responses(stored_at)"
+        )
+        self._db.commit()
+
+    def ttl_for(self, path: str) -> Optional[int]:
+        """Returns the TTL for path, or None if it must not be cached."""
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return None
+
+    @staticmethod
+    def key(url: str, params: Params, scope: Any = None) -> str:
+        normalized = sorted(
+            (k, str(v)) for k, v in params.items() if k != "sessionId" and v is not None
+        )
+        raw = json.dumps([url, normalized, str(scope)])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, headers, body, stored_at, ttl FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        url, headers, body, stored_at, ttl = row
+        return CacheEntry(url, json.loads(headers), body, stored_at, ttl)
+
+    def store(
+        self, key: str, path: str, response: requests.Response, ttl: int
+    ) -> None:
+        headers = {k.lower(): v for k, v in response.headers.items()}
+        # The body is stored decoded, so these no longer describe it
+        for name in ("content-encoding", "content-length", "transfer-encoding"):
+            headers.pop(name, None)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    path,
+                    json.dumps(headers),
+                    response.content,
+                    time.time(),
+                    ttl,
+                ),
+            )
+            self.stores += 1
+            if self.stores % 100 == 0:
+                self._prune()
+            self._db.commit()
+
+    def touch(self, key: str) -> None:
+        """Marks an entry as fresh again after a 304 response."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
+
+    @staticmethod
+    def resource(path: str) -> str:
+        """The resource a path belongs to, e.g. ``playlists/<id>`` for
+        ``playlists/<id>/items/3``."""
+        return "/".join(path.strip("/").split("/")[:2])
+
+    def invalidate(self, resource: str) -> None:
+        """Drops all entries for resource and everything below it."""
+        escaped = (
+            resource.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM responses WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                (resource, escaped + "/%"),
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def _prune(self) -> None:
+        self._db.execute(
+            "DELETE FROM responses WHERE key NOT IN "
+            "(SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            "entries": entries,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "stores": self.stores,
+            "hit_rate": (self.hits + self.revalidated) / lookups if lookups else 0.0,
+        }
+
 
 class Requests(object):
     """A class for handling api requests to TIDAL."""
@@ -63,6 +274,10 @@ class Requests(object):
         self.session = session
         self.config = session.config
         self.latest_err_response = requests.Response()
+        #: The on-disk response cache, only used if config.cache_path is set
+        self.cache: Optional[ResponseCache] = None
+        if self.config.cache_path:
+            self.cache = ResponseCache(self.config.cache_path, self.config.cache_ttls)
 
     def basic_request(
         self,
@@ -95,6 +310,8 @@ class Requests(object):
             headers["User-Agent"] = self.user_agent
 
         if self.session.token_type and self.session.access_token is not None:
+            # Renew a token that ran out while no background refresh could run
+            self.session.tokens.ensure_fresh()
             headers["authorization"] = (
                 self.session.token_type + " " + self.session.access_token
             )
@@ -102,10 +319,41 @@ class Requests(object):
             base_url = self.session.config.api_v1_location
 
         url = urljoin(base_url, path)
+
+        cache_key = None
+        cached = None
+        ttl = None
+        if self.cache is not None:
+            if method == "GET":
+                ttl = self.cache.ttl_for(path)
+            else:
+                # Anything cached for the modified resource may be stale now
+                self.cache.invalidate(self.cache.resource(path))
+        if ttl is not None:
+            user = self.session.user
+            cache_key = self.cache.key(url, request_params, user.id if user else None)
+            cached = self.cache.lookup(cache_key)
+            if cached is not None:
+                if cached.fresh:
+                    self.cache.hits += 1
+                    return cached.to_response(
+                        requests.Request("GET", url, params=request_params).prepare()
+                    )
+                headers.update(cached.conditional_headers())
+
         request = self.session.request_session.request(
             method, url, params=request_params, data=data, headers=headers
         )
 
+        if cache_key is not None:
+            if request.status_code == 304 and cached is not None:
+                self.cache.revalidated += 1
+                self.cache.touch(cache_key)
+                return cached.to_response(request.request)
+            self.cache.misses += 1
+            if request.status_code == 200:
+                self.cache.store(cache_key, path, request, ttl)
+
         refresh_token = self.session.refresh_token
         if not request.ok and refresh_token:
             json_resp = None
@@ -118,7 +366,8 @@ class Requests(object):
                 "The token has expired."
             ):
                 log.debug("The access token has expired, trying to refresh it.")
-                refreshed = self.session.token_refresh(refresh_token)
+                # Shared with any other request that hit the expiry right now
+                refreshed = self.session.tokens.refresh()
                 if refreshed:
                     request = self.basic_request(method, url, params, data, headers)
             else:
@@ -162,6 +411,13 @@ class Requests(object):
                 raise  # re raise last error, usually HTTPError
         return request
 
+    def cache_stats(self) -> dict:
+        """Hit/miss statistics of the response cache.
+
+        :return: A dict with the counters, empty if no cache is configured.
+        """
+        return self.cache.stats() if self.cache is not None else {}
+
     def get_latest_err_response(self) -> dict:
         """Get the latest request Response that resulted in an Exception.
 
@@ -205,7 +461,8 @@ class Requests(object):
         """
         json_obj = self.request("GET", url, params).json()
         if parse:
-            return self.map_json(json_obj, parse=parse)
+            with self.session.identity_scope():
+                return self.map_json(json_obj, parse=parse)
         else:
             return json_obj
 
@@ -27,8 +27,10 @@ import json
 import logging
 import os
 import random
+import threading
 import time
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -36,6 +38,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Iterator,
     List,
     Literal,
     Optional,
@@ -54,7 +57,20 @@ from requests.exceptions import HTTPError
 from tidalapi.exceptions import *
 from tidalapi.types import JsonObj
 
-from . import album, artist, genre, media, mix, page, playlist, request, user
+from . import (
+    album,
+    artist,
+    genre,
+    identity,
+    media,
+    mix,
+    page,
+    playlist,
+    request,
+    tokens,
+    transport,
+    user,
+)
 
 if TYPE_CHECKING:
     from tidalapi.user import FetchedUser, LoggedInUser, PlaylistCreator
@@ -129,6 +145,18 @@ class Config:
     code_challenge: str
     pkce_uri_redirect: str = "https://tidal.com/android/login/auth"
     client_id_pkce: str
+    # Optional on-disk response cache
+    cache_path: Optional[str]
+    cache_ttls: Optional[List[Tuple[str, Optional[int]]]]
+    # HTTP transport, see :mod:`tidalapi.transport`
+    pool_connections: int
+    pool_maxsize: int
+    max_retries: int
+    backoff_factor: float
+    retry_statuses: Tuple[int, ...]
+    retry_after_max: float
+    # Sharing of embedded artists/albums while parsing, see :mod:`tidalapi.identity`
+    identity_map: Optional[str]
     # Base URLs for sharing, listen URLs
     listen_base_url: str = "https://listen.tidal.com"
     share_base_url: str = "https://tidal.com/browse"
@@ -140,10 +168,34 @@ class Config:
         video_quality: str = media.VideoQuality.default,
         item_limit: int = 1000,
         alac: bool = True,
+        cache_path: Optional[str] = None,
+        cache_ttls: Optional[List[Tuple[str, Optional[int]]]] = None,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+        retry_after_max: float = 10,
+        identity_map: Optional[str] = "response",
     ):
         self.quality = quality
         self.video_quality = video_quality
         self.alac = alac
+        # Persistent GET response cache, see :class:`tidalapi.request.ResponseCache`
+        self.cache_path = cache_path
+        self.cache_ttls = cache_ttls
+        # Connections kept per host and retries of idempotent requests on
+        # connection errors and retry_statuses, see :mod:`tidalapi.transport`
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = retry_statuses
+        self.retry_after_max = retry_after_max
+        # "response": artists/albums embedded in one response are parsed once
+        # and shared; "session": shared across responses through a weak map;
+        # None: every track gets its own copies
+        self.identity_map = identity_map
 
         if item_limit > 10000:
             log.warning(
@@ -236,9 +288,18 @@ class Session:
     def __init__(self, config: Config = Config()):
         self.config = config
         self.request_session = requests.Session()
+        transport.mount(self.request_session, config)
 
         # Objects for keeping the session across all modules.
         self.request = request.Requests(session=self)
+        #: Refreshes the access token ahead of its expiry, see :class:`.TokenManager`
+        self.tokens = tokens.TokenManager(session=self)
+        self._identity_scope = threading.local()
+        self.identity = (
+            identity.IdentityMap(weak=True)
+            if config.identity_map == "session"
+            else None
+        )
         self.genre = genre.Genre(session=self)
 
         self.parse_user = user.User(self, None).parse
@@ -300,6 +361,62 @@ class Session:
         """Parse an artist from the given response."""
         return self.artist().parse_artists(obj)
 
+    @contextmanager
+    def identity_scope(self) -> Iterator[Optional[identity.IdentityMap]]:
+        """Share embedded artists and albums parsed within this block.
+
+        Scopes nest; the outermost one of the current thread is used. With
+        ``Config.identity_map == "session"`` the session-wide map is used
+        instead, with ``None`` nothing is shared.
+        """
+        if self.identity is not None or self.config.identity_map != "response":
+            yield self.identity
+            return
+        current = getattr(self._identity_scope, "map", None)
+        if current is not None:
+            yield current
+            return
+        self._identity_scope.map = identity.IdentityMap()
+        try:
+            yield self._identity_scope.map
+        finally:
+            self._identity_scope.map = None
+
+    def _identity_map(self) -> Optional[identity.IdentityMap]:
+        if self.identity is not None:
+            return self.identity
+        return getattr(self._identity_scope, "map", None)
+
+    def parse_shared_artist(self, obj: JsonObj) -> artist.Artist:
+        """Parse an artist embedded in another object, sharing it within the
+        current :meth:`identity_scope`."""
+        shared = self._identity_map()
+        if shared is None:
+            return self.parse_artist(obj)
+        return shared.get(
+            ("artist", obj["id"], obj.get("type")), lambda: self.parse_artist(obj)
+        )
+
+    def parse_shared_artists(self, obj: List[JsonObj]) -> List[artist.Artist]:
+        """Parse a list of embedded artists, see :meth:`parse_shared_artist`."""
+        return [self.parse_shared_artist(a) for a in obj]
+
+    def parse_shared_album(
+        self,
+        obj: JsonObj,
+        album_artist: artist.Artist,
+        album_artists: List[artist.Artist],
+    ) -> album.Album:
+        """Parse an album embedded in a track, sharing it within the current
+        :meth:`identity_scope`."""
+        def parse() -> album.Album:
+            return self.album().parse(obj, album_artist, album_artists)
+
+        shared = self._identity_map()
+        if shared is None:
+            return parse()
+        return shared.get(("album", obj["id"], album_artist.id), parse)
+
     def parse_mix(self, obj: JsonObj) -> mix.Mix:
         """Parse a mix from the given response."""
         return self.mix().parse(obj)
@@ -406,6 +523,7 @@ class Session:
         self.locale = "en_US"  # TODO Get locale from system configuration
         self.user = user.User(self, user_id=json["userId"]).factory()
 
+        self.tokens.schedule()
         return True
 
     def login_session_file(
@@ -674,6 +792,7 @@ class Session:
         self.user = user.User(self, user_id=json["userId"]).factory()
         self.is_pkce = is_pkce_token
 
+        self.tokens.schedule()
         return True
 
     def _check_link_login(
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Proactive access token refresh.
+
+Classes: :class:`TokenManager`
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import threading
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+if TYPE_CHECKING:
+    from tidalapi.session import Session
+
+log = logging.getLogger(__name__)
+
+
+class TokenManager:
+    """Keeps the access token of a :class:`.Session` valid.
+
+    Once the session knows when its token expires, a timer refreshes it
+    ``margin`` seconds ahead of time. Requests that are about to go out with
+    an expired token call :meth:`ensure_fresh`; concurrent callers share a
+    single in-flight refresh instead of each starting their own.
+
+    :param session: The session whose tokens are managed.
+    :param margin: Seconds before expiry at which the token is refreshed.
+    :param min_validity: A request with less time left than this refreshes
+        first, e.g. when the timer could not fire while the device slept.
+    """
+
+    def __init__(
+        self, session: "Session", margin: float = 300, min_validity: float = 30
+    ):
+        self.session = session
+        self.margin = margin
+        self.min_validity = min_validity
+        #: Called with the session after every successful refresh.
+        self.on_refresh: List[Callable[["Session"], None]] = []
+        self._lock = threading.Lock()
+        self._in_flight: Optional[threading.Event] = None
+        self._result = False
+        self._timer: Optional[threading.Timer] = None
+
+    def expires_in(self) -> Optional[float]:
+        """Seconds until the access token expires, ``None`` if unknown."""
+        expiry = self.session.expiry_time
+        if expiry is None:
+            return None
+        return (expiry - datetime.datetime.utcnow()).total_seconds()
+
+    @property
+    def valid(self) -> bool:
+        """``True`` if there is an access token that has not expired yet."""
+        if not self.session.access_token:
+            return False
+        remaining = self.expires_in()
+        return remaining is None or remaining > 0
+
+    @property
+    def can_refresh(self) -> bool:
+        return bool(self.session.refresh_token)
+
+    def ensure_fresh(self) -> bool:
+        """Refresh now if the token has expired or is about to.
+
+        :return: ``False`` if the token is expired and could not be renewed.
+        """
+        remaining = self.expires_in()
+        if remaining is None or remaining > self.min_validity:
+            return True
+        if not self.can_refresh:
+            return remaining > 0
+        return self.refresh()
+
+    def refresh(self) -> bool:
+        """Refresh the access token, joining a refresh already in progress.
+
+        :return: ``True`` if the token was refreshed.
+        """
+        with self._lock:
+            event = self._in_flight
+            owner = event is None
+            if owner:
+                event = self._in_flight = threading.Event()
+        if not owner:
+            event.wait()
+            return self._result
+
+        result = False
+        try:
+            refresh_token = self.session.refresh_token
+            if refresh_token:
+                result = self.session.token_refresh(refresh_token)
+        except Exception as e:
+            log.warning("Token refresh failed: %s", e)
+            result = False
+        finally:
+            with self._lock:
+                self._result = result
+                self._in_flight = None
+            event.set()
+
+        if result:
+            log.debug("Access token refreshed, expires at %s", self.session.expiry_time)
+            self.schedule()
+            for callback in list(self.on_refresh):
+                try:
+                    callback(self.session)
+                except Exception as e:
+                    log.exception(e)
+        return result
+
+    def schedule(self) -> None:
+        """(Re)arm the background refresh for the current expiry time."""
+        self.cancel()
+        remaining = self.expires_in()
+        if remaining is None or not self.can_refresh:
+            return
+        timer = threading.Timer(max(0.0, remaining - self.margin), self.refresh)
+        timer.daemon = True
+        with self._lock:
+            self._timer = timer
+        timer.start()
+
+    def cancel(self) -> None:
+        """Stop the background refresh."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""Connection pooling and retry policy for the HTTP session.
+
+Classes: :class:`JitterRetry`
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+from typing import TYPE_CHECKING, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from tidalapi.session import Config
+
+log = logging.getLogger(__name__)
+
+#: Hosts that share one pooled, retrying adapter.
+POOLED_HOSTS = ("https://api.tidal.com/", "https://resources.tidal.com/")
+
+#: Only requests that can safely be sent twice are retried.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class JitterRetry(Retry):
+    """A :class:`urllib3.util.retry.Retry` with full-jitter backoff.
+
+    The exponential backoff is randomised between zero and its nominal value,
+    so clients that failed together do not retry in lockstep. A Retry-After
+    header is honoured but capped at ``retry_after_max`` seconds.
+    """
+
+    def __init__(self, *args, retry_after_max: float = 10, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retry_after_max = retry_after_max
+
+    def new(self, **kw) -> "JitterRetry":
+        kw.setdefault("retry_after_max", self.retry_after_max)
+        return super().new(**kw)
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return random.uniform(0, backoff) if backoff > 0 else 0
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        if retry_after > self.retry_after_max:
+            log.debug(
+                "Retry-After of %ss capped at %ss", retry_after, self.retry_after_max
+            )
+        return min(retry_after, self.retry_after_max)
+
+
+def make_retry(config: "Config") -> JitterRetry:
+    """The retry policy described by ``config``."""
+    return JitterRetry(
+        total=config.max_retries,
+        connect=config.max_retries,
+        read=config.max_retries,
+        status=config.max_retries,
+        backoff_factor=config.backoff_factor,
+        status_forcelist=config.retry_statuses,
+        allowed_methods=IDEMPOTENT_METHODS,
+        respect_retry_after_header=True,
+        # Hand the last response back, so the usual HTTP error mapping applies
+        raise_on_status=False,
+        retry_after_max=config.retry_after_max,
+    )
+
+
+def make_adapter(config: "Config") -> HTTPAdapter:
+    """A pooled adapter with the retry policy from ``config``."""
+    return HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        max_retries=make_retry(config),
+    )
+
+
+def mount(request_session: requests.Session, config: "Config") -> HTTPAdapter:
+    """Mount one shared adapter for the TIDAL API and resource hosts.
+
+    Other hosts (login, the audio CDN) keep the default adapters.
+
+    :return: The mounted adapter.
+    """
+    adapter = make_adapter(config)
+    for prefix in POOLED_HOSTS:
+        request_session.mount(prefix, adapter)
+    return adapter
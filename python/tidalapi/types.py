@@ -1,7 +1,7 @@
 # Copyright (C) 2023- The Tidalapi Developers
 
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Callable, Dict, FrozenSet, Type
 
 JsonObj = Dict[str, Any]
 
@@ -13,6 +13,68 @@ def parse_iso_date(value):
     return dateutil.parser.isoparse(value)
 
 
+class LazyField:
+    """A model attribute that is decoded from the raw JSON on first access.
+
+    ``decode(obj, json_obj)`` computes the value from the JSON attached with
+    :func:`set_json`. The result is stored on the instance, so later reads
+    are ordinary attribute lookups and assigning to the attribute works as
+    before. Objects that were never parsed get ``default``.
+    """
+
+    def __init__(self, decode: Callable[[Any, JsonObj], Any], default: Any = None):
+        self.decode = decode
+        self.default = default
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: Any = None) -> Any:
+        if obj is None:
+            return self
+        json_obj = obj.__dict__.get("_json")
+        if json_obj is None:
+            return self.default
+        value = self.decode(obj, json_obj)
+        obj.__dict__[self.name] = value
+        return value
+
+
+def lazy_date(key: str) -> Any:
+    """A :class:`LazyField` holding the ISO date at ``key``, or None."""
+
+    def decode(obj: Any, json_obj: JsonObj) -> Any:
+        value = json_obj.get(key)
+        return parse_iso_date(value) if value else None
+
+    return LazyField(decode)
+
+
+_lazy_names: Dict[Type[Any], FrozenSet[str]] = {}
+
+
+def set_json(obj: Any, json_obj: JsonObj) -> None:
+    """Attach the raw JSON the lazy fields of obj are decoded from.
+
+    Values decoded from a previously parsed JSON are dropped, parse methods
+    call this before anything else.
+    """
+    cls = type(obj)
+    names = _lazy_names.get(cls)
+    if names is None:
+        names = _lazy_names[cls] = frozenset(
+            name
+            for klass in cls.__mro__
+            for name, value in vars(klass).items()
+            if isinstance(value, LazyField)
+        )
+    attrs = obj.__dict__
+    attrs["_json"] = json_obj
+    for name in names:
+        attrs.pop(name, None)
+
+
 class AlbumOrder(Enum):
     Artist = "ARTIST"
     DateAdded = "DATE"
@@ -25,7 +25,7 @@
 from __future__ import annotations
 
 from copy import copy
-from typing import TYPE_CHECKING, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union, cast
 from urllib.parse import urljoin
 
 from tidalapi.exceptions import ObjectNotFound
@@ -39,7 +39,7 @@ from tidalapi.types import (
     PlaylistOrder,
     VideoOrder,
 )
-from tidalapi.workers import get_items
+from tidalapi.workers import get_items, iter_pages
 
 if TYPE_CHECKING:
     from tidalapi.album import Album
@@ -564,6 +564,33 @@ class Favorites:
             self.session.user.favorites.artists, count, order, order_direction
         )
 
+    def artists_pages(
+        self,
+        page_size: int = 100,
+        first_page_size: Optional[int] = None,
+        offset: int = 0,
+        order: Optional[ArtistOrder] = None,
+        order_direction: Optional[OrderDirection] = None,
+    ) -> Iterator[List["Artist"]]:
+        """Get the users favorite artists page by page, fetching each page only when
+        the previous one has been consumed.
+
+        :param page_size: The amount of artists per page.
+        :param first_page_size: Optional; A different size for the first page.
+        :param offset: The index of the first artist you want included.
+        :param order: Optional; A :class:`ArtistOrder` describing the ordering type when returning the user favorite artists. eg.: "NAME, "DATE"
+        :param order_direction: Optional; A :class:`OrderDirection` describing the ordering direction when sorting by `order`. eg.: "ASC", "DESC"
+        :return: An iterator over lists of :class:`~tidalapi.artist.Artist` objects.
+        """
+        return iter_pages(
+            self.artists,
+            order,
+            order_direction,
+            page_size=page_size,
+            first_page_size=first_page_size,
+            offset=offset,
+        )
+
     def artists(
         self,
         limit: Optional[int] = None,
@@ -625,6 +652,33 @@ class Favorites:
             self.session.user.favorites.albums, count, order, order_direction
         )
 
+    def albums_pages(
+        self,
+        page_size: int = 100,
+        first_page_size: Optional[int] = None,
+        offset: int = 0,
+        order: Optional[AlbumOrder] = None,
+        order_direction: Optional[OrderDirection] = None,
+    ) -> Iterator[List["Album"]]:
+        """Get the users favorite albums page by page, fetching each page only when
+        the previous one has been consumed.
+
+        :param page_size: The amount of albums per page.
+        :param first_page_size: Optional; A different size for the first page.
+        :param offset: The index of the first album you want included.
+        :param order: Optional; A :class:`AlbumOrder` describing the ordering type when returning the user favorite albums. eg.: "NAME, "DATE"
+        :param order_direction: Optional; A :class:`OrderDirection` describing the ordering direction when sorting by `order`. eg.: "ASC", "DESC"
+        :return: An iterator over lists of :class:`~tidalapi.album.Album` objects.
+        """
+        return iter_pages(
+            self.albums,
+            order,
+            order_direction,
+            page_size=page_size,
+            first_page_size=first_page_size,
+            offset=offset,
+        )
+
     def albums(
         self,
         limit: Optional[int] = None,
@@ -806,6 +860,33 @@ class Favorites:
             self.session.user.favorites.tracks, count, order, order_direction
         )
 
+    def tracks_pages(
+        self,
+        page_size: int = 100,
+        first_page_size: Optional[int] = None,
+        offset: int = 0,
+        order: Optional[ItemOrder] = None,
+        order_direction: Optional[OrderDirection] = None,
+    ) -> Iterator[List["Track"]]:
+        """Get the users favorite tracks page by page, fetching each page only when
+        the previous one has been consumed.
+
+        :param page_size: The amount of tracks per page.
+        :param first_page_size: Optional; A different size for the first page.
+        :param offset: The index of the first track you want included.
+        :param order: Optional; A :class:`ItemOrder` describing the ordering type when returning the user favorite tracks. eg.: "NAME, "DATE"
+        :param order_direction: Optional; A :class:`OrderDirection` describing the ordering direction when sorting by `order`. eg.: "ASC", "DESC"
+        :return: An iterator over lists of :class:`~tidalapi.media.Track` objects.
+        """
+        return iter_pages(
+            self.tracks,
+            order,
+            order_direction,
+            page_size=page_size,
+            first_page_size=first_page_size,
+            offset=offset,
+        )
+
     def tracks(
         self,
         limit: Optional[int] = None,
@@ -1,6 +1,6 @@
 import logging
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable
+from typing import Callable, Iterator, List, Optional
 
 log = logging.getLogger(__name__)
 
@@ -48,3 +48,35 @@ def get_items(
 
     items = [item for _, item in sorted(items, key=lambda x: x[0])]
     return list(map(parse, items))
+
+
+def iter_pages(
+    func: Callable,
+    *args,
+    page_size: int = 100,
+    first_page_size: Optional[int] = None,
+    offset: int = 0,
+) -> Iterator[List]:
+    """Lazily pages through a function that supports `limit`/`offset` parameters.
+
+    Requests are made one at a time as the iterator is consumed and every page is
+    yielded as soon as it arrives, so callers can show the first page before the
+    rest is fetched. Iteration stops after the first short page, so results are
+    not capped by `Config.item_limit`.
+
+    :param func: The function to page through, called as func(limit, offset, *args)
+    :param page_size: The amount of items requested per page
+    :param first_page_size: (Optional) A different, usually smaller, size for the first page
+    :param offset: The index of the first item
+    :return: An iterator over lists of items
+    """
+    limit = first_page_size or page_size
+    while True:
+        items = func(limit, offset, *args)
+        if not items:
+            return
+        yield items
+        if len(items) < limit:
+            return
+        offset += len(items)
+        limit = page_size
@@ -0,0 +1,6 @@
+# This Python file uses the following encoding: utf-8
+"""Helpers for the tidal.py backend that do not talk to QML directly.
+
+Modules in this package never import pyotherside; tidal.py wires them up
+and hands in the callbacks that emit signals.
+"""
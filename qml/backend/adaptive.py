@@ -0,0 +1,159 @@
+# This Python file uses the following encoding: utf-8
+"""Audio quality per track from the measured throughput.
+
+ThroughputEstimator keeps a moving estimate of the download speed from the
+stream, segment and image downloads the backend makes anyway. Like the
+estimators of adaptive video players it runs two exponentially weighted
+averages, a fast and a slow one, weighted by download time, and reports the
+lower of them: it reacts quickly to a drop and slowly to a recovery.
+
+QualitySelector turns the estimate into a quality below the user's ceiling
+(the configured quality). Switching down needs less margin than switching
+up and a switch up waits for the hold time after the last switch, so the
+quality does not flap between tracks. A stall reported by the player steps
+down at once.
+"""
+
+import threading
+import time
+
+QUALITIES = ("LOW", "HIGH", "LOSSLESS", "HI_RES_LOSSLESS")
+# Typical bit rates in bit/s; FLAC varies with the music
+BITRATES = {
+    "LOW": 96000,
+    "HIGH": 320000,
+    "LOSSLESS": 1100000,
+    "HI_RES_LOSSLESS": 3000000,
+}
+
+
+class _Ewma:
+    """Exponentially weighted average with a half life in units of weight"""
+
+    def __init__(self, half_life):
+        self.half_life = half_life
+        self.value = 0.0
+        self.weight = 0.0
+
+    def add(self, weight, value):
+        alpha = 0.5 ** (weight / self.half_life)
+        self.value = alpha * self.value + (1 - alpha) * value
+        self.weight += weight
+
+    def estimate(self):
+        # corrects the bias towards the initial 0 while there are few samples
+        return self.value / (1 - 0.5 ** (self.weight / self.half_life))
+
+
+class ThroughputEstimator:
+    """Download throughput in bit/s from (bytes, seconds) samples.
+
+    Samples below min_bytes (cover art, API responses) are dominated by
+    latency and ignored; there is no estimate before min_total bytes were
+    measured. Only transfers that run at network speed are meaningful, not
+    ones paced by the player.
+    """
+
+    def __init__(self, fast_half_life=2.0, slow_half_life=10.0,
+                 min_bytes=256 * 1024, min_total=512 * 1024):
+        self.min_bytes = min_bytes
+        self.min_total = min_total
+        self._fast = _Ewma(fast_half_life)
+        self._slow = _Ewma(slow_half_life)
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def add(self, nbytes, seconds):
+        if nbytes < self.min_bytes:
+            return
+        seconds = max(seconds, 0.001)
+        bps = nbytes * 8 / seconds
+        with self._lock:
+            self._fast.add(seconds, bps)
+            self._slow.add(seconds, bps)
+            self._total += nbytes
+
+    def estimate(self):
+        """Estimated bit/s, None while too little was measured"""
+        with self._lock:
+            if self._total < self.min_total:
+                return None
+            return min(self._fast.estimate(), self._slow.estimate())
+
+
+class QualitySelector:
+    """Hysteresis between the qualities of QUALITIES.
+
+    A quality is kept while the throughput exceeds its bit rate times
+    down_margin and the next better one is taken once the throughput
+    exceeds that one's bit rate times up_margin, at most every hold
+    seconds.
+    """
+
+    def __init__(self, up_margin=1.5, down_margin=1.1, hold=30.0, floor="LOW"):
+        self.up_margin = up_margin
+        self.down_margin = down_margin
+        self.hold = hold
+        self.floor = floor
+        self.current = None
+        self._last_switch = None
+        self._stalled = False
+
+    def stalled(self):
+        """The player ran dry: go one quality down with the next track"""
+        self._stalled = True
+
+    def select(self, throughput, ceiling, now=None):
+        """Quality for the next track and why, as a dict for the bridge.
+
+        {quality, previous, throughput, reason}, reason being "start",
+        "hold", "up", "down", "stall", "ceiling" or "unmeasured".
+        """
+        now = time.monotonic() if now is None else now
+        decision = self.peek(throughput, ceiling, now)
+        if str(ceiling) not in QUALITIES:
+            return decision
+        if self._stalled:
+            self._stalled = False
+        if decision["reason"] in ("stall", "down", "up"):
+            self._last_switch = now
+        self.current = decision["quality"]
+        return decision
+
+    def peek(self, throughput, ceiling, now=None):
+        """The decision select() would make, without making it"""
+        now = time.monotonic() if now is None else now
+        ceiling = str(ceiling)
+        if ceiling not in QUALITIES:
+            # a quality the selector knows no bit rate of: leave it alone
+            return {"quality": ceiling, "previous": self.current,
+                    "throughput": throughput, "reason": "ceiling"}
+        top = QUALITIES.index(ceiling)
+        bottom = min(QUALITIES.index(self.floor), top)
+        previous = self.current
+        level = top if previous is None else min(QUALITIES.index(previous), top)
+        level = max(level, bottom)
+        reason = "start" if previous is None else "hold"
+        if previous is not None and QUALITIES.index(previous) > top:
+            reason = "ceiling"
+
+        if self._stalled:
+            if level > bottom:
+                level -= 1
+                reason = "stall"
+        elif throughput is None:
+            if previous is None:
+                reason = "unmeasured"
+        elif throughput < BITRATES[QUALITIES[level]] * self.down_margin and level > bottom:
+            # straight down to the best quality the link sustains
+            while level > bottom and throughput < BITRATES[QUALITIES[level]] * self.down_margin:
+                level -= 1
+            reason = "down"
+        elif (level < top and throughput >= BITRATES[QUALITIES[level + 1]] * self.up_margin
+              and (self._last_switch is None or now - self._last_switch >= self.hold)):
+            level += 1
+            reason = "up"
+
+        return {"quality": QUALITIES[level], "previous": previous,
+                "throughput": None if throughput is None else int(throughput),
+                "reason": reason}
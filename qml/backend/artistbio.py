@@ -0,0 +1,158 @@
+# This Python file uses the following encoding: utf-8
+"""On-demand artist biographies.
+
+Artist dicts are sent to QML without a biography; pages that actually show
+one ask for it by artist id. Lookups are answered from a persistent JSON
+cache first, misses are fetched on a small bounded worker pool and the
+results are delivered as one batch per request.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BioCache:
+    """Persistent artist-id -> biography map stored as one JSON file.
+
+    An empty string is a valid entry and means "this artist has no bio",
+    so artists without one are not asked for again until the entry expires.
+    """
+
+    def __init__(self, path, max_age=30 * 24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def get(self, artist_id):
+        """Return the cached bio, or None if unknown or expired."""
+        with self._lock:
+            entry = self._entries.get(str(artist_id))
+        if entry is None:
+            return None
+        if time.time() - entry[1] > self.max_age:
+            return None
+        return entry[0]
+
+    def put(self, artist_id, bio):
+        with self._lock:
+            self._entries[str(artist_id)] = [bio, time.time()]
+            self._dirty = True
+
+    def flush(self):
+        """Write the cache to disk if it changed since the last flush."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = dict(self._entries)
+            self._dirty = False
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            with self._lock:
+                self._dirty = True
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
+            self._dirty = True
+        self.flush()
+
+
+class BioLoader:
+    """Fetch biographies through a bounded pool and emit them in batches.
+
+    fetch(artist_id) returns the bio text or raises; emit(bios) receives a
+    list of {"artistid": ..., "bio": ...} dicts. Ids already in flight are
+    not fetched twice.
+    """
+
+    def __init__(self, fetch, emit, cache, max_workers=2):
+        self.fetch = fetch
+        self.emit = emit
+        self.cache = cache
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="bio")
+        self._lock = threading.Lock()
+        self._in_flight = set()
+
+    def cached(self, artist_id):
+        return self.cache.get(artist_id)
+
+    def request(self, artist_ids):
+        """Deliver the bios for artist_ids; returns immediately.
+
+        Cached bios go out in one batch right away, the missing ones in a
+        second batch once they have all been fetched.
+        """
+        hits = []
+        missing = []
+        with self._lock:
+            for artist_id in dict.fromkeys(str(a) for a in artist_ids):
+                bio = self.cache.get(artist_id)
+                if bio is not None:
+                    hits.append({"artistid": artist_id, "bio": bio})
+                elif artist_id not in self._in_flight:
+                    self._in_flight.add(artist_id)
+                    missing.append(artist_id)
+        if hits:
+            self.emit(hits)
+        if not missing:
+            return
+        futures = [self._pool.submit(self._fetch_one, a) for a in missing]
+        remaining = [len(futures)]
+
+        def fetched(_):
+            with self._lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            self._loaded(missing, [f.result() if not f.cancelled() else None
+                                   for f in futures])
+
+        for future in futures:
+            future.add_done_callback(fetched)
+
+    def load(self, artist_id):
+        """Fetch one bio on the calling thread and cache it; None on failure."""
+        artist_id = str(artist_id)
+        bio = self._fetch_one(artist_id)
+        if bio is not None:
+            self.cache.put(artist_id, bio)
+            self.cache.flush()
+        return bio
+
+    def _fetch_one(self, artist_id):
+        try:
+            return self.fetch(artist_id)
+        except Exception:
+            return None
+
+    def _loaded(self, artist_ids, bios):
+        """Cache and emit the bios fetched for one request"""
+        with self._lock:
+            self._in_flight.difference_update(artist_ids)
+        batch = []
+        for artist_id, bio in zip(artist_ids, bios):
+            if bio is None:
+                continue
+            self.cache.put(artist_id, bio)
+            batch.append({"artistid": artist_id, "bio": bio})
+        self.cache.flush()
+        if batch:
+            self.emit(batch)
@@ -0,0 +1,288 @@
+# This Python file uses the following encoding: utf-8
+"""Localhost proxy that serves DASH tracks as one progressive stream.
+
+Hi-res tracks come as MPD manifests, i.e. a list of segment URLs with the
+init segment first, which QtMultimedia cannot play. DashProxy registers the
+segments of a track under a http://127.0.0.1 URL and serves their
+concatenation: the segments after the read position are fetched ahead on a
+bounded pool and only a small window of them is held in memory per track.
+
+HTTP Range requests (seeking) are mapped onto segments by their sizes.
+Fetched segments tell their size; the others are probed with HEAD requests
+when the first Range request needs them, so tracks that are registered
+ahead of time or only played through cost no extra requests. Until all
+sizes are known a plain GET is answered without a Content-Length, so the
+start of playback never waits for them.
+
+The server serves any stream with the interface of DashStream, see add()
+and backend.streamcache.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)$")
+
+
+class DashStream:
+    """The segments of one track, their sizes and the read-ahead window"""
+
+    def __init__(self, proxy, urls, content_type):
+        self.proxy = proxy
+        self.urls = list(urls)
+        self.content_type = content_type
+        self.sizes = [None] * len(self.urls)
+        self._lock = threading.Lock()
+        self._segments = OrderedDict()  # n -> bytes, least recently read first
+        self._pending = {}              # n -> Future of the fetch
+        self._sized = threading.Event()
+        self._probing = False
+
+    def length(self):
+        """Total size in bytes, None while a segment size is unknown"""
+        with self._lock:
+            return None if None in self.sizes else sum(self.sizes)
+
+    def _set_size(self, n, size):
+        """Call with self._lock held"""
+        self.sizes[n] = size
+        if None not in self.sizes:
+            self._sized.set()
+
+    def probe(self):
+        """Learn the missing segment sizes in the background"""
+        with self._lock:
+            if self._probing:
+                return
+            self._probing = True
+            todo = [n for n, size in enumerate(self.sizes) if size is None]
+        if not todo:
+            self._sized.set()
+        for n in todo:
+            self.proxy._probes.submit(self._probe, n)
+
+    def _probe(self, n):
+        with self._lock:
+            if self.sizes[n] is not None:
+                return
+        try:
+            size = self.proxy.probe(self.urls[n])
+        except Exception:
+            # no usable HEAD answer, the segment itself tells
+            size = len(self.proxy.fetch(self.urls[n]))
+        with self._lock:
+            self._set_size(n, size)
+
+    def wait_sized(self, timeout=None):
+        self.probe()
+        return self._sized.wait(timeout)
+
+    def locate(self, offset):
+        """(segment, offset within it) of a byte offset; needs the sizes"""
+        n = 0
+        while n < len(self.sizes) and offset >= self.sizes[n]:
+            offset -= self.sizes[n]
+            n += 1
+        return n, offset
+
+    def segment(self, n):
+        """Bytes of segment n; queues the fetches of the next read_ahead"""
+        window = range(n, min(n + 1 + self.proxy.read_ahead, len(self.urls)))
+        with self._lock:
+            # fetches left behind by a seek only take up memory
+            for m in [m for m in self._pending if m not in window]:
+                self._pending.pop(m).cancel()
+            for m in window:
+                if m not in self._segments and m not in self._pending:
+                    self._pending[m] = self.proxy._pool.submit(self.proxy.fetch, self.urls[m])
+            data = self._segments.get(n)
+            if data is not None:
+                self._segments.move_to_end(n)
+                return data
+            future = self._pending[n]
+        try:
+            data = future.result()
+        finally:
+            with self._lock:
+                if self._pending.get(n) is future:
+                    del self._pending[n]
+        with self._lock:
+            self._set_size(n, len(data))
+            self._segments[n] = data
+            # prefetched segments arrive out of band, keep them
+            for m in [m for m in self._pending if self._pending[m].done()]:
+                try:
+                    self._segments[m] = self._pending.pop(m).result()
+                    self._set_size(m, len(self._segments[m]))
+                except Exception:
+                    pass
+            # what lies behind the read position goes first
+            for m in [m for m in self._segments if m not in window]:
+                if len(self._segments) <= self.proxy.read_ahead + 1:
+                    break
+                del self._segments[m]
+        return data
+
+    def copy(self, out, start=0, end=None):
+        """Write bytes start..end (inclusive, None for all) to out"""
+        n, skip = self.locate(start) if start else (0, 0)
+        remaining = None if end is None else end - start + 1
+        while n < len(self.urls) and (remaining is None or remaining > 0):
+            data = self.segment(n)
+            if skip or (remaining is not None and remaining < len(data) - skip):
+                data = memoryview(data)[skip:skip + remaining if remaining is not None else None]
+            out.write(data)
+            if remaining is not None:
+                remaining -= len(data)
+            skip = 0
+            n += 1
+
+    def held(self):
+        """Number of segments in memory (fetched or being fetched)"""
+        with self._lock:
+            return len(self._segments) + len(self._pending)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    proxy = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self._serve(False)
+
+    def do_GET(self):
+        self._serve(True)
+
+    def _serve(self, body):
+        stream = self.proxy.stream(self.path.split("?", 1)[0].rsplit("/", 1)[-1])
+        if stream is None:
+            self.send_error(404)
+            return
+        requested = self.headers.get("Range")
+        if requested:
+            match = _RANGE.match(requested.strip())
+            if match is None or match.groups() == ("", ""):
+                self.send_error(416)
+                return
+            if not stream.wait_sized(self.proxy.timeout):
+                self.send_error(503)
+                return
+            length = stream.length()
+            first, last = match.groups()
+            if first:
+                start = int(first)
+                end = min(int(last), length - 1) if last else length - 1
+            else:
+                # the last `last` bytes
+                start = max(0, length - int(last))
+                end = length - 1
+            if start >= length or end < start:
+                self.send_response(416)
+                self.send_header("Content-Range", "bytes */%d" % length)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", "bytes %d-%d/%d" % (start, end, length))
+            self.send_header("Content-Length", str(end - start + 1))
+        else:
+            start, end = 0, None
+            length = stream.length()
+            self.send_response(200)
+            if length is not None:
+                self.send_header("Content-Length", str(length))
+            else:
+                # the end of the body is the end of the connection
+                self.send_header("Connection", "close")
+                self.close_connection = True
+        self.send_header("Content-Type", stream.content_type)
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        if not body:
+            return
+        try:
+            stream.copy(self.wfile, start, end)
+        except (BrokenPipeError, ConnectionResetError):
+            # the player closed the connection, e.g. to seek
+            self.close_connection = True
+        except Exception:
+            # a segment failed: the response is cut short
+            self.close_connection = True
+
+
+class DashProxy:
+    """HTTP server on 127.0.0.1 for registered DASH tracks and other streams.
+
+    fetch(url) returns the bytes of a segment, probe(url) its size (a HEAD
+    request); both may raise. read_ahead segments after the read position
+    are fetched on a pool of `workers` threads. At most max_streams tracks
+    stay registered. The server starts with the first register().
+    """
+
+    def __init__(self, fetch, probe=None, read_ahead=4, workers=4, max_streams=8,
+                 timeout=20, host="127.0.0.1", port=0):
+        self.fetch = fetch
+        self.probe = probe or (lambda url: len(fetch(url)))
+        self.read_ahead = read_ahead
+        self.max_streams = max_streams
+        self.timeout = timeout
+        self.host = host
+        self.port = port
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dash")
+        self._probes = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dash-probe")
+        self._lock = threading.Lock()
+        self._streams = OrderedDict()   # key -> DashStream
+        self._server = None
+
+    def _start(self):
+        """Call with self._lock held"""
+        if self._server is not None:
+            return
+        handler = type("Handler", (_Handler,), {"proxy": self})
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True,
+                         name="dash-proxy").start()
+
+    def register(self, key, urls, content_type="audio/mp4"):
+        """Local URL that serves the concatenated segments at urls"""
+        return self.add(key, DashStream(self, urls, content_type))
+
+    def add(self, key, stream):
+        """Local URL that serves stream, which needs content_type, length(),
+        wait_sized(timeout) and copy(out, start, end)"""
+        key = str(key)
+        with self._lock:
+            self._start()
+            self._streams.pop(key, None)
+            self._streams[key] = stream
+            while len(self._streams) > self.max_streams:
+                self._streams.popitem(last=False)
+        return "http://%s:%d/%s" % (self.host, self.port, key)
+
+    def serves(self, url):
+        """Whether url points at this proxy"""
+        return self._server is not None and url.startswith(
+            "http://%s:%d/" % (self.host, self.port))
+
+    def stream(self, key):
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is not None:
+                self._streams.move_to_end(key)
+            return stream
+
+    def close(self):
+        with self._lock:
+            server, self._server = self._server, None
+            self._streams.clear()
+        if server is not None:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,327 @@
+# This Python file uses the following encoding: utf-8
+"""Offline downloads of tracks.
+
+A download job resolves the stream of a track into its file URLs (the
+segments of a DASH manifest, or the single file of a BTS one), fetches the
+segments concurrently on a bounded pool and joins them in order into one
+file. Segments are written to disk as they arrive, so a single-file stream
+never sits in memory. Every finished segment is kept as a part file, and the jobs are
+recorded in a JSON journal, so an interrupted download continues where it
+stopped after a restart. Downloads stop at the storage budget.
+
+Playback asks local_file() first, see Tidal.getTrackUrl().
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+class Cancelled(Exception):
+    pass
+
+
+class DownloadManager:
+    """Queue of track downloads below directory.
+
+    resolve(track_id) returns (urls, extension) of the track's stream and
+    fetch(url) an iterable of the byte chunks of one URL; both may raise. emit(event, job) is
+    called with "progress", "done" and "failed" and a copy of the job dict
+    {trackid, info, status, segments, fetched, size, path, error}.
+    """
+
+    def __init__(self, directory, resolve, fetch, emit=None,
+                 budget=2 * 1024 ** 3, segment_workers=4, retries=2,
+                 progress_interval=0.5):
+        self.directory = directory
+        self.resolve = resolve
+        self.fetch = fetch
+        self.emit = emit or (lambda event, job: None)
+        self.budget = budget
+        self.retries = retries
+        self.progress_interval = progress_interval
+        self.journal_path = os.path.join(directory, "jobs.json")
+        self._parts_root = os.path.join(directory, ".parts")
+        os.makedirs(self._parts_root, exist_ok=True)
+        self._pool = ThreadPoolExecutor(max_workers=max(1, segment_workers),
+                                        thread_name_prefix="download")
+        self._cond = threading.Condition()
+        self._jobs = {}             # track id -> job dict
+        self._queue = deque()
+        self._cancelled = set()
+        self._runner = None
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                self._jobs = json.load(f)
+        except (OSError, ValueError):
+            self._jobs = {}
+
+    def _save(self):
+        """Write the journal; call with self._cond held"""
+        tmp = self.journal_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._jobs, f)
+            os.replace(tmp, self.journal_path)
+        except OSError:
+            pass
+
+    def add(self, track_id, info=None):
+        """Queue a track; False if it is downloaded or queued already"""
+        track_id = str(track_id)
+        with self._cond:
+            job = self._jobs.get(track_id)
+            if job is not None and job["status"] in (QUEUED, RUNNING):
+                return False
+            if job is not None and job["status"] == DONE and os.path.exists(job["path"]):
+                return False
+            old = job or {}
+            # a failed job keeps its segment count, so its parts are reused
+            job = {"trackid": track_id, "info": info or old.get("info"),
+                   "status": QUEUED, "segments": old.get("segments", 0),
+                   "fetched": old.get("fetched", 0), "size": old.get("size", 0),
+                   "path": "", "error": "", "added": time.time()}
+            self._jobs[track_id] = job
+            self._cancelled.discard(track_id)
+            self._queue.append(track_id)
+            self._save()
+            self._start()
+            self._cond.notify()
+        return True
+
+    def resume(self):
+        """Queue the jobs an earlier run left unfinished; returns their number"""
+        with self._cond:
+            pending = [t for t, job in sorted(self._jobs.items(), key=lambda j: j[1]["added"])
+                       if job["status"] in (QUEUED, RUNNING) and t not in self._queue]
+            for track_id in pending:
+                self._jobs[track_id]["status"] = QUEUED
+                self._queue.append(track_id)
+            if pending:
+                self._start()
+                self._cond.notify()
+        return len(pending)
+
+    def local_file(self, track_id):
+        """Path of the downloaded file of a track, None if there is none"""
+        with self._cond:
+            job = self._jobs.get(str(track_id))
+            path = job["path"] if job is not None and job["status"] == DONE else None
+        return path if path and os.path.exists(path) else None
+
+    def info(self, track_id):
+        """Track info saved with a job, None if there is none"""
+        with self._cond:
+            job = self._jobs.get(str(track_id))
+            return job["info"] if job is not None else None
+
+    def cancel(self, track_id):
+        """Stop and forget a queued or running download"""
+        track_id = str(track_id)
+        with self._cond:
+            job = self._jobs.get(track_id)
+            if job is None or job["status"] == DONE:
+                return False
+            if job["status"] == RUNNING:
+                # the runner stops at the next chunk
+                self._cancelled.add(track_id)
+            if track_id in self._queue:
+                self._queue.remove(track_id)
+            del self._jobs[track_id]
+            self._save()
+        if job["status"] != RUNNING:
+            shutil.rmtree(self._parts(track_id), ignore_errors=True)
+        return True
+
+    def remove(self, track_id):
+        """Delete a downloaded track (or stop its download)"""
+        track_id = str(track_id)
+        if self.cancel(track_id):
+            return True
+        with self._cond:
+            job = self._jobs.pop(track_id, None)
+            self._save()
+        if job is None:
+            return False
+        try:
+            os.remove(job["path"])
+        except OSError:
+            pass
+        return True
+
+    def jobs(self):
+        with self._cond:
+            return [dict(job) for job in self._jobs.values()]
+
+    def used(self):
+        """Bytes taken by finished downloads and part files"""
+        with self._cond:
+            return sum(job["size"] for job in self._jobs.values())
+
+    def wait_idle(self, timeout=None):
+        """Block until the queue is empty and nothing runs (for tests)"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._cancelled and not any(
+                    j["status"] == RUNNING for j in self._jobs.values()), timeout)
+
+    def _start(self):
+        if self._runner is None or not self._runner.is_alive():
+            self._runner = threading.Thread(target=self._run, daemon=True,
+                                            name="downloads")
+            self._runner.start()
+
+    def _parts(self, track_id):
+        return os.path.join(self._parts_root, track_id)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                track_id = self._queue.popleft()
+                job = self._jobs.get(track_id)
+                if job is None:
+                    continue
+                job["status"] = RUNNING
+                self._save()
+            try:
+                self._download(job)
+            except Cancelled:
+                shutil.rmtree(self._parts(track_id), ignore_errors=True)
+                with self._cond:
+                    self._cancelled.discard(track_id)
+                    self._cond.notify_all()
+                continue
+            except Exception as e:
+                with self._cond:
+                    self._cancelled.discard(track_id)
+                    job["status"] = FAILED
+                    job["error"] = str(e) or type(e).__name__
+                    if isinstance(e, BudgetExceeded):
+                        job["size"] = 0
+                    self._save()
+                    self._cond.notify_all()
+                if isinstance(e, BudgetExceeded):
+                    shutil.rmtree(self._parts(track_id), ignore_errors=True)
+                self.emit("failed", dict(job))
+                continue
+            with self._cond:
+                self._cancelled.discard(track_id)
+                cancelled = self._jobs.get(track_id) is not job
+                job["status"] = DONE
+                job["error"] = ""
+                self._save()
+                self._cond.notify_all()
+            if cancelled:
+                # cancelled while the parts were being joined
+                os.remove(job["path"])
+                continue
+            self.emit("done", dict(job))
+
+    def _check(self, track_id):
+        if track_id in self._cancelled:
+            raise Cancelled(track_id)
+
+    def _download(self, job):
+        track_id = job["trackid"]
+        urls, extension = self.resolve(track_id)
+        urls = list(urls)
+        parts = self._parts(track_id)
+        if job["segments"] != len(urls):
+            # a different manifest (quality changed): start over
+            shutil.rmtree(parts, ignore_errors=True)
+        os.makedirs(parts, exist_ok=True)
+        done = {int(name) for name in os.listdir(parts) if name.isdigit()}
+        with self._cond:
+            job["segments"] = len(urls)
+            job["fetched"] = len(done)
+            job["size"] = sum(os.path.getsize(os.path.join(parts, str(n))) for n in done)
+            self._save()
+        if self.used() > self.budget:
+            raise BudgetExceeded("storage budget exceeded")
+
+        last_progress = 0.0
+        todo = [(n, url) for n, url in enumerate(urls) if n not in done]
+        futures = [(n, self._pool.submit(self._fetch_part, track_id, parts, n, url))
+                   for n, url in todo]
+        try:
+            for n, future in futures:
+                size = future.result()
+                self._check(track_id)
+                with self._cond:
+                    job["fetched"] += 1
+                    job["size"] += size
+                if self.used() > self.budget:
+                    raise BudgetExceeded("storage budget exceeded")
+                now = time.monotonic()
+                if now - last_progress >= self.progress_interval:
+                    last_progress = now
+                    self.emit("progress", dict(job))
+        except BaseException:
+            for _, future in futures:
+                future.cancel()
+            raise
+
+        # join the parts in order, then swap the file in
+        path = os.path.join(self.directory, track_id + extension)
+        tmp = path + ".part"
+        with open(tmp, "wb") as out:
+            for n in range(len(urls)):
+                with open(os.path.join(parts, str(n)), "rb") as part:
+                    shutil.copyfileobj(part, out)
+        os.replace(tmp, path)
+        shutil.rmtree(parts, ignore_errors=True)
+        with self._cond:
+            job["path"] = path
+            job["size"] = os.path.getsize(path)
+
+    def _fetch_part(self, track_id, parts, n, url):
+        """Fetch segment n into its part file; returns its size"""
+        path = os.path.join(parts, str(n))
+        for attempt in range(self.retries + 1):
+            self._check(track_id)
+            try:
+                size = self._write(track_id, url, path + ".tmp")
+                break
+            except Cancelled:
+                raise
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                time.sleep(0.5 * (attempt + 1))
+        os.replace(path + ".tmp", path)
+        return size
+
+    def _write(self, track_id, url, path):
+        """Stream url into path; returns the size. Stops when cancelled"""
+        chunks = self.fetch(url)
+        size = 0
+        try:
+            with open(path, "wb") as f:
+                for chunk in chunks:
+                    self._check(track_id)
+                    f.write(chunk)
+                    size += len(chunk)
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                # ends the HTTP response of a cancelled download
+                close()
+        return size
@@ -0,0 +1,217 @@
+# This Python file uses the following encoding: utf-8
+"""Disk cache of cover art.
+
+The bridge dicts carry resources.tidal.com URLs, which every view used to
+download again through Qt. ImageCache keeps downloaded art on disk, one
+file per image UUID and size, and localize() swaps the URLs of cached
+images for file:// URLs right before a dict goes to QML; the dicts that are
+stored or indexed keep the remote URL. prefetch() downloads art ahead of
+time, e.g. for the upcoming queue.
+
+The files are evicted least recently used first once they exceed the
+byte budget. Their mtime records the last use across restarts. The files
+that went out last as file:// URLs are not evicted, the views may still
+show them; only the most recent of them are kept this way, so a long
+scroll cannot hold the cache over budget.
+"""
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+_TIDAL_IMAGE = re.compile(
+    r"https?://resources\.tidal\.com/images/([0-9a-fA-F/]+)/(\d+x\d+)\.jpg$")
+# A hit only refreshes the file's mtime once it is older than this
+_TOUCH_INTERVAL = 3600
+# Files handed out last that eviction keeps, a few screens of rows
+_PINNED = 256
+
+
+def image_key(url):
+    """File name of a Tidal image URL, None for anything else"""
+    match = _TIDAL_IMAGE.match(url)
+    if match is None:
+        return None
+    return "%s_%s.jpg" % (match.group(1).replace("/", "-").lower(), match.group(2))
+
+
+class ImageCache:
+    """Cover art files below directory, at most budget bytes.
+
+    fetch(url) returns the image bytes or raises. Thread-safe; concurrent
+    prefetches of the same image download it once. The last pinned images
+    handed out are not evicted.
+    """
+
+    def __init__(self, directory, fetch, budget=64 * 1024 * 1024, pinned=_PINNED):
+        self.directory = directory
+        self.fetch = fetch
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._files = OrderedDict()     # key -> [size, mtime], least recent first
+        self._size = 0
+        self._inflight = set()
+        self._handed_out = OrderedDict()  # keys sent last as file:// URLs
+        self.pinned = pinned
+        self.hits = 0
+        self.downloads = 0
+        os.makedirs(directory, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".jpg"):
+                st = entry.stat()
+                entries.append((st.st_mtime, entry.name, st.st_size))
+            elif entry.name.endswith(".part"):
+                # left over by an interrupted download
+                os.remove(entry.path)
+        for mtime, name, size in sorted(entries):
+            self._files[name] = [size, mtime]
+            self._size += size
+
+    def path(self, key):
+        return os.path.join(self.directory, key)
+
+    def local(self, url):
+        """file:// URL of the cached image of url, None if it is not cached"""
+        key = image_key(url) if isinstance(url, str) else None
+        if key is None:
+            return None
+        touch = False
+        now = time.time()
+        with self._lock:
+            entry = self._files.get(key)
+            if entry is None:
+                return None
+            self._files.move_to_end(key)
+            self._handed_out[key] = True
+            self._handed_out.move_to_end(key)
+            if len(self._handed_out) > self.pinned:
+                self._handed_out.popitem(last=False)
+            self.hits += 1
+            if now - entry[1] > _TOUCH_INTERVAL:
+                entry[1] = now
+                touch = True
+        if touch:
+            try:
+                os.utime(self.path(key))
+            except OSError:
+                pass
+        return "file://" + self.path(key)
+
+    def localize(self, data):
+        """data with cached "image" URLs replaced, copied only where needed"""
+        if not self._files:
+            return data
+        if isinstance(data, list):
+            items = [self.localize(item) for item in data]
+            return items if any(a is not b for a, b in zip(items, data)) else data
+        if not isinstance(data, dict):
+            return data
+        changes = {}
+        for name, value in data.items():
+            if name == "image":
+                local = self.local(value)
+                if local is not None:
+                    changes[name] = local
+            elif isinstance(value, (list, dict)):
+                localized = self.localize(value)
+                if localized is not value:
+                    changes[name] = localized
+        return dict(data, **changes) if changes else data
+
+    def prefetch(self, urls, cancelled=None):
+        """Download the images of urls that are not cached yet.
+
+        Returns the number downloaded; cancelled() is checked between
+        downloads. Failed downloads are skipped.
+        """
+        todo = OrderedDict()
+        for url in urls:
+            key = image_key(url) if isinstance(url, str) else None
+            if key is not None:
+                todo.setdefault(key, url)
+        with self._lock:
+            todo = OrderedDict((k, u) for k, u in todo.items()
+                               if k not in self._files and k not in self._inflight)
+            self._inflight.update(todo)
+        done = 0
+        try:
+            for key, url in todo.items():
+                if cancelled is not None and cancelled():
+                    break
+                try:
+                    content = self.fetch(url)
+                except Exception:
+                    continue
+                self._store(key, content)
+                done += 1
+        finally:
+            with self._lock:
+                self._inflight.difference_update(todo)
+        return done
+
+    def _store(self, key, content):
+        path = self.path(key)
+        part = "%s.%d.part" % (path, threading.get_ident())
+        with open(part, "wb") as f:
+            f.write(content)
+        os.replace(part, path)
+        with self._lock:
+            old = self._files.pop(key, None)
+            if old is not None:
+                self._size -= old[0]
+            self._files[key] = [len(content), time.time()]
+            self._size += len(content)
+            self.downloads += 1
+            evicted = self._evict(keep=key)
+        for name in evicted:
+            try:
+                os.remove(self.path(name))
+            except OSError:
+                pass
+
+    def _evict(self, keep=None):
+        """Drop least recently used entries over budget; returns their keys"""
+        evicted = []
+        for name in list(self._files):
+            if self._size <= self.budget:
+                break
+            if name == keep or name in self._handed_out:
+                continue
+            size, _ = self._files.pop(name)
+            self._size -= size
+            evicted.append(name)
+        return evicted
+
+    def set_budget(self, budget):
+        with self._lock:
+            self.budget = budget
+            evicted = self._evict()
+        for name in evicted:
+            try:
+                os.remove(self.path(name))
+            except OSError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            return {"files": len(self._files), "bytes": self._size,
+                    "budget": self.budget, "hits": self.hits,
+                    "downloads": self.downloads}
+
+    def clear(self):
+        with self._lock:
+            names = list(self._files)
+            self._files.clear()
+            self._handed_out.clear()
+            self._size = 0
+        for name in names:
+            try:
+                os.remove(self.path(name))
+            except OSError:
+                pass
@@ -0,0 +1,74 @@
+# This Python file uses the following encoding: utf-8
+"""Deferred module imports and attributes.
+
+The backend is imported before the first page can talk to Python, so large
+dependencies (requests and everything below tidalapi.session) are bound to
+lazy module objects and only executed on first attribute access. preload()
+warms them up in the background once the UI is up. lazy_property does the
+same for attributes that open files, e.g. the on-disk caches.
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+
+# Imported by preload(); together they pull in requests, urllib3 and all
+# tidalapi models.
+HEAVY_MODULES = ("requests", "tidalapi.session")
+
+
+def lazy_import(name):
+    """Return module name, executing it on first attribute access."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def preload(names=HEAVY_MODULES, done=None):
+    """Import names in a daemon thread; done() is called afterwards."""
+    def run():
+        for name in names:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
+        if done is not None:
+            done()
+    thread = threading.Thread(target=run, name="preload", daemon=True)
+    thread.start()
+    return thread
+
+
+class lazy_property:
+    """Attribute computed by the decorated method on first access.
+
+    The value is stored on the instance, so it can also be assigned (tests
+    swap in their own stores). Creation is serialized, concurrent first
+    accesses get the same object.
+    """
+
+    def __init__(self, create):
+        self.create = create
+        self.name = create.__name__
+        self.__doc__ = create.__doc__
+        self._lock = threading.Lock()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with self._lock:
+            try:
+                return instance.__dict__[self.name]
+            except KeyError:
+                value = instance.__dict__[self.name] = self.create(instance)
+                return value
@@ -0,0 +1,190 @@
+# This Python file uses the following encoding: utf-8
+"""Offline full-text index of the user's library.
+
+Every track, album, artist and playlist dict that goes to QML through a
+cache* or favorites batch is also upserted into a small SQLite database,
+so search can show local hits in a few milliseconds, before the network
+answers and without any network at all.
+
+The text columns live in an FTS5 table (external content, kept in sync by
+triggers) with prefix indexes, so "radioh" already finds Radiohead. SQLite
+builds without FTS5 fall back to LIKE over the plain table, which is
+slower and does not fold diacritics, but fine for a personal library.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+
+# Bridge dict "type" -> (result category, id field), see backend.projection
+KINDS = {
+    "track": ("tracks", "trackid"),
+    "album": ("albums", "albumid"),
+    "artist": ("artists", "artistid"),
+    "playlist": ("playlists", "playlistid"),
+    "video": ("videos", "videoid"),
+}
+CATEGORIES = ("tracks", "artists", "albums", "playlists", "videos", "mixes")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    title TEXT NOT NULL,
+    artist TEXT NOT NULL DEFAULT '',
+    album TEXT NOT NULL DEFAULT '',
+    favorite INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_seen ON items (favorite, seen);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    title, artist, album,
+    content='items', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts (rowid, title, artist, album)
+    VALUES (new.id, new.title, new.artist, new.album);
+END;
+CREATE TRIGGER IF NOT EXISTS items_ad AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, title, artist, album)
+    VALUES ('delete', old.id, old.title, old.artist, old.album);
+END;
+CREATE TRIGGER IF NOT EXISTS items_au AFTER UPDATE OF title, artist, album ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, title, artist, album)
+    VALUES ('delete', old.id, old.title, old.artist, old.album);
+    INSERT INTO items_fts (rowid, title, artist, album)
+    VALUES (new.id, new.title, new.artist, new.album);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO items (key, kind, title, artist, album, favorite, data, seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    title = excluded.title, artist = excluded.artist, album = excluded.album,
+    favorite = max(favorite, excluded.favorite),
+    data = excluded.data, seen = excluded.seen
+"""
+
+
+def item_key(info):
+    """"<type>:<id>" of a bridge dict, None if it is not indexed"""
+    kind = KINDS.get(info.get("type"))
+    if kind is None or info.get(kind[1]) in (None, ""):
+        return None
+    return "%s:%s" % (info["type"], info[kind[1]])
+
+
+def _words(query):
+    return re.findall(r"\w+", str(query).lower())
+
+
+class LibraryIndex:
+    """Thread-safe SQLite index of bridge dicts.
+
+    add() upserts a batch in one transaction, search() returns a results
+    dict like backend.projection.Projector.search(), favorites first.
+    fts is False when the SQLite build lacks FTS5 (or use_fts is False)
+    and LIKE is used.
+    """
+
+    def __init__(self, path, max_items=20000, use_fts=True):
+        self.path = path
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            self._db.executescript(_SCHEMA)
+            self.fts = False
+            if use_fts:
+                try:
+                    self._db.executescript(_FTS_SCHEMA)
+                    self.fts = True
+                except sqlite3.OperationalError:
+                    pass
+        self.prune()
+
+    def add(self, infos, favorite=False):
+        """Index bridge dicts; items of unknown type are skipped"""
+        now = time.time()
+        rows = []
+        for info in infos:
+            if not isinstance(info, dict):
+                continue
+            key = item_key(info)
+            if key is None:
+                continue
+            title = info.get("title") or info.get("name") or ""
+            # artists are found by their name, which is their title
+            artist = info.get("artist") or ""
+            rows.append((key, info["type"], str(title), str(artist),
+                         str(info.get("album") or ""), int(bool(favorite)),
+                         json.dumps(info), now))
+        if not rows:
+            return 0
+        with self._lock, self._db:
+            self._db.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def set_favorite(self, kind, item_id, favorite):
+        with self._lock, self._db:
+            self._db.execute("UPDATE items SET favorite = ? WHERE key = ?",
+                             (int(bool(favorite)), "%s:%s" % (kind, item_id)))
+
+    def search(self, query, limit=20):
+        """Results dict of the items matching every word of query as a prefix"""
+        results = {category: [] for category in CATEGORIES}
+        words = _words(query)
+        if not words:
+            return results
+        if self.fts:
+            sql = ("SELECT items.kind, items.data FROM items_fts"
+                   " JOIN items ON items.id = items_fts.rowid"
+                   " WHERE items_fts MATCH ?"
+                   " ORDER BY items.favorite DESC, bm25(items_fts) LIMIT ?")
+            args = [" ".join('"%s"*' % w for w in words)]
+        else:
+            # word prefixes, like the FTS query
+            match = " AND ".join(["(' ' || title || ' ' || artist || ' ' || album) LIKE ?"]
+                                 * len(words))
+            sql = ("SELECT kind, data FROM items WHERE %s"
+                   " ORDER BY favorite DESC, seen DESC LIMIT ?" % match)
+            args = ["% " + w + "%" for w in words]
+        # enough rows for every category to fill up
+        args.append(limit * len(KINDS))
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        for kind, data in rows:
+            items = results[KINDS[kind][0]]
+            if len(items) < limit:
+                items.append(json.loads(data))
+        return results
+
+    def count(self):
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM items").fetchone()[0]
+
+    def prune(self):
+        """Forget the least recently seen non-favorites beyond max_items"""
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM items WHERE id IN (SELECT id FROM items WHERE favorite = 0"
+                " ORDER BY seen DESC LIMIT -1 OFFSET ?)", (self.max_items,))
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM items")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
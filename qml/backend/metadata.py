@@ -0,0 +1,189 @@
+# This Python file uses the following encoding: utf-8
+"""Persistent metadata cache of tracks, albums, artists, playlists and mixes.
+
+Replaces the LocalStorage tables of TidalCache.qml, which stored every item
+as a JSON string written and parsed on the UI thread. Here the bridge dicts
+are upserted in bulk by the loaders that send them, the fields the UI
+shows, sorts and filters on get typed columns and only the rest is kept as
+JSON. QML asks for the items it misses in batches, see
+Tidal.lookupCached().
+
+Rows older than max_age are pruned by a background thread. Rows older than
+ttl are still served, the caller refreshes them.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+# kind -> (table, id field, id column type, typed columns)
+TABLES = {
+    "track": ("tracks", "trackid", "TEXT", (
+        ("title", "TEXT"), ("artist", "TEXT"), ("artistid", "TEXT"),
+        ("album", "TEXT"), ("albumid", "INTEGER"), ("duration", "INTEGER"),
+        ("track_num", "INTEGER"), ("image", "TEXT"))),
+    "album": ("albums", "albumid", "INTEGER", (
+        ("title", "TEXT"), ("artist", "TEXT"), ("artistid", "TEXT"),
+        ("duration", "INTEGER"), ("num_tracks", "INTEGER"), ("year", "INTEGER"),
+        ("image", "TEXT"))),
+    "artist": ("artists", "artistid", "TEXT", (
+        ("name", "TEXT"), ("image", "TEXT"), ("bio", "TEXT"))),
+    "playlist": ("playlists", "playlistid", "TEXT", (
+        ("title", "TEXT"), ("image", "TEXT"), ("duration", "INTEGER"),
+        ("num_tracks", "INTEGER"))),
+    "mix": ("mixes", "mixid", "TEXT", (
+        ("title", "TEXT"), ("image", "TEXT"), ("duration", "INTEGER"),
+        ("num_tracks", "INTEGER"))),
+}
+# Columns an update must not blank out: bios are loaded lazily, so most
+# artist dicts arrive without one
+_KEEP = {"bio"}
+# Fields that are not stored, "timestamp" is set from the updated column
+_DROP = {"timestamp", "fromSearch"}
+
+
+def _schema(kind):
+    table, _, id_type, columns = TABLES[kind]
+    cols = "".join(", %s %s" % c for c in columns)
+    return ("CREATE TABLE IF NOT EXISTS %s (id %s PRIMARY KEY%s, extra TEXT,"
+            " updated INTEGER NOT NULL) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS %s_updated ON %s (updated);"
+            % (table, id_type, cols, table, table))
+
+
+def _upsert(kind):
+    table, _, _, columns = TABLES[kind]
+    names = [c[0] for c in columns]
+    updates = ["%s = coalesce(nullif(excluded.%s, ''), %s)" % (n, n, n) if n in _KEEP
+               else "%s = excluded.%s" % (n, n) for n in names + ["extra", "updated"]]
+    return ("INSERT INTO %s (id, %s, extra, updated) VALUES (%s)"
+            " ON CONFLICT (id) DO UPDATE SET %s"
+            % (table, ", ".join(names),
+               ", ".join("?" * (len(names) + 3)), ", ".join(updates)))
+
+
+class MetadataStore:
+    """Thread-safe SQLite store of bridge dicts per kind.
+
+    put() upserts a batch in one transaction, get() returns the stored
+    dicts with a "timestamp" in ms of their last update.
+    """
+
+    def __init__(self, path, ttl=24 * 3600, max_age=30 * 24 * 3600):
+        self.path = path
+        self.ttl = ttl
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            for kind in TABLES:
+                self._db.executescript(_schema(kind))
+        self._upserts = {kind: _upsert(kind) for kind in TABLES}
+        self._selects = {
+            kind: "SELECT id, %s, extra, updated FROM %s WHERE id IN (%%s)"
+                  % (", ".join(c[0] for c in columns), table)
+            for kind, (table, _, _, columns) in TABLES.items()
+        }
+        self._pruner = None
+        self._stop = threading.Event()
+
+    def put(self, kind, infos, now=None):
+        """Upsert bridge dicts of one kind; returns the number stored"""
+        _, id_field, _, columns = TABLES[kind]
+        names = [c[0] for c in columns]
+        updated = int((time.time() if now is None else now) * 1000)
+        rows = []
+        for info in infos:
+            if not isinstance(info, dict) or info.get(id_field) in (None, ""):
+                continue
+            extra = {k: v for k, v in info.items()
+                     if k != id_field and k not in names and k not in _DROP}
+            rows.append([info[id_field]] + [info.get(n) for n in names]
+                        + [json.dumps(extra, separators=(",", ":")) if extra else None,
+                           updated])
+        if not rows:
+            return 0
+        with self._lock, self._db:
+            self._db.executemany(self._upserts[kind], rows)
+        return len(rows)
+
+    def get(self, kind, ids):
+        """Stored dicts of the given ids, in no particular order"""
+        _, id_field, _, columns = TABLES[kind]
+        names = [c[0] for c in columns]
+        ids = list(ids)
+        rows = []
+        with self._lock:
+            # stay below SQLITE_MAX_VARIABLE_NUMBER of old builds
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                sql = self._selects[kind] % ", ".join("?" * len(chunk))
+                rows.extend(self._db.execute(sql, chunk).fetchall())
+        infos = []
+        for row in rows:
+            info = json.loads(row[-2]) if row[-2] else {}
+            info[id_field] = row[0]
+            info.update(zip(names, row[1:-2]))
+            info["timestamp"] = row[-1]
+            infos.append(info)
+        return infos
+
+    def is_fresh(self, info):
+        return time.time() * 1000 - info["timestamp"] < self.ttl * 1000
+
+    def set_bios(self, bios):
+        """Store lazily loaded bios, a list of {artistid, bio}"""
+        rows = [(b["bio"], b["artistid"]) for b in bios if b.get("bio")]
+        if rows:
+            with self._lock, self._db:
+                self._db.executemany("UPDATE artists SET bio = ? WHERE id = ?", rows)
+
+    def prune(self, now=None):
+        """Delete rows older than max_age; returns the number deleted"""
+        cutoff = int(((time.time() if now is None else now) - self.max_age) * 1000)
+        deleted = 0
+        with self._lock, self._db:
+            for table, _, _, _ in TABLES.values():
+                deleted += self._db.execute(
+                    "DELETE FROM %s WHERE updated < ?" % table, (cutoff,)).rowcount
+        return deleted
+
+    def start_pruning(self, interval=3600, delay=5):
+        """Prune after delay seconds and then every interval on a daemon thread"""
+        if self._pruner is not None:
+            return
+
+        def run():
+            wait = delay
+            while not self._stop.wait(wait):
+                try:
+                    self.prune()
+                except sqlite3.Error:
+                    pass
+                wait = interval
+
+        self._pruner = threading.Thread(target=run, daemon=True, name="metadata-prune")
+        self._pruner.start()
+
+    def stats(self):
+        """Row count and oldest/newest update (ms) per table"""
+        stats = {}
+        with self._lock:
+            for kind, (table, _, _, _) in TABLES.items():
+                count, oldest, newest = self._db.execute(
+                    "SELECT count(*), min(updated), max(updated) FROM %s" % table).fetchone()
+                stats[table] = {"count": count, "oldest": oldest, "newest": newest}
+        return stats
+
+    def clear(self):
+        with self._lock, self._db:
+            for table, _, _, _ in TABLES.values():
+                self._db.execute("DELETE FROM %s" % table)
+
+    def close(self):
+        self._stop.set()
+        with self._lock:
+            self._db.close()
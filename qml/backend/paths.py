@@ -0,0 +1,39 @@
+# This Python file uses the following encoding: utf-8
+"""Location of the on-disk caches and data used by the Python backend."""
+
+import os
+
+APP_NAME = "harbour-tidalplayer"
+
+
+def cache_dir():
+    """Return (and create) the per-user cache directory of the app."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    path = os.path.join(base, APP_NAME, APP_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cache_path(*parts):
+    """Join parts below cache_dir(), creating intermediate directories."""
+    path = os.path.join(cache_dir(), *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def data_dir():
+    """Return (and create) the per-user data directory of the app.
+
+    Unlike the cache, its content (downloads) is not to be thrown away.
+    """
+    base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    path = os.path.join(base, APP_NAME, APP_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def data_path(*parts):
+    """Join parts below data_dir(), creating intermediate directories."""
+    path = os.path.join(data_dir(), *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
@@ -0,0 +1,160 @@
+# This Python file uses the following encoding: utf-8
+"""Raw API JSON -> bridge dicts, without building tidalapi objects.
+
+List views only need a handful of fields per row, yet the object path
+parses every item into Track/Album/Artist objects (with embedded albums and
+artists) and then copies those fields out again in Tidal.handle_*(). The
+projectors here read the same fields straight from the JSON and produce the
+same dicts. Every projector can be passed as parse= to
+Requests.map_request() / map_json(), which also unwraps the {"item": ...}
+envelopes of favorites and playlist responses.
+
+Items the object path would drop (missing album, no usable picture) are
+projected to None as well.
+"""
+
+IMAGE_URL = "https://resources.tidal.com/images/%s/%ix%i.jpg"
+DEFAULT_ALBUM_IMG = "0dfd3368-3aa1-49a3-935f-10ffb39803c0"
+DEFAULT_ARTIST_IMG = "1e01cdb6-f15d-4d8b-8440-a047976c1cac"
+DEFAULT_MIX_IMAGE = "image://theme/icon-m-media-playlists"
+
+
+def _year(value):
+    """Year of an ISO date string, 0 if there is none"""
+    try:
+        return int(value[:4])
+    except (TypeError, ValueError):
+        return 0
+
+
+class Projector:
+    """Bridge dicts in the schema of Tidal.handle_track() and friends."""
+
+    def __init__(self, image_url=IMAGE_URL, size=320):
+        self.image_url = image_url
+        self.size = size
+
+    def image(self, uuid, size=None):
+        size = size or self.size
+        return self.image_url % (uuid.replace("-", "/"), size, size)
+
+    def track(self, json_obj):
+        album = json_obj.get("album")
+        artist = json_obj.get("artist")
+        if artist is None:
+            artists = json_obj.get("artists")
+            if not artists:
+                return None
+            artist = artists[0]
+        if not album:
+            return None
+        return {
+            "trackid": str(json_obj["id"]),
+            "title": str(json_obj["title"]),
+            "artist": str(artist["name"]),
+            "artistid": str(artist["id"]),
+            "album": str(album["title"]),
+            "duration": int(json_obj["duration"]),
+            "image": self.image(album.get("cover") or DEFAULT_ALBUM_IMG),
+            "track_num": json_obj["trackNumber"],
+            "type": "track",
+            "albumid": album["id"],
+        }
+
+    def video(self, json_obj):
+        album = json_obj.get("album")
+        artist = json_obj.get("artist")
+        if not album or not artist:
+            return None
+        return {
+            "videoid": str(json_obj["id"]),
+            "title": str(json_obj["title"]),
+            "artist": str(artist["name"]),
+            "artistid": str(artist["id"]),
+            "album": str(album["title"]),
+            "duration": int(json_obj["duration"]),
+            "image": self.image(album.get("cover") or DEFAULT_ALBUM_IMG),
+            "track_num": json_obj.get("trackNumber"),
+            "type": "video",
+            "albumid": album["id"],
+        }
+
+    def media(self, json_obj):
+        """Track or video, chosen like Session.parse_media()"""
+        if json_obj.get("type") in (None, "Track"):
+            return self.track(json_obj)
+        return self.video(json_obj)
+
+    def album(self, json_obj):
+        artist = json_obj.get("artist")
+        if artist is None:
+            artists = json_obj.get("artists")
+            if not artists:
+                return None
+            artist = artists[0]
+        return {
+            "albumid": int(json_obj["id"]),
+            "title": str(json_obj["title"]),
+            "artist": str(artist["name"]),
+            "artistid": str(artist["id"]),
+            "image": self.image(json_obj.get("cover") or DEFAULT_ALBUM_IMG),
+            "duration": int(json_obj.get("duration") or 0),
+            "num_tracks": int(json_obj.get("numberOfTracks") or 0),
+            "year": _year(json_obj.get("releaseDate") or json_obj.get("streamStartDate")),
+            "type": "album",
+        }
+
+    def artist(self, json_obj, bio=""):
+        return {
+            "artistid": str(json_obj["id"]),
+            "name": str(json_obj["name"]),
+            "image": self.image(json_obj.get("picture") or DEFAULT_ARTIST_IMG),
+            "type": "artist",
+            "bio": bio or "",
+        }
+
+    def playlist(self, json_obj):
+        square = json_obj.get("squareImage")
+        if square:
+            image = self.image(square)
+        elif json_obj.get("image"):
+            image = self.image_url % (json_obj["image"].replace("-", "/"), 1080, 720)
+        else:
+            return None
+        return {
+            "playlistid": str(json_obj["uuid"]),
+            "title": str(json_obj["title"]),
+            "image": image,
+            "duration": int(json_obj.get("duration") or 0),
+            "num_tracks": int(json_obj.get("numberOfTracks") or 0),
+            "description": json_obj.get("description") or "",
+            "type": "playlist",
+        }
+
+    def search(self, json_obj):
+        """Lists of bridge dicts per category of a search response"""
+        categories = (
+            ("tracks", self.track),
+            ("artists", self.artist),
+            ("albums", self.album),
+            ("playlists", self.playlist),
+            ("videos", self.video),
+        )
+        results = {"mixes": []}
+        for name, project in categories:
+            items = (json_obj.get(name) or {}).get("items") or []
+            results[name] = [info for info in map(project, items) if info]
+        return results
+
+    @staticmethod
+    def paged_list_items(page_json):
+        """Items of the first paged list of a pages/... response
+
+        The mix page keeps its tracks there, after the mix header row.
+        """
+        for row in page_json.get("rows") or []:
+            for module in row.get("modules") or []:
+                paged = module.get("pagedList")
+                if paged and paged.get("items") is not None:
+                    return paged["items"]
+        return []
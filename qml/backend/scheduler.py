@@ -0,0 +1,190 @@
+# This Python file uses the following encoding: utf-8
+"""Priority scheduling of backend calls.
+
+pyotherside runs every call from QML on one worker thread, so a long
+playlist load used to delay the stream URL the player was waiting for.
+QML now hands calls to Scheduler.submit() and gets control back at once;
+the calls run on a small pool of daemon threads, highest priority first.
+
+Background work never occupies more than background_workers threads, so
+playback and interactive calls always find a free worker; interactive and
+background work together leave one worker to playback calls. Every call
+has a request id that can be cancelled. Calls submitted with a group supersede
+the older calls of that group: queued ones are dropped, running ones are
+flagged and can stop early by checking cancelled().
+"""
+
+import heapq
+import itertools
+import threading
+
+PLAYBACK = 0
+INTERACTIVE = 1
+BACKGROUND = 2
+
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "error"
+
+
+class Task:
+    __slots__ = ("id", "priority", "seq", "fn", "args", "group", "done",
+                 "cancelled", "running")
+
+    def __init__(self, request_id, priority, seq, fn, args, group, done):
+        self.id = request_id
+        self.priority = priority
+        self.seq = seq
+        self.fn = fn
+        self.args = args
+        self.group = group
+        self.done = done
+        self.cancelled = False
+        self.running = False
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class Scheduler:
+    """Bounded worker pool running calls in priority order.
+
+    done(request_id, status, result) is called on the worker thread once a
+    call has finished, failed or been cancelled; status is one of DONE,
+    CANCELLED or FAILED (result is the exception then).
+    """
+
+    def __init__(self, max_workers=4, background_workers=2):
+        self.max_workers = max(1, max_workers)
+        # at least one worker stays free for playback/interactive calls,
+        # and one for playback calls alone
+        self.background_workers = max(1, min(background_workers, self.max_workers - 1))
+        self.shared_workers = max(1, self.max_workers - 1)
+        self._cond = threading.Condition()
+        self._queue = []
+        self._tasks = {}        # request id -> Task, queued or running
+        self._groups = {}       # group -> newest Task of that group
+        self._seq = itertools.count()
+        self._running_background = 0
+        self._running_shared = 0    # interactive and background calls
+        self._workers = []
+        self._local = threading.local()
+
+    def submit(self, fn, args=(), priority=INTERACTIVE, group=None,
+               request_id=None, done=None):
+        """Queue fn(*args) and return its request id"""
+        dropped = []
+        with self._cond:
+            seq = next(self._seq)
+            if request_id is None:
+                request_id = "job-%d" % seq
+            task = Task(request_id, priority, seq, fn, tuple(args), group, done)
+            if group is not None:
+                older = self._groups.get(group)
+                if older is not None and self._cancel(older):
+                    dropped.append(older)
+                self._groups[group] = task
+            self._tasks[request_id] = task
+            heapq.heappush(self._queue, task)
+            self._start_worker()
+            self._cond.notify()
+        for older in dropped:
+            self._finish(older, CANCELLED, None)
+        return request_id
+
+    def cancel(self, request_id):
+        """Cancel a queued or running call; False if it is unknown/finished"""
+        with self._cond:
+            task = self._tasks.get(request_id)
+            if task is None:
+                return False
+            dropped = self._cancel(task)
+        if dropped:
+            self._finish(task, CANCELLED, None)
+        return True
+
+    def cancelled(self):
+        """True if the call running on this thread has been cancelled"""
+        task = getattr(self._local, "task", None)
+        return task is not None and task.cancelled
+
+    def pending(self):
+        """Number of queued and running calls"""
+        with self._cond:
+            return len(self._tasks)
+
+    def _cancel(self, task):
+        """Flag task; returns True if it was still queued and is now dropped"""
+        task.cancelled = True
+        if task.running:
+            return False
+        self._forget(task)
+        return True
+
+    def _forget(self, task):
+        self._tasks.pop(task.id, None)
+        if task.group is not None and self._groups.get(task.group) is task:
+            del self._groups[task.group]
+
+    def _start_worker(self):
+        if len(self._workers) < self.max_workers and len(self._workers) < len(self._tasks):
+            worker = threading.Thread(target=self._work, daemon=True,
+                                      name="sched-%d" % len(self._workers))
+            self._workers.append(worker)
+            worker.start()
+
+    def _next(self):
+        """Pop the next runnable task, None if there is none"""
+        while self._queue:
+            task = self._queue[0]
+            if task.cancelled:
+                heapq.heappop(self._queue)
+                continue
+            # the queue is ordered by priority: a task on top that has to
+            # wait means there is nothing else to run
+            if task.priority > PLAYBACK and self._running_shared >= self.shared_workers:
+                return None
+            if (task.priority >= BACKGROUND
+                    and self._running_background >= self.background_workers):
+                return None
+            heapq.heappop(self._queue)
+            task.running = True
+            if task.priority > PLAYBACK:
+                self._running_shared += 1
+            if task.priority >= BACKGROUND:
+                self._running_background += 1
+            return task
+        return None
+
+    def _work(self):
+        while True:
+            with self._cond:
+                task = self._next()
+                while task is None:
+                    self._cond.wait()
+                    task = self._next()
+            self._local.task = task
+            try:
+                result = task.fn(*task.args)
+            except Exception as e:
+                status, result = FAILED, e
+            else:
+                status = CANCELLED if task.cancelled else DONE
+            finally:
+                self._local.task = None
+                with self._cond:
+                    if task.priority > PLAYBACK:
+                        self._running_shared -= 1
+                    if task.priority >= BACKGROUND:
+                        self._running_background -= 1
+                    self._forget(task)
+                    self._cond.notify_all()
+            self._finish(task, status, result)
+
+    @staticmethod
+    def _finish(task, status, result):
+        if task.done is not None:
+            try:
+                task.done(task.id, status, result)
+            except Exception:
+                pass
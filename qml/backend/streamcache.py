@@ -0,0 +1,296 @@
+# This Python file uses the following encoding: utf-8
+"""Read-through disk cache of progressive streams.
+
+Every time a track is replayed, sought backwards or crossfaded into itself
+the player downloads it again from the CDN URL. CachedStream is served by
+the localhost proxy (backend.dashproxy) instead: the bytes it fetches are
+written into a sparse file per track and quality, and RangeCache records
+which byte ranges of it are there. Reads are answered from the file where
+possible and only the gaps go to the network.
+
+The files are evicted least recently used first once the cached bytes
+exceed the budget, except those a CachedStream is reading from. The ranges
+are journaled in index.json.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+# Bytes read from the file per write to the player
+_CHUNK = 256 * 1024
+
+
+def _add_range(ranges, start, end):
+    """ranges (sorted, disjoint [start, end) pairs) with [start, end) merged in"""
+    merged = []
+    for a, b in ranges:
+        if b < start or a > end:
+            merged.append([a, b])
+        else:
+            start, end = min(a, start), max(b, end)
+    merged.append([start, end])
+    merged.sort()
+    return merged
+
+
+class RangeCache:
+    """Sparse files below directory with the byte ranges they hold.
+
+    Thread-safe; the file data is written before its range is recorded, so
+    the index never claims bytes the file lacks. Keys acquire()d by a
+    reader are not evicted until they are release()d as often.
+    """
+
+    def __init__(self, directory, budget=512 * 1024 * 1024):
+        self.directory = directory
+        self.budget = budget
+        self.index_path = os.path.join(directory, "index.json")
+        self._lock = threading.Lock()
+        # key -> {"length", "type", "ranges"}, least recently used first
+        self._entries = OrderedDict()
+        self._size = 0
+        self._readers = {}      # key -> number of open readers
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = []
+        for key, entry in entries:
+            if os.path.exists(self.path(key)):
+                self._entries[key] = entry
+                self._size += sum(b - a for a, b in entry["ranges"])
+
+    def save(self):
+        with self._lock:
+            entries = list(self._entries.items())
+        tmp = "%s.%d.tmp" % (self.index_path, threading.get_ident())
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp, self.index_path)
+        except OSError:
+            pass
+
+    def path(self, key):
+        return os.path.join(self.directory, re.sub(r"[^\w.-]", "_", key) + ".bin")
+
+    def _entry(self, key):
+        """Call with self._lock held"""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {"length": None, "type": None, "ranges": []}
+        self._entries.move_to_end(key)
+        return entry
+
+    def length(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry["length"] if entry is not None else None
+
+    def content_type(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry["type"] if entry is not None else None
+
+    def set_length(self, key, length, content_type=None):
+        with self._lock:
+            entry = self._entry(key)
+            entry["length"] = length if length is not None else entry["length"]
+            entry["type"] = content_type or entry["type"]
+
+    def complete(self, key):
+        """Whether every byte of key is cached"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return (entry is not None and entry["length"] is not None
+                    and entry["ranges"] == [[0, entry["length"]]])
+
+    def cached_until(self, key, position):
+        """End of the cached run starting at position, position if none"""
+        with self._lock:
+            entry = self._entries.get(key)
+            for a, b in entry["ranges"] if entry is not None else ():
+                if a <= position < b:
+                    return b
+        return position
+
+    def next_cached(self, key, position):
+        """Start of the first cached range after position, None if none"""
+        with self._lock:
+            entry = self._entries.get(key)
+            for a, _ in entry["ranges"] if entry is not None else ():
+                if a > position:
+                    return a
+        return None
+
+    def acquire(self, key):
+        """Keep key from being evicted while it is read"""
+        with self._lock:
+            self._readers[key] = self._readers.get(key, 0) + 1
+
+    def release(self, key):
+        with self._lock:
+            count = self._readers.pop(key, 0) - 1
+            if count > 0:
+                self._readers[key] = count
+            evicted = self._evict()
+        self._remove(evicted)
+
+    def read(self, key, position, size):
+        fd = os.open(self.path(key), os.O_RDONLY)
+        try:
+            data = os.pread(fd, size, position)
+        finally:
+            os.close(fd)
+        with self._lock:
+            self._entry(key)
+            self.hits += len(data)
+        return data
+
+    def write(self, key, position, data):
+        if not data:
+            return
+        fd = os.open(self.path(key), os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            os.pwrite(fd, data, position)
+        finally:
+            os.close(fd)
+        with self._lock:
+            entry = self._entry(key)
+            before = sum(b - a for a, b in entry["ranges"])
+            entry["ranges"] = _add_range(entry["ranges"], position, position + len(data))
+            self._size += sum(b - a for a, b in entry["ranges"]) - before
+            self.misses += len(data)
+            evicted = self._evict(keep=key)
+        self._remove(evicted)
+
+    def _evict(self, keep=None):
+        """Drop least recently used entries over budget; returns their keys"""
+        evicted = []
+        for key in list(self._entries):
+            if self._size <= self.budget:
+                break
+            if key == keep or key in self._readers:
+                continue
+            entry = self._entries.pop(key)
+            self._size -= sum(b - a for a, b in entry["ranges"])
+            evicted.append(key)
+        return evicted
+
+    def _remove(self, keys):
+        for key in keys:
+            try:
+                os.remove(self.path(key))
+            except OSError:
+                pass
+        if keys:
+            self.save()
+
+    def set_budget(self, budget):
+        with self._lock:
+            self.budget = budget
+            evicted = self._evict()
+        self._remove(evicted)
+
+    def stats(self):
+        with self._lock:
+            return {"tracks": len(self._entries), "bytes": self._size,
+                    "budget": self.budget, "hit_bytes": self.hits,
+                    "miss_bytes": self.misses}
+
+    def clear(self):
+        with self._lock:
+            keys = list(self._entries)
+            self._entries.clear()
+            self._size = 0
+        self._remove(keys)
+
+
+class CachedStream:
+    """A progressive stream read through a RangeCache, for the proxy.
+
+    resolve() returns the (current) URL of the stream. open_range(url,
+    start, end) requests bytes start..end - 1 (to the end if end is None)
+    and returns (total length, content type, iterable of byte chunks);
+    probe(url) returns the total length. All may raise.
+    """
+
+    def __init__(self, cache, key, resolve, open_range, probe, content_type="audio/mp4"):
+        self.cache = cache
+        self.key = key
+        self.resolve = resolve
+        self.open_range = open_range
+        self._probe = probe
+        self._content_type = content_type
+
+    @property
+    def content_type(self):
+        return self.cache.content_type(self.key) or self._content_type
+
+    def length(self):
+        return self.cache.length(self.key)
+
+    def probe(self):
+        if self.length() is None:
+            self.cache.set_length(self.key, self._probe(self.resolve()))
+
+    def wait_sized(self, timeout=None):
+        try:
+            self.probe()
+        except Exception:
+            return False
+        return True
+
+    def copy(self, out, start=0, end=None):
+        """Write bytes start..end (inclusive, None for all) to out"""
+        position = start
+        stop = None if end is None else end + 1
+        self.cache.acquire(self.key)
+        try:
+            while True:
+                length = self.length()
+                if length is not None:
+                    stop = length if stop is None else min(stop, length)
+                if stop is not None and position >= stop:
+                    break
+                cached = self.cache.cached_until(self.key, position)
+                if cached > position:
+                    size = min(cached, stop if stop is not None else cached,
+                               position + _CHUNK) - position
+                    out.write(self.cache.read(self.key, position, size))
+                    position += size
+                    continue
+                position = self._fetch(out, position, stop)
+        finally:
+            self.cache.release(self.key)
+            self.cache.save()
+
+    def _fetch(self, out, position, stop):
+        """Copy the gap at position from the network; returns the new position"""
+        limit = self.cache.next_cached(self.key, position)
+        if stop is not None:
+            limit = stop if limit is None else min(limit, stop)
+        length, content_type, chunks = self.open_range(self.resolve(), position, limit)
+        self.cache.set_length(self.key, length, content_type)
+        start = position
+        for chunk in chunks:
+            if limit is not None:
+                chunk = chunk[:limit - position]
+            # into the cache first, so bytes survive a closed connection
+            self.cache.write(self.key, position, chunk)
+            out.write(chunk)
+            position += len(chunk)
+            if limit is not None and position >= limit:
+                break
+        if position == start and (length is None or position < length):
+            raise IOError("no data at %d" % position)
+        return position
@@ -0,0 +1,152 @@
+# This Python file uses the following encoding: utf-8
+"""Search as you type.
+
+Every keystroke calls IncrementalSearch.type(). Queries that were searched
+recently are answered from an LRU cache with a TTL; otherwise the results
+of the longest cached prefix are narrowed locally and shown right away,
+while the network query waits for a pause in typing. Results of a query
+that has been overtaken by newer input are cached but not shown.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+# Categories of a search result dict, see backend.projection.Projector.search
+CATEGORIES = ("tracks", "artists", "albums", "playlists", "videos", "mixes")
+# Text fields an item is matched against when narrowing
+_TEXT_FIELDS = ("title", "name", "artist", "album")
+
+
+def normalize(text):
+    return " ".join(str(text).lower().split())
+
+
+def narrow(results, query):
+    """Items of results whose text contains every word of query"""
+    words = query.split()
+    narrowed = {}
+    for category in CATEGORIES:
+        items = []
+        for item in results.get(category) or []:
+            text = " ".join(str(item.get(f) or "") for f in _TEXT_FIELDS).lower()
+            if all(w in text for w in words):
+                items.append(item)
+        narrowed[category] = items
+    return narrowed
+
+
+class SearchCache:
+    """LRU of normalized query -> results, entries expire after ttl seconds"""
+
+    def __init__(self, max_entries=64, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # query -> (results, stored_at)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query):
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is None or time.monotonic() - entry[1] > self.ttl:
+                if entry is not None:
+                    del self._entries[query]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(query)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, query, results):
+        with self._lock:
+            self._entries[query] = (results, time.monotonic())
+            self._entries.move_to_end(query)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def prefix(self, query):
+        """(prefix, results) of the longest cached, unexpired prefix of query"""
+        now = time.monotonic()
+        with self._lock:
+            for end in range(len(query) - 1, 0, -1):
+                entry = self._entries.get(query[:end])
+                if entry is not None and now - entry[1] <= self.ttl:
+                    return query[:end], entry[0]
+        return None, None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class IncrementalSearch:
+    """Debounced search with stale-query dropping and a prefix cache.
+
+    search(query) returns a results dict and may raise; emit(query,
+    results, final) shows results, final is False for locally narrowed
+    ones. submit(fn, query) runs the network query, by default right on
+    the debounce timer thread.
+    """
+
+    def __init__(self, search, emit, submit=None, delay=0.35, min_length=2,
+                 cache=None):
+        self.search = search
+        self.emit = emit
+        self.submit = submit or (lambda fn, query: fn(query))
+        self.delay = delay
+        self.min_length = min_length
+        self.cache = cache if cache is not None else SearchCache()
+        self._lock = threading.Lock()
+        self._timer = None
+        self._current = ""
+        self.queries = 0
+
+    def type(self, text):
+        """New input; returns what was shown immediately ("cache", "prefix")"""
+        query = normalize(text)
+        with self._lock:
+            self._current = query
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if len(query) < self.min_length:
+            return None
+        results = self.cache.get(query)
+        if results is not None:
+            self.emit(query, results, True)
+            return "cache"
+        shown = None
+        prefix, prefix_results = self.cache.prefix(query)
+        if prefix_results is not None:
+            self.emit(query, narrow(prefix_results, query), False)
+            shown = "prefix"
+        with self._lock:
+            if self._current == query:
+                self._timer = threading.Timer(self.delay, self.submit, (self._run, query))
+                self._timer.daemon = True
+                self._timer.start()
+        return shown
+
+    def cancel(self):
+        """Stop waiting for input; results still in flight are dropped"""
+        with self._lock:
+            self._current = ""
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def is_current(self, query):
+        with self._lock:
+            return self._current == query
+
+    def _run(self, query):
+        if not self.is_current(query):
+            return None
+        self.queries += 1
+        results = self.search(query)
+        self.cache.put(query, results)
+        if self.is_current(query):
+            self.emit(query, results, True)
+        return None
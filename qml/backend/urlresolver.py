@@ -0,0 +1,140 @@
+# This Python file uses the following encoding: utf-8
+"""Stream URL resolution with prefetching and an expiry-aware cache.
+
+Stream URLs are signed and only valid for a limited time. The resolver keeps
+them in memory until shortly before they expire, so the URLs of the next
+queue entries can be fetched while the current track is still playing and
+a track change does not have to wait for the network.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Signed CDN URLs carry their expiry as epoch seconds, either as an
+# explicit parameter or as the leading field of the token.
+_EXPIRY_PATTERNS = (
+    re.compile(r"[?&](?:Expires|expires|exp)=(\d{10})"),
+    re.compile(r"[?&~]exp=(\d{10})"),
+    re.compile(r"[?&]token=(\d{10})~"),
+)
+
+
+def url_expiry(url, default_ttl, now=None):
+    """Epoch time at which url stops working, default_ttl if unknown."""
+    now = time.time() if now is None else now
+    for pattern in _EXPIRY_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            expiry = int(match.group(1))
+            if expiry > now:
+                return expiry
+    return now + default_ttl
+
+
+class UrlResolver:
+    """Cache of track id -> stream URL with background prefetching.
+
+    resolve(track_id, quality) returns the URL and may raise. Entries are
+    dropped margin seconds before their expiry; concurrent requests for the
+    same track share one lookup. get() resolves a miss on the calling
+    thread, so playback never waits behind queued prefetches.
+    """
+
+    def __init__(self, resolve, default_ttl=600, margin=30, max_entries=64,
+                 max_workers=2):
+        self.resolve = resolve
+        self.default_ttl = default_ttl
+        self.margin = margin
+        self.max_entries = max_entries
+        self._pool = ThreadPoolExecutor(max_workers=max_workers,
+                                        thread_name_prefix="url")
+        self._lock = threading.Lock()
+        self._urls = OrderedDict()     # (id, quality) -> (url, expires_at)
+        self._pending = {}             # (id, quality) -> Future
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, track_id, quality):
+        return (str(track_id), str(quality))
+
+    def cached(self, track_id, quality=None):
+        """The cached URL if it is still valid, else None."""
+        key = self._key(track_id, quality)
+        with self._lock:
+            entry = self._urls.get(key)
+            if entry is None:
+                return None
+            url, expires_at = entry
+            if expires_at - self.margin <= time.time():
+                del self._urls[key]
+                return None
+            self._urls.move_to_end(key)
+            return url
+
+    def get(self, track_id, quality=None):
+        """Return a valid URL, resolving it now if it is not cached."""
+        url = self.cached(track_id, quality)
+        if url is not None:
+            self.hits += 1
+            return url
+        self.misses += 1
+        key = self._key(track_id, quality)
+        future = self._future(key)[0]
+        # a queued prefetch of the track is taken over, a running one shared
+        self._run(key, track_id, quality, future)
+        return future.result()
+
+    def prefetch(self, track_ids, quality=None):
+        """Resolve URLs in the background; already valid ones are skipped."""
+        for track_id in track_ids:
+            if self.cached(track_id, quality) is None:
+                self._submit(track_id, quality)
+
+    def invalidate(self, track_id=None):
+        """Forget the URL(s) of track_id, or all URLs."""
+        with self._lock:
+            if track_id is None:
+                self._urls.clear()
+                return
+            for key in [k for k in self._urls if k[0] == str(track_id)]:
+                del self._urls[key]
+
+    def _future(self, key):
+        """(Future of the lookup of key, whether it is new)"""
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future, False
+            future = self._pending[key] = Future()
+            return future, True
+
+    def _submit(self, track_id, quality):
+        key = self._key(track_id, quality)
+        future, new = self._future(key)
+        if new:
+            self._pool.submit(self._run, key, track_id, quality, future)
+        return future
+
+    def _run(self, key, track_id, quality, future):
+        """Do the lookup of future unless another thread has started it"""
+        with self._lock:
+            if future.running() or future.done():
+                return
+            future.set_running_or_notify_cancel()
+        try:
+            url = self.resolve(track_id, quality)
+        except Exception as e:
+            with self._lock:
+                self._pending.pop(key, None)
+            future.set_exception(e)
+            return
+        with self._lock:
+            self._urls[key] = (url, url_expiry(url, self.default_ttl))
+            self._urls.move_to_end(key)
+            while len(self._urls) > self.max_entries:
+                self._urls.popitem(last=False)
+            self._pending.pop(key, None)
+        future.set_result(url)
@@ -41,6 +41,8 @@ Item {
     signal preloadReady()
     signal playerError(string error)
     signal trackInfoChanged()
+    // The active player ran out of data while playing
+    signal playbackStalled()
 
     // Player references - exported for Settings display
     property AudioPlayerComponent audioPlayer1: audioPlayer1
@@ -185,6 +187,10 @@ Item {
         }
 
         onPlayerStatusChanged: {
+            if (isActive && status === Audio.Stalled && playbackState === Audio.PlayingState) {
+                playbackStalled()
+            }
+
             // KORRIGIERT: EndOfMedia für automatischen Titelwechsel
             if (isActive && status === Audio.EndOfMedia) {
                 if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
@@ -330,6 +336,10 @@ Item {
         }
 
         onPlayerStatusChanged: {
+            if (isActive && status === Audio.Stalled && playbackState === Audio.PlayingState) {
+                playbackStalled()
+            }
+
             // Player2 hat keine Playlist, also direkt trackFinished bei EndOfMedia
             if (isActive && status === Audio.EndOfMedia) {
                 if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
@@ -401,6 +411,15 @@ Item {
     }
 
     function setSource(url) {
+        cancelQualityUpgrade()
+        if (qualityUpgradeActive) {
+            // the upgraded track played on player 2; player 1 plays the
+            // playlist again. Switch first, stopping the active player
+            // would count as the end of the track.
+            qualityUpgradeActive = false
+            player1Active = true
+            audioPlayer2.stopPlayback()
+        }
         if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1) {
             if (url) {
                 var urlStr = String(url)
@@ -422,6 +441,8 @@ Item {
     function crossfadeToTrack(url, trackId) {
         if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
             console.log("DualAudioManager: Starting crossfade to:", trackId, "mode:", crossfadeMode)
+        cancelQualityUpgrade()
+        qualityUpgradeActive = false
 
         // Prevent concurrent switches during crossfade or playlist operations
         if (playerSwitchLocked) {
@@ -610,7 +631,8 @@ Item {
     }
 
     function startPreload(trackId, url) {
-        if (!preloadingEnabled || preloadInProgress) {
+        // the inactive player is taken by a quality upgrade
+        if (!preloadingEnabled || preloadInProgress || qualityUpgradeActive || upgradeTimer.running) {
             return false
         }
 
@@ -720,6 +742,8 @@ Item {
         if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
             console.log("DualAudioManager: Resetting audio players")
 
+        cancelQualityUpgrade()
+        qualityUpgradeActive = false
         audioPlayer1.stop()
         audioPlayer2.stop()
 
@@ -742,6 +766,100 @@ Item {
             console.log("DualAudioManager: Players reset complete")
     }
 
+    // Fast start: a track starts on player 1 at a low quality. The full
+    // quality stream of it is loaded into player 2, started muted at the
+    // same position once it is buffered, and then the players swap. The next
+    // setSource() goes back to player 1.
+    signal qualityUpgraded(string url)
+    property string upgradeUrl: ""
+    property bool upgradeSeeked: false
+    property double upgradeStarted: 0
+    property bool qualityUpgradeActive: false
+    property int upgradeTimeoutMs: 20000
+
+    Timer {
+        id: upgradeTimer
+        interval: 100
+        repeat: true
+        onTriggered: checkQualityUpgrade()
+    }
+
+    function upgradeQuality(url, replaces) {
+        if (!player1Active || crossfadeInProgress || playerSwitchLocked || preloadInProgress
+                || currentTrackUrl.toString() !== replaces.toString()) {
+            if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
+                console.log("DualAudioManager: Quality upgrade skipped, the track or player changed")
+            return false
+        }
+        if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
+            console.log("DualAudioManager: Loading full quality stream for upgrade")
+        upgradeUrl = url
+        upgradeSeeked = false
+        upgradeStarted = Date.now()
+        audioPlayer2.loadTrack(url)
+        upgradeTimer.start()
+        return true
+    }
+
+    function cancelQualityUpgrade() {
+        if (!upgradeTimer.running)
+            return
+        upgradeTimer.stop()
+        upgradeUrl = ""
+        if (!audioPlayer2.isActive)
+            audioPlayer2.stopPlayback()
+    }
+
+    function checkQualityUpgrade() {
+        var oldPlayer = audioPlayer1
+        var newPlayer = audioPlayer2
+        if (!player1Active || crossfadeInProgress
+                || newPlayer.source.toString() !== upgradeUrl.toString()
+                || Date.now() - upgradeStarted > upgradeTimeoutMs) {
+            if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
+                console.log("DualAudioManager: Quality upgrade abandoned")
+            cancelQualityUpgrade()
+            return
+        }
+        if (!newPlayer.isReady())
+            return
+        if (oldPlayer.playbackState !== Audio.PlayingState) {
+            // paused: sync again once playback continues
+            if (newPlayer.playbackState === Audio.PlayingState)
+                newPlayer.pausePlayback()
+            upgradeSeeked = false
+            return
+        }
+        if (newPlayer.playbackState !== Audio.PlayingState) {
+            newPlayer.startPlayback()  // muted, it is the inactive player
+            return
+        }
+        if (!upgradeSeeked) {
+            if (!newPlayer.seekable)
+                return
+            // a little ahead, the old player catches up while the seek runs
+            newPlayer.seekTo(oldPlayer.position + 2 * upgradeTimer.interval)
+            upgradeSeeked = true
+            return
+        }
+        if (newPlayer.position + 1000 < oldPlayer.position) {
+            upgradeSeeked = false  // the seek did not take
+            return
+        }
+        if (newPlayer.position > oldPlayer.position + 3 * upgradeTimer.interval)
+            return
+
+        if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
+            console.log("DualAudioManager: Switching to full quality at", oldPlayer.position)
+        upgradeTimer.stop()
+        player1Active = false
+        qualityUpgradeActive = true
+        currentTrackUrl = upgradeUrl
+        oldPlayer.stopPlayback()
+        qualityUpgraded(upgradeUrl)
+        upgradeUrl = ""
+    }
+
     function setCrossfadeVolume(player, volume) {
         // Only log volume changes at debug level 3 to reduce spam
         if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 3) {
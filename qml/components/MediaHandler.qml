@@ -150,6 +150,15 @@ Item {
             }
         }
         
+        onQualityUpgraded: {
+            media_source = url
+        }
+
+        onPlaybackStalled: {
+            // adaptive quality steps down with the next track
+            tidalApi.reportStall()
+        }
+
         onTrackInfoChanged: {
             if (settings.debugLevel >= 2) {
                 console.log("MEDIA: Track info changed, updating...")
@@ -422,6 +431,28 @@ Item {
             console.log("MediaHandler: Resetting preload state for new track")
         }
         resetPreloadState()
+        prefetchUpcomingUrls()
+    }
+
+    // Fast start: switch the playing track to its full quality stream
+    function upgradeQuality(url, replaces) {
+        return dualAudioManager.upgradeQuality(url, replaces)
+    }
+
+    // Number of upcoming queue entries whose stream URL is resolved ahead
+    property int urlPrefetchCount: 2
+
+    // Let the backend resolve the next stream URLs while this track plays,
+    // so the track change itself needs no network round trip
+    function prefetchUpcomingUrls() {
+        var ids = []
+        for (var i = playlistManager.currentIndex + 1;
+             i < playlistManager.size && ids.length < urlPrefetchCount; i++) {
+            ids.push(playlistManager.playlist[i])
+        }
+        if (ids.length > 0) {
+            tidalApi.prefetchTrackUrls(ids)
+        }
     }
     
     // Enhanced: Play track with immediate switching capability
@@ -47,6 +47,7 @@ Item {
     signal topTracksofArtist(var track_info)
     signal radioTrackofArtist(var track_info)
     signal similarArtist(var artist_info)
+    signal artistBio(string artistid, string bio)
 
     // signals for search
     signal foundTrack(var track_info)
@@ -61,6 +62,13 @@ Item {
     signal foundAlbumsBatch(var albums_array)
     signal foundArtistsBatch(var artists_array)
 
+    // Progressive search, see searchPaged(): hits of the offline library
+    // index, the top hit, then one page per category {query, category,
+    // offset, items, total, next}
+    signal localSearchResults(var results)
+    signal searchTopHit(var hit)
+    signal searchCategoryPage(var page)
+
     // signal for favorites
     signal favTracks(var track_info)
     signal favAlbums(var album_info)
@@ -90,10 +98,28 @@ Item {
     signal playlistTrackAdded(var track_info)
     signal albumTrackAdded(var track_info)
     signal mixTrackAdded(var track_info)
+    // Paged collections: {source, id, offset, count, next}; next is the
+    // offset to continue from, -1 once everything has been delivered
+    signal collectionPage(var page_info)
     
     // Claude Generated: Preload and crossfade signals
     signal preloadUrlReady(string trackId, string url)
     signal crossfadeUrlReady(string trackId, string url)
+    // Fast start: {trackid, url, replaces}, the full quality URL of the
+    // track that started playing from the low quality URL replaces
+    signal qualityUpgradeReady(var upgrade)
+    // Adaptive quality: {trackid, quality, previous, throughput, reason},
+    // the quality a track is played at and why (throughput in bit/s)
+    signal qualityDecision(var decision)
+    // Cover art prefetched by prefetchImages(): [{url, image}], image being
+    // the file:// URL, or url again if the download failed
+    signal imagesCached(var images)
+
+    // Offline downloads, each with the job {trackid, info, status, segments,
+    // fetched, size, path, error}
+    signal downloadProgress(var job)
+    signal downloadFinished(var job)
+    signal downloadFailed(var job)
     
 
     // Properties für die Suche
@@ -149,7 +175,9 @@ Item {
                 var request = requestQueue.shift()
                 if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
                     console.log("Processing async request:", request.method)
-                pythonTidal.call(request.method, request.params)
+                // runs on the backend scheduler, see Tidal.schedule()
+                pythonTidal.call('tidal.Tidaler.schedule',
+                                 [request.id, backendMethod(request.method), request.params])
 
                 // Continue processing if more requests
                 if (requestQueue.length > 0) {
@@ -409,6 +437,46 @@ Item {
                 tidalApi.cacheMix(mix_info)
             })            
 
+            setHandler('downloadProgress', function(job) {
+                tidalApi.downloadProgress(job)
+            })
+            setHandler('downloadFinished', function(job) {
+                tidalApi.downloadFinished(job)
+            })
+            setHandler('downloadFailed', function(job) {
+                tidalApi.downloadFailed(job)
+            })
+
+            // PERFORMANCE: chunked *Batch signals from BatchEmitter in tidal.py;
+            // every item is re-emitted through the matching per-item signal
+            var batchSignals = {
+                "cacheTracksBatch":        "cacheTrack",
+                "cacheAlbumsBatch":        "cacheAlbum",
+                "cacheArtistsBatch":       "cacheArtist",
+                "cachePlaylistsBatch":     "cachePlaylist",
+                "cacheMixesBatch":         "cacheMix",
+                "FavTracksBatch":          "favTracks",
+                "FavAlbumsBatch":          "favAlbums",
+                "FavArtistBatch":          "favArtists",
+                "playlistTrackAddedBatch": "playlistTrackAdded",
+                "albumTrackAddedBatch":    "albumTrackAdded",
+                "mixTrackAddedBatch":      "mixTrackAdded",
+                "AlbumofArtistBatch":      "albumofArtist",
+                "TopTrackofArtistBatch":   "topTracksofArtist",
+                "RadioTrackofArtistBatch": "radioTrackofArtist",
+                "addPersonalPlaylistBatch": "personalPlaylistAdded"
+            }
+            for (var batchName in batchSignals) {
+                setHandler(batchName, root.batchHandler(batchSignals[batchName]))
+            }
+
+            setHandler('SimilarArtistBatch', function(artists) {
+                for (var i = 0; i < artists.length; i++) {
+                    tidalApi.cacheArtist(artists[i])
+                    tidalApi.similarArtist(artists[i])
+                }
+            })
+
             setHandler('TopTrackofArtist', function(track_info) {
                 tidalApi.topTracksofArtist(track_info)
             })
@@ -427,6 +495,13 @@ Item {
                 tidalApi.similarArtist(artist_info)
             })
 
+            // Biographies are loaded on demand and arrive batched
+            setHandler('artistBios', function(bios) {
+                for (var i = 0; i < bios.length; i++) {
+                    tidalApi.artistBio(bios[i].artistid, bios[i].bio)
+                }
+            })
+
             setHandler('noSimilarArtists', function() {
                 tidalApi.noSimilarArtists()
             })
@@ -481,6 +556,22 @@ Item {
                 tidalApi.foundPlaylistsBatch(playlists_array)
             })
 
+            setHandler('localSearchResults', function(results) {
+                if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 2)
+                    console.log("Received local search results:", results.tracks.length, "tracks")
+                tidalApi.localSearchResults(results)
+            })
+
+            setHandler('searchTopHit', function(hit) {
+                tidalApi.searchTopHit(hit)
+            })
+
+            setHandler('searchCategoryPage', function(page) {
+                if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 2)
+                    console.log("Received search page:", page.category, page.offset, page.items.length, "of", page.total)
+                tidalApi.searchCategoryPage(page)
+            })
+
             setHandler('foundVideosBatch', function(videos_array) {
                 if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
                     console.log("Received videos batch:", videos_array.length, "videos")
@@ -659,6 +750,22 @@ Item {
                 tidalApi.current_track_image = info.track.image
             })
 
+            setHandler('qualityUpgradeReady', function(upgrade) {
+                qualityUpgradeReady(upgrade)
+                mediaController.upgradeQuality(upgrade.url, upgrade.replaces)
+            })
+
+            setHandler('imagesCached', function(images) {
+                imagesCached(images)
+            })
+
+            setHandler('qualityDecision', function(decision) {
+                if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
+                    console.log("QUALITY:", decision.trackid, decision.quality,
+                                "(" + decision.reason + ",", decision.throughput, "bit/s)")
+                qualityDecision(decision)
+            })
+
             // Unified batch loader - sent atomically by Python after all
             // cacheTrack calls. The mode-to-operation dispatch lives in
             // PlaylistManager so this layer only carries the wire format.
@@ -681,6 +788,10 @@ Item {
                     console.log("api-error: " + error)
             })
 
+            setHandler('collectionPage', function(page_info) {
+                root.collectionPage(page_info)
+            })
+
             setHandler('playlistTrackAdded', function(track_info) {
                 root.playlistTrackAdded(track_info)
             })
@@ -743,6 +854,31 @@ Item {
                 root.customMix(mix_info, mixType)
             })
 
+            // One batch per artist/album page section, see loadArtistPage()
+            setHandler('artistPageSection', function(artistid, section, items) {
+                if (settings.debugLevel >= 2) {
+                    console.log("TIDAL: artistPageSection", artistid, section, "with", items.length, "items")
+                }
+                root.dispatchArtistSection(section, items)
+            })
+
+            setHandler('albumPageSection', function(albumid, section, items) {
+                if (settings.debugLevel >= 2) {
+                    console.log("TIDAL: albumPageSection", albumid, section, "with", items.length, "items")
+                }
+                root.dispatchAlbumSection(section, items)
+            })
+
+            // One batch per home screen section, see loadHomeScreen()
+            setHandler('homeSection', function(section, items) {
+                if (settings.debugLevel >= 2) {
+                    console.log("TIDAL: homeSection", section, "with", items.length, "items")
+                }
+                for (var i = 0; i < items.length; i++) {
+                    root.dispatchHomeItem(section, items[i])
+                }
+            })
+
             setHandler('topArtist', function(artist_info)
             {
                 if (settings.debugLevel >= 3) {
@@ -753,6 +889,15 @@ Item {
                 root.topArtist(artist_info)
             })
 
+            // Outcome of a scheduled call: "done", "cancelled" or "error"
+            setHandler('requestDone', function(requestId, status, result) {
+                if (status === "done") {
+                    completeRequest(requestId, result)
+                } else {
+                    forgetRequest(requestId)
+                }
+            })
+
             // Favorites status updates - handled here since FavoritesManager
             // no longer runs its own Python instance - Claude Generated
             setHandler('updateFavorite', function(id, status) {
@@ -771,6 +916,8 @@ Item {
                 importModule('tidal', function() {
                     // Backend successfully initialized
                     backendInitialized = true
+                    // warm up requests/tidalapi while the first page is drawn
+                    call('tidal.Tidaler.preload', [])
 
                     if (applicationWindow.settings.debugLevel >= 1) {
                         console.log("TIDAL: ✓ Python module 'tidal' imported successfully")
@@ -832,6 +979,7 @@ Item {
         if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
             console.log("Request new login")
         pythonTidal.call('tidal.Tidaler.initialize', [quality])
+        setAdaptiveQuality(applicationWindow.settings.adaptiveQuality !== false)
         pythonTidal.call('tidal.Tidaler.request_oauth', [])
     }
 
@@ -842,6 +990,7 @@ Item {
             console.log("AUTH: loginIn with token (length:", accessToken.length, "chars)")
         }
         pythonTidal.call('tidal.Tidaler.initialize', [quality])
+        setAdaptiveQuality(applicationWindow.settings.adaptiveQuality !== false)
         pythonTidal.call('tidal.Tidaler.login',
             [tokenType, accessToken, refreshToken, expiryTime])
     }
@@ -954,6 +1103,50 @@ Item {
         requestProcessingTimer.start()
     }
     
+    // "tidal.Tidaler.getTrackInfo" -> "getTrackInfo"
+    function backendMethod(method) {
+        return method.substring(method.lastIndexOf(".") + 1)
+    }
+
+    // Fire-and-forget call through the backend scheduler; its priority is
+    // chosen by the backend (Tidal.CALL_PRIORITIES). Returns the request id
+    // for cancelRequest().
+    function scheduleCall(method, params) {
+        var requestId = generateRequestId()
+        pythonTidal.call('tidal.Tidaler.schedule', [requestId, method, params || []])
+        return requestId
+    }
+
+    // Drop a queued request or stop a running one in the backend
+    function cancelRequest(requestId) {
+        for (var i = 0; i < requestQueue.length; i++) {
+            if (requestQueue[i].id === requestId) {
+                requestQueue.splice(i, 1)
+                forgetRequest(requestId)
+                return
+            }
+        }
+        pythonTidal.call('tidal.Tidaler.cancel', [requestId])
+        forgetRequest(requestId)
+    }
+
+    // Remove a cancelled/failed request without caching a result
+    function forgetRequest(requestId) {
+        var request = pendingRequests[requestId]
+        if (!request)
+            return
+        if (request.signature && activeRequests[request.signature] === request)
+            delete activeRequests[request.signature]
+        delete pendingRequests[requestId]
+        if (Object.keys(pendingRequests).length === 0) {
+            loading = false
+            if (requestQueue.length === 0)
+                processingQueue = false
+            else
+                processRequestQueue()
+        }
+    }
+
     function completeRequest(requestId, result) {
         if (pendingRequests[requestId]) {
             var request = pendingRequests[requestId]
@@ -1010,6 +1203,31 @@ Item {
         })
     }
 
+    // Local library hits, then the top hit and a small first page of every
+    // category; more pages of a category on demand via
+    // searchMore(text, category, page.next)
+    function searchPaged(text) {
+        return scheduleCall('searchPaged', [text])
+    }
+
+    function searchMore(text, category, offset) {
+        if (offset < 0)
+            return -1
+        return scheduleCall('searchMore', [text, category, offset])
+    }
+
+    // Results per category of genericSearch/searchMore and the number of
+    // artist top tracks
+    function setSearchConfig(topTracks, albumSearch, trackSearch, artistSearch) {
+        pythonTidal.call('tidal.Tidaler.setconfig', [topTracks, albumSearch, trackSearch, artistSearch])
+    }
+
+    // Call on every keystroke of a search field; the backend debounces,
+    // caches and answers with searchResults({query, final, tracks, ...})
+    function searchAsYouType(text) {
+        pythonTidal.call('tidal.Tidaler.searchAsYouType', [text])
+    }
+
     function reInit() {
         if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
             console.log("Re-initializing Tidal session")
@@ -1127,11 +1345,30 @@ Item {
             console.log("TidalApi: Calling Python backend for track URL:", id)
         }
         
-        pythonTidal.call("tidal.Tidaler.getTrackUrl", [id], function(name) {
-            if (applicationWindow.settings.debugLevel >= 2) {
-                console.log("TidalApi: Python callback received for track", id, "result type:", typeof name)
-            }
+        // fast start: low quality first, qualityUpgradeReady follows
+        scheduleCall("getTrackUrl", [id, applicationWindow.settings.fastStart || false])
+    }
+
+    // Resolve stream URLs and download the cover art of upcoming tracks in
+    // the background, so a later playTrackId/preload is answered from the
+    // backend's URL cache
+    function prefetchTrackUrls(ids) {
+        pythonTidal.call("tidal.Tidaler.prefetchTrackUrls", [ids])
+    }
+
+    // Download cover art into the backend's disk cache; imagesCached tells
+    // the file:// URLs, later bridge dicts carry them as well
+    function prefetchImages(urls) {
+        var remote = urls.filter(function(url) {
+            return url && url.indexOf("http") === 0
         })
+        if (remote.length === 0)
+            return -1
+        return scheduleCall("prefetchImages", [remote])
+    }
+
+    function setImageCacheBudget(megabytes) {
+        pythonTidal.call("tidal.Tidaler.setImageCacheBudget", [megabytes])
     }
 
     // Claude Generated: Track URL fetching for preloading
@@ -1144,10 +1381,7 @@ Item {
         if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
             console.log("TidalApi: Set pendingPreloadId to:", root.pendingPreloadId)
         
-        pythonTidal.call("tidal.Tidaler.getTrackUrl", [id], function(result) {
-            if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
-                console.log("TidalApi: Preload URL received for track", id)
-        })
+        scheduleCall("getTrackUrl", [id])
     }
     
     // Claude Generated: Track URL fetching for crossfade
@@ -1160,20 +1394,88 @@ Item {
         if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
             console.log("TidalApi: Set pendingCrossfadeId to:", root.pendingCrossfadeId)
         
-        pythonTidal.call("tidal.Tidaler.getTrackUrl", [id], function(result) {
-            if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
-                console.log("TidalApi: Crossfade URL received for track", id)
-        })
+        scheduleCall("getTrackUrl", [id])
     }
     
     // Claude Generated: Track request tracking
     property string pendingPreloadId: ""
     property string pendingCrossfadeId: ""
 
+    // Batched lookup of TidalCache misses in the Python metadata store; kind
+    // is "track", "album", "artist", "playlist" or "mix". Stored items come
+    // back at once as cache*Batch, missing ones are fetched from the API.
+    function lookupCached(kind, ids) {
+        return scheduleCall('lookupCached', [kind, ids])
+    }
+
+    function clearMetadataCache() {
+        pythonTidal.call('tidal.Tidaler.clearMetadataCache', [])
+    }
+
+    function clearImageCache() {
+        pythonTidal.call('tidal.Tidaler.clearImageCache', [])
+    }
+
+    // Streams are cached on disk by the backend's localhost proxy
+    function setStreamCacheBudget(megabytes) {
+        pythonTidal.call('tidal.Tidaler.setStreamCacheBudget', [megabytes])
+    }
+
+    function clearStreamCache() {
+        pythonTidal.call('tidal.Tidaler.clearStreamCache', [])
+    }
+
+    // Adaptive quality: the configured quality is the ceiling, the backend
+    // goes below it per track when the throughput is too low
+    function setAdaptiveQuality(enabled) {
+        pythonTidal.call('tidal.Tidaler.setAdaptiveQuality', [enabled])
+    }
+
+    // The player ran out of data: the next track is played a quality lower
+    function reportStall() {
+        pythonTidal.call('tidal.Tidaler.reportStall', [])
+    }
+
+    // Offline downloads: queued in the backend and resumed after login;
+    // playTrackId plays a downloaded track from its file
+    function downloadTrack(id) {
+        return scheduleCall('downloadTrack', [id])
+    }
+
+    function downloadAlbum(id) {
+        return scheduleCall('downloadAlbum', [id])
+    }
+
+    function downloadPlaylist(id) {
+        return scheduleCall('downloadPlaylist', [id])
+    }
+
+    function cancelDownload(id) {
+        pythonTidal.call('tidal.Tidaler.cancelDownload', [id])
+    }
+
+    function removeDownload(id) {
+        pythonTidal.call('tidal.Tidaler.removeDownload', [id])
+    }
+
+    function setDownloadBudget(megabytes) {
+        pythonTidal.call('tidal.Tidaler.setDownloadBudget', [megabytes])
+    }
+
+    // callback(jobs): every download job, finished or not
+    function getDownloads(callback) {
+        pythonTidal.call('tidal.Tidaler.getDownloads', [], callback)
+    }
+
+    // callback(stats): row count and oldest/newest update per table
+    function getMetadataStats(callback) {
+        pythonTidal.call('tidal.Tidaler.getMetadataStats', [], callback)
+    }
+
     // Async info fetches via the request queue: never block the UI thread and
     // deduplicate concurrent requests; results also arrive as the matching
     // cacheTrack/cacheAlbum/cacheArtist/cachePlaylist/cacheMix signal, which
-    // TidalCache persists. - Claude Generated
+    // TidalCache keeps in memory; the backend persists them. - Claude Generated
     function requestTrackInfo(id, callback) {
         return queueRequest("tidal.Tidaler.getTrackInfo", [id], callback || null)
     }
@@ -1216,7 +1518,7 @@ Item {
     function getAlbumTracks(id) {
         if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
             console.log("Get album tracks", id)
-        pythonTidal.call("tidal.Tidaler.getAlbumTracks", [id])
+        scheduleCall("getAlbumTracks", [id])
     }
 
     // Unified collection loaders - mode ∈ {"replace","append","play_now","play_next","queue"}.
@@ -1238,53 +1540,166 @@ Item {
                 console.log("TidalApi.loadCollection: unknown source", source)
             return
         }
-        pythonTidal.call(pyMethod, [id, mode || "replace"])
+        scheduleCall(backendMethod(pyMethod), [id, mode || "replace"])
     }
 
     // Artist Funktionen
     // Playlist Funktionen
     function getPersonalPlaylists() {
-        pythonTidal.call('tidal.Tidaler.getPersonalPlaylists', [])
+        scheduleCall('getPersonalPlaylists', [])
+    }
+
+    // Handler that re-emits every item of a batch through signalName
+    function batchHandler(signalName) {
+        return function(items) {
+            for (var i = 0; i < items.length; i++) {
+                root[signalName](items[i])
+            }
+        }
+    }
+
+    // Chunk size and flush interval (seconds) of the *Batch signals
+    function setBatchConfig(chunkSize, flushInterval) {
+        pythonTidal.call('tidal.Tidaler.setBatchConfig', [chunkSize, flushInterval])
+    }
+
+    // Fetch several home screen sections in parallel; each arrives as one
+    // homeSection batch. sections: "recent", "foryou", "dailyMixes",
+    // "radioMixes", "favArtists"
+    function loadHomeScreen(sections) {
+        scheduleCall('loadHomeScreen', [sections])
+    }
+
+    // Artist page in one go; every section arrives as it completes.
+    // sections: "info", "albums", "epSingles", "other", "topTracks",
+    // "similar", "radio", "bio" - all of them if omitted
+    function loadArtistPage(artistid, sections) {
+        return scheduleCall('loadArtistPage', [artistid, sections || null])
+    }
+
+    // Album info and tracks concurrently; sections: "info", "tracks"
+    function loadAlbumPage(albumid, sections) {
+        return scheduleCall('loadAlbumPage', [albumid, sections || null])
+    }
+
+    // Route an artist page section to the cache and the existing signals
+    function dispatchArtistSection(section, items) {
+        if (section === "similar" && items.length === 0) {
+            noSimilarArtists()
+            return
+        }
+        for (var i = 0; i < items.length; i++) {
+            var item = items[i]
+            switch (section) {
+                case "info":
+                    cacheArtist(item)
+                    break
+                case "albums":
+                case "epSingles":
+                case "other":
+                    cacheAlbum(item)
+                    albumofArtist(item)
+                    break
+                case "topTracks":
+                    cacheTrack(item)
+                    topTracksofArtist(item)
+                    break
+                case "similar":
+                    cacheArtist(item)
+                    similarArtist(item)
+                    break
+                case "radio":
+                    cacheTrack(item)
+                    radioTrackofArtist(item)
+                    break
+            }
+        }
+    }
+
+    function dispatchAlbumSection(section, items) {
+        for (var i = 0; i < items.length; i++) {
+            if (section === "info") {
+                cacheAlbum(items[i])
+            } else if (section === "tracks") {
+                cacheTrack(items[i])
+                albumTrackAdded(items[i])
+            }
+        }
+    }
+
+    // Route one home screen item to the cache and the per-section signal
+    function dispatchHomeItem(section, item) {
+        switch (item.type) {
+            case "album":    cacheAlbum(item); break
+            case "artist":   cacheArtist(item); break
+            case "playlist": cachePlaylist(item); break
+            case "mix":      cacheMix(item); break
+            case "track":    cacheTrack(item); break
+        }
+        if (section === "recent") {
+            switch (item.type) {
+                case "album":    recentAlbum(item); break
+                case "artist":   recentArtist(item); break
+                case "playlist": recentPlaylist(item); break
+                case "mix":      recentMix(item); break
+                case "track":    recentTrack(item); break
+            }
+        } else if (section === "foryou") {
+            switch (item.type) {
+                case "album":    foryouAlbum(item); break
+                case "artist":   foryouArtist(item); break
+                case "playlist": foryouPlaylist(item); break
+                case "mix":      foryouMix(item); break
+            }
+        } else if (section === "dailyMixes" && item.type === "mix") {
+            customMix(item, "dailyMix")
+        } else if (section === "radioMixes" && item.type === "mix") {
+            customMix(item, "radioMix")
+        } else if (section === "favArtists" && item.type === "artist") {
+            topArtist(item)
+        }
     }
 
     function getForYouPage() {
-        pythonTidal.call('tidal.Tidaler.getForYouPage', [])
+        scheduleCall('getForYouPage', [])
     }
 
     function getRecentPage() {
-        pythonTidal.call('tidal.Tidaler.getRecentPage', [])
+        scheduleCall('getRecentPage', [])
     }
 
     function getFavoriteAlbums() {
-        pythonTidal.call('tidal.Tidaler.getFavoriteAlbums', [])
+        scheduleCall('getFavoriteAlbums', [])
     }
 
     function getFavoriteTracks() {
-        pythonTidal.call('tidal.Tidaler.getFavoriteTracks', [])
+        scheduleCall('getFavoriteTracks', [])
     }
 
     function getFavoriteArtists() {
-        pythonTidal.call('tidal.Tidaler.getFavoriteArtists', [])
+        scheduleCall('getFavoriteArtists', [])
     }
 
     function getDailyMixes() {
-        pythonTidal.call('tidal.Tidaler.getDailyMixes', [])
+        scheduleCall('getDailyMixes', [])
     }
 
     function getRadioMixes() {
-        pythonTidal.call('tidal.Tidaler.getRadioMixes', [])
+        scheduleCall('getRadioMixes', [])
     }
 
     function getTopArtists() {
-        pythonTidal.call('tidal.Tidaler.getTopArtists', [])
+        scheduleCall('getTopArtists', [])
     }
 
-    function getPlaylistTracks(id) {
-        pythonTidal.call('tidal.Tidaler.getPlaylistTracks', [id])
+    // Stream a playlist from offset; maxPages > 0 stops after that many
+    // pages, continue from the last collectionPage cursor. 0 loads the rest.
+    function getPlaylistTracks(id, offset, maxPages) {
+        return scheduleCall('getPlaylistTracks', [id, offset || 0, maxPages || 0])
     }
 
     function getMixTracks(id) {
-        pythonTidal.call('tidal.Tidaler.getMixTracks', [id])
+        return scheduleCall('getMixTracks', [id])
     }
 
     function getFavorites() {
@@ -1292,19 +1707,25 @@ Item {
     }
 
     function getAlbumsofArtist(artistid) {
-        pythonTidal.call('tidal.Tidaler.getAlbumsofArtist', [artistid])
+        scheduleCall('getAlbumsofArtist', [artistid])
     }
 
     function getTopTracksofArtist(artistid) {
-        pythonTidal.call('tidal.Tidaler.getTopTracksofArtist', [artistid])
+        scheduleCall('getTopTracksofArtist', [artistid])
     }
 
     function getArtistRadio(artistid) {
-        pythonTidal.call('tidal.Tidaler.getArtistRadio', [artistid])
+        scheduleCall('getArtistRadio', [artistid])
     }
 
     function getSimiliarArtist(artistid) {
-        pythonTidal.call('tidal.Tidaler.getSimiliarArtist', [artistid])
+        scheduleCall('getSimiliarArtist', [artistid])
+    }
+
+    // Answered from the persistent bio cache or fetched in the background;
+    // results arrive via the artistBio signal
+    function getArtistBio(artistid) {
+        pythonTidal.call('tidal.Tidaler.getArtistBio', [artistid])
     }
 
     // ROOT CAUSE FIX: Complete search requests when Python results arrive
@@ -1,5 +1,5 @@
 import QtQuick 2.0
-import QtQuick.LocalStorage 2.0
+import QtQuick.LocalStorage 2.0  // only to drop the old tables
 
 Item {
 id: root
@@ -21,14 +21,12 @@ id: root
     property var playlistAccessOrder: []
     property var mixAccessOrder: []
     
-    property var db
-    
-    // PERFORMANCE: Database batching properties
-    property var pendingWrites: []
-    property bool batchWriteInProgress: false
-    property int batchSize: 50           // Process 50 writes per batch
-    property int batchTimeout: 2000      // Batch timeout in milliseconds
-    
+    // Misses are looked up in the Python metadata store in batches, see
+    // queueLookup(); ids asked for recently are not asked for again
+    property var pendingLookups: ({})
+    property var lookupRequested: ({})
+    property int lookupRetryInterval: 10000
+
     // PERFORMANCE: Incremental cleanup properties
     property bool cleanupInProgress: false
     property int cleanupBatchSize: 25    // Clean 25 entries per batch
@@ -87,27 +85,32 @@ id: root
         }
     }
     
-    // PERFORMANCE: Database batch write timer
+    // Collects cache misses for one lookupCached() call per kind
     Timer {
-        id: batchWriteTimer
-        interval: batchTimeout
+        id: lookupTimer
+        interval: 50
         running: false
         repeat: false
         onTriggered: {
-            if (pendingWrites.length > 0) {
-                processBatchWrites()
+            var pending = pendingLookups
+            pendingLookups = ({})
+            for (var kind in pending) {
+                var ids = Object.keys(pending[kind])
+                if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 2)
+                    console.log("CACHE: Looking up", ids.length, kind, "entries")
+                tidalApi.lookupCached(kind, ids)
             }
         }
     }
-    
-    // Deferred startup prune: deletes expired rows via the timestamp index
-    // without loading them into memory. - Claude Generated
+
+    // The items used to live in LocalStorage; drop those tables once the
+    // UI is up, the Python store refills itself
     Timer {
-        id: dbPruneTimer
+        id: legacyDbTimer
         interval: 5000
         running: false
         repeat: false
-        onTriggered: pruneExpiredDb()
+        onTriggered: dropLegacyDatabase()
     }
 
     // PERFORMANCE: Incremental cleanup timer
@@ -129,70 +132,21 @@ id: root
         }
     }
 
-    // PERFORMANCE: Database batch processing functions
-    function queueWrite(table, data) {
-        pendingWrites.push({
-            table: table,
-            data: data,
-            timestamp: Date.now()
-        })
-        
-        // Start batch timer if not running
-        if (!batchWriteTimer.running) {
-            batchWriteTimer.start()
-        }
-        
-        // Process immediately if batch is full
-        if (pendingWrites.length >= batchSize) {
-            batchWriteTimer.stop()
-            processBatchWrites()
-        }
-    }
-    
-    function processBatchWrites() {
-        if (batchWriteInProgress || pendingWrites.length === 0) return
-        
-        batchWriteInProgress = true
-        var writesToProcess = pendingWrites.splice(0, batchSize)
-        
-        if (settings.debugLevel >= 2) {
-            console.log("CACHE: Processing", writesToProcess.length, "database writes in batch")
-        }
-        
-        db.transaction(function(tx) {
-            for (var i = 0; i < writesToProcess.length; i++) {
-                var write = writesToProcess[i]
-                try {
-                    // Convert table to string to handle potential objects
-                    var tableName = String(write.table)
-                    
-                    // Handle DELETE operations differently
-                    if (tableName.indexOf('_delete') !== -1 || (write.data && write.data.operation === 'DELETE')) {
-                        var actualTable = tableName.replace('_delete', '')
-                        var deleteId = write.data.id || write.data.trackid || write.data.albumid || write.data.artistid || 
-                                      write.data.playlistid || write.data.mixid || write.data.trackId
-                        tx.executeSql('DELETE FROM ' + actualTable + ' WHERE id = ?', [deleteId])
-                    } else {
-                        // Handle INSERT/REPLACE operations
-                        var id = write.data.trackid || write.data.albumid || write.data.artistid || 
-                                 write.data.playlistid || write.data.mixid || write.data.trackId
-                        tx.executeSql('INSERT OR REPLACE INTO ' + tableName + '(id, data, timestamp) VALUES(?, ?, ?)',
-                            [id, JSON.stringify(write.data), write.timestamp])
-                    }
-                } catch (e) {
-                    console.error("Batch write error:", e, "for table:", write.table)
-                }
-            }
-        })
-        
-        batchWriteInProgress = false
-        
-        // Process remaining writes if any
-        if (pendingWrites.length > 0) {
-            batchWriteTimer.start()
-        }
+    function queueLookup(kind, id) {
+        if (id === undefined || id === null || id === "")
+            return
+        var key = kind + ":" + id
+        var now = Date.now()
+        if (lookupRequested[key] && now - lookupRequested[key] < lookupRetryInterval)
+            return
+        lookupRequested[key] = now
+        if (!pendingLookups[kind])
+            pendingLookups[kind] = {}
+        pendingLookups[kind][id] = true
+        if (!lookupTimer.running)
+            lookupTimer.start()
     }
-    
+
     // PERFORMANCE: Incremental cleanup functions
     function startIncrementalCleanup() {
         if (cleanupInProgress) {
@@ -206,6 +160,7 @@ id: root
         }
         cleanupInProgress = true
         cleanupQueue = []
+        lookupRequested = ({})
         
         // Queue all cache types for cleanup
         var cacheTypes = [
@@ -256,7 +211,7 @@ id: root
                 console.log("CACHE: Cleaning", expiredKeys.length, "expired", batch.type, "entries")
             }
             
-            // Remove from cache and access order
+            // Remove from cache and access order; the Python store prunes itself
             for (var j = 0; j < expiredKeys.length; j++) {
                 var expiredKey = expiredKeys[j]
                 delete batch.cache[expiredKey]
@@ -266,31 +221,17 @@ id: root
                     batch.accessOrder.splice(orderIndex, 1)
                 }
             }
-            
-            // Queue database cleanup
-            queueDatabaseCleanup(batch.type, expiredKeys)
-        }
-    }
-    
-    function queueDatabaseCleanup(tableName, expiredKeys) {
-        // Use batch write system for database cleanup
-        for (var i = 0; i < expiredKeys.length; i++) {
-            queueWrite(tableName + '_delete', {
-                id: expiredKeys[i],
-                operation: 'DELETE'
-            })
         }
     }
 
     Component.onCompleted: {
-        initDatabase()
-        // Entries are loaded lazily per id (see loadFromDb); expired rows are
-        // pruned in SQL after startup instead of scanning every row into memory.
-        dbPruneTimer.start()
+        // Entries are persisted and pruned by the Python metadata store and
+        // looked up from there in batches (see queueLookup)
+        legacyDbTimer.start()
 
         // Log initial cache stats
         if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
-            console.log("TidalCache initialized with lazy DB loading + LRU, max size per type:", maxCacheSize)
+            console.log("TidalCache initialized with batched store lookups + LRU, max size per type:", maxCacheSize)
     }
 
     // Verbindungen zu den Python-Signalen
@@ -314,7 +255,7 @@ id: root
                 duration: track_info.duration,
                 image: track_info.image,
                 track_num : track_info.track_num,
-                timestamp: Date.now(),
+                timestamp: track_info.timestamp || Date.now(),
                 fromSearch: true  // Optional: markiert Einträge aus der Suche
             })
         }
@@ -325,16 +266,27 @@ id: root
                 console.error("artist_info is undefined. skipping save")
                 return;
             }            
+            // Bios are loaded lazily, keep one we already have
+            var known = artistCache[artist_info.artistid]
             saveArtistToCache({
                 artistid: artist_info.artistid,
                 name: artist_info.name,
                 image: artist_info.image,
-                bio: artist_info.bio,
-                timestamp: Date.now(),
+                bio: artist_info.bio || (known ? known.bio : ""),
+                timestamp: artist_info.timestamp || Date.now(),
                 fromSearch: true  // Optional: markiert Einträge aus der Suche
             })
         }
 
+        onArtistBio: {
+            var known = artistCache[artistid]
+            if (known && known.bio !== bio) {
+                known.bio = bio
+                known.timestamp = Date.now()
+                saveArtistToCache(known)
+            }
+        }
+
         onCacheAlbum: {
             //album_info
             if (album_info == undefined) {
@@ -350,7 +302,7 @@ id: root
                 duration: album_info.duration,
                 num_tracks : album_info.num_tracks,
                 year : album_info.year,
-                timestamp: Date.now(),
+                timestamp: album_info.timestamp || Date.now(),
                 fromSearch: true  // Optional: markiert Einträge aus der Suche
             })
         }
@@ -366,7 +318,7 @@ id: root
                 title: playlist_info.title,
                 image: playlist_info.image,
                 duration: playlist_info.duration,
-                timestamp: Date.now(),
+                timestamp: playlist_info.timestamp || Date.now(),
                 fromSearch: true  // Optional: markiert Einträge aus der Suche
             })
         }
@@ -387,7 +339,7 @@ id: root
                 duration: mix_info.duration,
                 image: mix_info.image,
                 track_num : mix_info.track_num,
-                timestamp: Date.now(),
+                timestamp: mix_info.timestamp || Date.now(),
                 fromSearch: true  // Optional: markiert Einträge aus der Suche
             })
         }
@@ -455,246 +407,131 @@ id: root
         });
     }
 
-    // Info-Getter: reine Cache/DB-Lookups, blockieren nie den UI-Thread.
-    // Bei Miss wird asynchron nachgeladen (Ergebnis kommt als cache*-Signal
-    // zurueck und wird ueber die Connections unten gespeichert); ein
-    // abgelaufener Eintrag wird sofort geliefert und im Hintergrund
-    // aufgefrischt. - Claude Generated
+    // Info-Getter: reine Cache-Lookups, blockieren nie den UI-Thread.
+    // Bei Miss oder abgelaufenem Eintrag wird gesammelt im Python-Store
+    // nachgeschlagen (queueLookup); der liefert gespeicherte Eintraege
+    // sofort und holt fehlende/abgelaufene aus dem Netz. Ergebnisse kommen
+    // als cache*-Signale zurueck und landen ueber die Connections oben im
+    // LRU-Speicher.
     function getTrackInfo(id) {
         var cached = getTrack(id)
         if (!cached || Date.now() - cached.timestamp >= maxCacheAge)
-            tidalApi.requestTrackInfo(id)
+            queueLookup("track", id)
         return cached
     }
 
     function getAlbumInfo(id) {
         var cached = getAlbum(id)
         if (!cached || Date.now() - cached.timestamp >= maxCacheAge)
-            tidalApi.requestAlbumInfo(id)
+            queueLookup("album", id)
         return cached
     }
 
     function getArtistInfo(id) {
         var cached = getArtist(id)
         if (!cached || Date.now() - cached.timestamp >= maxCacheAge)
-            tidalApi.requestArtistInfo(id)
+            queueLookup("artist", id)
         return cached
     }
 
     function getPlaylistInfo(id) {
         var cached = getPlaylist(id)
         if (!cached || Date.now() - cached.timestamp >= maxCacheAge)
-            tidalApi.requestPlaylistInfo(id)
+            queueLookup("playlist", id)
         return cached
     }
 
     function getMixInfo(id) {
         var cached = getMix(id)
         if (!cached || Date.now() - cached.timestamp >= maxCacheAge)
-            tidalApi.requestMixInfo(id)
+            queueLookup("mix", id)
         return cached
     }
 
-    // Datenbank initialisieren
-    function initDatabase() {
-        db = LocalStorage.openDatabaseSync("TidalCache", "1.2", "Cache for Tidal data", 1000000)
-        db.transaction(function(tx) {
-            // Tracks Tabelle
-            tx.executeSql('CREATE TABLE IF NOT EXISTS tracks(id TEXT PRIMARY KEY, data TEXT, timestamp INTEGER)')
-            tx.executeSql('CREATE INDEX IF NOT EXISTS tracks_timestamp_idx ON tracks(timestamp)')
-
-
-            tx.executeSql('CREATE TABLE IF NOT EXISTS albums(id TEXT PRIMARY KEY, data TEXT, timestamp INTEGER)')
-            tx.executeSql('CREATE INDEX IF NOT EXISTS albums_timestamp_idx ON albums(timestamp)')
-
-            // Artists Tabelle
-            tx.executeSql('CREATE TABLE IF NOT EXISTS artists(id TEXT PRIMARY KEY, data TEXT, timestamp INTEGER)')
-            tx.executeSql('CREATE INDEX IF NOT EXISTS artists_timestamp_idx ON artists(timestamp)')
-        
-            // Playlists Tabelle
-            tx.executeSql('CREATE TABLE IF NOT EXISTS playlists(id TEXT PRIMARY KEY, data TEXT, timestamp INTEGER)') 
-            tx.executeSql('CREATE INDEX IF NOT EXISTS playlists_timestamp_idx ON playlists(timestamp)')
-            
-            // Mixes Tabelle
-            tx.executeSql('CREATE TABLE IF NOT EXISTS mixes(id TEXT PRIMARY KEY, data TEXT, timestamp INTEGER)')
-            tx.executeSql('CREATE INDEX IF NOT EXISTS mixes_timestamp_idx ON mixes(timestamp)')
-
-            // Migration: Drop unused urls table if it exists
+    // Alte LocalStorage-Tabellen entfernen, der Cache liegt jetzt in Python
+    function dropLegacyDatabase() {
+        var legacy = LocalStorage.openDatabaseSync("TidalCache", "", "Cache for Tidal data", 1000000)
+        legacy.transaction(function(tx) {
+            tx.executeSql('DROP TABLE IF EXISTS tracks')
+            tx.executeSql('DROP TABLE IF EXISTS albums')
+            tx.executeSql('DROP TABLE IF EXISTS artists')
+            tx.executeSql('DROP TABLE IF EXISTS playlists')
+            tx.executeSql('DROP TABLE IF EXISTS mixes')
             tx.executeSql('DROP TABLE IF EXISTS urls')
         })
     }
 
-    // Einzelnen Eintrag lazy aus der DB in den LRU-Cache laden - Claude Generated
-    function loadFromDb(table, cache, accessOrder, id) {
-        if (!db || id === undefined || id === null)
-            return null
-        var item = null
-        db.readTransaction(function(tx) {
-            var rs = tx.executeSql('SELECT data FROM ' + table + ' WHERE id = ?', [String(id)])
-            if (rs.rows.length > 0) {
-                try {
-                    item = JSON.parse(rs.rows.item(0).data)
-                } catch(e) {
-                    console.error("Error parsing", table, "data:", e)
-                }
-            }
-        })
-        if (item)
-            addToLRU(cache, accessOrder, id, item)
-        return item
-    }
-
-    // Abgelaufene Einträge direkt in SQL löschen (nutzt timestamp-Index) - Claude Generated
-    function pruneExpiredDb() {
-        if (!db)
-            return
-        var cutoff = Date.now() - maxCacheAge
-        db.transaction(function(tx) {
-            tx.executeSql('DELETE FROM tracks WHERE timestamp < ?', [cutoff])
-            tx.executeSql('DELETE FROM albums WHERE timestamp < ?', [cutoff])
-            tx.executeSql('DELETE FROM artists WHERE timestamp < ?', [cutoff])
-            tx.executeSql('DELETE FROM playlists WHERE timestamp < ?', [cutoff])
-            tx.executeSql('DELETE FROM mixes WHERE timestamp < ?', [cutoff])
-        })
-        if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 2)
-            console.log("CACHE: Pruned expired DB entries older than", new Date(cutoff))
-    }
-
-    // Cache-Speicherfunktionen - Now with Database Batching
+    // Cache-Speicherfunktionen: nur der LRU-Speicher, persistiert wird in
+    // Python beim Senden der cache*-Signale
     function saveTrackToCache(trackData) {
-        // PERFORMANCE: Use LRU cache instead of unlimited growth
         addToLRU(trackCache, trackAccessOrder, trackData.trackid, trackData)
-        
-        // PERFORMANCE: Queue write instead of immediate transaction
-        queueWrite('tracks', trackData)
     }
 
     function saveAlbumToCache(albumData) {
-        // PERFORMANCE: Use LRU cache
         addToLRU(albumCache, albumAccessOrder, albumData.albumid, albumData)
-        
-        // PERFORMANCE: Queue write instead of immediate transaction
-        queueWrite('albums', albumData)
     }
 
     function saveArtistToCache(artistData) {
-        // PERFORMANCE: Use LRU cache
         addToLRU(artistCache, artistAccessOrder, artistData.artistid, artistData)
-        
-        // PERFORMANCE: Queue write instead of immediate transaction
-        queueWrite('artists', artistData)
     }
 
     function savePlaylistToCache(playlistData) {
-        // PERFORMANCE: Use LRU cache
         addToLRU(playlistCache, playlistAccessOrder, playlistData.playlistid, playlistData)
-        
-        // PERFORMANCE: Queue write instead of immediate transaction
-        queueWrite('playlists', playlistData)
     }
 
     function saveMixToCache(mixData) {
-        // PERFORMANCE: Use LRU cache
         addToLRU(mixCache, mixAccessOrder, mixData.mixid, mixData)
-        
-        // PERFORMANCE: Queue write instead of immediate transaction
-        queueWrite('mixes', mixData)
     }
 
-    // Getter-Funktionen: erst LRU-Speicher, dann lazy aus der DB
+    // Getter-Funktionen: nur der LRU-Speicher, siehe get*Info fuer Misses
     function getTrack(id) {
         var track = trackCache[id] || null
         if (track) {
             // PERFORMANCE: Update LRU access order
             touchLRU(trackAccessOrder, id)
-            return track
         }
-        return loadFromDb('tracks', trackCache, trackAccessOrder, id)
+        return track
     }
 
     function getAlbum(id) {
         var album = albumCache[id] || null
-        if (album) {
+        if (album)
             touchLRU(albumAccessOrder, id)
-            return album
-        }
-        return loadFromDb('albums', albumCache, albumAccessOrder, id)
+        return album
     }
 
     function getArtist(id) {
         var artist = artistCache[id] || null
-        if (artist) {
+        if (artist)
             touchLRU(artistAccessOrder, id)
-            return artist
-        }
-        return loadFromDb('artists', artistCache, artistAccessOrder, id)
+        return artist
     }
 
     function getPlaylist(id) {
         var playlist = playlistCache[id] || null
-        if (playlist) {
+        if (playlist)
             touchLRU(playlistAccessOrder, id)
-            return playlist
-        }
-        return loadFromDb('playlists', playlistCache, playlistAccessOrder, id)
+        return playlist
     }
 
     function getMix(id) {
         var mix = mixCache[id] || null
-        if (mix) {
+        if (mix)
             touchLRU(mixAccessOrder, id)
-            return mix
-        }
-        return loadFromDb('mixes', mixCache, mixAccessOrder, id)
+        return mix
     }
 
-    // Cache-Statistiken
+    // Cache-Statistiken des LRU-Speichers; die des Stores liefert
+    // tidalApi.getMetadataStats()
     function getCacheStats() {
         var stats = {
-            tracks: { count: 0, oldest: null, newest: null },
-            albums: { count: 0, oldest: null, newest: null },
-            artists: { count: 0, oldest: null, newest: null },
-            playlists: { count: 0, oldest: null, newest: null },
-            mixes: { count: 0, oldest: null, newest: null }
+            tracks: trackAccessOrder.length,
+            albums: albumAccessOrder.length,
+            artists: artistAccessOrder.length,
+            playlists: playlistAccessOrder.length,
+            mixes: mixAccessOrder.length
         }
-
-        db.transaction(function(tx) {
-            var rs = tx.executeSql('SELECT COUNT(*) as count, MIN(timestamp) as oldest, MAX(timestamp) as newest FROM tracks')
-            stats.tracks = {
-                count: rs.rows.item(0).count,
-                oldest: new Date(rs.rows.item(0).oldest),
-                newest: new Date(rs.rows.item(0).newest)
-            }
-
-            rs = tx.executeSql('SELECT COUNT(*) as count, MIN(timestamp) as oldest, MAX(timestamp) as newest FROM albums')
-            stats.albums = {
-                count: rs.rows.item(0).count,
-                oldest: new Date(rs.rows.item(0).oldest),
-                newest: new Date(rs.rows.item(0).newest)
-            }
-
-            rs = tx.executeSql('SELECT COUNT(*) as count, MIN(timestamp) as oldest, MAX(timestamp) as newest FROM artists')
-            stats.artists = {
-                count: rs.rows.item(0).count,
-                oldest: new Date(rs.rows.item(0).oldest),
-                newest: new Date(rs.rows.item(0).newest)
-            }
-
-            rs = tx.executeSql('SELECT COUNT(*) as count, MIN(timestamp) as oldest, MAX(timestamp) as newest FROM playlists')
-            stats.playlists = {
-                count: rs.rows.item(0).count,
-                oldest: new Date(rs.rows.item(0).oldest),
-                newest: new Date(rs.rows.item(0).newest)
-            }
-
-            rs = tx.executeSql('SELECT COUNT(*) as count, MIN(timestamp) as oldest, MAX(timestamp) as newest FROM mixes')
-            stats.mixes = {
-                count: rs.rows.item(0).count,
-                oldest: new Date(rs.rows.item(0).oldest),
-                newest: new Date(rs.rows.item(0).newest)
-            }
-        })
-
+        stats.total = stats.tracks + stats.albums + stats.artists + stats.playlists + stats.mixes
         return stats
     }
 
@@ -702,13 +539,9 @@ id: root
     function clearCache() {
         if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
             console.log("clearing cache.")
-        db.transaction(function(tx) {
-            tx.executeSql('DELETE FROM tracks')
-            tx.executeSql('DELETE FROM albums')
-            tx.executeSql('DELETE FROM artists')
-            tx.executeSql('DELETE FROM playlists')
-            tx.executeSql('DELETE FROM mixes')
-        })
+        tidalApi.clearMetadataCache()
+        tidalApi.clearImageCache()
+        tidalApi.clearStreamCache()
         trackCache = ({})
         albumCache = ({})
         artistCache = ({})
@@ -719,5 +552,7 @@ id: root
         artistAccessOrder = []
         playlistAccessOrder = []
         mixAccessOrder = []
+        pendingLookups = ({})
+        lookupRequested = ({})
     }
 }
@@ -58,6 +58,8 @@ ApplicationWindow
         property bool radioMixesList: true // personal radio stations
         property bool topArtistsList: true // your top artists (most played)
         property bool enableTrackPreloading: false // dual audio player for seamless transitions
+        property bool fastStart: false // start at low quality, switch to the configured one
+        property bool adaptiveQuality: true // lower the quality per track on slow connections
         property int crossfadeMode: 1 // crossfade mode: 0=No Fade, 1=Timer, 2=Buffer Crossfade, 3=Buffer Fade-Out
         property int crossfadeTimeMs: 1000 // crossfade time in milliseconds
         property int debugLevel: 0 // debug logging level: 0=None, 1=Normal, 2=Informative, 3=Verbose/Spawn
@@ -511,6 +513,18 @@ ApplicationWindow
         key : "/enableTrackPreloading"
         defaultValue: false
     }
+
+    ConfigurationValue {
+        id: fastStartConfig
+        key : "/fastStart"
+        defaultValue: false
+    }
+
+    ConfigurationValue {
+        id: adaptiveQualityConfig
+        key : "/adaptiveQuality"
+        defaultValue: true
+    }
     
     ConfigurationValue {
         id: crossfadeModeConfig
@@ -1098,6 +1112,8 @@ ApplicationWindow
             radioMixesListConfig.value = applicationWindow.settings.radioMixesList
             topArtistsListConfig.value = applicationWindow.settings.topArtistsList
             enableTrackPreloadingConfig.value = applicationWindow.settings.enableTrackPreloading
+            fastStartConfig.value = applicationWindow.settings.fastStart
+            adaptiveQualityConfig.value = applicationWindow.settings.adaptiveQuality
             crossfadeModeConfig.value = applicationWindow.settings.crossfadeMode
             crossfadeTimeMsConfig.value = applicationWindow.settings.crossfadeTimeMs
             debugLevelConfig.value = applicationWindow.settings.debugLevel
@@ -1165,6 +1181,8 @@ ApplicationWindow
                 console.log("Personal: invalid homescreenSectionOrder, using default:", e)
         }
         applicationWindow.settings.enableTrackPreloading = enableTrackPreloadingConfig.value
+        applicationWindow.settings.fastStart = fastStartConfig.value
+        applicationWindow.settings.adaptiveQuality = adaptiveQualityConfig.value
         applicationWindow.settings.crossfadeMode = crossfadeModeConfig.value
         applicationWindow.settings.crossfadeTimeMs = crossfadeTimeMsConfig.value
         applicationWindow.settings.debugLevel = debugLevelConfig.value
@@ -1237,6 +1255,8 @@ ApplicationWindow
         radioMixesListConfig.value = applicationWindow.settings.radioMixesList
         topArtistsListConfig.value = applicationWindow.settings.topArtistsList
         enableTrackPreloadingConfig.value = applicationWindow.settings.enableTrackPreloading
+        fastStartConfig.value = applicationWindow.settings.fastStart
+        adaptiveQualityConfig.value = applicationWindow.settings.adaptiveQuality
         crossfadeModeConfig.value = applicationWindow.settings.crossfadeMode
         crossfadeTimeMsConfig.value = applicationWindow.settings.crossfadeTimeMs
         debugLevelConfig.value = applicationWindow.settings.debugLevel
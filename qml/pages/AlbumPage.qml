@@ -295,7 +295,8 @@ Page {
 
     Component.onCompleted: {
         if (albumId > 0) {
-            albumData = cacheManager.getAlbumInfo(albumId)
+            // the TrackList loads info and tracks via loadAlbumPage()
+            albumData = cacheManager.getAlbum(albumId)
             if (albumData) {
                 initialized = true
                 isFav = favManager.isFavorite(albumId)
@@ -324,7 +325,7 @@ Page {
                 return
             }
             if (albumId === album_info.albumid) {
-                albumData = cacheManager.getAlbumInfo(albumId)
+                albumData = cacheManager.getAlbum(albumId) || album_info
                 if (albumData) {
                     initialized = true
                     isFav = favManager.isFavorite(albumId)
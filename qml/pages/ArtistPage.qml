@@ -397,12 +397,11 @@ Page {
 
             isFav = favManager.isFavorite(artistId)
 
-            tidalApi.getAlbumsofArtist(artistId)
-            tidalApi.getTopTracksofArtist(artistId)
-            tidalApi.getSimiliarArtist(artistId)
-            //todo: tidalApi.getArtistRadio(artistId)
+            // one composite request; "info" refreshes the cached artist
+            //todo: add "radio" once the page shows the artist radio
+            tidalApi.loadArtistPage(artistId, ["info", "albums", "topTracks", "similar", "bio"])
 
-            artistData = cacheManager.getArtistInfo(artistId)
+            artistData = cacheManager.getArtist(artistId)
             if (artistData) {
                 if (!artistData.image) {
                     artistData.image = "image://theme/icon-m-media-artists"
@@ -457,6 +456,12 @@ Page {
             }
         }
 
+        onArtistBio: {
+            if (artistid == artistId && bio) {
+                bioText.text = processWimpLinks(bio)
+            }
+        }
+
         onTrackAdded: {
             topTracks
             .addTrack(title, artist, album, id, duration)
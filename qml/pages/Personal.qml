@@ -209,14 +209,20 @@ Item {
         }
     }
 
-    // PERFORMANCE: Phase 1 - recent + foryou
+    // PERFORMANCE: Phase 1 - every pages/... section in one parallel fan-out
     Timer {
         id: phaseOneTimer
         interval: 0
         repeat: false
         onTriggered: {
-            if (applicationWindow.settings.recentList) tidalApi.getRecentPage()
-            if (applicationWindow.settings.yourList)   tidalApi.getForYouPage()
+            // All pages/... sections are fetched concurrently in one call
+            var sections = []
+            if (applicationWindow.settings.recentList)     sections.push("recent")
+            if (applicationWindow.settings.yourList)       sections.push("foryou")
+            if (applicationWindow.settings.dailyMixesList) sections.push("dailyMixes")
+            if (applicationWindow.settings.radioMixesList) sections.push("radioMixes")
+            if (applicationWindow.settings.topArtistsList) sections.push("favArtists")
+            if (sections.length > 0) tidalApi.loadHomeScreen(sections)
         }
     }
 
@@ -248,15 +254,6 @@ Item {
             if (applicationWindow.settings.personalPlaylistList) {
                 tidalApi.getPersonalPlaylists()
             }
-            if (applicationWindow.settings.dailyMixesList) {
-                tidalApi.getDailyMixes()
-            }
-            if (applicationWindow.settings.radioMixesList) {
-                tidalApi.getRadioMixes()
-            }
-            if (applicationWindow.settings.topArtistsList) {
-                tidalApi.getTopArtists()
-            }
         }
     }
 
@@ -13,6 +13,13 @@ Item {
     readonly property int typePlaylist: 4
     readonly property int typeVideo: 5
 
+    // Progressive search state: the query the pages belong to, the next
+    // offset per category (-1 when complete) and the keys of the local hits
+    // and the top hit, which the remote pages must not repeat
+    property string pagedQuery: ""
+    property var searchNext: ({})
+    property var shownKeys: ({})
+
     SilicaFlickable {
         anchors.fill: parent
         clip: true //miniPlayerPanel.expanded
@@ -40,11 +47,20 @@ Item {
                 label: qsTr("Please wait for login ...")
                 enabled: tidalApi.loginTrue
 
+                onTextChanged: {
+                    if (text.length === 0)
+                        listModel.clear()
+                    tidalApi.searchAsYouType(text)
+                }
+
                 EnterKey.enabled: text.length > 0
                 EnterKey.iconSource: "image://theme/icon-m-search"
                 EnterKey.onClicked: {
                     listModel.clear()
-                    tidalApi.genericSearch(text)
+                    pagedQuery = text
+                    searchNext = ({})
+                    shownKeys = ({})
+                    tidalApi.searchPaged(text)
                     focus = false
                 }
             }
@@ -113,6 +129,36 @@ Item {
                 itemData: model
             }
 
+            PushUpMenu {
+                visible: moreTracks.visible || moreAlbums.visible
+                         || moreArtists.visible || morePlaylists.visible
+
+                MenuItem {
+                    id: moreTracks
+                    text: qsTr("More tracks")
+                    visible: searchNext.tracks !== undefined && searchNext.tracks >= 0
+                    onClicked: tidalApi.searchMore(pagedQuery, "tracks", searchNext.tracks)
+                }
+                MenuItem {
+                    id: moreAlbums
+                    text: qsTr("More albums")
+                    visible: searchNext.albums !== undefined && searchNext.albums >= 0
+                    onClicked: tidalApi.searchMore(pagedQuery, "albums", searchNext.albums)
+                }
+                MenuItem {
+                    id: moreArtists
+                    text: qsTr("More artists")
+                    visible: searchNext.artists !== undefined && searchNext.artists >= 0
+                    onClicked: tidalApi.searchMore(pagedQuery, "artists", searchNext.artists)
+                }
+                MenuItem {
+                    id: morePlaylists
+                    text: qsTr("More playlists")
+                    visible: searchNext.playlists !== undefined && searchNext.playlists >= 0
+                    onClicked: tidalApi.searchMore(pagedQuery, "playlists", searchNext.playlists)
+                }
+            }
+
                 VerticalScrollDecorator {}
             }
         }
@@ -127,6 +173,10 @@ Item {
         onLoginFailed: searchField.label = qsTr("Please go to the settings and login via OAuth")
 
         onSearchResults: {
+            // incremental results of a query the field no longer shows
+            if (search_results.query !== undefined
+                    && search_results.query !== normalizedQuery(searchField.text))
+                return
             listModel.clear()
             addSearchResultsToModel(search_results)
         }
@@ -155,6 +205,39 @@ Item {
             listModel.append(createVideoItem(video_info))
         }
 
+        onLocalSearchResults: {
+            if (results.query !== pagedQuery)
+                return
+            ["tracks", "albums", "artists", "playlists", "videos"].forEach(function(category) {
+                results[category].forEach(function(info) {
+                    addSearchItem(category, info)
+                })
+            })
+        }
+
+        onSearchTopHit: {
+            if (hit.query !== pagedQuery || shownKeys[searchItemKey(hit.category, hit.item)])
+                return
+            var item = createSearchItem(hit.category, hit.item)
+            if (item) {
+                shownKeys[searchItemKey(hit.category, hit.item)] = true
+                listModel.insert(0, item)
+            }
+        }
+
+        onSearchCategoryPage: {
+            if (page.query !== pagedQuery)
+                return
+            page.items.forEach(function(info) {
+                addSearchItem(page.category, info)
+            })
+            var next = {}
+            for (var category in searchNext)
+                next[category] = searchNext[category]
+            next[page.category] = page.next
+            searchNext = next
+        }
+
         // PERFORMANCE: Batch signal handlers for improved search performance
         onFoundTracksBatch: {
             tracks_array.forEach(function(track) {
@@ -183,6 +266,10 @@ Item {
     }
 
     // Hilfsfunktionen
+    function normalizedQuery(text) {
+        return text.toLowerCase().trim().split(/\s+/).join(" ")
+    }
+
     function addSearchResultsToModel(results) {
         // Tracks hinzufügen
         results.tracks.forEach(function(track) {
@@ -204,6 +291,34 @@ Item {
         })
     }
 
+    function createSearchItem(category, info) {
+        switch (category) {
+        case "tracks": return createTrackItem(info)
+        case "albums": return createAlbumItem(info)
+        case "artists": return createArtistItem(info)
+        case "playlists": return createPlaylistItem(info)
+        case "videos": return createVideoItem(info)
+        }
+        return null
+    }
+
+    // Append a result unless it is already in the list
+    function addSearchItem(category, info) {
+        var key = searchItemKey(category, info)
+        if (shownKeys[key])
+            return
+        var item = createSearchItem(category, info)
+        if (item) {
+            shownKeys[key] = true
+            listModel.append(item)
+        }
+    }
+
+    function searchItemKey(category, info) {
+        return category + ":" + (info.trackid || info.albumid || info.artistid
+                                 || info.playlistid || info.videoid)
+    }
+
     function createTrackItem(track) {
         return {
             name: track.title,
@@ -209,7 +209,7 @@ Page {
                     MenuItem { text: qsTr("Low (96 kbps)") }
                     MenuItem { text: qsTr("High (320 kbps)") }
                     MenuItem { text: qsTr("Lossless (FLAC)") }
-                    MenuItem { text: qsTr("Master (MQA)") }
+                    MenuItem { text: qsTr("Hi-Res (FLAC)") }
                 }
                 onCurrentIndexChanged: {
                     if (currentIndex >= 0 && currentIndex < qualities.length) {
@@ -229,6 +229,29 @@ Page {
                 }
             }
 
+            TextSwitch {
+                id: fastStart
+                visible: tidalApi.loginTrue
+                text: qsTr("Fast start")
+                description: qsTr("Start tracks at low quality and switch to the selected quality once it is buffered")
+                checked: applicationWindow.settings.fastStart || false
+                onClicked: {
+                    applicationWindow.settings.fastStart = fastStart.checked
+                }
+            }
+
+            TextSwitch {
+                id: adaptiveQuality
+                visible: tidalApi.loginTrue
+                text: qsTr("Adaptive quality")
+                description: qsTr("Play tracks at a lower quality than the selected one when the connection is too slow for it")
+                checked: applicationWindow.settings.adaptiveQuality !== false
+                onClicked: {
+                    applicationWindow.settings.adaptiveQuality = adaptiveQuality.checked
+                    tidalApi.setAdaptiveQuality(adaptiveQuality.checked)
+                }
+            }
+
             TextSwitch {
                 id: enableTrackPreloading
                 visible: tidalApi.loginTrue
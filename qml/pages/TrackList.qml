@@ -148,12 +148,29 @@ Item {
                     "id": track.id,
                     "trackid": track.id,
                     "duration": track.duration,
-                    "image": track.image,
+                    "image": localImages[track.image] || track.image,
                     "index": i
                 })
             }
         }
 
+        // Cover art of the visible page and the rows below it: these rows show
+        // their art once the backend has it on disk (imagesCached), so every
+        // cover is downloaded once
+        var first = Math.max(0, tracks.indexAt(0, tracks.contentY))
+        var prefetch = []
+        for (var p = first; p < Math.min(newItems.length, first + prefetchImageRows); ++p) {
+            var image = newItems[p].image
+            if (!image || image.indexOf("http") !== 0)
+                continue
+            if (!pendingImages[image]) {
+                pendingImages[image] = []
+                prefetch.push(image)
+            }
+            pendingImages[image].push({ "row": p, "trackid": newItems[p].trackid })
+            newItems[p].image = ""
+        }
+
         // Preserve scroll position and current active focus
         var savedContentY = tracks.contentY
         var savedAnimate = tracks.animateScrolling
@@ -189,6 +206,60 @@ Item {
         if (savedHasFocus && savedFocusItem) {
             savedFocusItem.forceActiveFocus()
         }
+
+        if (prefetch.length > 0)
+            tidalApi.prefetchImages(prefetch)
+    }
+
+    // Rows from the top of the view whose cover art refreshList() prefetches
+    property int prefetchImageRows: 30
+    // Remote cover URL -> file:// URL of the art the backend has on disk
+    property var localImages: ({})
+    // Remote cover URL -> [{row, trackid}] waiting for its prefetch
+    property var pendingImages: ({})
+
+    // Playlists arrive in pages: pagesPerLoad pages up front, the next ones
+    // once the list is scrolled to its end. nextOffset is the cursor of the
+    // last collectionPage, -1 once the whole playlist is in the model.
+    property int pagesPerLoad: 2
+    property int nextOffset: -1
+    property int pagesPending: 0
+
+    function loadPlaylistPages(offset) {
+        pagesPending = pagesPerLoad
+        tidalApi.getPlaylistTracks(playlistId, offset, pagesPerLoad)
+    }
+
+    function playlistPageLoaded(page_info) {
+        if (type !== "playlist" || page_info.source !== "playlist"
+                || page_info.id !== playlistId)
+            return
+        nextOffset = page_info.next
+        pagesPending = nextOffset < 0 ? 0 : pagesPending - 1
+        // A short first load may not fill the screen, so nothing scrolls
+        if (pagesPending === 0 && tracks.atYEnd)
+            loadMorePlaylistPages()
+    }
+
+    function loadMorePlaylistPages() {
+        if (type === "playlist" && pagesPending === 0 && nextOffset > 0)
+            loadPlaylistPages(nextOffset)
+    }
+
+    function showCachedImages(images) {
+        for (var i = 0; i < images.length; ++i) {
+            var url = images[i].url
+            if (images[i].image.indexOf("file://") === 0)
+                localImages[url] = images[i].image
+            var rows = pendingImages[url] || []
+            delete pendingImages[url]
+            for (var j = 0; j < rows.length; ++j) {
+                var row = rows[j].row
+                if (row < listModel.count && listModel.get(row).trackid === rows[j].trackid
+                        && listModel.get(row).image === "")
+                    listModel.setProperty(row, "image", images[i].image)
+            }
+        }
     }
 
     // Add styling properties
@@ -267,6 +338,8 @@ Item {
         
         // Conditional smooth animated scrolling - Claude Generated
         property bool animateScrolling: false
+
+        onAtYEndChanged: if (atYEnd) loadMorePlaylistPages()
         
         Behavior on contentY {
             enabled: tracks.animateScrolling
@@ -835,9 +908,9 @@ Item {
         if (type === "playlist") {
             if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
                 console.log("getPlaylistTracks")
-            tidalApi.getPlaylistTracks(playlistId)
+            loadPlaylistPages(0)
         } else if (type == "album") {
-            tidalApi.getAlbumTracks(albumId)
+            tidalApi.loadAlbumPage(albumId)
         } else if (type == "mix") {
             if (applicationWindow.settings && applicationWindow.settings.debugLevel >= 1)
                 console.log("getMixTracks")
@@ -861,6 +934,8 @@ Item {
 
     Connections {
         target: tidalApi
+        onImagesCached: showCachedImages(images)
+        onCollectionPage: playlistPageLoaded(page_info)
         onCacheTrack: {
             if (type === "current" && listModel.count < playlistManager.size)
                 cacheRefreshTimer.restart()
@@ -7,10 +7,14 @@ sys.path.append("/usr/share/harbour-tidalplayer/lib/python" + str(major) + "." +
 
 sys.path.append('/usr/share/harbour-tidalplayer/python/')
 sys.path.append('/usr/share/harbour-tidalplayer/python/python-future/')
-import socket
-import requests
-import json
-import tidalapi
+# backend/ lives next to this file, make it importable however we are loaded
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from collections import OrderedDict
+import threading
 import pyotherside
 
 # Debug function for controlled logging synchronized with QML debug levels
@@ -44,33 +48,51 @@ def debug_log(message, level=1, force=False):
 
 # Enhanced import with error handling and debug info
 debug_log("Starting TidalAPI Python backend initialization", level=1)
-debug_log(f"Python version: {sys.version}", level=2)
-debug_log(f"Python path: {sys.path[:3]}...", level=2)
 
 # Add custom Python path
 python_path = '/usr/share/harbour-tidalplayer/python/'
 if python_path not in sys.path:
     sys.path.append(python_path)
-    debug_log(f"Added Python path: {python_path}", level=2)
 
-# Check if path exists
-if os.path.exists(python_path):
-    debug_log(f"Python path verified: {python_path}", level=2)
-    if os.path.exists(os.path.join(python_path, 'tidalapi')):
-        debug_log("TidalAPI package found in Python path", level=2)
+
+def log_environment():
+    """Debug details about the interpreter and the tidalapi install.
+
+    Kept out of the import path; called from preload() once the UI is up.
+    """
+    debug_log(f"Python version: {sys.version}", level=2)
+    debug_log(f"Python path: {sys.path[:3]}...", level=2)
+    if os.path.exists(python_path):
+        debug_log(f"Python path verified: {python_path}", level=2)
+        if os.path.exists(os.path.join(python_path, 'tidalapi')):
+            debug_log("TidalAPI package found in Python path", level=2)
+        else:
+            debug_log("WARNING: TidalAPI package not found in Python path", level=1, force=True)
     else:
-        debug_log("WARNING: TidalAPI package not found in Python path", level=1, force=True)
-else:
-    debug_log(f"WARNING: Python path does not exist: {python_path}", level=1, force=True)
+        debug_log(f"WARNING: Python path does not exist: {python_path}", level=1, force=True)
 
-# Import TidalAPI submodules; heavy optional deps (typing_extensions, dateutil,
-# isodate, mpegdash) are no longer forced here - they load lazily on first use.
+
+# tidalapi resolves its submodules on first use and requests is bound
+# lazily, so neither is loaded before the first call that needs them.
 debug_log("Importing TidalAPI submodules...", level=2)
 try:
-    from tidalapi.page import PageItem, PageLink
-    from tidalapi.mix import Mix
-    from tidalapi.media import Quality
-    from requests.exceptions import HTTPError, RequestException
+    from backend.lazy import lazy_import, lazy_property, preload as preload_modules
+    import tidalapi
+    requests = lazy_import("requests")
+    from backend.paths import cache_path, data_dir
+    from backend.artistbio import BioCache, BioLoader
+    from backend.urlresolver import UrlResolver
+    from backend.projection import Projector
+    from backend import scheduler
+    from backend.typeahead import IncrementalSearch, normalize
+    from backend.library import LibraryIndex
+    from backend.metadata import MetadataStore
+    from backend.images import ImageCache
+    from backend.downloads import DownloadManager
+    from backend.dashproxy import DashProxy
+    from backend.streamcache import CachedStream, RangeCache
+    from backend.adaptive import QualitySelector, ThroughputEstimator
+    from tidalapi.workers import iter_pages
 except ImportError as e:
     debug_log(f"✗ Failed to import {str(e)}", level=1, force=True)
     raise
@@ -78,6 +100,62 @@ except ImportError as e:
 debug_log("All modules imported successfully", level=1)
 
 
+class BatchEmitter:
+    """Collects items per signal and sends them as lists.
+
+    Every add() is queued under "<signal>Batch"; a chunk goes out once it
+    holds chunk_size items or the oldest queued item is older than
+    flush_interval seconds. Pending signals are always flushed together with
+    the cache batches first, so a cache batch reaches QML before the view
+    batch for the same items. Use as a context manager to flush the
+    rest on exit.
+    """
+
+    # cache* signals are pluralised, view signals just get the suffix
+    CACHE_BATCHES = {
+        "cacheTrack": "cacheTracksBatch",
+        "cacheAlbum": "cacheAlbumsBatch",
+        "cacheArtist": "cacheArtistsBatch",
+        "cachePlaylist": "cachePlaylistsBatch",
+        "cacheMix": "cacheMixesBatch",
+    }
+    CACHE_NAMES = frozenset(CACHE_BATCHES.values())
+
+    def __init__(self, send, chunk_size=100, flush_interval=0.25):
+        self.send = send
+        self.chunk_size = max(1, int(chunk_size))
+        self.flush_interval = flush_interval
+        self.pending = {}
+        self.first_added = None
+
+    def add(self, signal_name, item):
+        if item is None:
+            return
+        name = self.CACHE_BATCHES.get(signal_name, signal_name + "Batch")
+        self.pending.setdefault(name, []).append(item)
+        now = time.monotonic()
+        if self.first_added is None:
+            self.first_added = now
+        if (len(self.pending[name]) >= self.chunk_size
+                or now - self.first_added >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        pending, self.pending = self.pending, {}
+        self.first_added = None
+        # cache batches first, so views never reference items QML lacks
+        names = sorted(pending, key=lambda n: n not in self.CACHE_NAMES)
+        for name in names:
+            self.send(name, pending[name])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+        return False
+
+
 class Tidal:
     def __init__(self):
         debug_log("Creating Tidal class instance", level=1)
@@ -87,6 +165,216 @@ class Tidal:
         self.album_search = 20
         self.track_search = 20
         self.artist_search = 20
+        # searchPaged(): a small first page of every category for the first
+        # paint, then pages of the per-category limit (see _search_limits)
+        self.search_first_page = 5
+        self.search_page_size = 20
+        # Artist dicts go out without a bio; pages that show one ask for it
+        # via getArtistBios(). Set to False to fetch bios inline again.
+        self.lazy_bios = True
+        # pages/... sections fetched concurrently by loadHomeScreen()
+        self.home_sections = ["recent", "foryou", "dailyMixes", "radioMixes", "favArtists"]
+        self.home_workers = 5
+        # Sections fetched concurrently by loadArtistPage() / loadAlbumPage()
+        self.artist_page_sections = ["info", "albums", "epSingles", "other",
+                                     "topTracks", "similar", "radio", "bio"]
+        self.album_page_sections = ["info", "tracks"]
+        self.page_workers = 7
+        # Chunking of the *Batch signals, see BatchEmitter
+        self.emit_chunk_size = 100
+        self.emit_flush_interval = 0.25
+        # Paged collection loading: a small first page for a quick first
+        # paint, then bigger ones. A newer stream of a source stops the older.
+        self.first_page_size = 50
+        self.page_size = 100
+        self._stream_generation = {}
+        self._stream_lock = threading.Lock()
+        # Parsed Track objects by id, so stream URLs and playback info do not
+        # need the track metadata again; plus the prefetching URL cache
+        self._tracks = OrderedDict()
+        self._tracks_lock = threading.Lock()
+        self.max_known_tracks = 2000
+        self.urls = UrlResolver(self._resolve_url)
+        # DASH (hi-res) tracks play through a localhost proxy that joins
+        # their segments into one stream, see _resolve_url()
+        self.dash_proxy = DashProxy(self._fetch_url, self._probe_url, read_ahead=4)
+        # Progressive streams go through the same proxy and are kept on
+        # disk, so replays and seeks into heard parts need no network
+        self.cache_streams = True
+        # getTrackUrl(id, fast_start=True) starts at this quality
+        self.fast_start_quality = "LOW"  # Quality.low_96k
+        # Each track is played at the best quality up to the configured one
+        # that the measured throughput sustains, see _track_quality()
+        self.adaptive_quality = True
+        self.throughput = ThroughputEstimator()
+        self.quality_selector = QualitySelector()
+        # List loaders project the raw JSON straight into bridge dicts
+        # instead of building tidalapi objects first, see backend.projection.
+        # Set to False to go through the object path again.
+        self.fast_projection = True
+        self.project = Projector()
+        # QML calls go through schedule() and run here by priority, see
+        # CALL_PRIORITIES and SUPERSEDED_CALLS
+        self.jobs = scheduler.Scheduler(max_workers=4, background_workers=2)
+        # searchAsYouType(): debounced, cached, fewer results per category
+        self.typeahead_limit = 20
+        self.typeahead = IncrementalSearch(
+            self._typeahead_query, self._send_typeahead,
+            submit=lambda fn, query: self.jobs.submit(
+                fn, (query,), scheduler.INTERACTIVE, "searchAsYouType",
+                done=self._typeahead_done))
+        # The on-disk stores below (stream_cache, bios, library, metadata,
+        # images, downloads) are lazy_property: nothing is opened or scanned
+        # at import, preload() opens the metadata store in the background.
+
+    @lazy_property
+    def stream_cache(self):
+        # Progressive streams kept on disk, see cache_streams
+        return RangeCache(cache_path("streams"))
+
+    @lazy_property
+    def bios(self):
+        return BioLoader(self._fetch_bio, self._send_bios,
+                         BioCache(cache_path("artist_bios.json")))
+
+    @lazy_property
+    def library(self):
+        # Offline full-text index of everything sent through INDEXED_SIGNALS,
+        # searched by searchLocal() before the network answers
+        return LibraryIndex(cache_path("library.db"))
+
+    @lazy_property
+    def metadata(self):
+        # The metadata cache behind TidalCache.qml: every cache* signal is
+        # stored here (STORED_SIGNALS), QML looks up misses via lookupCached()
+        return MetadataStore(cache_path("metadata.db"))
+
+    @lazy_property
+    def images(self):
+        # Cover art on disk: cached images go out as file:// URLs, see
+        # send_object(); prefetched for the queue and via prefetchImages()
+        return ImageCache(cache_path("covers"), self._fetch_url)
+
+    @lazy_property
+    def downloads(self):
+        # Offline copies of tracks, played instead of the stream, see
+        # getTrackUrl(); unfinished downloads resume after login
+        return DownloadManager(os.path.join(data_dir(), "downloads"),
+                               self._download_source, self._fetch_chunks,
+                               self._download_event)
+
+    # Priority class of the calls QML makes through schedule(); anything not
+    # listed is interactive
+    CALL_PRIORITIES = {
+        "getTrackUrl": scheduler.PLAYBACK,
+        "playAlbumTracks": scheduler.BACKGROUND,
+        "playAlbumfromTrack": scheduler.BACKGROUND,
+        "playPlaylist": scheduler.BACKGROUND,
+        "playMix": scheduler.BACKGROUND,
+        "playArtistTracks": scheduler.BACKGROUND,
+        "playArtistRadio": scheduler.BACKGROUND,
+        "getArtistRadio": scheduler.BACKGROUND,
+        "prefetchTrackUrls": scheduler.BACKGROUND,
+        "prefetchImages": scheduler.BACKGROUND,
+        "downloadTrack": scheduler.BACKGROUND,
+        "downloadAlbum": scheduler.BACKGROUND,
+        "downloadPlaylist": scheduler.BACKGROUND,
+    }
+    # A new call of one of these drops or stops the previous one
+    SUPERSEDED_CALLS = frozenset([
+        "genericSearch", "searchPaged", "loadArtistPage", "loadAlbumPage",
+        "getAlbumTracks", "getPlaylistTracks", "getMixTracks",
+    ])
+
+    # Signals whose items go into self.library; True marks the user's own
+    # items (favorites, personal playlists), which rank first
+    INDEXED_SIGNALS = {
+        "cacheTrack": False,
+        "cacheAlbum": False,
+        "cacheArtist": False,
+        "cachePlaylist": False,
+        "cacheTracksBatch": False,
+        "cacheAlbumsBatch": False,
+        "cacheArtistsBatch": False,
+        "cachePlaylistsBatch": False,
+        "FavTracksBatch": True,
+        "FavAlbumsBatch": True,
+        "FavArtistBatch": True,
+        "addPersonalPlaylistBatch": True,
+        "artistPageSection": False,
+        "albumPageSection": False,
+        "homeSection": False,
+    }
+
+    # Signals whose items go into self.metadata, by kind; page sections mix
+    # kinds (MIXED) and are stored by the "type" of each item
+    MIXED = None
+    STORED_SIGNALS = {
+        "cacheTrack": "track",
+        "cacheAlbum": "album",
+        "cacheArtist": "artist",
+        "cachePlaylist": "playlist",
+        "cacheMix": "mix",
+        "cacheTracksBatch": "track",
+        "cacheAlbumsBatch": "album",
+        "cacheArtistsBatch": "artist",
+        "cachePlaylistsBatch": "playlist",
+        "cacheMixesBatch": "mix",
+        "artistPageSection": MIXED,
+        "albumPageSection": MIXED,
+        "homeSection": MIXED,
+    }
+
+    # kind -> cache signal, for answers from self.metadata
+    CACHE_SIGNALS = {
+        "track": "cacheTrack",
+        "album": "cacheAlbum",
+        "artist": "cacheArtist",
+        "playlist": "cachePlaylist",
+        "mix": "cacheMix",
+    }
+
+    def schedule(self, request_id, method, args=None):
+        """Run self.<method>(*args) on the backend scheduler.
+
+        Returns at once; the outcome arrives as requestDone(request_id,
+        status, result) with status "done", "cancelled" or "error".
+        """
+        fn = getattr(self, method, None) if not method.startswith("_") else None
+        if not callable(fn) or method in ("schedule", "cancel"):
+            raise ValueError(f"not a schedulable call: {method}")
+        group = method if method in self.SUPERSEDED_CALLS else None
+        return self.jobs.submit(fn, args or [],
+                                self.CALL_PRIORITIES.get(method, scheduler.INTERACTIVE),
+                                group, request_id, self._request_done)
+
+    def cancel(self, request_id):
+        """Cancel a scheduled call; True if it was still queued or running"""
+        return self.jobs.cancel(request_id)
+
+    def _request_done(self, request_id, status, result):
+        if status == scheduler.FAILED:
+            debug_log(f"SCHEDULER: request {request_id} failed: {result}", level=1, force=True)
+            result = None
+        elif not isinstance(result, (dict, list, str, int, float, bool)):
+            # objects returned "for testing" cannot cross the bridge
+            result = None
+        pyotherside.send("requestDone", request_id, status, result)
+
+    def preload(self):
+        """Load requests and the tidalapi models in the background.
+
+        Called by QML right after the module import, so the first API call
+        does not have to pay for the imports while the UI is drawn. The
+        metadata store is opened on the same thread afterwards.
+        """
+        log_environment()
+
+        def preloaded():
+            debug_log("Backend modules preloaded", level=2)
+            self.metadata.start_pruning()
+
+        preload_modules(done=preloaded)
 
     def initialize(self, quality="HIGH"):
         debug_log(f"Initializing TidalAPI with quality: {quality}", level=1)
@@ -94,17 +382,18 @@ class Tidal:
         try:
             # Enhanced quality selection with debug info
             quality_mapping = {
-                "LOW": (Quality.low_96k, "96k"),
-                "HIGH": (Quality.low_320k, "320k"), 
-                "LOSSLESS": (Quality.high_lossless, "lossless"),
-                "TEST": (Quality.low_96k, "96k test")
+                "LOW": (tidalapi.Quality.low_96k, "96k"),
+                "HIGH": (tidalapi.Quality.low_320k, "320k"), 
+                "LOSSLESS": (tidalapi.Quality.high_lossless, "lossless"),
+                "HI_RES": (tidalapi.Quality.hi_res_lossless, "hi-res"),
+                "TEST": (tidalapi.Quality.low_96k, "96k test")
             }
             
             if quality in quality_mapping:
                 selected_quality, quality_name = quality_mapping[quality]
                 debug_log(f"Selected audio quality: {quality_name}", level=2)
             else:
-                selected_quality = Quality.default
+                selected_quality = tidalapi.Quality.default
                 debug_log(f"Unknown quality '{quality}', using default", level=1, force=True)
                 quality_name = "default"
 
@@ -120,14 +409,17 @@ class Tidal:
                 
             self.config = tidalapi.Config(
                 quality=selected_quality, 
-                video_quality=tidalapi.VideoQuality.low
+                video_quality=tidalapi.VideoQuality.low,
+                cache_path=cache_path("responses.sqlite")
             )
             debug_log(f"TidalAPI Config created successfully with {quality_name} audio quality", level=2)
+            # cached stream URLs were resolved for the previous quality
+            self.urls.invalidate()
 
             # Only create new session if none exists or session is invalid
             if not hasattr(self, 'session') or not self.session:
                 debug_log("Creating new TidalAPI Session object...", level=2)
-                self.session = tidalapi.Session(self.config)
+                self.session = self._create_session(self.config)
                 if self.session:
                     debug_log("New TidalAPI Session created successfully", level=1)
             else:
@@ -156,11 +448,35 @@ class Tidal:
             debug_log(f"Error type: {type(e).__name__}", level=1, force=True)
             raise
 
+    def _create_session(self, config):
+        """New tidalapi session whose background token refreshes reach QML"""
+        session = tidalapi.Session(config)
+        session.tokens.on_refresh.append(self._send_refreshed_tokens)
+        return session
+
+    def _send_refreshed_tokens(self, session):
+        debug_log("Access token refreshed in background", level=2)
+        pyotherside.send("oauth_refresh", session.access_token,
+                         session.refresh_token, session.expiry_time)
+
+    @staticmethod
+    def _expiry_datetime(expiry_time):
+        """QML stores the expiry as unix seconds; tidalapi wants naive UTC"""
+        if isinstance(expiry_time, datetime.datetime):
+            return expiry_time
+        try:
+            expiry_time = float(expiry_time)
+        except (TypeError, ValueError):
+            return None
+        if expiry_time <= 0:
+            return None
+        return datetime.datetime.utcfromtimestamp(expiry_time)
+
     def setconfig(self, top_tracks, album_search, track_search, artist_search):
-        self.top_tracks = top_tracks
-        self.album_search = album_search
-        self.track_search = track_search
-        self.artist_search = artist_search
+        self.top_tracks = int(top_tracks)
+        self.album_search = int(album_search)
+        self.track_search = int(track_search)
+        self.artist_search = int(artist_search)
 
     def login(self, token_type, access_token, refresh_token, expiry_time):
         try:
@@ -172,20 +488,25 @@ class Tidal:
 
                     try:
                         self.session.token_refresh(refresh_token)
-                        self.session.load_oauth_session(token_type, self.session.access_token)
+                        # keep the refresh token and expiry, the background
+                        # refresh needs both
+                        logged_in = self.session.load_oauth_session(
+                            self.session.token_type, self.session.access_token,
+                            refresh_token, self.session.expiry_time)
 
-                        if self.session.check_login() is True:
+                        if logged_in:
                             debug_log(f"New token obtained (length: {len(self.session.access_token)} chars)", level=1)
                             # Send all token info including new expiry time
                             pyotherside.send("oauth_refresh", self.session.access_token, 
                                             self.session.refresh_token, self.session.expiry_time)
                             pyotherside.send("oauth_login_success")
+                            self.downloads.resume()
                             debug_log("Login verification successful", level=1)
                         else:
                             pyotherside.send("printConsole", "Token refresh failed - login check unsuccessful")
                             pyotherside.send("oauth_login_failed")
 
-                    except HTTPError as http_err:
+                    except requests.exceptions.HTTPError as http_err:
                         if http_err.response.status_code == 401:
                             pyotherside.send("printConsole", "Token refresh failed - 401 Unauthorized")
                             pyotherside.send("oauth_login_failed")
@@ -193,7 +514,7 @@ class Tidal:
                             pyotherside.send("printConsole", f"HTTP error during token refresh: {http_err}")
                             pyotherside.send("oauth_login_failed")
 
-                    except RequestException as req_err:
+                    except requests.exceptions.RequestException as req_err:
                         pyotherside.send("printConsole", f"Network error during token refresh: {req_err}")
                         pyotherside.send("oauth_login_failed")
 
@@ -205,16 +526,21 @@ class Tidal:
                     pyotherside.send("printConsole", "Login with old token")
 
                     try:
-                        self.session.load_oauth_session(token_type, access_token)
+                        # load_oauth_session already asks the server for the
+                        # session, no separate check_login round trip needed
+                        logged_in = self.session.load_oauth_session(
+                            token_type, access_token, refresh_token,
+                            self._expiry_datetime(expiry_time))
 
-                        if self.session.check_login() == True:
+                        if logged_in:
                             pyotherside.send("oauth_login_success")
+                            self.downloads.resume()
                             debug_log("Login verification successful", level=1)
                         else:
                             pyotherside.send("printConsole", "Login check failed with old token")
                             pyotherside.send("oauth_login_failed")
 
-                    except HTTPError as http_err:
+                    except requests.exceptions.HTTPError as http_err:
                         if http_err.response.status_code == 401:
                             pyotherside.send("printConsole", "Login failed - 401 Unauthorized, please re-authenticate")
                             pyotherside.send("oauth_login_failed")
@@ -222,7 +548,7 @@ class Tidal:
                             pyotherside.send("printConsole", f"HTTP error during login: {http_err}")
                             pyotherside.send("oauth_login_failed")
 
-                    except RequestException as req_err:
+                    except requests.exceptions.RequestException as req_err:
                         pyotherside.send("printConsole", f"Network error during login: {req_err}")
                         pyotherside.send("oauth_login_failed")
 
@@ -298,7 +624,7 @@ class Tidal:
                 debug_log("CRITICAL: OAuth login verification failed", level=1, force=True)
                 pyotherside.send("oauth_failed")
                 
-        except HTTPError as e:
+        except requests.exceptions.HTTPError as e:
             debug_log(f"HTTP error during OAuth: {e} (Status: {getattr(e.response, 'status_code', 'unknown')})", level=1, force=True)
             pyotherside.send("oauth_failed")
         except Exception as e:
@@ -307,10 +633,24 @@ class Tidal:
             
         pyotherside.send('loadingFinished')
 
+    def _remember_track(self, track):
+        """Remember a Track object, or the bridge dict of a projected one"""
+        track_id = str(track["trackid"] if isinstance(track, dict) else track.id)
+        with self._tracks_lock:
+            self._tracks[track_id] = track
+            self._tracks.move_to_end(track_id)
+            while len(self._tracks) > self.max_known_tracks:
+                self._tracks.popitem(last=False)
+
+    def _known_track(self, track_id):
+        with self._tracks_lock:
+            return self._tracks.get(str(track_id))
+
     def handle_track(self, track):
         if track is None:
             print(f"Track is None.")
             return None        
+        self._remember_track(track)
         try:
             return {
                 "trackid": str(track.id),
@@ -344,18 +684,62 @@ class Tidal:
         except AttributeError as e:
             print(f"Error handling artist: {e}")
             return None
-        try:
-            bio = str(artist.get_bio())
-        except HTTPError as e:
-            if e.response.status_code == 404:
-                print(f"Error fetching biography: {e}")
-                return artisti
-            return artisti
-        except tidalapi.exceptions.ObjectNotFound as e:
-            return artisti
-        artisti["bio"] = bio
+        bio = self._artist_bio(artist.id)
+        if bio:
+            artisti["bio"] = bio
         return artisti
 
+    def _project_artist(self, json_obj):
+        """handle_artist() for raw artist JSON"""
+        artisti = self.project.artist(json_obj)
+        bio = self._artist_bio(artisti["artistid"])
+        if bio:
+            artisti["bio"] = bio
+        return artisti
+
+    def _artist_bio(self, artist_id):
+        """Cached bio; fetched inline only when lazy_bios is off"""
+        bio = self.bios.cached(artist_id)
+        if bio is None and not self.lazy_bios:
+            bio = self.bios.load(artist_id)
+        return bio
+
+    def _artist_shell(self, artist_id):
+        """Artist object with only the id set, for the artists/{id}/... calls
+
+        session.artist(id) would GET artists/{id} first, which the sub
+        resources do not need.
+        """
+        artist = self.session.artist()
+        artist.id = int(artist_id)
+        return artist
+
+    def _fetch_bio(self, artist_id):
+        """Fetch one biography; artists without one get an empty string."""
+        artist = self._artist_shell(artist_id)
+        try:
+            return str(artist.get_bio())
+        except tidalapi.exceptions.ObjectNotFound:
+            return ""
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return ""
+            raise
+
+    def _send_bios(self, bios):
+        try:
+            self.metadata.set_bios(bios)
+        except Exception as e:
+            debug_log(f"METADATA: storing bios failed: {e}", level=1, force=True)
+        self.send_object("artistBios", bios)
+
+    def getArtistBios(self, artist_ids):
+        """Request biographies; they arrive batched via the artistBios signal."""
+        self.bios.request(artist_ids)
+
+    def getArtistBio(self, artist_id):
+        self.bios.request([artist_id])
+
     def handle_album(self, album):
         if album is None:
             print(f"Album is None.")
@@ -398,13 +782,25 @@ class Tidal:
             print(f"Error handling video: {e}")
             return None
 
+    def setBatchConfig(self, chunk_size, flush_interval):
+        self.emit_chunk_size = chunk_size
+        self.emit_flush_interval = flush_interval
+
+    def batch(self):
+        """New BatchEmitter with the configured chunk size and interval"""
+        return BatchEmitter(self.send_object, self.emit_chunk_size,
+                            self.emit_flush_interval)
+
     def send_object(self, signal_name, data, data2=None):
         """Helper-Funktion zum Senden von Objekten"""
+        self._keep(signal_name, data if isinstance(data, list) else [data])
         try:
+            # stored/indexed above with the remote image URLs
             if (data2 is None):
-                pyotherside.send(signal_name, data)
+                pyotherside.send(signal_name, self.images.localize(data))
             else:
-                pyotherside.send(signal_name, data, data2)
+                pyotherside.send(signal_name, self.images.localize(data),
+                                 self.images.localize(data2))
         except Exception as e:
             debug_log(f"ERROR: Failed to send signal '{signal_name}': {str(e)}", level=1, force=True)
             debug_log(f"ERROR: Signal data type: {type(data)}", level=2)
@@ -412,19 +808,175 @@ class Tidal:
             return False
         return True
 
+    def send_items(self, signal_name, items, *args):
+        """Send signal_name(*args, items), e.g. a page section.
+
+        The items are indexed and stored like those of send_object().
+        """
+        self._keep(signal_name, items)
+        try:
+            pyotherside.send(signal_name, *args, self.images.localize(items))
+        except Exception as e:
+            debug_log(f"ERROR: Failed to send signal '{signal_name}': {str(e)}", level=1, force=True)
+            return False
+        return True
+
+    def _keep(self, signal_name, infos):
+        """Index and store the items of a signal, see INDEXED_SIGNALS and
+        STORED_SIGNALS; the remote image URLs are kept"""
+        favorite = self.INDEXED_SIGNALS.get(signal_name)
+        if favorite is not None:
+            self._index(infos, favorite)
+        if signal_name not in self.STORED_SIGNALS:
+            return
+        kind = self.STORED_SIGNALS[signal_name]
+        if kind is not self.MIXED:
+            self._store(kind, infos)
+            return
+        by_kind = {}
+        for info in infos:
+            kind = info.get("type") if isinstance(info, dict) else None
+            if kind in self.CACHE_SIGNALS:
+                by_kind.setdefault(kind, []).append(info)
+        for kind, items in by_kind.items():
+            self._store(kind, items)
+
+    def _store(self, kind, infos):
+        """Persist bridge dicts in the metadata cache"""
+        try:
+            self.metadata.put(kind, infos)
+        except Exception as e:
+            debug_log(f"METADATA: storing {kind} failed: {e}", level=1, force=True)
+
+    def _stored_info(self, kind, id):
+        """The fresh stored dict of one item, sent as cache signal; else None"""
+        try:
+            infos = self.metadata.get(kind, [id])
+        except Exception as e:
+            debug_log(f"METADATA: lookup failed: {e}", level=1, force=True)
+            return None
+        if not infos or not self.metadata.is_fresh(infos[0]):
+            return None
+        # straight to QML, going through send_object would store it again
+        pyotherside.send(BatchEmitter.CACHE_BATCHES[self.CACHE_SIGNALS[kind]],
+                         self.images.localize(infos))
+        return infos[0]
+
+    def lookupCached(self, kind, ids):
+        """Batched lookup of the items TidalCache.qml misses.
+
+        Stored items go out at once as one cache*Batch; missing and
+        expired ones are then fetched in the background through
+        get<Kind>Info(), which sends them as cache* signals as well.
+        """
+        if kind not in self.CACHE_SIGNALS:
+            raise ValueError(f"unknown cache kind {kind}")
+        id_field = kind + "id"
+        infos = self.metadata.get(kind, [str(i) for i in ids])
+        if infos:
+            pyotherside.send(BatchEmitter.CACHE_BATCHES[self.CACHE_SIGNALS[kind]],
+                             self.images.localize(infos))
+        fresh = {str(info[id_field]) for info in infos if self.metadata.is_fresh(info)}
+        missing = [id for id in ids if str(id) not in fresh]
+        if self.session is None or not missing:
+            return None
+        # one request per item: keep them off the interactive workers
+        self.jobs.submit(self._fetch_missing, (kind, missing), scheduler.BACKGROUND)
+        return None
+
+    def _fetch_missing(self, kind, ids):
+        fetch = getattr(self, "get%sInfo" % kind.capitalize())
+        for id in ids:
+            if self.jobs.cancelled():
+                break
+            fetch(id)
+
+    def clearMetadataCache(self):
+        self.metadata.clear()
+
+    def getMetadataStats(self):
+        return self.metadata.stats()
+
+    def _index(self, infos, favorite=False):
+        """Add bridge dicts to the offline library index"""
+        try:
+            self.library.add(infos, favorite)
+        except Exception as e:
+            # a broken index must never stop loading
+            debug_log(f"LIBRARY: indexing failed: {e}", level=1, force=True)
+
+    def searchLocal(self, text, limit=None):
+        """Search the offline library index, no network involved.
+
+        Returns a results dict like search_results (tracks, albums, artists,
+        playlists, videos, mixes) of the favorites and items seen before.
+        """
+        try:
+            results = self.library.search(text, limit or self.typeahead_limit)
+        except Exception as e:
+            debug_log(f"LIBRARY: local search failed: {e}", level=1, force=True)
+            return None
+        # local tracks are playable like searched ones
+        self._projected_tracks(results["tracks"])
+        return results
+
+    def _projected_tracks(self, infos):
+        """Drop unusable items and remember the tracks for getTrackUrl()"""
+        infos = [info for info in infos if info]
+        for info in infos:
+            if info["type"] == "track":
+                self._remember_track(info)
+        return infos
+
+    def _projected_pages(self, url, project, offset=0, params=None):
+        """Like the tidalapi *_pages() iterators, but yields bridge dicts
+
+        Pages may contain None for items the projector skipped, so their
+        length still matches the API offsets.
+        """
+        def fetch(limit, offset):
+            page = self.session.request.map_request(
+                url, dict(params or {}, limit=limit, offset=offset), parse=project)
+            if project in (self.project.track, self.project.media):
+                self._projected_tracks(page)
+            return page
+        return iter_pages(fetch, page_size=self.page_size,
+                          first_page_size=None if offset else self.first_page_size,
+                          offset=offset)
+
+    def _search_json(self, text, limit=50, offset=0, types=None):
+        """Raw response of session.search(), for all SEARCH_TYPES by default"""
+        if types is None:
+            types = list(self.SEARCH_TYPES.values())
+        return self.session.request.request("GET", "search", params={
+            "query": text,
+            "limit": limit,
+            "offset": offset,
+            "types": ",".join(types),
+        }).json()
+
+    def _mix_track_infos(self, mix_id):
+        """Bridge dicts of all items of a mix, from the raw mix page"""
+        page = self.session.request.request(
+            "GET", "pages/mix", params={"mixId": mix_id, "deviceType": "BROWSER"}).json()
+        items = Projector.paged_list_items(page)
+        return self._projected_tracks(
+            self.session.request.map_json({"items": items}, parse=self.project.media))
+
     def _send_playlist_load(self, source, source_id, tracks, mode, start_track_id=None):
         """Unified batch-signal for all collection loaders.
 
         mode ∈ {"replace", "append", "play_now", "queue"}
-        Sends one cacheTrack per track first, then a single playlist_load
+        Sends the tracks as chunked cacheTracksBatch first, then a single playlist_load
         with the full track-id list. QML decides how to apply the mode.
         """
         track_ids = []
-        for track_info in tracks:
-            if not track_info:
-                continue
-            self.send_object("cacheTrack", track_info)
-            track_ids.append(track_info['trackid'])
+        with self.batch() as emitter:
+            for track_info in tracks:
+                if not track_info:
+                    continue
+                emitter.add("cacheTrack", track_info)
+                track_ids.append(track_info['trackid'])
 
         self.send_object("playlist_load", {
             "source": source,
@@ -474,7 +1026,164 @@ class Tidal:
             pyotherside.send("printConsole", f"trouble loading mix: f{e}")
             return None
 
+    def _search_objects(self, result):
+        """Bridge dicts per category from session.search() objects"""
+        handlers = {
+            "tracks": self.handle_track,
+            "artists": self.handle_artist,
+            "albums": self.handle_album,
+            "playlists": self.handle_playlist,
+            "videos": self.handle_video,
+            "mixes": self.handle_mix,
+        }
+        return {name: [info for info in map(handle, result.get(name) or []) if info]
+                for name, handle in handlers.items()}
+
+    def _search_projected(self, text, limit=50):
+        """Bridge dicts per category, projected from the raw search response"""
+        search_json = self._search_json(text, limit)
+        search_results = self.project.search(search_json)
+        self._projected_tracks(search_results["tracks"])
+        search_results["artists"] = [
+            self._project_artist(a)
+            for a in (search_json.get("artists") or {}).get("items") or []]
+        return search_results
+
+    SEARCH_CATEGORIES = ("tracks", "artists", "albums", "playlists", "videos")
+    # The search API's names for the categories, as used in its types param
+    SEARCH_TYPES = {category: category.upper() for category in SEARCH_CATEGORIES}
+
+    def _search_limits(self):
+        """Results per category, the album/track/artist ones from setconfig()"""
+        limits = dict.fromkeys(self.SEARCH_CATEGORIES, self.search_page_size)
+        limits.update(tracks=self.track_search, albums=self.album_search,
+                      artists=self.artist_search)
+        return limits
+
+    def _search_infos(self, category, items):
+        """Bridge dicts of the raw items of one search category"""
+        if self.fast_projection:
+            project = {
+                "tracks": self.project.track,
+                "artists": self._project_artist,
+                "albums": self.project.album,
+                "playlists": self.project.playlist,
+                "videos": self.project.video,
+            }[category]
+            infos = [info for info in map(project, items) if info]
+            if category == "tracks":
+                self._projected_tracks(infos)
+            return infos
+        parse, handle = {
+            "tracks": (self.session.parse_track, self.handle_track),
+            "artists": (self.session.parse_artist, self.handle_artist),
+            "albums": (self.session.parse_album, self.handle_album),
+            "playlists": (self.session.parse_playlist, self.handle_playlist),
+            "videos": (self.session.parse_video, self.handle_video),
+        }[category]
+        return [info for info in (handle(parse(item)) for item in items) if info]
+
+    def _send_search_page(self, text, category, page_json, offset):
+        items = page_json.get("items") or []
+        infos = self._search_infos(category, items)
+        total = page_json.get("totalNumberOfItems", 0)
+        next_offset = offset + len(items)
+        if not items or next_offset >= total:
+            next_offset = -1
+        cache_signal = {"tracks": "cacheTrack", "artists": "cacheArtist",
+                        "albums": "cacheAlbum"}.get(category)
+        if cache_signal:
+            with self.batch() as emitter:
+                for info in infos:
+                    emitter.add(cache_signal, info)
+        self.send_object("searchCategoryPage", {
+            "query": text,
+            "category": category,
+            "offset": offset,
+            "items": infos,
+            "total": total,
+            "next": next_offset,
+        })
+
+    def searchPaged(self, text):
+        """Search with progressive delivery.
+
+        One request for the top hit (searchTopHit) and the first
+        search_first_page items of every category; each category then goes
+        out as a searchCategoryPage {query, category, offset, items, total,
+        next}. Continue a category with searchMore(text, category, next).
+        """
+        self.typeahead.cancel()
+        # local hits first, they stay on screen if the network fails
+        local = self.searchLocal(text, self.search_first_page)
+        if local is not None:
+            self.send_object("localSearchResults", dict(local, query=text))
+        search_json = self._search_json(text, self.search_first_page)
+        if self.jobs.cancelled():
+            return None
+        top_hit = search_json.get("topHit")
+        if top_hit and top_hit.get("value"):
+            category = str(top_hit.get("type", "")).lower()
+            if category in self.SEARCH_CATEGORIES:
+                infos = self._search_infos(category, [top_hit["value"]])
+                if infos:
+                    self.send_object("searchTopHit", {"query": text, "category": category,
+                                                      "item": infos[0]})
+        for category in self.SEARCH_CATEGORIES:
+            self._send_search_page(text, category, search_json.get(category) or {}, 0)
+        return None
+
+    def searchMore(self, text, category, offset):
+        """Next page of one search category, see searchPaged()"""
+        if category not in self.SEARCH_CATEGORIES:
+            raise ValueError(f"unknown search category {category}")
+        offset = int(offset)
+        search_json = self._search_json(text, self._search_limits()[category],
+                                        offset, types=[self.SEARCH_TYPES[category]])
+        self._send_search_page(text, category, search_json.get(category) or {}, offset)
+        return None
+
+    def searchAsYouType(self, text):
+        """Incremental search, called by the search field on every keystroke.
+
+        Answers from the query cache or with locally narrowed results of an
+        earlier prefix right away, else with hits of the offline library
+        index; the network query runs once typing pauses. Results arrive as
+        search_results dicts with the query and a final flag (False for
+        narrowed and library results).
+        """
+        shown = self.typeahead.type(text) if self.session is not None else None
+        query = normalize(text)
+        if shown is None and len(query) >= self.typeahead.min_length:
+            local = self.searchLocal(query)
+            if local is not None:
+                self.send_object("search_results", dict(local, query=query, final=False))
+                shown = "library"
+        return shown
+
+    def _typeahead_query(self, query):
+        if self.fast_projection:
+            return self._search_projected(query, self.typeahead_limit)
+        return self._search_objects(self.session.search(query, limit=self.typeahead_limit))
+
+    def _send_typeahead(self, query, results, final):
+        if final:
+            with self.batch() as emitter:
+                for track_info in results["tracks"]:
+                    emitter.add("cacheTrack", track_info)
+                for artist_info in results["artists"]:
+                    emitter.add("cacheArtist", artist_info)
+                for album_info in results["albums"]:
+                    emitter.add("cacheAlbum", album_info)
+        self.send_object("search_results", dict(results, query=query, final=final))
+
+    def _typeahead_done(self, request_id, status, result):
+        if status == scheduler.FAILED:
+            debug_log(f"SEARCH: incremental search failed: {result}", level=1, force=True)
+
     def genericSearch(self, text):
+        # an explicit search replaces whatever the search field was waiting for
+        self.typeahead.cancel()
         pyotherside.send('loadingStarted')
         debug_log(f"SEARCH: Starting generic search for: '{text}'", level=1)
 
@@ -489,79 +1198,44 @@ class Tidal:
                     return None
 
             debug_log("SEARCH: Session validated, performing search", level=2)
-            result = self.session.search(text)
-
-            # OLD: Individual signals (many bridge calls)
-            # NEW: Batch processing for better performance
-            search_results = {
-            "tracks": [],
-            "artists": [],
-            "albums": [],
-            "playlists": [],
-            "videos": [],
-            "mixes": []
-        }
-
-            # Batch process tracks
-            if "tracks" in result:
-                for track in result["tracks"]:
-                    if track_info := self.handle_track(track):
-                        search_results["tracks"].append(track_info)
-                        # Database errors should not stop search processing
-                        if not self.send_object("cacheTrack", track_info):
-                            debug_log("CACHE: Failed to cache track - continuing search", level=2)
-
-            # Batch process artists
-            if "artists" in result:
-                for artist in result["artists"]:
-                    if artist_info := self.handle_artist(artist):
-                        search_results["artists"].append(artist_info)
-                        # Database errors should not stop search processing
-                        if not self.send_object("cacheArtist", artist_info):
-                            debug_log("CACHE: Failed to cache artist - continuing search", level=2)
-
-            # Batch process albums
-            if "albums" in result:
-                for album in result["albums"]:
-                    if album_info := self.handle_album(album):
-                        search_results["albums"].append(album_info)
-                        # Database errors should not stop search processing
-                        if not self.send_object("cacheAlbum", album_info):
-                            debug_log("CACHE: Failed to cache album - continuing search", level=2)
-
-            # Batch process playlists
-            if "playlists" in result:
-                for playlist in result["playlists"]:
-                    if playlist_info := self.handle_playlist(playlist):
-                        search_results["playlists"].append(playlist_info)
-
-            # Batch process videos
-            if "videos" in result:
-                for video in result["videos"]:
-                    if video_info := self.handle_video(video):
-                        search_results["videos"].append(video_info)
-
-            # Batch process mixes
-            if "mixes" in result:
-                for mix in result["mixes"]:
-                    if mix_info := self.handle_mix(mix):
-                        search_results["mixes"].append(mix_info)
+            limits = self._search_limits()
+            if self.fast_projection:
+                search_results = self._search_projected(text, max(limits.values()))
+                result = search_results
+            else:
+                result = self.session.search(text, limit=max(limits.values()))
+                search_results = self._search_objects(result)
+            for category, limit in limits.items():
+                search_results[category] = search_results[category][:limit]
+
+            if self.jobs.cancelled():
+                debug_log(f"SEARCH: '{text}' superseded, results dropped", level=2)
+                return None
+
+            # cache* signals go out chunked; failures there must not stop the search
+            with self.batch() as emitter:
+                for track_info in search_results["tracks"]:
+                    emitter.add("cacheTrack", track_info)
+                for artist_info in search_results["artists"]:
+                    emitter.add("cacheArtist", artist_info)
+                for album_info in search_results["albums"]:
+                    emitter.add("cacheAlbum", album_info)
 
             # PERFORMANCE: Send all results in batches instead of individually
             if search_results["tracks"]:
-                pyotherside.send("foundTracksBatch", search_results["tracks"])
+                self.send_object("foundTracksBatch", search_results["tracks"])
             if search_results["artists"]:
-                pyotherside.send("foundArtistsBatch", search_results["artists"])
+                self.send_object("foundArtistsBatch", search_results["artists"])
             if search_results["albums"]:
-                pyotherside.send("foundAlbumsBatch", search_results["albums"])
+                self.send_object("foundAlbumsBatch", search_results["albums"])
             if search_results["playlists"]:
-                pyotherside.send("foundPlaylistsBatch", search_results["playlists"])
+                self.send_object("foundPlaylistsBatch", search_results["playlists"])
             if search_results["videos"]:
-                pyotherside.send("foundVideosBatch", search_results["videos"])
+                self.send_object("foundVideosBatch", search_results["videos"])
             if search_results["mixes"]:
-                pyotherside.send("foundMixesBatch", search_results["mixes"])
+                self.send_object("foundMixesBatch", search_results["mixes"])
 
-            debug_log(f"SEARCH: Successfully processed search results", level=2)
+            debug_log("SEARCH: Successfully processed search results", level=2)
             return result
 
         except requests.exceptions.HTTPError as e:
@@ -590,6 +1264,9 @@ class Tidal:
             pyotherside.send('loadingFinished')
 
     def getMixInfo(self, id):
+        stored = self._stored_info("mix", id)
+        if stored is not None:
+            return stored
         try:
             mix = self.session.mix(id)
             mix_info = self.handle_mix(mix)
@@ -602,6 +1279,9 @@ class Tidal:
             return None
 
     def getAlbumInfo(self, id):
+        stored = self._stored_info("album", id)
+        if stored is not None:
+            return stored
         try:
             album = self.session.album(int(id))
             album_info = self.handle_album(album)
@@ -614,6 +1294,9 @@ class Tidal:
             return None
 
     def getArtistInfo(self, id):
+        stored = self._stored_info("artist", id)
+        if stored is not None:
+            return stored
         try:
             artist = self.session.artist(int(id))
             artist_info = self.handle_artist(artist)
@@ -626,6 +1309,9 @@ class Tidal:
             return None
 
     def getTrackInfo(self, id):
+        stored = self._stored_info("track", id)
+        if stored is not None:
+            return stored
         try:
             track = self.session.track(int(id))
             track_info = self.handle_track(track)
@@ -638,6 +1324,9 @@ class Tidal:
             return None
 
     def getPlaylistInfo(self, id):
+        stored = self._stored_info("playlist", id)
+        if stored is not None:
+            return stored
         try:
             playlist = self.session.playlist(id)
             playlist_info = self.handle_playlist(playlist)
@@ -649,46 +1338,386 @@ class Tidal:
             self.send_object("error", {"message": str(e)})
             return None
 
-    def getTrackUrl(self, id):
+    def _resolve_url(self, track_id, quality=None):
+        """Stream URL of a track, only its id is needed for that"""
+        track = self._known_track(track_id)
+        if track is None or isinstance(track, dict):
+            track = self.session.track()
+            track.id = int(track_id)
+        if quality is not None and str(quality) != str(self.session.config.quality):
+            # another quality than the session's, e.g. for fast start
+            params = {"urlusagemode": "STREAM", "audioquality": str(quality),
+                      "assetpresentation": "FULL"}
+            return self.session.request.request(
+                "GET", "tracks/%s/urlpostpaywall" % int(track_id), params).json()["urls"][0]
+        if not self.session.is_pkce and self.session.config.quality != tidalapi.Quality.hi_res_lossless:
+            return track.get_url()
+        # hi-res (and every PKCE session) only gets stream manifests
+        manifest = track.get_stream().get_stream_manifest()
+        if manifest.is_mpd and not manifest.is_encrypted:
+            return self.dash_proxy.register(track_id, manifest.urls, str(manifest.mime_type))
+        return manifest.urls[0]
+
+    def _probe_url(self, url):
+        """Size of the file at url, for the DASH proxy"""
+        http = self.session.request_session if self.session is not None else requests
+        response = http.head(url, timeout=15, allow_redirects=True)
+        response.raise_for_status()
+        return int(response.headers["Content-Length"])
+
+    def _open_range(self, url, start, end=None):
+        """Request bytes start..end - 1 of url: (length, content type, chunks)"""
+        http = self.session.request_session if self.session is not None else requests
+        byte_range = "bytes=%d-%s" % (start, "" if end is None else end - 1)
+        response = http.get(url, headers={"Range": byte_range}, stream=True, timeout=15)
+        response.raise_for_status()
+        if response.status_code == 206:
+            length = int(response.headers["Content-Range"].rsplit("/", 1)[1])
+        elif start == 0:
+            length = int(response.headers.get("Content-Length") or 0) or None
+        else:
+            response.close()
+            raise IOError("no range support at %s" % url)
+
+        def chunks():
+            # read at the player's pace, so no throughput samples from here
+            try:
+                yield from response.iter_content(64 * 1024)
+            finally:
+                response.close()
+
+        return length, response.headers.get("Content-Type"), chunks()
+
+    def _stream_key(self, track_id, quality=None):
+        return "%s-%s" % (track_id, quality or self.session.config.quality)
+
+    def _stream_url(self, track_id, quality=None):
+        """URL the player gets for a track, at the session's quality by default"""
+        key = self._stream_key(track_id, quality)
+        if self.cache_streams and self.stream_cache.complete(key):
+            # a cached replay needs no network, not even for the URL
+            return self._cached_stream(track_id, quality, key)
+        url = self.urls.get(track_id, quality)
+        if (not self.cache_streams or not url or not url.startswith("http")
+                or self.dash_proxy.serves(url)):
+            return url
+        return self._cached_stream(track_id, quality, key)
+
+    def _cached_stream(self, track_id, quality, key):
+        stream = CachedStream(self.stream_cache, key, lambda: self.urls.get(track_id, quality),
+                              self._open_range, self._probe_url)
+        return self.dash_proxy.add(key, stream)
+
+    def _fast_starts(self, track_id, quality=None):
+        """Whether fast start would play track_id at a lower quality first"""
+        return (not self.session.is_pkce
+                and str(quality or self.session.config.quality) != str(self.fast_start_quality)
+                and not (self.cache_streams
+                         and self.stream_cache.complete(self._stream_key(track_id, quality))))
+
+    def _track_quality(self, track_id, prefetch=False):
+        """Quality to play track_id at, None for the configured one.
+
+        The configured quality is the ceiling; below it the quality follows
+        the measured throughput. Every decision goes out as qualityDecision
+        {trackid, quality, previous, throughput, reason}; a prefetch only
+        looks at the quality the track would get now.
+        """
+        ceiling = str(self.session.config.quality)
+        if not self.adaptive_quality or self.session.is_pkce:
+            # PKCE sessions get other qualities only as manifests
+            return None
+        if self.cache_streams and self.stream_cache.complete(self._stream_key(track_id)):
+            # a cached replay at the best quality costs no throughput
+            return None
+        if prefetch:
+            decision = self.quality_selector.peek(self.throughput.estimate(), ceiling)
+        else:
+            decision = self.quality_selector.select(self.throughput.estimate(), ceiling)
+            pyotherside.send("qualityDecision", dict(decision, trackid=str(track_id)))
+        return None if decision["quality"] == ceiling else decision["quality"]
+
+    def setAdaptiveQuality(self, enabled):
+        self.adaptive_quality = bool(enabled)
+
+    def reportStall(self):
+        """The player ran out of data: the next track plays a quality lower"""
+        self.quality_selector.stalled()
+
+    def setStreamCacheBudget(self, megabytes):
+        self.stream_cache.set_budget(int(megabytes) * 1024 * 1024)
+
+    def getStreamCacheStats(self):
+        return self.stream_cache.stats()
+
+    def clearStreamCache(self):
+        self.stream_cache.clear()
+
+    def setStreamReadAhead(self, segments):
+        """DASH segments the proxy fetches ahead of the read position"""
+        self.dash_proxy.read_ahead = max(1, int(segments))
+
+    def prefetchTrackUrls(self, track_ids):
+        """Resolve the stream URLs and cover art of upcoming tracks in the background"""
+        if self.session is not None:
+            # at the quality getTrackUrl() would pick; downloads need no URL
+            for track_id in track_ids:
+                if self.downloads.local_file(track_id) is None:
+                    self.urls.prefetch([track_id], self._track_quality(track_id, prefetch=True))
         try:
-            track = self.session.track(int(id))
-            url = track.get_url()
-            track_info = self.handle_track(track)
+            images = [t.get("image") for t in self.metadata.get("track", map(str, track_ids))]
+        except Exception as e:
+            debug_log(f"IMAGES: no queue art to prefetch: {e}", level=2)
+            return
+        self.jobs.submit(self.images.prefetch, (images, self.jobs.cancelled),
+                         scheduler.BACKGROUND)
+
+    def _fetch_url(self, url):
+        # the API session's connection pool; cover art and the signed
+        # stream URLs need no auth. Segment fetches run as fast as the link
+        # allows and are sampled for the throughput; cover art is below
+        # ThroughputEstimator.min_bytes.
+        http = self.session.request_session if self.session is not None else requests
+        began = time.monotonic()
+        response = http.get(url, timeout=15)
+        response.raise_for_status()
+        content = response.content
+        self.throughput.add(len(content), time.monotonic() - began)
+        return content
+
+    def _fetch_chunks(self, url):
+        """The body of url in chunks, for downloads too big to hold in memory"""
+        http = self.session.request_session if self.session is not None else requests
+        began = time.monotonic()
+        response = http.get(url, stream=True, timeout=15)
+        # downloads are not paced by a reader, so they measure the link;
+        # only the time spent waiting for the network counts
+        received, spent = 0, time.monotonic() - began
+        try:
+            response.raise_for_status()
+            content = response.iter_content(256 * 1024)
+            while True:
+                began = time.monotonic()
+                chunk = next(content, None)
+                spent += time.monotonic() - began
+                if chunk is None:
+                    break
+                received += len(chunk)
+                if received >= 1024 * 1024:
+                    self.throughput.add(received, spent)
+                    received, spent = 0, 0.0
+                yield chunk
+            self.throughput.add(received, spent)
+        finally:
+            response.close()
+
+    def prefetchImages(self, urls):
+        """Download cover art into the disk cache, e.g. of the visible rows.
+
+        Afterwards imagesCached [{url, image}] tells QML what to show for
+        each of urls: the file:// URL, or url itself if the download failed.
+        """
+        try:
+            return self.images.prefetch(urls, self.jobs.cancelled)
+        finally:
+            pyotherside.send("imagesCached", [
+                {"url": url, "image": self.images.local(url) or url} for url in urls])
+
+    def setImageCacheBudget(self, megabytes):
+        self.images.set_budget(int(megabytes) * 1024 * 1024)
+
+    def getImageCacheStats(self):
+        return self.images.stats()
+
+    def clearImageCache(self):
+        self.images.clear()
+
+    def _download_source(self, track_id):
+        """File URLs and extension of a track's stream, for self.downloads"""
+        track = self.session.track()
+        track.id = int(track_id)
+        manifest = track.get_stream().get_stream_manifest()
+        if manifest.is_encrypted:
+            raise ValueError("encrypted stream")
+        return list(manifest.urls), manifest.file_extension or ".m4a"
+
+    def _download_event(self, event, job):
+        signal = {"progress": "downloadProgress", "done": "downloadFinished",
+                  "failed": "downloadFailed"}[event]
+        pyotherside.send(signal, job)
+
+    def _queue_downloads(self, infos):
+        queued = 0
+        for info in infos:
+            if info and self.downloads.add(info["trackid"], info):
+                queued += 1
+        return queued
+
+    def downloadTrack(self, id):
+        """Download a track for offline playback; False if it is there already"""
+        info = self._known_track(id)
+        if info is not None and not isinstance(info, dict):
+            info = self.handle_track(info)
+        if info is None:
+            # saved with the job, offline playback needs no metadata lookup
+            info = self.getTrackInfo(id)
+        return self.downloads.add(id, info)
+
+    def downloadAlbum(self, id):
+        """Queue every track of an album; returns the number queued"""
+        return self._queue_downloads(self._album_track_infos(id))
+
+    def downloadPlaylist(self, id):
+        """Queue every track of a playlist; returns the number queued"""
+        if self.fast_projection:
+            infos = chain.from_iterable(
+                self._projected_pages("playlists/%s/tracks" % id, self.project.track))
+        else:
+            infos = map(self.handle_track, chain.from_iterable(
+                self.session.playlist(id).tracks_pages(self.page_size)))
+        return self._queue_downloads(infos)
+
+    def getDownloads(self):
+        return self.downloads.jobs()
+
+    def cancelDownload(self, id):
+        return self.downloads.cancel(id)
+
+    def removeDownload(self, id):
+        return self.downloads.remove(id)
+
+    def setDownloadBudget(self, megabytes):
+        self.downloads.budget = int(megabytes) * 1024 * 1024
+
+    def getTrackUrl(self, id, fast_start=False):
+        """Send playback_info with the URL to play id from.
+
+        With fast_start the URL is of fast_start_quality, which is small
+        and resolved together with the configured quality; once that is
+        resolved too, qualityUpgradeReady {trackid, url, replaces} follows
+        and QML switches over at the current position.
+        """
+        try:
+            track = self._known_track(id)
+            local = self.downloads.local_file(id)
+            if track is None and local is not None:
+                # downloads play offline, with the info saved along
+                track = self.downloads.info(id)
+            quality = self._track_quality(id) if local is None else None
+            upgrade = fast_start and local is None and self._fast_starts(id, quality)
+            if track is None or upgrade:
+                # start the URL lookup while the metadata is being fetched
+                self.urls.prefetch([id], quality)
+            if track is None:
+                track = self.session.track(int(id))
+            if local is not None:
+                url = "file://" + local
+            elif upgrade:
+                url = self._stream_url(id, self.fast_start_quality)
+            else:
+                url = self._stream_url(id, quality)
+            if isinstance(track, dict):
+                track_info = dict(track)
+            else:
+                track_info = self.handle_track(track)
 
             if track_info and url:
                 self.send_object("playback_info", {
                     "track": track_info,
                     "url": url
                 })
+                if upgrade:
+                    pyotherside.send("qualityUpgradeReady", {
+                        "trackid": str(id), "url": self._stream_url(id, quality),
+                        "replaces": url})
                 return track_info
             return None
         except Exception as e:
+            self.urls.invalidate(id)
             self.send_object("error", {"message": str(e)})
         return None
 
     def getMixTracks(self, id):
+        if self.fast_projection:
+            infos = self._mix_track_infos(id)
+            pages = (infos[i:i + self.page_size]
+                     for i in range(0, len(infos), self.page_size))
+            self._stream_pages("mix", id, pages, None, "cacheTrack", "mixTrackAdded")
+            return None
+        mix = self.session.mix(id)
+        self._stream_pages("mix", id, mix.items_pages(self.page_size),
+                           self.handle_track, "cacheTrack", "mixTrackAdded")
+        return mix # just for testing
+
+    def _stream_pages(self, source, source_id, pages, handle, cache_signal,
+                      view_signal, offset=0, max_pages=0):
+        """Forward a paged collection to QML page by page.
+
+        pages is an iterator over lists of tidalapi objects (see the
+        *_pages() methods) that handle turns into bridge dicts, or over
+        lists of projected bridge dicts if handle is None. Every page goes
+        out as cache and view batches followed by a collectionPage cursor
+        {source, id, offset, count, next}; next is the offset to continue
+        from, or -1 once the collection is complete. max_pages > 0 stops
+        early so QML can continue on scroll, see TrackList.qml.
+        """
+        with self._stream_lock:
+            generation = self._stream_generation.get(source, 0) + 1
+            self._stream_generation[source] = generation
         pyotherside.send('loadingStarted')
+        loading = True
         try:
-            mix = self.session.mix(id)
-            for track in mix.items():
-                track_info = self.handle_track(track)
-                if track_info:
-                    pyotherside.send("cacheTrack", track_info)
-                    pyotherside.send("mixTrackAdded",track_info)
-            return mix # just for testing
+            loaded = 0
+            for page in pages:
+                if self.jobs.cancelled() or self._stream_generation.get(source) != generation:
+                    debug_log(f"PAGING: {source} {source_id} superseded at offset {offset}", level=2)
+                    return
+                with self.batch() as emitter:
+                    for item in page:
+                        info = handle(item) if handle else item
+                        if cache_signal:
+                            emitter.add(cache_signal, info)
+                        emitter.add(view_signal, info)
+                self.send_object("collectionPage", {
+                    "source": source,
+                    "id": str(source_id),
+                    "offset": offset,
+                    "count": len(page),
+                    "next": offset + len(page),
+                })
+                offset += len(page)
+                loaded += 1
+                if loading:
+                    # the first rows are on screen, the rest loads in the background
+                    pyotherside.send('loadingFinished')
+                    loading = False
+                if max_pages and loaded >= max_pages:
+                    return
+            self.send_object("collectionPage", {
+                "source": source,
+                "id": str(source_id),
+                "offset": offset,
+                "count": 0,
+                "next": -1,
+            })
         finally:
-            pyotherside.send('loadingFinished')
+            if loading:
+                pyotherside.send('loadingFinished')
 
-    def _load_collection(self, source, source_id, fetcher, mode, start_track_id=None):
+    def _load_collection(self, source, source_id, fetcher, mode, start_track_id=None,
+                         handle=None):
         """Generic collection loader.
 
-        fetcher() returns an iterable of tidalapi Track objects. We wrap the
-        common loadingStarted/loadingFinished + error reporting around it and
-        emit a single playlist_load batch with the resolved track infos.
+        fetcher() returns an iterable of tidalapi Track objects, or of
+        projected track dicts when handle is None. We wrap the common
+        loadingStarted/loadingFinished + error reporting around it and emit
+        a single playlist_load batch with the resolved track infos.
         """
         pyotherside.send('loadingStarted')
         try:
-            tracks = [self.handle_track(t) for t in fetcher()]
+            tracks = [handle(t) if handle else t for t in fetcher()]
+            if self.jobs.cancelled():
+                return
             self._send_playlist_load(source, source_id, tracks, mode,
                                      start_track_id=start_track_id)
         except Exception as e:
@@ -697,20 +1726,30 @@ class Tidal:
             pyotherside.send('loadingFinished')
 
     def playMix(self, id, mode="replace"):
+        if self.fast_projection:
+            self._load_collection("mix", id, lambda: self._mix_track_infos(id), mode)
+            return
         self._load_collection("mix", id,
-                              lambda: self.session.mix(id).items(), mode)
+                              lambda: self.session.mix(id).items(), mode,
+                              handle=self.handle_track)
+
+    def _album_track_infos(self, id):
+        """Bridge dicts of all tracks of an album"""
+        if self.fast_projection:
+            # the track JSON embeds the album, no albums/{id} lookup needed
+            return self._projected_tracks(chain.from_iterable(
+                self._projected_pages("albums/%s/tracks" % int(id), self.project.track)))
+        return [self.handle_track(t) for t in self.session.album(int(id)).tracks()]
 
     def getAlbumTracks(self, id):
-        album = self.session.album(int(id))
-        for track in album.tracks():
-            track_info = self.handle_track(track)
-            if track_info:
-                pyotherside.send("cacheTrack", track_info)
-                pyotherside.send("albumTrackAdded",track_info)
+        with self.batch() as emitter:
+            for track_info in self._album_track_infos(id):
+                if track_info:
+                    emitter.add("cacheTrack", track_info)
+                    emitter.add("albumTrackAdded", track_info)
 
     def playAlbumTracks(self, id, mode="replace"):
-        self._load_collection("album", id,
-                              lambda: self.session.album(int(id)).tracks(), mode)
+        self._load_collection("album", id, lambda: self._album_track_infos(id), mode)
 
     def playAlbumfromTrack(self, track_id, mode="replace"):
         """Load the album that contains track_id and start playback from that track."""
@@ -718,18 +1757,19 @@ class Tidal:
         album_id = track.album.id if track.album else None
         self._load_collection("album_from_track", album_id,
                               lambda: track.album.tracks(), mode,
-                              start_track_id=track_id)
+                              start_track_id=track_id, handle=self.handle_track)
 
     def playArtistTracks(self, id, mode="replace"):
         self._load_collection(
             "artist_top", id,
             lambda: self.session.artist(int(id)).get_top_tracks(self.top_tracks),
-            mode)
+            mode, handle=self.handle_track)
 
     def playArtistRadio(self, id, mode="replace"):
         self._load_collection(
             "artist_radio", id,
-            lambda: self.session.artist(int(id)).get_radio(), mode)
+            lambda: self.session.artist(int(id)).get_radio(), mode,
+            handle=self.handle_track)
 
     # this is kinda duplicate of getTopTracksofArtist
     #def getTopTracks(self, id, max):
@@ -749,57 +1789,164 @@ class Tidal:
     def getArtistRadio(self, id): # -> Optional[List[Track]]:
         pyotherside.send('loadingStarted')
         tracks = self.session.artist(int(id)).get_radio()
-        for ti in tracks:
-            i = self.handle_track(ti)
-            pyotherside.send("cacheTrack", i)
-            pyotherside.send("RadioTrackofArtist", i)
+        with self.batch() as emitter:
+            for ti in tracks:
+                i = self.handle_track(ti)
+                emitter.add("cacheTrack", i)
+                emitter.add("RadioTrackofArtist", i)
 
         pyotherside.send('loadingFinished')
         return tracks  # just for testing
                 
+    def _fetch_artist_section(self, artist, section):
+        """Bridge dicts of one artist page section"""
+        if section == "info":
+            return [self.handle_artist(self.session.artist(artist.id))]
+        if section == "albums":
+            return [self.handle_album(a) for a in artist.get_albums()]
+        if section == "epSingles":
+            return [self.handle_album(a) for a in artist.get_ep_singles()]
+        if section == "other":
+            return [self.handle_album(a) for a in artist.get_other()]
+        if section == "topTracks":
+            return [self.handle_track(t) for t in artist.get_top_tracks(self.top_tracks)]
+        if section == "radio":
+            return [self.handle_track(t) for t in artist.get_radio()]
+        if section == "similar":
+            try:
+                return [self.handle_artist(a) for a in artist.get_similar()]
+            except tidalapi.exceptions.ObjectNotFound:
+                return []
+        raise ValueError(f"unknown artist page section {section}")
+
+    def _fetch_album_section(self, album, section):
+        """Bridge dicts of one album page section"""
+        if section == "info":
+            return [self.handle_album(self.session.album(album.id))]
+        if section == "tracks":
+            if self.fast_projection:
+                return self._album_track_infos(album.id)
+            # sparse: the shell album has no name/cover, the track JSON does
+            return [self.handle_track(t) for t in album.tracks(sparse_album=True)]
+        raise ValueError(f"unknown album page section {section}")
+
+    def _load_sections(self, signal, obj_id, sections, fetch):
+        """Run fetch(section) for all sections concurrently.
+
+        Each section goes out as signal(id, section, items) as soon as it is
+        done; failed sections are logged and skipped.
+        """
+        if not sections:
+            return
+        pyotherside.send('loadingStarted')
+        pool = ThreadPoolExecutor(max_workers=min(self.page_workers, len(sections)))
+        futures = {pool.submit(fetch, s): s for s in sections}
+        cancelled = False
+        try:
+            for future in as_completed(futures):
+                if self.jobs.cancelled():
+                    debug_log(f"{signal}: {obj_id} superseded", level=2)
+                    cancelled = True
+                    break
+                section = futures[future]
+                try:
+                    items = [i for i in future.result() if i]
+                except Exception as e:
+                    debug_log(f"{signal}: Failed to load {section} of {obj_id}: {e}", level=1, force=True)
+                    continue
+                self.send_items(signal, items, str(obj_id), section)
+        finally:
+            self._shutdown_pool(pool, futures, cancelled)
+            pyotherside.send('loadingFinished')
+
+    @staticmethod
+    def _shutdown_pool(pool, futures, cancelled):
+        """Shut pool down, without waiting for its fetches if cancelled"""
+        if cancelled:
+            for future in futures:
+                future.cancel()
+        pool.shutdown(wait=not cancelled)
+
+    def loadArtistPage(self, id, sections=None):
+        """Everything the artist page shows, fetched concurrently.
+
+        Sections: info, albums, epSingles, other, topTracks, similar, radio
+        (artistPageSection signal) and bio (artistBios signal). The page
+        takes about as long as its slowest section instead of their sum.
+        """
+        sections = list(sections or self.artist_page_sections)
+        if "bio" in sections:
+            sections.remove("bio")
+            self.bios.request([id])
+        artist = self._artist_shell(id)
+        self._load_sections("artistPageSection", id, sections,
+                            lambda section: self._fetch_artist_section(artist, section))
+
+    def loadAlbumPage(self, id, sections=None):
+        """Album info and tracks, fetched concurrently (albumPageSection)"""
+        album = self.session.album()
+        album.id = int(id)
+        self._load_sections("albumPageSection", id,
+                            list(sections or self.album_page_sections),
+                            lambda section: self._fetch_album_section(album, section))
+
     def getPersonalPlaylists(self):
         pyotherside.send('loadingStarted')
         playlists = self.session.user.playlists()
-        for i in playlists:
-            playlist_info = self.handle_playlist(i)
-            self.send_object("addPersonalPlaylist", playlist_info)
+        with self.batch() as emitter:
+            for i in playlists:
+                emitter.add("addPersonalPlaylist", self.handle_playlist(i))
         pyotherside.send('loadingFinished')
 
     def playPlaylist(self, id, mode="replace"):
-        self._load_collection("playlist", id,
-                              lambda: self.session.playlist(id).tracks(), mode)
-
-    def getPlaylistTracks(self, playlist_id):
-        pyotherside.send('loadingStarted')
-        try:
-            playlist = self.session.playlist(playlist_id)
-
-            for ti in playlist.tracks():
-                i = self.handle_track(ti)
-                pyotherside.send("cacheTrack", i)
-                pyotherside.send('playlistTrackAdded',i)
-            return playlist # just for testing
-
-        finally:
-            pyotherside.send('loadingFinished')
+        # all pages, tracks() alone stops at Config.item_limit
+        if self.fast_projection:
+            self._load_collection(
+                "playlist", id,
+                lambda: chain.from_iterable(
+                    self._projected_pages("playlists/%s/tracks" % id, self.project.track)),
+                mode)
+            return
+        self._load_collection(
+            "playlist", id,
+            lambda: chain.from_iterable(self.session.playlist(id).tracks_pages(self.page_size)),
+            mode, handle=self.handle_track)
+
+    def getPlaylistTracks(self, playlist_id, offset=0, max_pages=0):
+        """Stream the playlist page by page; continue with offset = cursor"""
+        if self.fast_projection:
+            pages = self._projected_pages("playlists/%s/tracks" % playlist_id,
+                                          self.project.track, offset)
+            self._stream_pages("playlist", playlist_id, pages, None,
+                               "cacheTrack", "playlistTrackAdded", offset, max_pages)
+            return None
+        playlist = self.session.playlist(playlist_id)
+        pages = playlist.tracks_pages(self.page_size,
+                                      None if offset else self.first_page_size,
+                                      offset)
+        self._stream_pages("playlist", playlist_id, pages, self.handle_track,
+                           "cacheTrack", "playlistTrackAdded", offset, max_pages)
+        return playlist # just for testing
 
     def getAlbumsofArtist(self, id):
         pyotherside.send('loadingStarted')
         albums = self.session.artist(int(id)).get_albums()
-        for ti in albums:
-            i = self.handle_album(ti)
-            pyotherside.send("cacheAlbum", i)
-            pyotherside.send("AlbumofArtist", i)
+        with self.batch() as emitter:
+            for ti in albums:
+                i = self.handle_album(ti)
+                emitter.add("cacheAlbum", i)
+                emitter.add("AlbumofArtist", i)
 
         pyotherside.send('loadingFinished')
 
     def getTopTracksofArtist(self, id):
         pyotherside.send('loadingStarted')
         tracks = self.session.artist(int(id)).get_top_tracks(self.top_tracks)
-        for ti in tracks:
-            i = self.handle_track(ti)
-            pyotherside.send("cacheTrack", i)
-            pyotherside.send("TopTrackofArtist", i)
+        with self.batch() as emitter:
+            for ti in tracks:
+                i = self.handle_track(ti)
+                emitter.add("cacheTrack", i)
+                emitter.add("TopTrackofArtist", i)
 
         pyotherside.send('loadingFinished')
 
@@ -808,10 +1955,9 @@ class Tidal:
         try:
             artists = self.session.artist(int(id)).get_similar()
             if artists:  # Wenn Artists zurückgegeben wurden
-                for ti in artists:
-                    i = self.handle_artist(ti)
-                    #pyotherside.send("cacheArtist", i)
-                    pyotherside.send("SimilarArtist", i)
+                with self.batch() as emitter:
+                    for ti in artists:
+                        emitter.add("SimilarArtist", self.handle_artist(ti))
             else:
                 pyotherside.send("noSimilarArtists")  # Signal wenn keine ähnlichen Künstler gefunden
         except requests.exceptions.HTTPError as e:
@@ -827,92 +1973,163 @@ class Tidal:
         finally:
             pyotherside.send('loadingFinished')
 
-    def getFavoriteAlbums(self):
-        pyotherside.send('loadingStarted')
-        for ti in self.session.user.favorites.albums():
-            i = self.handle_album(ti)
-            pyotherside.send("cacheAlbum", i)
-            pyotherside.send("FavAlbums", i)
-        pyotherside.send('loadingFinished')
+    def _favorite_pages(self, kind, project, offset):
+        """Projected pages of users/{id}/favorites/{kind}"""
+        return self._projected_pages(f"{self.session.user.favorites.base_url}/{kind}",
+                                     project, offset)
 
-    def getFavoriteTracks(self):
-        pyotherside.send('loadingStarted')
-        for ti in self.session.user.favorites.tracks():
-            i = self.handle_track(ti)
-            pyotherside.send("cacheTrack", i)
-            pyotherside.send("FavTracks", i)
-        pyotherside.send('loadingFinished')
+    def getFavoriteAlbums(self, offset=0, max_pages=0):
+        if self.fast_projection:
+            self._stream_pages("favAlbums", "", self._favorite_pages("albums", self.project.album, offset),
+                               None, "cacheAlbum", "FavAlbums", offset, max_pages)
+            return
+        favorites = self.session.user.favorites
+        pages = favorites.albums_pages(self.page_size,
+                                       None if offset else self.first_page_size, offset)
+        self._stream_pages("favAlbums", "", pages, self.handle_album,
+                           "cacheAlbum", "FavAlbums", offset, max_pages)
+
+    def getFavoriteTracks(self, offset=0, max_pages=0):
+        if self.fast_projection:
+            self._stream_pages("favTracks", "", self._favorite_pages("tracks", self.project.track, offset),
+                               None, "cacheTrack", "FavTracks", offset, max_pages)
+            return
+        favorites = self.session.user.favorites
+        pages = favorites.tracks_pages(self.page_size,
+                                       None if offset else self.first_page_size, offset)
+        self._stream_pages("favTracks", "", pages, self.handle_track,
+                           "cacheTrack", "FavTracks", offset, max_pages)
+
+    def getFavoriteArtists(self, offset=0, max_pages=0):
+        if self.fast_projection:
+            self._stream_pages("favArtists", "", self._favorite_pages("artists", self._project_artist, offset),
+                               None, "cacheArtist", "FavArtist", offset, max_pages)
+            return
+        favorites = self.session.user.favorites
+        pages = favorites.artists_pages(self.page_size,
+                                        None if offset else self.first_page_size, offset)
+        self._stream_pages("favArtists", "", pages, self.handle_artist,
+                           "cacheArtist", "FavArtist", offset, max_pages)
+
+    # Home screen sections that come from pages/... endpoints. "foryou" is
+    # the first category of the home feed, the others are view-all pages.
+    HOME_PAGES = {
+        "recent": "pages/HISTORY_MIXES/view-all",  # CONTINUE_LISTEN_TO was removed
+        "dailyMixes": "pages/DAILY_MIXES/view-all?",
+        "radioMixes": "pages/SUGGESTED_RADIOS_MIXES/view-all?",
+        "favArtists": "pages/YOUR_FAVORITE_ARTISTS/view-all?",
+    }
+
+    def _page(self, endpoint):
+        """Fetch a page into a fresh Page object.
+
+        session.page.get() overwrites the shared session.page, which is not
+        safe when several pages are loaded at the same time.
+        """
+        return tidalapi.Page(self.session, "").get(endpoint)
+
+    def _fetch_home_section(self, section):
+        if section == "foryou":
+            items = self.session.home().categories[0].items
+        else:
+            items = self._page(self.HOME_PAGES[section])
+        return [info for info in map(self._page_item_info, items) if info]
+
+    def _page_item_info(self, item):
+        """Bridge dict for any page item, None for unsupported types"""
+        if isinstance(item, tidalapi.album.Album):
+            return self.handle_album(item)
+        if isinstance(item, tidalapi.artist.Artist):
+            return self.handle_artist(item)
+        if isinstance(item, tidalapi.playlist.Playlist):
+            return self.handle_playlist(item)
+        if isinstance(item, tidalapi.mix.Mix):
+            return self.handle_mix(item)
+        if isinstance(item, tidalapi.Track):
+            return self.handle_track(item)
+        return None
+
+    def loadHomeScreen(self, sections=None):
+        """Load several home screen sections concurrently.
 
-    def getFavoriteArtists(self):
+        Every section is sent as one homeSection(section, items) batch as
+        soon as its page has been parsed, so the whole screen takes about as
+        long as the slowest page.
+        """
+        sections = [s for s in (sections or self.home_sections)
+                    if s == "foryou" or s in self.HOME_PAGES]
+        if not sections:
+            return
         pyotherside.send('loadingStarted')
-        for ti in self.session.user.favorites.artists():
-            i = self.handle_artist(ti)
-            pyotherside.send("cacheArtist", i)
-            pyotherside.send("FavArtist", i)
-        pyotherside.send('loadingFinished')
+        pool = ThreadPoolExecutor(max_workers=min(self.home_workers, len(sections)))
+        futures = {pool.submit(self._fetch_home_section, s): s for s in sections}
+        cancelled = False
+        try:
+            for future in as_completed(futures):
+                if self.jobs.cancelled():
+                    debug_log("HOME: Loading cancelled", level=2)
+                    cancelled = True
+                    break
+                section = futures[future]
+                try:
+                    items = future.result()
+                except Exception as e:
+                    debug_log(f"HOME: Failed to load section {section}: {e}", level=1, force=True)
+                    continue
+                self.send_items("homeSection", items, section)
+        finally:
+            self._shutdown_pool(pool, futures, cancelled)
+            pyotherside.send('loadingFinished')
 
     def getForYouPage(self):
-        pyotherside.send('loadingStarted')
-        home = self.session.home()
-        for item in home.categories[0].items:
-            self.getForYou(item)
-        pyotherside.send('loadingFinished')
+        self.loadHomeScreen(["foryou"])
 
     def getRecentPage(self):
-        pyotherside.send('loadingStarted')
-        for item in self.getPageContinueListen():
-            self.getRecently(item)
-        pyotherside.send('loadingFinished')
+        self.loadHomeScreen(["recent"])
 
     def getRadioMixes(self):
-        page = self.getPageSuggestedRadioMixes()
-        for item in page:
-            self.getCustomMixes("radioMix",item)
+        self.loadHomeScreen(["radioMixes"])
 
     def getDailyMixes(self):
-        page = self.getPageDailyMixes()
-        for item in page:
-            self.getCustomMixes("dailyMix",item)
+        self.loadHomeScreen(["dailyMixes"])
 
     def getTopArtists(self): # should there be a switch on get-artist in the end ?
-        page = self.getPageFavoriteArtists()
-        for item in page:
-            self.tryHandleArtist("topArtist", item)
+        self.loadHomeScreen(["favArtists"])
 
     #todo: rename method
     def getPageContinueListen(self):
-        return self.session.page.get("pages/HISTORY_MIXES/view-all") # CONTINUE_LISTEN_TO was removed
+        return self._page("pages/HISTORY_MIXES/view-all") # CONTINUE_LISTEN_TO was removed
 
     def getPageNewTrackSuggestions(self):
-        return self.session.page.get("pages/NEW_TRACK_SUGGESTIONS/view-all")
+        return self._page("pages/NEW_TRACK_SUGGESTIONS/view-all")
     
     def getPagePopularPlaylists(self):
-        return self.session.page.get("pages/POPULAR_PLAYLISTS/view-all")
+        return self._page("pages/POPULAR_PLAYLISTS/view-all")
 
     def getPageSuggestedRadioMixes(self):
-        return self.session.page.get("pages/SUGGESTED_RADIOS_MIXES/view-all?")
+        return self._page("pages/SUGGESTED_RADIOS_MIXES/view-all?")
 
     def getPageDailyMixes(self):
-        return self.session.page.get("pages/DAILY_MIXES/view-all?")
+        return self._page("pages/DAILY_MIXES/view-all?")
 
     # sorted by activity
     def getPageFavoriteArtists(self):
-        return self.session.page.get("pages/YOUR_FAVORITE_ARTISTS/view-all?")
+        return self._page("pages/YOUR_FAVORITE_ARTISTS/view-all?")
 
     def getPageListeningHistorypage(self):
-        return self.session.page.get("pages/HISTORY_MIXES/view-all?")
+        return self._page("pages/HISTORY_MIXES/view-all?")
 
     def getPageSuggestedNewAlbumspage(self):
-        return self.session.page.get("pages/NEW_ALBUM_SUGGESTIONS/view-all?")
+        return self._page("pages/NEW_ALBUM_SUGGESTIONS/view-all?")
 
     def getPageDecades(self):
-        return self.session.page.get("pages/genre_decades")
+        return self._page("pages/genre_decades")
 
     def getPageGenres(self):
-        return self.session.page.get("pages/genre_page")
+        return self._page("pages/genre_page")
 
     def getPageMoods(self):
-        return self.session.page.get("pages/moods_page")
+        return self._page("pages/moods_page")
 
     def tryHandleAlbum(self, signalName, item):
         if isinstance(item, tidalapi.album.Album):
@@ -1006,6 +2223,7 @@ class Tidal:
         else:
             result = self.getUser().favorites.remove_album(id)
         if result:
+            self.library.set_favorite("album", id, status)
             pyotherside.send('updateFavorite', id, status)
 
     def setArtistFavInfo(self,id,status):
@@ -1016,6 +2234,7 @@ class Tidal:
         else:
             result = user.favorites.remove_artist(id)
         if result:
+            self.library.set_favorite("artist", id, status)
             pyotherside.send('updateFavorite', id, status)
 
     def setTrackFavInfo(self,id,status):
@@ -1025,6 +2244,7 @@ class Tidal:
         else:
             result = self.getUser().favorites.remove_track(id)
         if result:
+            self.library.set_favorite("track", id, status)
             pyotherside.send('updateFavorite', id, status)
 
     def setPlaylistFavInfo(self,id,status):
@@ -1034,6 +2254,7 @@ class Tidal:
         else:
             result = self.getUser().favorites.remove_playlist(id)
         if result:
+            self.library.set_favorite("playlist", id, status)
             pyotherside.send('updateFavorite', id, status)
             
     def validateSession(self):
@@ -1051,17 +2272,16 @@ class Tidal:
                 token_length = len(self.session.access_token) if self.session.access_token else 0
                 debug_log(f"Session has access_token (length: {token_length})", level=2)
             
-            if not hasattr(self.session, 'check_login'):
-                debug_log("Session has no check_login method - validation failed", level=2)
+            # Local state only: the token manager keeps the token fresh, so
+            # no check_login round trip is needed here
+            if not self.session.session_id or self.session.user is None:
+                debug_log("Session not logged in - validation failed", level=2)
                 return False
-                
-            login_valid = self.session.check_login()
-            debug_log(f"Session check_login result: {login_valid}", level=2)
-            
-            if not login_valid:
-                debug_log("Session login check failed - validation failed", level=2)  
+
+            if not self.session.tokens.valid and not self.session.tokens.ensure_fresh():
+                debug_log("Access token expired and refresh failed - validation failed", level=2)
                 return False
-                
+
             debug_log("Session validation passed", level=2)
             return True
             
@@ -1069,6 +2289,12 @@ class Tidal:
             debug_log(f"Session validation error: {e}", level=1, force=True)
             return False
 
+    def getCacheStats(self):
+        """Hit/miss counters of the HTTP response cache"""
+        stats = self.session.request.cache_stats() if self.session else {}
+        debug_log(f"HTTP cache: {stats}", level=2)
+        return stats
+
     def clearSession(self):
         """Clear the current session completely - for manual logout"""
         debug_log("Clearing TidalAPI session (manual logout)", level=1)
@@ -1112,6 +2338,17 @@ class Tidal:
                     self.session.logout() 
                     debug_log("Session logout called", level=2)
                     
+                self.session.tokens.cancel()
+                self.urls.invalidate()
+                self.typeahead.cancel()
+                self.typeahead.cache.clear()
+                self.library.clear()
+                self.metadata.clear()
+
+                # Cached responses belong to the user that is logging out
+                if self.session.request.cache is not None:
+                    self.session.request.cache.clear()
+
                 # Force recreate session object to ensure clean state
                 debug_log("Recreating session object for clean state", level=2)
                 old_config = self.config
@@ -1119,7 +2356,7 @@ class Tidal:
                 
                 # Recreate with same config but clean state
                 if old_config:
-                    self.session = tidalapi.Session(old_config)
+                    self.session = self._create_session(old_config)
                     debug_log("New clean session created", level=2)
                 else:
                     debug_log("No config available, session set to None", level=2)
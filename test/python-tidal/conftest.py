@@ -20,6 +20,8 @@
 from __future__ import print_function
 
 import logging
+import sys
+import types
 from abc import ABC
 from contextlib import suppress
 from json import dumps, loads
@@ -34,6 +36,8 @@ import pytest
 
 import tidalapi
 
+ROOT = Path(__file__).resolve().parents[2]
+
 
 @pytest.fixture(scope="session")
 def session(request):
@@ -169,4 +173,119 @@ def pytest_addoption(parser):
         action="store_true",
         default=False,
         help="Run tests that require user input",
-    )
\ No newline at end of file
+    )
+
+
+# Offline helpers and fixtures for the bridge, projection and model tests
+
+
+def artist_json(artist_id, role="MAIN"):
+    return {
+        "id": artist_id,
+        "name": "Artist %d" % artist_id,
+        "type": role,
+        "picture": "0d5e7c8b-6b2a-4e5f-9a1b-%012d" % artist_id,
+    }
+
+
+def track_json(track_id, n_artists=100, n_albums=200):
+    album_id = track_id % n_albums
+    main = artist_json(album_id % n_artists)
+    featured = artist_json((album_id + 7) % n_artists, "FEATURED")
+    return {
+        "id": track_id,
+        "title": "Track %d" % track_id,
+        "duration": 200 + track_id % 60,
+        "explicit": False,
+        "allowStreaming": True,
+        "streamReady": True,
+        "stemReady": False,
+        "djReady": True,
+        "adSupportedStreamReady": True,
+        "trackNumber": track_id % 12 + 1,
+        "volumeNumber": 1,
+        "popularity": 50,
+        "audioQuality": "LOSSLESS",
+        "artist": main,
+        "artists": [main, featured],
+        "album": {
+            "id": 1000 + album_id,
+            "title": "Album %d" % album_id,
+            "cover": "3f1f7f2e-1a2b-4c3d-8e9f-%012d" % album_id,
+            "videoCover": None,
+            "releaseDate": "2020-01-01",
+        },
+    }
+
+
+def album_json(album_id):
+    return dict(
+        track_json(album_id)["album"],
+        artists=[artist_json(album_id % 100)],
+        duration=2400,
+        numberOfTracks=12,
+        streamStartDate="2019-05-01T00:00:00.000+0000",
+    )
+
+
+def playlist_json(n):
+    return {
+        "uuid": "a1b2c3d4-0000-4000-8000-%012d" % n,
+        "title": "Playlist %d" % n,
+        "numberOfTracks": 10 + n,
+        "numberOfVideos": 0,
+        "description": "Description %d" % n,
+        "duration": 3600,
+        "type": "USER",
+        "publicPlaylist": False,
+        "image": "0d5e7c8b-6b2a-4e5f-9a1b-%012d" % n,
+        "squareImage": "9a8b7c6d-6b2a-4e5f-9a1b-%012d" % n if n % 2 else None,
+        "creator": None,
+    }
+
+
+def page(items, wrap=False):
+    if wrap:
+        items = [{"created": "2021-01-01T00:00:00.000+0000", "item": i} for i in items]
+    return {"limit": len(items), "offset": 0, "totalNumberOfItems": len(items), "items": items}
+
+
+TRACKS = page([track_json(i) for i in range(1000)], wrap=True)
+ALBUMS = page([album_json(i) for i in range(1000)])
+
+
+def offline_session(identity_map="response"):
+    return tidalapi.Session(tidalapi.Config(identity_map=identity_map))
+
+
+def projected(tidal, json_obj, project):
+    return tidal.session.request.map_json(json_obj, parse=project)
+
+
+@pytest.fixture(scope="module")
+def tidal():
+    pyotherside = types.ModuleType("pyotherside")
+    pyotherside.send = lambda *args: None
+    sys.modules.setdefault("pyotherside", pyotherside)
+    sys.path.insert(0, str(ROOT / "qml"))
+    import tidal as backend
+
+    instance = backend.Tidal()
+    instance.session = tidalapi.Session(tidalapi.Config(identity_map=None))
+    return instance
+
+
+@pytest.fixture
+def sent(tidal, monkeypatch, tmp_path):
+    """Signals sent to QML, with fresh stores below tmp_path"""
+    import tidal as backend
+    from backend.images import ImageCache
+    from backend.library import LibraryIndex
+    from backend.metadata import MetadataStore
+
+    signals = []
+    monkeypatch.setattr(backend.pyotherside, "send", lambda *args: signals.append(args))
+    monkeypatch.setattr(tidal, "metadata", MetadataStore(str(tmp_path / "metadata.db")))
+    monkeypatch.setattr(tidal, "library", LibraryIndex(str(tmp_path / "library.db")))
+    monkeypatch.setattr(tidal, "images", ImageCache(str(tmp_path / "covers"), lambda url: b"jpeg"))
+    return signals
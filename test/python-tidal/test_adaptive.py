@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "qml"))
+
+from backend.adaptive import BITRATES, QualitySelector, ThroughputEstimator  # noqa: E402
+
+MBIT = 1000000
+
+
+def measured(bps, seconds=1.0, samples=10):
+    estimator = ThroughputEstimator()
+    for _ in range(samples):
+        estimator.add(int(bps * seconds / 8), seconds)
+    return estimator
+
+
+def test_estimate_needs_enough_data():
+    estimator = ThroughputEstimator()
+    assert estimator.estimate() is None
+    # latency dominated samples do not count
+    for _ in range(100):
+        estimator.add(4096, 0.1)
+        estimator.add(200 * 1024, 0.1)
+    assert estimator.estimate() is None
+    estimator.add(512 * 1024, 1.0)
+    # no bias towards zero from the first sample
+    assert estimator.estimate() == pytest.approx(512 * 1024 * 8)
+
+
+def test_estimate_drops_fast_and_recovers_slowly():
+    estimator = measured(8 * MBIT)
+    assert estimator.estimate() == pytest.approx(8 * MBIT)
+    estimator.add(int(MBIT / 8 * 4), 4.0)
+    dropped = estimator.estimate()
+    assert dropped < 5 * MBIT
+    # three seconds back at 8 Mbit/s
+    for _ in range(3):
+        estimator.add(MBIT, 1.0)
+    # the slow average holds back the recovery
+    assert dropped < estimator.estimate() < 8 * MBIT * 0.9
+
+
+def test_selector_starts_at_the_ceiling():
+    selector = QualitySelector()
+    decision = selector.select(None, "LOSSLESS", now=0)
+    assert decision == {"quality": "LOSSLESS", "previous": None,
+                        "throughput": None, "reason": "unmeasured"}
+    assert QualitySelector().select(10 * MBIT, "HIGH", now=0)["reason"] == "start"
+
+
+def test_selector_goes_down_at_once_and_up_after_hold():
+    selector = QualitySelector(hold=30)
+    assert selector.select(10 * MBIT, "HI_RES_LOSSLESS", now=0)["quality"] == "HI_RES_LOSSLESS"
+    # straight down to what the link sustains
+    decision = selector.select(400000, "HI_RES_LOSSLESS", now=1)
+    assert (decision["quality"], decision["reason"]) == ("HIGH", "down")
+    # just above the next bit rate is not enough to go up
+    assert selector.select(BITRATES["LOSSLESS"] * 1.2, "HI_RES_LOSSLESS", now=40)["quality"] == "HIGH"
+    # enough margin, but within the hold time of the last switch
+    assert selector.select(10 * MBIT, "HI_RES_LOSSLESS", now=10)["reason"] == "hold"
+    # one step at a time
+    decision = selector.select(10 * MBIT, "HI_RES_LOSSLESS", now=40)
+    assert (decision["quality"], decision["previous"], decision["reason"]) == ("LOSSLESS", "HIGH", "up")
+    assert selector.select(10 * MBIT, "HI_RES_LOSSLESS", now=50)["quality"] == "LOSSLESS"
+
+
+def test_selector_keeps_quality_within_the_margins():
+    selector = QualitySelector()
+    selector.select(10 * MBIT, "LOSSLESS", now=0)
+    # below the bit rate times up_margin but above it times down_margin
+    assert selector.select(BITRATES["LOSSLESS"] * 1.2, "LOSSLESS", now=100)["reason"] == "hold"
+
+
+def test_selector_stall_and_ceiling():
+    selector = QualitySelector()
+    selector.select(10 * MBIT, "LOSSLESS", now=0)
+    selector.stalled()
+    decision = selector.select(10 * MBIT, "LOSSLESS", now=1)
+    assert (decision["quality"], decision["reason"]) == ("HIGH", "stall")
+    # the stall counts once
+    assert selector.select(10 * MBIT, "LOSSLESS", now=2)["reason"] == "hold"
+    # a lower ceiling set by the user applies at once
+    decision = selector.select(10 * MBIT, "LOW", now=3)
+    assert (decision["quality"], decision["reason"]) == ("LOW", "ceiling")
+    # the floor holds on a stall
+    selector.stalled()
+    assert selector.select(10 * MBIT, "LOW", now=4)["quality"] == "LOW"
+    # qualities the selector has no bit rate for pass through
+    assert selector.select(10 * MBIT, "HI_RES", now=5)["quality"] == "HI_RES"
+
+
+def test_peek_does_not_switch():
+    selector = QualitySelector()
+    selector.select(10 * MBIT, "LOSSLESS", now=0)
+    selector.stalled()
+    assert selector.peek(10 * MBIT, "LOSSLESS", now=1)["reason"] == "stall"
+    assert selector.peek(100_000, "LOSSLESS", now=1)["reason"] == "stall"
+    assert selector.current == "LOSSLESS"
+    # the stall is still there for the next track
+    assert selector.select(10 * MBIT, "LOSSLESS", now=2)["reason"] == "stall"
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "qml"))
+
+from backend.artistbio import BioCache, BioLoader  # noqa: E402
+
+
+class Emitted:
+    def __init__(self):
+        self.batches = []
+        self.cond = threading.Condition()
+
+    def __call__(self, bios):
+        with self.cond:
+            self.batches.append(bios)
+            self.cond.notify_all()
+
+    def wait(self, count, timeout=5):
+        with self.cond:
+            return self.cond.wait_for(lambda: len(self.batches) >= count, timeout)
+
+
+def test_cache_entries_expire_and_persist(tmp_path):
+    path = str(tmp_path / "bios.json")
+    cache = BioCache(path, max_age=60)
+    cache.put(1, "bio 1")
+    cache.put("2", "")
+    assert (cache.get("1"), cache.get(2), cache.get(3)) == ("bio 1", "", None)
+    cache.flush()
+
+    reloaded = BioCache(path, max_age=60)
+    assert (reloaded.get(1), reloaded.get(2)) == ("bio 1", "")
+    reloaded._entries["1"][1] = time.time() - 61
+    assert reloaded.get(1) is None
+
+    reloaded.clear()
+    assert json.loads(Path(path).read_text()) == {}
+
+
+def test_unreadable_cache_starts_empty(tmp_path):
+    path = tmp_path / "bios.json"
+    path.write_text("{not json")
+    assert BioCache(str(path)).get(1) is None
+
+
+def test_hits_go_out_at_once_and_misses_once_fetched(tmp_path):
+    cache = BioCache(str(tmp_path / "bios.json"))
+    cache.put(1, "bio 1")
+    gate = threading.Event()
+    fetched = []
+
+    def fetch(artist_id):
+        fetched.append(artist_id)
+        gate.wait(5)
+        if artist_id == "3":
+            raise IOError("offline")
+        return "bio " + artist_id
+
+    emitted = Emitted()
+    loader = BioLoader(fetch, emitted, cache)
+    loader.request([1, 2, 3, 2])
+    # already in flight, so not fetched again
+    loader.request([2])
+    assert emitted.batches == [[{"artistid": "1", "bio": "bio 1"}]]
+    gate.set()
+    assert emitted.wait(2)
+    assert emitted.batches[1] == [{"artistid": "2", "bio": "bio 2"}]
+    assert sorted(fetched) == ["2", "3"]
+    # the fetched bio is saved, the failed one is asked for again next time
+    assert json.loads((tmp_path / "bios.json").read_text())["2"][0] == "bio 2"
+    assert cache.get(3) is None
+
+
+def test_inline_load_saves_the_cache(tmp_path):
+    path = tmp_path / "bios.json"
+    loader = BioLoader(lambda artist_id: "bio " + artist_id, Emitted(), BioCache(str(path)))
+    assert loader.load(5) == "bio 5"
+    assert json.loads(path.read_text())["5"][0] == "bio 5"
+    assert BioCache(str(path)).get(5) == "bio 5"
+
+    failing = BioLoader(lambda artist_id: 1 / 0, Emitted(), BioCache(str(path)))
+    assert failing.load(6) is None
+    assert "6" not in json.loads(path.read_text())
+
+
+def test_requests_share_the_pool(tmp_path):
+    gate = threading.Event()
+    before = set(threading.enumerate())
+
+    def fetch(artist_id):
+        gate.wait(5)
+        return "bio " + artist_id
+
+    emitted = Emitted()
+    loader = BioLoader(fetch, emitted, BioCache(str(tmp_path / "bios.json")), max_workers=2)
+    for artist_id in range(20):
+        loader.request([artist_id, artist_id + 100])
+    # no thread per request, only the pool's
+    started = set(threading.enumerate()) - before
+    gate.set()
+    assert emitted.wait(20)
+    assert len(started) == 2 and all(t.name.startswith("bio") for t in started)
+    assert sorted(b["artistid"] for batch in emitted.batches for b in batch) == sorted(
+        str(a) for a in list(range(20)) + list(range(100, 120)))
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+
+import pytest
+
+from tidalapi.exceptions import ManifestDecodeError
+from tidalapi.media import DashInfo, SegmentUrls
+
+MEDIA = "https://sp-ad-cf.audio.tidal.com/mediatracks/abc/$Number$.mp4?token=x"
+
+
+def make_mpd(timeline, codecs="flac", rate=44100):
+    segments = "".join(
+        '<S d="%d" r="%d"/>' % (d, r) if r else '<S d="%d"/>' % d
+        for d, r in timeline
+    )
+    return (
+        "<?xml version='1.0' encoding='UTF-8'?>"
+        '<MPD xmlns="urn:mpeg:dash:schema:mpd:2011" '
+        'profiles="urn:mpeg:dash:profile:isoff-main:2011" type="static" '
+        'minBufferTime="PT3.993S" mediaPresentationDuration="PT4M2.123S">'
+        '<Period id="0">'
+        '<AdaptationSet id="0" contentType="audio" mimeType="audio/mp4" '
+        'segmentAlignment="true">'
+        '<Representation id="FLAC,44100,16" codecs="%s" bandwidth="874213" '
+        'audioSamplingRate="%d">'
+        '<SegmentTemplate timescale="%d" '
+        'initialization="https://sp-ad-cf.audio.tidal.com/mediatracks/abc/0.mp4" '
+        'media="%s" startNumber="1">'
+        "<SegmentTimeline>%s</SegmentTimeline>"
+        "</SegmentTemplate></Representation></AdaptationSet></Period></MPD>"
+    ) % (codecs, rate, rate, MEDIA.replace("&", "&amp;"), segments)
+
+
+SMALL = make_mpd([(176128, 59), (79872, 0)])
+# Hi-res tracks come with hundreds of irregular segments.
+LARGE = make_mpd([(192512 + (i % 3), 0) for i in range(600)], rate=192000)
+
+
+def legacy(mpd_xml):
+    mpegdash = pytest.importorskip("mpegdash.parser")
+    return mpegdash.MPEGDASHParser.parse(
+        mpd_xml.split("<?xml version='1.0' encoding='UTF-8'?>")[1]
+    )
+
+
+@pytest.mark.parametrize("manifest", [SMALL, LARGE])
+def test_dash_info_matches_mpegdash(manifest):
+    mpd = legacy(manifest)
+    template = (
+        mpd.periods[0].adaptation_sets[0].representations[0].segment_templates[0]
+    )
+    info = DashInfo.from_mpd(manifest)
+
+    assert info.content_type == mpd.periods[0].adaptation_sets[0].content_type
+    assert info.mime_type == mpd.periods[0].adaptation_sets[0].mime_type
+    assert info.codecs == mpd.periods[0].adaptation_sets[0].representations[0].codecs
+    assert info.first_url == template.initialization
+    assert info.media_url == template.media
+    assert info.timescale == template.timescale
+    assert info.audio_sampling_rate == int(
+        mpd.periods[0].adaptation_sets[0].representations[0].audio_sampling_rate
+    )
+    assert info.chunk_size == template.segment_timelines[0].Ss[0].d
+    assert info.last_chunk_size == template.segment_timelines[0].Ss[-1].d
+    assert list(info.urls) == DashInfo.get_urls(mpd)
+
+
+def test_hls_playlist():
+    info = DashInfo.from_mpd(SMALL)
+    hls = info.get_hls()
+    assert hls.startswith("#EXTM3U\n")
+    assert hls.count("#EXTINF") == len(info.urls)
+    assert hls.endswith(info.urls[-1] + "\n#EXT-X-ENDLIST\n")
+    assert info.duration.seconds == 242
+
+
+def test_segment_urls_sequence():
+    urls = SegmentUrls(MEDIA, 5)
+    assert len(urls) == 5
+    assert urls[0] == MEDIA.replace("$Number$", "0")
+    assert urls[-1] == MEDIA.replace("$Number$", "4")
+    assert urls[1:3] == [MEDIA.replace("$Number$", str(i)) for i in (1, 2)]
+    assert urls == [MEDIA.replace("$Number$", str(i)) for i in range(5)]
+    with pytest.raises(IndexError):
+        urls[5]
+
+
+def test_invalid_manifest():
+    with pytest.raises(ManifestDecodeError):
+        DashInfo.from_mpd("<MPD><Period/></MPD>")
+
+
+def test_benchmark_large_manifest():
+    pytest.importorskip("mpegdash")
+    rounds = 20
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        list(DashInfo.get_urls(legacy(LARGE)))
+    slow = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        DashInfo.from_mpd(LARGE).urls[0]
+    fast = time.perf_counter() - start
+
+    print(
+        "mpegdash: %.2f ms, streaming: %.2f ms per manifest"
+        % (slow * 1000 / rounds, fast * 1000 / rounds)
+    )
+    assert fast < slow
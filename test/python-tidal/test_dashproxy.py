@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "qml"))
+
+from backend.dashproxy import DashProxy  # noqa: E402
+
+SEGMENTS = 40
+SEGMENT_SIZE = 32 * 1024
+LATENCY = 0.02
+
+
+def segment_bytes(n):
+    size = SEGMENT_SIZE // 4 if n == 0 else SEGMENT_SIZE + n  # init segment is small
+    return bytes((n + i) % 251 for i in range(size))
+
+
+SEGMENT_DATA = [segment_bytes(n) for n in range(SEGMENTS)]
+TRACK = b"".join(SEGMENT_DATA)
+HEADS = []
+
+
+class SegmentHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _segment(self):
+        time.sleep(LATENCY)
+        content = SEGMENT_DATA[int(self.path.rsplit("/", 1)[-1])]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        return content
+
+    def do_HEAD(self):
+        HEADS.append(self.path)
+        self._segment()
+
+    def do_GET(self):
+        self.wfile.write(self._segment())
+
+
+@pytest.fixture(scope="module")
+def cdn():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SegmentHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield ["http://127.0.0.1:%d/segment/%d" % (server.server_address[1], n)
+           for n in range(SEGMENTS)]
+    server.shutdown()
+
+
+def fetch(url):
+    with urllib.request.urlopen(url) as response:
+        return response.read()
+
+
+def probe(url):
+    request = urllib.request.Request(url, method="HEAD")
+    with urllib.request.urlopen(request) as response:
+        return int(response.headers["Content-Length"])
+
+
+@pytest.fixture
+def proxy():
+    proxy = DashProxy(fetch, probe, read_ahead=4)
+    yield proxy
+    proxy.close()
+
+
+def get(url, byte_range=None):
+    request = urllib.request.Request(url)
+    if byte_range:
+        request.add_header("Range", byte_range)
+    return urllib.request.urlopen(request)
+
+
+def test_progressive_stream(cdn, proxy):
+    url = proxy.register("1", cdn)
+    with get(url) as response:
+        assert response.status == 200
+        assert response.read() == TRACK
+    # the sizes are known by now, so is the length
+    assert proxy.stream("1").wait_sized(5)
+    with get(url) as response:
+        assert int(response.headers["Content-Length"]) == len(TRACK)
+        assert response.headers["Accept-Ranges"] == "bytes"
+
+
+def test_sizes_are_probed_for_seeking_only(cdn, proxy):
+    HEADS.clear()
+    url = proxy.register("6", cdn)
+    time.sleep(0.1)
+    assert HEADS == []
+    # playing through learns the sizes from the segments
+    with get(url) as response:
+        assert response.read() == TRACK
+    assert proxy.stream("6").length() == len(TRACK)
+    assert HEADS == []
+
+    with get(proxy.register("7", cdn), "bytes=100-199") as response:
+        assert response.read() == TRACK[100:200]
+    assert len(HEADS) == SEGMENTS
+
+
+def test_range_requests(cdn, proxy):
+    url = proxy.register("2", cdn)
+    for first, last in ((0, 99), (SEGMENT_SIZE // 4 - 10, SEGMENT_SIZE // 4 + 10),
+                        (len(TRACK) // 2, len(TRACK) // 2 + 3 * SEGMENT_SIZE)):
+        with get(url, "bytes=%d-%d" % (first, last)) as response:
+            assert response.status == 206
+            assert response.headers["Content-Range"] == "bytes %d-%d/%d" % (
+                first, last, len(TRACK))
+            assert response.read() == TRACK[first:last + 1]
+    with get(url, "bytes=%d-" % (len(TRACK) - 1000)) as response:
+        assert response.read() == TRACK[-1000:]
+    with get(url, "bytes=-500") as response:
+        assert response.read() == TRACK[-500:]
+    with pytest.raises(urllib.error.HTTPError) as error:
+        get(url, "bytes=%d-" % len(TRACK))
+    assert error.value.code == 416
+    with pytest.raises(urllib.error.HTTPError) as error:
+        get(proxy.register("3", cdn).replace("/3", "/unknown"))
+    assert error.value.code == 404
+
+
+def test_memory_stays_bounded(cdn, proxy):
+    url = proxy.register("4", cdn)
+    stream = proxy.stream("4")
+    most = 0
+    with get(url) as response:
+        while response.read(SEGMENT_SIZE):
+            most = max(most, stream.held())
+    assert most <= 2 * (proxy.read_ahead + 1)
+
+    for n in range(proxy.max_streams + 1):
+        proxy.register("other%d" % n, cdn[:2])
+    assert proxy.stream("4") is None
+
+
+def test_benchmark_startup_and_seek(cdn, proxy):
+    # fetching the track first, as a plain download would
+    start = time.perf_counter()
+    whole = b"".join(fetch(url) for url in cdn)
+    download = time.perf_counter() - start
+    assert whole == TRACK
+
+    url = proxy.register("5", cdn)
+    start = time.perf_counter()
+    with get(url) as response:
+        response.read(1)
+        first_byte = time.perf_counter() - start
+        body = response.read(len(TRACK) // 2)
+    streamed_half = time.perf_counter() - start
+    assert body == TRACK[1:len(TRACK) // 2 + 1]
+
+    offset = len(TRACK) * 3 // 4
+    start = time.perf_counter()
+    with get(url, "bytes=%d-" % offset) as response:
+        assert response.read(1000) == TRACK[offset:offset + 1000]
+    seek = time.perf_counter() - start
+
+    print("%d segments, %d ms latency: download %.0f ms; proxy first byte %.0f ms,"
+          " half the track %.0f ms, seek %.0f ms"
+          % (SEGMENTS, LATENCY * 1000, download * 1000, first_byte * 1000,
+             streamed_half * 1000, seek * 1000))
+    assert first_byte < download / 5
+    assert seek < download / 5
+    # read-ahead overlaps the fetches
+    assert streamed_half < download / 2
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "qml"))
+
+from backend import downloads  # noqa: E402
+
+SEGMENT = "https://sp-ad-cf.audio.tidal.com/mediatracks/%s/%d.mp4"
+
+
+class FakeCdn:
+    """DASH streams of `segments` segments, each with network latency"""
+
+    def __init__(self, segments=20, latency=0.02, fail_after=None):
+        self.segments = segments
+        self.latency = latency
+        self.fail_after = fail_after
+        self.fetched = []
+        self.lock = threading.Lock()
+
+    def resolve(self, track_id):
+        return [SEGMENT % (track_id, n) for n in range(self.segments)], ".m4a"
+
+    def fetch(self, url):
+        with self.lock:
+            if self.fail_after is not None and len(self.fetched) >= self.fail_after:
+                raise IOError("connection lost")
+            self.fetched.append(url)
+        time.sleep(self.latency)
+        # in two chunks, as the response arrives
+        return iter([url.encode(), b"\n"])
+
+
+class Events:
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, event, job):
+        self.events.append((event, job["trackid"]))
+
+
+def expected(track_id, segments):
+    return b"".join((SEGMENT % (track_id, n)).encode() + b"\n" for n in range(segments))
+
+
+def test_parallel_download_in_order(tmp_path):
+    cdn, events = FakeCdn(segments=40), Events()
+    manager = downloads.DownloadManager(str(tmp_path), cdn.resolve, cdn.fetch, events,
+                                        segment_workers=4)
+    start = time.perf_counter()
+    assert manager.add("42", {"title": "Creep"})
+    assert not manager.add("42")
+    assert manager.wait_idle(5)
+    elapsed = time.perf_counter() - start
+
+    path = manager.local_file("42")
+    with open(path, "rb") as f:
+        assert f.read() == expected("42", 40)
+    assert ("done", "42") in events.events
+    assert not os.listdir(str(tmp_path / ".parts"))
+    print("40 segments of 20 ms: %.0f ms with 4 workers" % (elapsed * 1000))
+    assert elapsed < 40 * cdn.latency / 2
+
+
+def test_resume_after_restart(tmp_path):
+    cdn, events = FakeCdn(segments=30, latency=0, fail_after=12), Events()
+    manager = downloads.DownloadManager(str(tmp_path), cdn.resolve, cdn.fetch, events,
+                                        segment_workers=1, retries=0)
+    manager.add("7")
+    assert manager.wait_idle(5)
+    assert ("failed", "7") in events.events
+    assert manager.local_file("7") is None
+
+    # a new process picks the job up from the journal and fetches the rest only
+    cdn.fail_after = None
+    again = downloads.DownloadManager(str(tmp_path), cdn.resolve, cdn.fetch, events)
+    assert again.jobs()[0]["status"] == downloads.FAILED
+    assert again.add("7")
+    assert again.wait_idle(5)
+    assert len(cdn.fetched) == 30
+    with open(again.local_file("7"), "rb") as f:
+        assert f.read() == expected("7", 30)
+
+
+def test_interrupted_jobs_are_resumed(tmp_path):
+    cdn = FakeCdn(segments=5, latency=0)
+    manager = downloads.DownloadManager(str(tmp_path), cdn.resolve, cdn.fetch)
+    manager._jobs["9"] = {"trackid": "9", "info": None, "status": downloads.RUNNING,
+                          "segments": 0, "fetched": 0, "size": 0, "path": "",
+                          "error": "", "added": 0}
+    assert manager.resume() == 1
+    assert manager.wait_idle(5)
+    assert manager.local_file("9")
+
+
+def test_budget_cancel_and_remove(tmp_path):
+    cdn, events = FakeCdn(segments=10, latency=0), Events()
+    size = len(expected("1", 10))
+    manager = downloads.DownloadManager(str(tmp_path), cdn.resolve, cdn.fetch, events,
+                                        budget=int(size * 1.5))
+    manager.add("1")
+    manager.add("2")
+    assert manager.wait_idle(5)
+    status = {job["trackid"]: (job["status"], job["error"]) for job in manager.jobs()}
+    assert status == {"1": (downloads.DONE, ""),
+                      "2": (downloads.FAILED, "storage budget exceeded")}
+    assert manager.used() == size
+
+    assert manager.remove("1")
+    assert manager.local_file("1") is None and manager.used() == 0
+    assert manager.add("2")
+    assert manager.cancel("2") or manager.wait_idle(5)
+
+
+def test_single_file_is_streamed_and_cancellable(tmp_path):
+    """A BTS track is one URL: it goes to disk chunk by chunk"""
+    chunk = b"\x00" * 64 * 1024
+    started, sent, closed = threading.Event(), [], []
+
+    def fetch(url):
+        try:
+            for _ in range(1000):
+                started.set()
+                sent.append(len(chunk))
+                time.sleep(0.001)
+                yield chunk
+        finally:
+            closed.append(url)
+
+    manager = downloads.DownloadManager(
+        str(tmp_path), lambda track_id: (["https://lgf.audio.tidal.com/3.flac"], ".flac"), fetch)
+    manager.add("3")
+    assert started.wait(5)
+    time.sleep(0.05)
+    assert manager.cancel("3")
+    assert manager.wait_idle(5)
+    # stopped within the file, the response was closed and nothing is left
+    assert len(sent) < 1000 and closed
+    assert manager.jobs() == [] and not os.listdir(str(tmp_path / ".parts"))
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import gc
+import threading
+import time
+import tracemalloc
+
+import tidalapi
+from tidalapi.identity import IdentityMap
+from conftest import artist_json, offline_session, track_json
+
+
+# A large playlist: 1000 tracks over 100 artists and 200 albums
+PLAYLIST = {
+    "limit": 1000,
+    "offset": 0,
+    "totalNumberOfItems": 1000,
+    "items": [track_json(i) for i in range(1000)],
+}
+
+
+def parse_playlist(session):
+    with session.identity_scope():
+        return session.request.map_json(PLAYLIST, parse=session.parse_track)
+
+
+def measure(identity_map, rounds=5):
+    session = offline_session(identity_map)
+    gc.collect()
+    tracemalloc.start()
+    tracks = parse_playlist(session)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        parse_playlist(session)
+    elapsed = (time.perf_counter() - start) / rounds
+    return tracks, peak, elapsed
+
+
+def test_embedded_objects_are_shared():
+    tracks = parse_playlist(offline_session())
+
+    assert len({id(t.album) for t in tracks}) == 200
+    assert len({id(a) for t in tracks for a in t.artists}) == 200
+    first, again = tracks[0], tracks[200]
+    assert first.album is again.album
+    assert first.artist is again.artist
+    assert first.album.name == "Album 0"
+    assert first.artist.name == "Artist 0"
+    assert [a.role for a in first.artists] == [
+        tidalapi.Role.main,
+        tidalapi.Role.featured,
+    ]
+
+
+def test_scope_is_per_response():
+    session = offline_session()
+    one = parse_playlist(session)
+    two = parse_playlist(session)
+    assert one[0].album is not two[0].album
+
+
+def test_session_scope_shares_across_responses():
+    session = offline_session("session")
+    one = parse_playlist(session)
+    two = parse_playlist(session)
+    assert one[0].album is two[0].album
+    assert session.identity.hits > 0
+
+
+def test_disabled():
+    tracks = parse_playlist(offline_session(None))
+    assert tracks[0].album is not tracks[200].album
+    assert tracks[0].album.name == tracks[200].album.name
+
+
+def test_scopes_nest_and_reset():
+    session = offline_session()
+    with session.identity_scope() as outer:
+        with session.identity_scope() as inner:
+            assert inner is outer
+        track = session.request.map_json(PLAYLIST, parse=session.parse_track)[0]
+        assert outer.get(("album", 1000, 0), lambda: None) is track.album
+    assert session._identity_map() is None
+
+    try:
+        with session.identity_scope():
+            raise ValueError("parse error")
+    except ValueError:
+        pass
+    assert session._identity_map() is None
+
+
+def test_scopes_are_per_thread():
+    session = offline_session()
+    maps = []
+
+    def parse():
+        with session.identity_scope() as scope:
+            maps.append(scope)
+            barrier.wait(5)
+
+    barrier = threading.Barrier(2)
+    threads = [threading.Thread(target=parse) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert maps[0] is not maps[1]
+
+
+def test_roles_and_album_artists_are_distinct():
+    session = offline_session()
+    with session.identity_scope():
+        main = session.parse_shared_artist(artist_json(1))
+        featured = session.parse_shared_artist(artist_json(1, "FEATURED"))
+        album = track_json(0)["album"]
+        by_main = session.parse_shared_album(album, main, [main])
+        other = session.parse_artist(artist_json(2))
+        by_other = session.parse_shared_album(album, other, [other])
+    assert main is not featured
+    assert (main.role, featured.role) == (tidalapi.Role.main, tidalapi.Role.featured)
+    assert by_main is not by_other
+    assert by_other.artist.id == 2
+
+
+def test_concurrent_misses_share_one_object():
+    shared = IdentityMap()
+    barrier = threading.Barrier(4)
+    results = []
+
+    def parse():
+        # every thread misses and parses before any stores its object
+        barrier.wait(5)
+        return object()
+
+    def get():
+        results.append(shared.get("key", parse))
+
+    threads = [threading.Thread(target=get) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 4
+    assert all(r is results[0] for r in results)
+    assert len(shared) == 1
+
+
+def test_weak_map_forgets_unreferenced_objects():
+    class Parsed:
+        pass
+
+    shared = IdentityMap(weak=True)
+    first = shared.get("key", Parsed)
+    assert shared.get("key", Parsed) is first
+    assert (shared.hits, shared.misses) == (1, 1)
+    del first
+    gc.collect()
+    assert len(shared) == 0
+    shared.get("key", Parsed)
+    assert shared.misses == 2
+
+    strong = IdentityMap()
+    strong.get("key", Parsed)
+    gc.collect()
+    assert len(strong) == 1
+    strong.clear()
+    assert len(strong) == 0
+
+
+def test_benchmark_large_playlist():
+    shared, shared_peak, shared_time = measure("response")
+    plain, plain_peak, plain_time = measure(None)
+
+    print(
+        "1000 tracks: %.0f KiB / %.1f ms without identity map, "
+        "%.0f KiB / %.1f ms with it"
+        % (
+            plain_peak / 1024,
+            plain_time * 1000,
+            shared_peak / 1024,
+            shared_time * 1000,
+        )
+    )
+    assert [t.album.name for t in shared] == [t.album.name for t in plain]
+    assert shared_peak < plain_peak
+    assert shared_time < plain_time
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "qml"))
+
+from backend.images import ImageCache, image_key  # noqa: E402
+
+URL = "https://resources.tidal.com/images/%s/%dx%d.jpg"
+
+
+def cover(n, size=320):
+    return URL % ("0d5e7c8b/6b2a/4e5f/9a1b/%012d" % n, size, size)
+
+
+class FakeCdn:
+    def __init__(self, size=1000, latency=0.0):
+        self.size = size
+        self.latency = latency
+        self.fetched = []
+        self.lock = threading.Lock()
+
+    def fetch(self, url):
+        with self.lock:
+            self.fetched.append(url)
+        time.sleep(self.latency)
+        return b"\xff" * self.size
+
+
+def test_keys():
+    assert image_key(cover(1)) == "0d5e7c8b-6b2a-4e5f-9a1b-000000000001_320x320.jpg"
+    assert image_key(cover(1, 640)) != image_key(cover(1))
+    assert image_key("image://theme/icon-m-media-playlists") is None
+
+
+def test_prefetch_deduplicates(tmp_path):
+    cdn = FakeCdn(latency=0.05)
+    cache = ImageCache(str(tmp_path), cdn.fetch)
+    # one album cover per track row, fetched by two prefetchers at once
+    rows = [cover(i % 3) for i in range(30)]
+    workers = [threading.Thread(target=cache.prefetch, args=(rows,)) for _ in range(2)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert sorted(cdn.fetched) == sorted(cover(i) for i in range(3))
+    assert cache.prefetch(rows) == 0
+    assert cache.stats()["files"] == 3
+
+
+def test_localize_copies_only_cached(tmp_path):
+    cache = ImageCache(str(tmp_path), FakeCdn().fetch)
+    tracks = [{"trackid": str(i), "image": cover(i)} for i in range(3)]
+    assert cache.localize(tracks) is tracks
+    cache.prefetch([cover(1)])
+
+    local = cache.localize({"query": "x", "tracks": tracks})
+    assert local["tracks"][1]["image"] == "file://" + os.path.join(str(tmp_path), image_key(cover(1)))
+    assert local["tracks"][0] is tracks[0]
+    assert tracks[1]["image"] == cover(1)
+
+
+def test_lru_eviction_and_restart(tmp_path):
+    cdn = FakeCdn(size=1000)
+    cache = ImageCache(str(tmp_path), cdn.fetch, budget=3500)
+    cache.prefetch([cover(i) for i in range(3)])
+    assert cache.local(cover(0))            # 0 is now the most recent
+    cache.prefetch([cover(3)])
+    assert cache.local(cover(1)) is None
+    assert all(cache.local(cover(i)) for i in (0, 2, 3))
+    assert sorted(os.listdir(str(tmp_path))) == sorted(image_key(cover(i)) for i in (0, 2, 3))
+
+    # a new instance knows the files, a smaller budget evicts
+    again = ImageCache(str(tmp_path), cdn.fetch, budget=3500)
+    assert again.stats()["bytes"] == 3000
+    again.set_budget(1000)
+    assert len(os.listdir(str(tmp_path))) == 1
+
+
+def test_handed_out_files_are_kept(tmp_path):
+    cache = ImageCache(str(tmp_path), FakeCdn(size=1000).fetch, budget=2500)
+    cache.prefetch([cover(0), cover(1)])
+    shown = cache.localize([{"image": cover(0)}, {"image": cover(1)}])
+    cache.prefetch([cover(2), cover(3)])
+    # a view may still show 0 and 1: over budget rather than broken images
+    assert all(os.path.exists(item["image"][len("file://"):]) for item in shown)
+    assert cache.local(cover(2)) is None and cache.local(cover(3))
+    cache.set_budget(0)
+    assert len(os.listdir(str(tmp_path))) == 3
+
+
+def test_only_recent_hand_outs_are_kept(tmp_path):
+    cache = ImageCache(str(tmp_path), FakeCdn(size=1000).fetch, budget=5000, pinned=3)
+    # scrolling through a long list hands out every cover once
+    for i in range(40):
+        cache.prefetch([cover(i)])
+        assert cache.local(cover(i))
+        on_disk = sum(os.path.getsize(str(tmp_path / name)) for name in os.listdir(str(tmp_path)))
+        assert on_disk <= 5000 + 3 * 1000
+    # the covers on screen last are still there
+    assert all(cache.local(cover(i)) for i in (37, 38, 39))
+    assert cache.local(cover(0)) is None
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# Startup import budget for the app backend (qml/tidal.py).
+#
+# Runs a fresh interpreter with -X importtime and fails if the cumulative
+# import time of the backend grows past IMPORT_BUDGET_MS, or if any of the
+# heavy modules is executed during the import. The import must not open the
+# on-disk stores either, and tidalapi's lazy exports must match its __all__.
+
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Generous for a desktop CPU; the cold import used to take ~300 ms here.
+IMPORT_BUDGET_MS = float(os.getenv("TIDAL_IMPORT_BUDGET_MS", "150"))
+
+HEAVY = ("urllib3", "requests.sessions", "tidalapi.session", "tidalapi.media")
+
+PROLOGUE = (
+    "import sys, types\n"
+    "pyotherside = types.ModuleType('pyotherside')\n"
+    "pyotherside.send = lambda *args: None\n"
+    "sys.modules['pyotherside'] = pyotherside\n"
+    "sys.path.insert(0, %r)\n"
+    "sys.path.insert(0, %r)\n" % (str(ROOT / "python"), str(ROOT))
+)
+
+
+def run(code, *flags, env=None):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", PROLOGUE + code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=str(ROOT),
+        env=dict(os.environ, **env) if env else None,
+    )
+
+
+def cumulative_us(stderr, module):
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+            return int(line.split("|")[1])
+    raise AssertionError("%s not found in -X importtime output" % module)
+
+
+def test_backend_import_budget():
+    result = run("import qml.tidal", "-X", "importtime")
+    total_ms = cumulative_us(result.stderr, "qml.tidal") / 1000.0
+    print("qml.tidal cold import: %.1f ms (budget %.0f ms)" % (total_ms, IMPORT_BUDGET_MS))
+    assert total_ms < IMPORT_BUDGET_MS
+
+
+def test_heavy_modules_not_loaded():
+    result = run(
+        "import qml.tidal\n"
+        "for name in %r:\n"
+        "    m = sys.modules.get(name)\n"
+        "    # lazily bound modules stay _LazyModule until first use\n"
+        "    if m is not None and type(m).__name__ != '_LazyModule':\n"
+        "        print(name)\n" % (HEAVY + ("requests",),)
+    )
+    assert result.stdout.split() == []
+
+
+def test_tidalapi_resolves_lazily():
+    result = run(
+        "import tidalapi\n"
+        "print('tidalapi.session' in sys.modules)\n"
+        "print(tidalapi.Quality.low_96k.value, tidalapi.album.Album.__name__)\n"
+        "print('tidalapi.media' in sys.modules)\n"
+    )
+    assert result.stdout.split() == ["False", "LOW", "Album", "True"]
+
+
+def test_preload_loads_heavy_modules():
+    result = run(
+        "import qml.tidal\n"
+        "from backend.lazy import preload\n"
+        "preload().join()\n"
+        "print(all(n in sys.modules for n in %r))\n" % (HEAVY,)
+    )
+    assert result.stdout.split() == ["True"]
+
+
+def test_no_stores_opened_at_import(tmp_path):
+    dirs = {"XDG_CACHE_HOME": str(tmp_path / "cache"), "XDG_DATA_HOME": str(tmp_path / "data")}
+    result = run(
+        "import os, qml.tidal\n"
+        "print(sorted(os.listdir(%r)))\n"
+        "qml.tidal.Tidaler.metadata\n"
+        "print(sorted(os.listdir(%r)))\n" % (str(tmp_path), str(tmp_path)),
+        env=dirs,
+    )
+    before, after = result.stdout.splitlines()
+    assert before == "[]"
+    assert after == "['cache']"
+    assert (tmp_path / "cache" / "harbour-tidalplayer" / "harbour-tidalplayer" / "metadata.db").exists()
+
+
+def test_lazy_exports_match_all():
+    import tidalapi
+
+    # the TYPE_CHECKING imports, which type checkers see, name the same modules
+    tree = ast.parse(Path(tidalapi.__file__).read_text())
+    checked = {
+        alias.name: node.module
+        for block in tree.body
+        if isinstance(block, ast.If) and getattr(block.test, "id", None) == "TYPE_CHECKING"
+        for node in block.body
+        for alias in node.names
+    }
+    assert checked == tidalapi._EXPORTS
+    assert tidalapi.__all__ == sorted(tidalapi._EXPORTS)
+    for name, module in tidalapi._EXPORTS.items():
+        assert getattr(tidalapi, name).__module__ == "tidalapi." + module
+
+    modules = {p.stem for p in Path(tidalapi.__file__).parent.glob("*.py")} - {"__init__"}
+    assert tidalapi._SUBMODULES == modules
+    assert set(tidalapi.__all__) | modules <= set(dir(tidalapi))
+    with pytest.raises(AttributeError):
+        tidalapi.Albums
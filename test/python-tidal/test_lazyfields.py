@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import copy
+import datetime
+
+import pytest
+
+import tidalapi
+from tidalapi.types import LazyField, lazy_date, set_json
+from conftest import offline_session, track_json
+
+DATED = dict(
+    track_json(1),
+    dateAdded="2021-05-06T10:00:00.000+0000",
+    streamStartDate="2020-01-01T00:00:00.000+0000",
+    mediaMetadata={"tags": ["LOSSLESS", "HIRES_LOSSLESS"]},
+)
+
+ALBUM = dict(track_json(3)["album"], artists=[track_json(3)["artist"]])
+
+LAZY = ("listen_url", "share_url", "user_date_added", "media_metadata_tags")
+
+
+def test_fields_are_decoded_on_access():
+    track = offline_session().parse_track(DATED)
+
+    assert not any(name in track.__dict__ for name in LAZY)
+    assert track.listen_url == "https://listen.tidal.com/album/1001/track/1"
+    assert track.share_url == "https://tidal.com/browse/track/1"
+    assert track.user_date_added == datetime.datetime(
+        2021, 5, 6, 10, 0, tzinfo=datetime.timezone.utc
+    )
+    assert track.date_added == track.user_date_added
+    assert track.media_metadata_tags == ["LOSSLESS", "HIRES_LOSSLESS"]
+    assert "listen_url" in track.__dict__
+
+    album = track.album
+    assert album.release_date == datetime.datetime(2020, 1, 1)
+    assert album.listen_url == "https://listen.tidal.com/album/1001"
+    assert [a.role for a in track.artists] == [
+        tidalapi.Role.main,
+        tidalapi.Role.featured,
+    ]
+
+
+def test_missing_keys_fall_back_to_defaults():
+    track = offline_session().parse_track(track_json(2))
+    assert track.user_date_added is None
+    assert track.tidal_release_date is None
+    assert tidalapi.Track.listen_url.default == ""
+
+
+def test_reparse_and_assignment():
+    session = offline_session()
+    album = session.album()
+    album.parse(dict(ALBUM, releaseDate="2001-02-03"))
+    assert album.release_date.year == 2001
+
+    album.parse(dict(ALBUM, releaseDate="1999-02-03"))
+    assert album.release_date.year == 1999
+
+    album.release_date = None
+    assert album.release_date is None
+
+
+class Base:
+    calls = []
+    title = LazyField(lambda obj, json_obj: Base.calls.append("title") or json_obj["title"])
+
+    def parse(self, json_obj):
+        set_json(self, json_obj)
+        return self
+
+
+class Derived(Base):
+    year = lazy_date("released")
+
+
+def test_unparsed_objects_get_the_default_until_parsed():
+    obj = Derived()
+    assert (obj.title, obj.year) == (None, None)
+    assert "title" not in obj.__dict__
+    obj.parse({"title": "First", "released": "2001-02-03"})
+    assert (obj.title, obj.year.year) == ("First", 2001)
+
+
+def test_values_are_decoded_once_and_dropped_on_reparse():
+    Base.calls = []
+    obj = Derived().parse({"title": "First"})
+    assert obj.title == obj.title == "First"
+    assert Base.calls == ["title"]
+
+    # inherited and own fields are both reset, assigned values too
+    obj.year = "assigned"
+    obj.parse({"title": "Second", "released": "1999-01-01"})
+    assert (obj.title, obj.year.year) == ("Second", 1999)
+    assert Base.calls == ["title", "title"]
+
+
+def test_copies_decode_on_their_own():
+    obj = Derived().parse({"title": "First", "released": "2001-02-03"})
+    before = copy.copy(obj)
+    assert obj.title == "First"
+    after = copy.copy(obj)
+    obj.title = "Changed"
+    assert (before.title, after.title) == ("First", "First")
+
+
+def test_bad_values_fail_on_access_not_on_parse():
+    obj = Derived().parse({"title": "First", "released": "not a date"})
+    assert obj.title == "First"
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            obj.year
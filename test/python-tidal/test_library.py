@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "qml"))
+
+from backend.library import LibraryIndex  # noqa: E402
+
+WORDS = ["Radio", "Karma", "Police", "Crème", "Brûlée", "Night", "Day", "Blue", "Moon", "Star"]
+
+
+def track(i):
+    return {
+        "trackid": str(i),
+        "title": "%s %s %d" % (WORDS[i % 10], WORDS[(i // 10) % 10], i),
+        "artist": "Artist %d" % (i % 50),
+        "artistid": str(i % 50),
+        "album": "Album %d" % (i % 200),
+        "albumid": i % 200,
+        "type": "track",
+    }
+
+
+def artist(i):
+    return {"artistid": str(i), "name": "Artist %d" % i, "type": "artist"}
+
+
+@pytest.fixture(params=[True, False], ids=["fts5", "like"])
+def library(request, tmp_path):
+    index = LibraryIndex(str(tmp_path / "library.db"), use_fts=request.param)
+    index.add([track(i) for i in range(1000)])
+    index.add([artist(i) for i in range(50)], favorite=True)
+    yield index
+    index.close()
+
+
+def test_prefix_and_multi_word_search(library):
+    results = library.search("karma pol", limit=50)
+    assert results["tracks"]
+    titles = {t["title"].rsplit(" ", 1)[0] for t in results["tracks"]}
+    assert titles == {"Karma Police", "Police Karma"}
+    assert library.search("artist 7")["artists"][0]["name"] == "Artist 7"
+    assert library.search("") == library.search("!?")
+
+
+def test_diacritics_are_folded():
+    index = LibraryIndex(":memory:")
+    index.add([track(3)])
+    assert index.search("creme")["tracks"][0]["trackid"] == "3"
+
+
+def test_upsert_and_favorites(library):
+    library.add([dict(track(1), title="Renamed Song")])
+    assert library.count() == 1050
+    assert library.search("renamed")["tracks"][0]["trackid"] == "1"
+    assert "1" not in [t["trackid"] for t in library.search("karma radio", limit=100)["tracks"]]
+
+    # favorites rank first and unfavoriting is kept
+    hits = library.search("album", limit=1000)["tracks"]
+    library.set_favorite("track", 999, True)
+    assert library.search("album", limit=1000)["tracks"][0]["trackid"] == "999"
+    library.add([track(999)])
+    assert library.search("album", limit=1000)["tracks"][0]["trackid"] == "999"
+    library.set_favorite("track", 999, False)
+    assert len(library.search("album", limit=1000)["tracks"]) == len(hits)
+
+
+def test_prune_keeps_favorites(tmp_path):
+    index = LibraryIndex(str(tmp_path / "library.db"), max_items=10)
+    index.add([artist(i) for i in range(5)], favorite=True)
+    index.add([track(i) for i in range(30)])
+    index.prune()
+    assert index.count() == 15
+    assert len(index.search("artist", limit=100)["artists"]) == 5
+
+
+def test_local_search_is_fast(library):
+    best = float("inf")
+    for query in ("ra", "karma", "blue moon", "artist 4"):
+        start = time.perf_counter()
+        library.search(query)
+        best = min(best, time.perf_counter() - start)
+    start = time.perf_counter()
+    for query in ("ra", "karma", "blue moon", "artist 4"):
+        library.search(query)
+    average = (time.perf_counter() - start) / 4
+    print("%s: %.2f ms per query over 1050 items" % ("fts5" if library.fts else "like", average * 1000))
+    assert average < 0.02
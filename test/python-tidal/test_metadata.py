@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "qml"))
+
+from backend.metadata import MetadataStore  # noqa: E402
+
+IMAGE = "https://resources.tidal.com/images/%s/320x320.jpg"
+
+
+def track(i):
+    return {
+        "trackid": str(i),
+        "title": "Track %d" % i,
+        "artist": "Artist %d" % (i % 50),
+        "artistid": str(i % 50),
+        "album": "Album %d" % (i % 200),
+        "albumid": i % 200,
+        "duration": 200 + i % 60,
+        "image": IMAGE % ("0d5e7c8b/6b2a/4e5f/9a1b/%012d" % (i % 200)),
+        "track_num": i % 12 + 1,
+        "type": "track",
+    }
+
+
+def test_roundtrip_and_bios(tmp_path):
+    store = MetadataStore(str(tmp_path / "metadata.db"))
+    infos = [track(i) for i in range(10)]
+    assert store.put("track", infos) == 10
+    stored = {t["trackid"]: t for t in store.get("track", ["3", "7", "404"])}
+    assert set(stored) == {"3", "7"}
+    timestamp = stored["3"].pop("timestamp")
+    assert stored["3"] == infos[3]
+    assert abs(timestamp - time.time() * 1000) < 5000
+
+    album = {"albumid": 1001, "title": "Pablo Honey", "year": 1993, "type": "album"}
+    store.put("album", [album])
+    assert store.get("album", ["1001"])[0]["albumid"] == 1001
+
+    # bios are loaded lazily, a later artist dict without one keeps it
+    store.put("artist", [{"artistid": "7", "name": "Radiohead", "bio": ""}])
+    store.set_bios([{"artistid": "7", "bio": "From Abingdon"}])
+    store.put("artist", [{"artistid": "7", "name": "Radiohead", "bio": ""}])
+    assert store.get("artist", ["7"])[0]["bio"] == "From Abingdon"
+
+
+def test_ttl_and_pruning(tmp_path):
+    store = MetadataStore(str(tmp_path / "metadata.db"), ttl=60, max_age=3600)
+    now = time.time()
+    store.put("track", [track(1)], now=now - 120)
+    store.put("track", [track(2)], now=now - 7200)
+    store.put("track", [track(3)])
+    fresh = {t["trackid"]: store.is_fresh(t) for t in store.get("track", ["1", "2", "3"])}
+    assert fresh == {"1": False, "2": False, "3": True}
+    assert store.prune() == 1
+    assert store.stats()["tracks"]["count"] == 2
+
+
+def test_bulk_writes_and_size(tmp_path):
+    infos = [track(i) for i in range(5000)]
+    store = MetadataStore(str(tmp_path / "metadata.db"))
+    start = time.perf_counter()
+    for offset in range(0, len(infos), 100):
+        store.put("track", infos[offset:offset + 100])
+    written = time.perf_counter() - start
+    start = time.perf_counter()
+    assert len(store.get("track", [str(i) for i in range(0, 5000, 5)])) == 1000
+    read = time.perf_counter() - start
+    store.close()
+
+    # the LocalStorage layout: one JSON string per row
+    legacy = sqlite3.connect(str(tmp_path / "legacy.db"))
+    with legacy:
+        legacy.execute("CREATE TABLE tracks(id TEXT PRIMARY KEY, data TEXT, timestamp INTEGER)")
+        legacy.execute("CREATE INDEX tracks_timestamp_idx ON tracks(timestamp)")
+        legacy.executemany(
+            "INSERT INTO tracks VALUES (?, ?, ?)",
+            [(t["trackid"], json.dumps(dict(t, timestamp=0, fromSearch=True)), 0) for t in infos])
+    legacy.close()
+
+    size = os.path.getsize(tmp_path / "metadata.db")
+    legacy_size = os.path.getsize(tmp_path / "legacy.db")
+    print("5000 tracks: %.0f ms in 50 batches, 1000 looked up in %.1f ms, %d KiB (LocalStorage layout %d KiB)"
+          % (written * 1000, read * 1000, size // 1024, legacy_size // 1024))
+    assert size < legacy_size
+    assert read < 0.1
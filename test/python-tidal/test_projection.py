@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import time
+
+from conftest import ALBUMS, TRACKS, album_json, artist_json, page, playlist_json, projected, track_json
+
+ARTISTS = page([artist_json(i) for i in range(1000)])
+PLAYLISTS = page([playlist_json(i) for i in range(50)])
+
+
+def object_path(tidal, json_obj, parse, handle):
+    return [handle(o) for o in tidal.session.request.map_json(json_obj, parse=parse)]
+
+
+def test_track_parity(tidal):
+    objects = object_path(tidal, TRACKS, tidal.session.parse_track, tidal.handle_track)
+    assert projected(tidal, TRACKS, tidal.project.track) == objects
+
+
+def test_album_artist_playlist_parity(tidal):
+    s = tidal.session
+    assert projected(tidal, ALBUMS, tidal.project.album) == object_path(
+        tidal, ALBUMS, s.parse_album, tidal.handle_album
+    )
+    assert projected(tidal, ARTISTS, tidal._project_artist) == object_path(
+        tidal, ARTISTS, s.parse_artist, tidal.handle_artist
+    )
+    assert projected(tidal, PLAYLISTS, tidal.project.playlist) == object_path(
+        tidal, PLAYLISTS, s.parse_playlist, tidal.handle_playlist
+    )
+
+
+def test_search_and_mix_page(tidal):
+    results = tidal.project.search(
+        {
+            "tracks": {"items": [track_json(1)]},
+            "albums": {"items": [album_json(1)]},
+            "artists": {"items": []},
+        }
+    )
+    assert [t["trackid"] for t in results["tracks"]] == ["1"]
+    assert [a["albumid"] for a in results["albums"]] == [1001]
+    assert results["artists"] == results["playlists"] == results["mixes"] == []
+
+    mix_page = {
+        "rows": [
+            {"modules": [{"type": "MIX_HEADER"}]},
+            {"modules": [{"type": "TRACK_LIST", "pagedList": {"items": [track_json(5)]}}]},
+        ]
+    }
+    infos = tidal._projected_tracks(
+        map(tidal.project.media, tidal.project.paged_list_items(mix_page))
+    )
+    assert [t["trackid"] for t in infos] == ["5"]
+    assert tidal._known_track("5") == infos[0]
+
+
+def test_benchmark_projection(tidal):
+    def best(fn, rounds=5):
+        times = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    s = tidal.session
+    cases = (
+        ("tracks", TRACKS, s.parse_track, tidal.handle_track, tidal.project.track),
+        ("albums", ALBUMS, s.parse_album, tidal.handle_album, tidal.project.album),
+    )
+    for name, json_obj, parse, handle, project in cases:
+        slow = best(lambda: object_path(tidal, json_obj, parse, handle))
+        fast = best(lambda: projected(tidal, json_obj, project))
+        print(
+            "1000 %s: %.1f ms via objects, %.1f ms projected"
+            % (name, slow * 1000, fast * 1000)
+        )
+        assert fast < slow
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import json
+import types
+
+import requests
+
+import tidalapi
+from tidalapi.request import ResponseCache
+
+
+class FakeApi:
+    """request_session stand-in that answers every call with `body` and records
+    the calls, answering 304 when the client already has the current etag"""
+
+    def __init__(self, etag=None):
+        self.calls = []
+        self.etag = etag
+        self.body = {"id": 1}
+
+    def request(self, method, url, params=None, data=None, headers=None):
+        self.calls.append((method, url, dict(headers or {})))
+        response = requests.Response()
+        response.url = url
+        response.request = requests.Request(method, url, params=params).prepare()
+        if self.etag:
+            response.headers["ETag"] = self.etag
+        if self.etag and (headers or {}).get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = json.dumps(self.body).encode()
+        return response
+
+
+def api_requests(tmp_path, api, ttls=None):
+    config = tidalapi.Config(cache_path=str(tmp_path / "responses.db"), cache_ttls=ttls)
+    session = types.SimpleNamespace(
+        config=config,
+        session_id="s1",
+        country_code="US",
+        token_type=None,
+        access_token=None,
+        refresh_token=None,
+        user=types.SimpleNamespace(id=7),
+        request_session=api,
+    )
+    return tidalapi.request.Requests(session)
+
+
+def test_ttl_table():
+    cache = ResponseCache(":memory:")
+    assert cache.ttl_for("albums/1") == 7 * 24 * 60 * 60
+    assert cache.ttl_for("artists/1/toptracks") == 24 * 60 * 60
+    assert cache.ttl_for("pages/home") == 15 * 60
+    assert cache.ttl_for("users/7/favorites/tracks") == 0
+    assert cache.ttl_for("playlists/x/items") == 0
+    assert cache.ttl_for("unknown/1") is None
+
+
+def test_playback_and_account_endpoints_are_never_cached(tmp_path):
+    api = FakeApi()
+    request = api_requests(tmp_path, api)
+    for path in (
+        "tracks/1/urlpostpaywall",
+        "tracks/1/playbackinfopostpaywall",
+        "sessions",
+        "users/7/subscription",
+    ):
+        request.basic_request("GET", path)
+        request.basic_request("GET", path)
+    assert len(api.calls) == 8
+    assert request.cache_stats()["entries"] == 0
+
+
+def test_fresh_entries_skip_the_network(tmp_path):
+    api = FakeApi()
+    request = api_requests(tmp_path, api)
+    first = request.basic_request("GET", "albums/1")
+    api.body = {"id": 2}
+    second = request.basic_request("GET", "albums/1")
+    assert len(api.calls) == 1
+    assert second.json() == first.json() == {"id": 1}
+    assert request.cache_stats()["hits"] == 1
+
+
+def test_session_id_does_not_split_the_cache(tmp_path):
+    api = FakeApi()
+    request = api_requests(tmp_path, api)
+    request.basic_request("GET", "albums/1")
+    request.session.session_id = "s2"
+    request.basic_request("GET", "albums/1")
+    assert len(api.calls) == 1
+    # ...but another user does
+    request.session.user = types.SimpleNamespace(id=8)
+    request.basic_request("GET", "albums/1")
+    assert len(api.calls) == 2
+
+
+def test_stale_entries_are_revalidated(tmp_path):
+    api = FakeApi(etag='"v1"')
+    request = api_requests(tmp_path, api)
+    request.basic_request("GET", "playlists/x")
+    response = request.basic_request("GET", "playlists/x")
+    assert len(api.calls) == 2
+    assert api.calls[1][2]["If-None-Match"] == '"v1"'
+    assert response.status_code == 200
+    assert response.json() == {"id": 1}
+    stats = request.cache_stats()
+    assert (stats["revalidated"], stats["misses"]) == (1, 1)
+
+    # A changed resource comes back in full
+    api.etag = '"v2"'
+    api.body = {"id": 2}
+    assert request.basic_request("GET", "playlists/x").json() == {"id": 2}
+
+
+def test_modifying_a_resource_invalidates_it(tmp_path):
+    api = FakeApi()
+    request = api_requests(tmp_path, api, ttls=[(r"^playlists/", 3600)])
+    for path in ("playlists/x", "playlists/x/items", "playlists/xy"):
+        request.basic_request("GET", path)
+    assert request.cache_stats()["entries"] == 3
+
+    request.basic_request("POST", "playlists/x/items", data={"trackIds": "1"})
+    assert request.cache_stats()["entries"] == 1
+    request.basic_request("GET", "playlists/xy")
+    assert len(api.calls) == 4
+
+    request.basic_request("GET", "playlists/x/items")
+    request.basic_request("DELETE", "playlists/x/items/0")
+    request.basic_request("GET", "playlists/x/items")
+    assert len(api.calls) == 7
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "qml"))
+
+from backend import scheduler  # noqa: E402
+
+
+class Recorder:
+    def __init__(self):
+        self.results = {}
+        self.cond = threading.Condition()
+
+    def done(self, request_id, status, result):
+        with self.cond:
+            self.results[request_id] = (status, result)
+            self.cond.notify_all()
+
+    def wait(self, expected, timeout=5):
+        with self.cond:
+            return self.cond.wait_for(lambda: len(self.results) >= expected, timeout)
+
+
+def test_priority_order():
+    order = []
+    gate = threading.Event()
+    jobs = scheduler.Scheduler(max_workers=2, background_workers=1)
+    rec = Recorder()
+    # occupy the only interactive worker until everything is queued
+    jobs.submit(gate.wait, (), scheduler.INTERACTIVE, request_id="block", done=rec.done)
+    jobs.submit(gate.wait, (), scheduler.INTERACTIVE, request_id="block2", done=rec.done)
+    time.sleep(0.05)
+    for name, priority in (("bg", scheduler.BACKGROUND),
+                           ("ui", scheduler.INTERACTIVE),
+                           ("play", scheduler.PLAYBACK)):
+        jobs.submit(order.append, (name,), priority, request_id=name, done=rec.done)
+    gate.set()
+    assert rec.wait(5)
+    assert order == ["play", "ui", "bg"]
+
+
+def test_background_leaves_a_worker_free():
+    stop = threading.Event()
+    jobs = scheduler.Scheduler(max_workers=3, background_workers=2)
+    rec = Recorder()
+    for i in range(6):
+        jobs.submit(stop.wait, (2,), scheduler.BACKGROUND, request_id="bg%d" % i, done=rec.done)
+    time.sleep(0.05)
+
+    start = time.perf_counter()
+    jobs.submit(lambda: "url", (), scheduler.PLAYBACK, request_id="url", done=rec.done)
+    while "url" not in rec.results:
+        time.sleep(0.001)
+    latency = time.perf_counter() - start
+    stop.set()
+    print("playback call with 6 background calls queued: %.1f ms" % (latency * 1000))
+    assert rec.results["url"] == (scheduler.DONE, "url")
+    assert latency < 0.5
+
+
+def test_interactive_leaves_a_worker_to_playback():
+    stop = threading.Event()
+    jobs = scheduler.Scheduler(max_workers=3)
+    rec = Recorder()
+    # a page load per section, all blocked on the network
+    for i in range(6):
+        jobs.submit(stop.wait, (2,), scheduler.INTERACTIVE, request_id="ui%d" % i, done=rec.done)
+    time.sleep(0.05)
+
+    jobs.submit(lambda: "url", (), scheduler.PLAYBACK, request_id="url", done=rec.done)
+    assert rec.wait(1, timeout=0.5)
+    stop.set()
+    assert rec.results == {"url": (scheduler.DONE, "url")}
+
+
+def test_superseded_and_cancelled_calls():
+    gate = threading.Event()
+    jobs = scheduler.Scheduler(max_workers=2, background_workers=1)
+    rec = Recorder()
+    seen = []
+
+    def search(text):
+        gate.wait()
+        seen.append((text, jobs.cancelled()))
+        return text
+
+    jobs.submit(search, ("a",), group="search", request_id=1, done=rec.done)
+    time.sleep(0.05)
+    jobs.submit(search, ("ab",), group="search", request_id=2, done=rec.done)
+    jobs.submit(search, ("abc",), group="search", request_id=3, done=rec.done)
+    jobs.submit(search, ("x",), request_id=4, done=rec.done)
+    assert jobs.cancel(4)
+    assert not jobs.cancel(99)
+    gate.set()
+    assert rec.wait(4)
+
+    # the running search is flagged, the queued one never runs
+    assert rec.results[1][0] == scheduler.CANCELLED
+    assert rec.results[2] == (scheduler.CANCELLED, None)
+    assert rec.results[3] == (scheduler.DONE, "abc")
+    assert rec.results[4] == (scheduler.CANCELLED, None)
+    assert ("a", True) in seen and ("abc", False) in seen
+    assert ("ab", False) not in seen and ("x", False) not in seen
+
+
+def test_failure_is_reported():
+    jobs = scheduler.Scheduler()
+    rec = Recorder()
+    jobs.submit(lambda: 1 / 0, request_id="boom", done=rec.done)
+    assert rec.wait(1)
+    status, error = rec.results["boom"]
+    assert status == scheduler.FAILED
+    assert isinstance(error, ZeroDivisionError)
+    assert jobs.pending() == 0
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import sys
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "qml"))
+
+from backend.dashproxy import DashProxy  # noqa: E402
+from backend.streamcache import CachedStream, RangeCache  # noqa: E402
+
+TRACK = bytes(i % 253 for i in range(3 * 1024 * 1024 + 17))
+URL = "https://lgf.audio.tidal.com/mediatracks/track.m4a?token=1"
+
+
+class FakeCdn:
+    """Range requests on TRACK, counting the bytes sent"""
+
+    def __init__(self):
+        self.sent = 0
+        self.requests = 0
+
+    def open_range(self, url, start, end=None):
+        self.requests += 1
+        end = len(TRACK) if end is None else end
+
+        def chunks():
+            for position in range(start, end, 64 * 1024):
+                chunk = TRACK[position:min(end, position + 64 * 1024)]
+                self.sent += len(chunk)
+                yield chunk
+
+        return len(TRACK), "audio/mp4", chunks()
+
+    def probe(self, url):
+        return len(TRACK)
+
+
+@pytest.fixture
+def proxy():
+    proxy = DashProxy(lambda url: b"")
+    yield proxy
+    proxy.close()
+
+
+def get(url, byte_range=None):
+    request = urllib.request.Request(url)
+    if byte_range:
+        request.add_header("Range", byte_range)
+    with urllib.request.urlopen(request) as response:
+        return response.read()
+
+
+def test_ranges_are_merged_and_journaled(tmp_path):
+    cache = RangeCache(str(tmp_path))
+    cache.write("1-HIGH", 100, TRACK[100:200])
+    cache.write("1-HIGH", 300, TRACK[300:400])
+    assert cache.cached_until("1-HIGH", 150) == 200
+    assert cache.cached_until("1-HIGH", 200) == 200
+    assert cache.next_cached("1-HIGH", 200) == 300
+    cache.write("1-HIGH", 200, TRACK[200:300])
+    cache.set_length("1-HIGH", 400, "audio/mp4")
+    assert cache.cached_until("1-HIGH", 100) == 400
+    assert not cache.complete("1-HIGH")
+    cache.write("1-HIGH", 0, TRACK[:100])
+    assert cache.complete("1-HIGH")
+    cache.save()
+
+    again = RangeCache(str(tmp_path))
+    assert again.complete("1-HIGH")
+    assert again.read("1-HIGH", 50, 300) == TRACK[50:350]
+    assert again.stats()["bytes"] == 400
+
+
+def test_lru_eviction_under_budget(tmp_path):
+    cache = RangeCache(str(tmp_path), budget=3500)
+    for key in ("a", "b", "c"):
+        cache.write(key, 0, TRACK[:1000])
+    cache.read("a", 0, 10)
+    cache.write("d", 0, TRACK[:1000])
+    assert cache.stats()["bytes"] == 3000
+    assert cache.cached_until("b", 0) == 0 and cache.cached_until("a", 0) == 1000
+    assert not (tmp_path / "b.bin").exists()
+
+
+def test_streams_being_read_are_not_evicted(tmp_path):
+    cache = RangeCache(str(tmp_path), budget=len(TRACK))
+    cdn, other = FakeCdn(), FakeCdn()
+    CachedStream(cache, "a", lambda: URL, cdn.open_range, cdn.probe).copy(io.BytesIO())
+
+    class Out(io.BytesIO):
+        # another connection fills the cache while "a" is being sent
+        def write(self, data):
+            if not other.requests:
+                CachedStream(cache, "b", lambda: URL, other.open_range, other.probe).copy(io.BytesIO())
+            return super().write(data)
+
+    out = Out()
+    CachedStream(cache, "a", lambda: URL, cdn.open_range, cdn.probe).copy(out)
+    assert out.getvalue() == TRACK
+    assert cdn.requests == 1 and other.requests == 1
+    # back within the budget once nobody reads "a" any more
+    assert cache.stats()["bytes"] <= len(TRACK)
+    assert cache.complete("a") != cache.complete("b")
@@ -0,0 +1,646 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import threading
+import time
+import types
+from pathlib import Path
+
+from conftest import (ALBUMS, TRACKS, album_json, artist_json, offline_session, playlist_json,
+                      projected, track_json)
+
+
+def artist_page(tidal):
+    return {
+        "info": [tidal.project.artist(artist_json(7))],
+        "albums": [tidal.project.album(album_json(n)) for n in (1, 2)],
+        "topTracks": [tidal.project.track(track_json(n)) for n in (3, 4, 5)],
+        "similar": [tidal.project.artist(artist_json(n)) for n in (8, 9)],
+    }
+
+
+def test_page_sections_are_stored(tidal, sent, monkeypatch):
+    page = artist_page(tidal)
+    monkeypatch.setattr(tidal, "_fetch_artist_section", lambda artist, section: page[section])
+    tidal.loadArtistPage("7", list(page))
+
+    sections = {a[2]: a[3] for a in sent if a[0] == "artistPageSection"}
+    assert sorted(sections) == sorted(page)
+    assert all(a[1] == "7" for a in sent if a[0] == "artistPageSection")
+    # the page can be shown again from the store
+    session, tidal.session = tidal.session, None
+    try:
+        tidal.lookupCached("track", ["3", "4", "5"])
+        tidal.lookupCached("artist", ["7", "8", "9"])
+    finally:
+        tidal.session = session
+    tracks = [a[1] for a in sent if a[0] == "cacheTracksBatch"][-1]
+    artists = [a[1] for a in sent if a[0] == "cacheArtistsBatch"][-1]
+    assert sorted(t["title"] for t in tracks) == sorted(t["title"] for t in page["topTracks"])
+    assert sorted(a["artistid"] for a in artists) == ["7", "8", "9"]
+    assert {a["albumid"] for a in tidal.metadata.get("album", [1001, 1002])} == {1001, 1002}
+
+
+def test_home_sections_are_stored_by_type(tidal, sent, monkeypatch):
+    items = [tidal.project.playlist(playlist_json(1)), tidal.project.album(album_json(3)),
+             tidal.project.track(track_json(4))]
+    monkeypatch.setattr(tidal, "_fetch_home_section", lambda section: items)
+    tidal.loadHomeScreen(["recent"])
+
+    assert [a[1:] for a in sent if a[0] == "homeSection"] == [("recent", items)]
+    assert tidal.metadata.get("playlist", [items[0]["playlistid"]])[0]["title"] == "Playlist 1"
+    assert tidal.metadata.get("album", [items[1]["albumid"]])[0]["title"] == items[1]["title"]
+    assert tidal.metadata.get("track", ["4"])[0]["title"] == items[2]["title"]
+
+
+def test_page_sections_are_searchable_offline(tidal, sent, monkeypatch):
+    page = artist_page(tidal)
+    monkeypatch.setattr(tidal, "_fetch_artist_section", lambda artist, section: page[section])
+    tidal.loadArtistPage("7", list(page))
+    home = [tidal.project.playlist(playlist_json(4))]
+    monkeypatch.setattr(tidal, "_fetch_home_section", lambda section: home)
+    tidal.loadHomeScreen(["foryou"])
+
+    results = tidal.searchLocal(page["topTracks"][1]["title"])
+    assert [t["trackid"] for t in results["tracks"]] == ["4"]
+    results = tidal.searchLocal(page["albums"][0]["title"])
+    assert results["albums"][0]["albumid"] == 1001
+    assert tidal.searchLocal("Playlist 4")["playlists"][0]["playlistid"] == home[0]["playlistid"]
+
+
+def test_page_sections_show_cached_art(tidal, sent, monkeypatch):
+    page = artist_page(tidal)
+    monkeypatch.setattr(tidal, "_fetch_artist_section", lambda artist, section: page[section])
+    cached, missing = page["topTracks"][0]["image"], "https://example.com/no-tidal-art.jpg"
+    tidal.prefetchImages([cached, missing])
+    assert [a[1] for a in sent if a[0] == "imagesCached"] == [[
+        {"url": cached, "image": tidal.images.local(cached)},
+        {"url": missing, "image": missing}]]
+    assert tidal.images.local(cached).startswith("file://")
+
+    tidal.loadArtistPage("7", ["topTracks"])
+    tracks = [a[3] for a in sent if a[0] == "artistPageSection"][0]
+    assert tracks[0]["image"] == tidal.images.local(cached)
+    # the stored dicts keep the remote URL
+    assert tidal.metadata.get("track", [tracks[0]["trackid"]])[0]["image"] == cached
+
+
+def test_download_keeps_the_track_info(tidal, sent, monkeypatch, tmp_path):
+    from backend.downloads import DownloadManager
+
+    source = lambda track_id: (["https://cdn/%s.flac" % track_id], ".flac")
+    monkeypatch.setattr(tidal, "downloads", DownloadManager(
+        str(tmp_path / "downloads"), source, lambda url: [url.encode()]))
+    info = tidal.project.track(track_json(31))
+    tidal.metadata.put("track", [info])
+    assert tidal._known_track("31") is None
+
+    assert tidal.downloadTrack("31")
+    assert tidal.downloads.wait_idle(5)
+    assert tidal.downloads.info("31")["title"] == info["title"]
+
+
+def playlist_api(tidal, monkeypatch, size):
+    """map_request() over a playlist of size tracks, recording the pages asked for"""
+    requests = []
+
+    def map_request(url, params, parse):
+        requests.append((params["offset"], params["limit"]))
+        end = min(params["offset"] + params["limit"], size)
+        return [parse(track_json(n)) for n in range(params["offset"], end)]
+
+    monkeypatch.setattr(tidal, "fast_projection", True)
+    monkeypatch.setattr(tidal.session.request, "map_request", map_request)
+    return requests
+
+
+def test_playlist_continues_from_the_cursor(tidal, sent, monkeypatch):
+    requests = playlist_api(tidal, monkeypatch, 230)
+    tidal.getPlaylistTracks("p", 0, 2)
+    cursors = [a[1] for a in sent if a[0] == "collectionPage"]
+    assert [c["next"] for c in cursors] == [50, 150]
+    assert requests == [(0, 50), (50, 100)]
+
+    del sent[:]
+    tidal.getPlaylistTracks("p", cursors[-1]["next"], 2)
+    cursors = [a[1] for a in sent if a[0] == "collectionPage"]
+    assert [(c["offset"], c["count"], c["next"]) for c in cursors] == [(150, 80, 230), (230, 0, -1)]
+    rows = [t for a in sent if a[0] == "playlistTrackAddedBatch" for t in a[1]]
+    assert [t["trackid"] for t in rows] == [str(n) for n in range(150, 230)]
+
+
+def test_newer_stream_supersedes_the_older(tidal, sent, monkeypatch):
+    def pages():
+        yield [tidal.project.track(track_json(1))]
+        # another page of the same kind is opened meanwhile
+        tidal._stream_pages("playlist", "q", iter([[tidal.project.track(track_json(2))]]),
+                            None, None, "playlistTrackAdded")
+        yield [tidal.project.track(track_json(3))]
+
+    tidal._stream_pages("playlist", "p", pages(), None, None, "playlistTrackAdded")
+    rows = [t["trackid"] for a in sent if a[0] == "playlistTrackAddedBatch" for t in a[1]]
+    assert rows == ["1", "2"]
+    assert [a[1]["id"] for a in sent if a[0] == "collectionPage"] == ["p", "q", "q"]
+
+
+def test_search_asks_for_api_type_names(tidal, sent, monkeypatch):
+    requests = []
+
+    def request(method, path, params=None):
+        requests.append(params)
+        return types.SimpleNamespace(json=lambda: {})
+
+    monkeypatch.setattr(tidal.session.request, "request", request)
+    tidal.searchPaged("creep")
+    tidal.searchMore("creep", "playlists", 10)
+
+    assert requests[0]["types"] == "TRACKS,ARTISTS,ALBUMS,PLAYLISTS,VIDEOS"
+    assert (requests[1]["types"], requests[1]["offset"]) == ("PLAYLISTS", 10)
+
+
+def test_typing_does_not_cancel_a_search(tidal, sent, monkeypatch):
+    from backend import scheduler
+
+    jobs = scheduler.Scheduler(max_workers=2, background_workers=1)
+    monkeypatch.setattr(tidal, "jobs", jobs)
+    searched, typed = [], []
+    monkeypatch.setattr(tidal, "genericSearch", searched.append)
+    # keep both workers busy until everything is queued
+    gate = threading.Event()
+    for _ in range(2):
+        jobs.submit(gate.wait, (), scheduler.PLAYBACK)
+    time.sleep(0.05)
+
+    tidal.schedule("search-1", "genericSearch", ["creep"])
+    tidal.typeahead.submit(typed.append, "cre")
+    tidal.typeahead.submit(typed.append, "creep")
+    gate.set()
+    deadline = time.time() + 5
+    while jobs.pending() and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert searched == ["creep"]
+    # only the newest search-as-you-type query is left
+    assert typed == ["creep"]
+    assert ("requestDone", "search-1", "done", None) in sent
+
+
+def test_paged_search(tidal, sent, monkeypatch):
+    requests_made = []
+
+    def search_json(text, limit=50, offset=0, types=None):
+        requests_made.append((limit, offset, types))
+        tracks = TRACKS["items"][offset : offset + limit]
+        return {
+            "topHit": {"type": "TRACKS", "value": tracks[0]["item"]},
+            "tracks": {"items": [t["item"] for t in tracks], "totalNumberOfItems": 30},
+            "albums": {"items": ALBUMS["items"][:2], "totalNumberOfItems": 2},
+        }
+
+    monkeypatch.setattr(tidal, "_search_json", search_json)
+    tidal.searchPaged("creep")
+
+    pages = {a[1]["category"]: a[1] for a in sent if a[0] == "searchCategoryPage"}
+    hits = [a[1] for a in sent if a[0] == "searchTopHit"]
+    assert requests_made == [(tidal.search_first_page, 0, None)]
+    assert sorted(pages) == sorted(tidal.SEARCH_CATEGORIES)
+    assert (hits[0]["category"], hits[0]["item"]["trackid"]) == ("tracks", "0")
+    assert [t["trackid"] for t in pages["tracks"]["items"]] == [
+        str(n) for n in range(tidal.search_first_page)]
+    assert (pages["tracks"]["total"], pages["tracks"]["next"]) == (30, tidal.search_first_page)
+    assert [a["albumid"] for a in pages["albums"]["items"]] == [1000, 1001]
+    assert pages["albums"]["next"] == -1
+    assert pages["artists"]["items"] == [] and pages["artists"]["next"] == -1
+    # searched tracks and albums reach the metadata cache as well
+    assert tidal.metadata.get("album", [1000])[0]["title"] == pages["albums"]["items"][0]["title"]
+
+    del sent[:]
+    tidal.setconfig(20, 20, 25, 20)
+    tidal.searchMore("creep", "tracks", 5)
+    page = [a[1] for a in sent if a[0] == "searchCategoryPage"]
+    assert requests_made[-1] == (25, 5, ["TRACKS"])
+    assert [(p["category"], p["offset"], p["next"]) for p in page] == [("tracks", 5, -1)]
+    assert [t["trackid"] for t in page[0]["items"]] == [str(n) for n in range(5, 30)]
+
+
+def test_local_library_search(tidal, sent):
+    infos = projected(tidal, TRACKS, tidal.project.track)
+    with tidal.batch() as emitter:
+        for info in infos[:100]:
+            emitter.add("cacheTrack", info)
+            emitter.add("FavTracks", info)
+    tidal.send_object("cacheAlbum", tidal.project.album(album_json(7)))
+    assert tidal.library.count() == 101
+
+    # the search field shows library hits without a session
+    session, tidal.session = tidal.session, None
+    try:
+        assert tidal.searchAsYouType(track_json(42)["title"]) == "library"
+        tidal.searchAsYouType("Unheard of")
+    finally:
+        tidal.session = session
+    results = [a[1] for a in sent if a[0] == "search_results"]
+    assert [r["query"] for r in results] == ["track 42", "unheard of"]
+    assert results[1]["tracks"] == []
+    assert results[0]["final"] is False
+    assert results[0]["tracks"][0]["trackid"] == "42"
+    # a library hit is playable like a searched track
+    assert tidal._known_track("42") == results[0]["tracks"][0]
+    assert tidal.searchLocal(album_json(7)["title"])["albums"][0]["albumid"] == 1007
+
+
+def test_metadata_store_lookups(tidal, sent, monkeypatch):
+    from backend import scheduler
+
+    infos = projected(tidal, TRACKS, tidal.project.track)[:10]
+    with tidal.batch() as emitter:
+        for info in infos:
+            emitter.add("cacheTrack", info)
+    assert tidal.metadata.stats()["tracks"]["count"] == 10
+
+    del sent[:]
+    session, tidal.session = tidal.session, None
+    try:
+        tidal.lookupCached("track", ["3", "5", "12345"])
+        # fresh stored items need no session
+        assert tidal.getTrackInfo("7")["title"] == infos[7]["title"]
+    finally:
+        tidal.session = session
+    batches = [a[1] for a in sent if a[0] == "cacheTracksBatch"]
+    assert sorted(t["trackid"] for t in batches[0]) == ["3", "5"]
+    assert [t["trackid"] for t in batches[1]] == ["7"]
+
+    # with a session only the miss goes to the network, in the background
+    fetched, priorities = [], []
+
+    def submit(fn, args, priority):
+        priorities.append(priority)
+        fn(*args)
+
+    monkeypatch.setattr(tidal, "getTrackInfo", fetched.append)
+    monkeypatch.setattr(tidal, "jobs", types.SimpleNamespace(submit=submit, cancelled=lambda: False))
+    tidal.lookupCached("track", ["3", "5", "12345"])
+    assert fetched == ["12345"]
+    assert priorities == [scheduler.BACKGROUND]
+
+
+def test_logout_forgets_the_library(tidal, sent, monkeypatch):
+    monkeypatch.setattr(tidal, "session", offline_session(None))
+    tidal.send_object("cacheTrack", tidal.project.track(track_json(3)))
+    assert tidal.metadata.get("track", ["3"]) and tidal.searchLocal("Track 3")["tracks"]
+
+    tidal.clearSession()
+    assert tidal.metadata.get("track", ["3"]) == []
+    assert tidal.searchLocal("Track 3")["tracks"] == []
+
+
+def test_cached_art_goes_out_as_files(tidal, sent):
+    info = tidal.project.track(track_json(3))
+    tidal.send_object("cacheTrack", info)
+    assert sent[-1][1]["image"] == info["image"]
+
+    tidal.images.prefetch([info["image"]])
+    tidal.send_object("cacheTrack", info)
+    local = sent[-1][1]["image"]
+    assert local.startswith("file://")
+    assert Path(local[len("file://"):]).read_bytes() == b"jpeg"
+    # the store keeps the remote URL, the file is only valid on this device
+    assert tidal.metadata.get("track", ["3"])[0]["image"] == info["image"]
+
+
+def test_downloaded_tracks_play_offline(tidal, sent, monkeypatch, tmp_path):
+    from backend.downloads import DownloadManager
+
+    source = lambda track_id: (["https://cdn/%s/%d" % (track_id, n) for n in range(3)], ".m4a")
+    monkeypatch.setattr(tidal, "downloads", DownloadManager(
+        str(tmp_path), source, lambda url: [url.encode(), b"|"], tidal._download_event))
+    info = tidal.project.track(track_json(11))
+    tidal.downloads.add("11", info)
+    assert tidal.downloads.wait_idle(5)
+    assert [a[1]["trackid"] for a in sent if a[0] == "downloadFinished"] == ["11"]
+    assert (tmp_path / "11.m4a").read_bytes() == b"https://cdn/11/0|https://cdn/11/1|https://cdn/11/2|"
+
+    session, tidal.session = tidal.session, None
+    try:
+        assert tidal.getTrackUrl("11")["trackid"] == "11"
+    finally:
+        tidal.session = session
+    playback = [a[1] for a in sent if a[0] == "playback_info"]
+    assert [p["url"] for p in playback] == ["file://" + str(tmp_path / "11.m4a")]
+
+
+def test_fast_start_upgrades_quality(tidal, sent, monkeypatch):
+    from backend.urlresolver import UrlResolver
+
+    monkeypatch.setattr(tidal, "cache_streams", False)
+    monkeypatch.setattr(tidal, "urls", UrlResolver(
+        lambda track_id, quality: "https://cdn/%s/%s.m4a" % (track_id, quality or "HIGH")))
+    tidal._projected_tracks([tidal.project.track(track_json(21))])
+
+    tidal.getTrackUrl("21", True)
+    playback = [a[1] for a in sent if a[0] == "playback_info"]
+    upgrade = [a[1] for a in sent if a[0] == "qualityUpgradeReady"]
+    assert [p["url"] for p in playback] == ["https://cdn/21/LOW.m4a"]
+    assert upgrade == [{"trackid": "21", "url": "https://cdn/21/HIGH.m4a",
+                        "replaces": playback[0]["url"]}]
+
+    # the full quality URL is cached now, so the next start needs no upgrade
+    del sent[:]
+    tidal.getTrackUrl("21")
+    assert [a[1]["url"] for a in sent if a[0] == "playback_info"] == ["https://cdn/21/HIGH.m4a"]
+    assert not [a for a in sent if a[0] == "qualityUpgradeReady"]
+
+
+def test_adaptive_quality_follows_throughput(tidal, sent, monkeypatch):
+    from backend.adaptive import QualitySelector, ThroughputEstimator
+    from backend.urlresolver import UrlResolver
+
+    monkeypatch.setattr(tidal, "cache_streams", False)
+    monkeypatch.setattr(tidal, "throughput", ThroughputEstimator())
+    monkeypatch.setattr(tidal, "quality_selector", QualitySelector())
+    monkeypatch.setattr(tidal, "urls", UrlResolver(
+        lambda track_id, quality: "https://cdn/%s/%s.m4a" % (track_id, quality or "HIGH")))
+    tidal._projected_tracks([tidal.project.track(track_json(22))])
+
+    # no samples yet: the configured quality
+    tidal.getTrackUrl("22")
+    assert [a[1]["url"] for a in sent if a[0] == "playback_info"] == ["https://cdn/22/HIGH.m4a"]
+
+    # 200 kbit/s sustain 96k but not 320k
+    del sent[:]
+    for _ in range(4):
+        tidal.throughput.add(500 * 1024, 20.0)
+    tidal.getTrackUrl("22")
+    decisions = [a[1] for a in sent if a[0] == "qualityDecision"]
+    assert [(d["trackid"], d["quality"], d["reason"]) for d in decisions] == [("22", "LOW", "down")]
+    assert [a[1]["url"] for a in sent if a[0] == "playback_info"] == ["https://cdn/22/LOW.m4a"]
+
+    del sent[:]
+    tidal.setAdaptiveQuality(False)
+    try:
+        tidal.getTrackUrl("22")
+    finally:
+        tidal.setAdaptiveQuality(True)
+    assert [a[1]["url"] for a in sent if a[0] == "playback_info"] == ["https://cdn/22/HIGH.m4a"]
+    assert not [a for a in sent if a[0] == "qualityDecision"]
+
+
+def test_prefetched_urls_match_the_adaptive_quality(tidal, sent, monkeypatch):
+    from backend.adaptive import QualitySelector, ThroughputEstimator
+    from backend.urlresolver import UrlResolver
+
+    resolved = []
+
+    def resolve(track_id, quality):
+        resolved.append((track_id, quality))
+        return "https://cdn/%s/%s.m4a" % (track_id, quality or "HIGH")
+
+    monkeypatch.setattr(tidal, "cache_streams", False)
+    monkeypatch.setattr(tidal, "throughput", ThroughputEstimator())
+    monkeypatch.setattr(tidal, "quality_selector", QualitySelector())
+    monkeypatch.setattr(tidal, "urls", UrlResolver(resolve))
+    tidal._projected_tracks([tidal.project.track(track_json(n)) for n in (23, 24)])
+    for _ in range(4):
+        tidal.throughput.add(500 * 1024, 20.0)
+
+    tidal.prefetchTrackUrls(["23", "24"])
+    deadline = time.monotonic() + 5
+    while len(resolved) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # prefetching decides nothing yet
+    assert not [a for a in sent if a[0] == "qualityDecision"]
+    tidal.getTrackUrl("23")
+    assert sorted(resolved) == [("23", "LOW"), ("24", "LOW")]
+    assert [a[1]["url"] for a in sent if a[0] == "playback_info"] == ["https://cdn/23/LOW.m4a"]
+
+
+class FakeHttp:
+    """request_session whose responses have a body of `size` bytes"""
+
+    def __init__(self, size):
+        self.size = size
+
+    def get(self, url, headers=None, stream=False, timeout=None):
+        body = b"x" * self.size
+        return types.SimpleNamespace(
+            status_code=200, headers={"Content-Length": str(self.size)}, content=body,
+            raise_for_status=lambda: None, close=lambda: None,
+            iter_content=lambda n: (body[i:i + n] for i in range(0, len(body), n)))
+
+
+def test_only_unpaced_transfers_measure_throughput(tidal, monkeypatch):
+    from backend.adaptive import ThroughputEstimator
+
+    monkeypatch.setattr(tidal, "throughput", ThroughputEstimator())
+    monkeypatch.setattr(tidal, "session", types.SimpleNamespace(request_session=FakeHttp(0)))
+
+    # cover art is too small, a progressive stream is read at the player's pace
+    tidal.session.request_session.size = 40 * 1024
+    for _ in range(50):
+        tidal._fetch_url("https://resources/cover.jpg")
+    tidal.session.request_session.size = 4 * 1024 * 1024
+    length, _, chunks = tidal._open_range("https://cdn/7.m4a", 0)
+    assert length == 4 * 1024 * 1024 and sum(map(len, chunks)) == length
+    assert tidal.throughput.estimate() is None
+
+    # downloads and DASH segment fetches do count
+    assert sum(map(len, tidal._fetch_chunks("https://cdn/7/0.mp4"))) == 4 * 1024 * 1024
+    assert tidal.throughput.estimate() is not None
+    monkeypatch.setattr(tidal, "throughput", ThroughputEstimator())
+    tidal.session.request_session.size = 600 * 1024
+    tidal._fetch_url("https://cdn/7/1.mp4")
+    tidal._fetch_url("https://cdn/7/2.mp4")
+    assert tidal.throughput.estimate() is not None
+
+
+def test_home_sections_load_concurrently(tidal, sent, monkeypatch):
+    delays = {"recent": 0.3, "foryou": 0.1, "dailyMixes": 0.2, "radioMixes": 0.0}
+    running, peak = [], []
+
+    def fetch(section):
+        running.append(section)
+        peak.append(len(running))
+        time.sleep(delays[section])
+        running.remove(section)
+        if section == "radioMixes":
+            raise IOError("offline")
+        return [tidal.project.playlist(playlist_json(len(section)))]
+
+    monkeypatch.setattr(tidal, "_fetch_home_section", fetch)
+    began = time.monotonic()
+    tidal.loadHomeScreen(["recent", "foryou", "dailyMixes", "radioMixes", "unknown"])
+    elapsed = time.monotonic() - began
+
+    assert max(peak) == 4
+    assert elapsed < sum(delays.values())
+    # each section as soon as it is ready; the failed and unknown ones are left out
+    assert [a[1] for a in sent if a[0] == "homeSection"] == ["foryou", "dailyMixes", "recent"]
+    names = [a[0] for a in sent if a[0] in ("loadingStarted", "loadingFinished", "homeSection")]
+    assert names[0] == "loadingStarted" and names[-1] == "loadingFinished"
+
+
+def test_cancelled_home_screen_does_not_wait(tidal, sent, monkeypatch):
+    release = threading.Event()
+
+    def fetch(section):
+        if section == "recent":
+            release.wait(5)
+        return [tidal.project.playlist(playlist_json(1))]
+
+    monkeypatch.setattr(tidal, "_fetch_home_section", fetch)
+    monkeypatch.setattr(tidal, "jobs", types.SimpleNamespace(cancelled=lambda: True))
+    began = time.monotonic()
+    try:
+        tidal.loadHomeScreen(["recent", "foryou"])
+        elapsed = time.monotonic() - began
+    finally:
+        release.set()
+    assert elapsed < 1
+    assert not [a for a in sent if a[0] == "homeSection"]
+
+
+def test_home_page_items_by_type(tidal):
+    session = tidal.session
+    items = [session.parse_track(track_json(1)), session.parse_album(album_json(2)),
+             session.parse_artist(artist_json(3)), session.parse_playlist(playlist_json(4)),
+             "an unsupported page item"]
+    infos = [tidal._page_item_info(item) for item in items]
+    assert [info and info["type"] for info in infos] == [
+        "track", "album", "artist", "playlist", None]
+    assert infos[0]["trackid"] == "1" and infos[2]["artistid"] == "3"
+
+
+def emitter(tidal, chunk_size=3, flush_interval=60):
+    import tidal as backend
+
+    sent = []
+    return backend.BatchEmitter(lambda *args: sent.append(args), chunk_size, flush_interval), sent
+
+
+def test_batches_are_chunked(tidal):
+    batch, sent = emitter(tidal)
+    with batch:
+        for n in range(7):
+            batch.add("FavTracks", {"trackid": str(n)})
+        batch.add("FavTracks", None)
+        assert [len(items) for _, items in sent] == [3, 3]
+    assert [name for name, _ in sent] == ["FavTracksBatch"] * 3
+    assert [t["trackid"] for _, items in sent for t in items] == [str(n) for n in range(7)]
+
+
+def test_cache_batches_go_out_before_views(tidal):
+    batch, sent = emitter(tidal, chunk_size=2)
+    batch.add("playlistTrackAdded", {"trackid": "1"})
+    batch.add("cacheAlbum", {"albumid": 2})
+    batch.add("cacheTrack", {"trackid": "1"})
+    batch.add("cacheTrack", {"trackid": "3"})
+    # the chunk that reached chunk_size took everything pending along
+    assert [name for name, _ in sent] == ["cacheAlbumsBatch", "cacheTracksBatch",
+                                          "playlistTrackAddedBatch"]
+    assert batch.pending == {}
+
+
+def test_slow_producers_flush_on_time(tidal):
+    batch, sent = emitter(tidal, chunk_size=100, flush_interval=0.05)
+    batch.add("FavAlbums", {"albumid": 1})
+    assert sent == []
+    time.sleep(0.06)
+    batch.add("FavAlbums", {"albumid": 2})
+    assert sent == [("FavAlbumsBatch", [{"albumid": 1}, {"albumid": 2}])]
+    batch.add("FavAlbums", {"albumid": 3})
+    assert len(sent) == 1
+    batch.flush()
+    batch.flush()
+    assert sent[1:] == [("FavAlbumsBatch", [{"albumid": 3}])]
+
+
+def test_batches_are_stored_like_single_items(tidal, sent):
+    tidal.emit_chunk_size = 2
+    try:
+        with tidal.batch() as batch:
+            for n in (1, 2, 3):
+                batch.add("cacheTrack", tidal.project.track(track_json(n)))
+    finally:
+        tidal.emit_chunk_size = 100
+    assert [len(a[1]) for a in sent if a[0] == "cacheTracksBatch"] == [2, 1]
+    assert {t["trackid"] for t in tidal.metadata.get("track", ["1", "2", "3"])} == {"1", "2", "3"}
+    assert tidal.library.count() == 3
+
+
+def test_album_page_sections_load_concurrently(tidal, sent, monkeypatch):
+    albums = []
+
+    def fetch(album, section):
+        albums.append(album.id)
+        if section == "info":
+            time.sleep(0.2)
+            return [tidal.project.album(album_json(5))]
+        if section == "credits":
+            raise IOError("offline")
+        return [tidal.project.track(track_json(n)) for n in (51, 52)] + [None]
+
+    monkeypatch.setattr(tidal, "_fetch_album_section", fetch)
+    began = time.monotonic()
+    tidal.loadAlbumPage("1005", ["info", "tracks", "credits"])
+    assert time.monotonic() - began < 0.4
+
+    assert albums == [1005] * 3
+    sections = [a[1:3] for a in sent if a[0] == "albumPageSection"]
+    assert sections == [("1005", "tracks"), ("1005", "info")]
+    tracks = [a[3] for a in sent if a[0] == "albumPageSection" and a[2] == "tracks"][0]
+    assert [t["trackid"] for t in tracks] == ["51", "52"]
+    assert sent[-1] == ("loadingFinished",)
+
+
+def test_superseded_page_stops_sending(tidal, sent, monkeypatch):
+    monkeypatch.setattr(tidal, "_fetch_album_section",
+                        lambda album, section: [tidal.project.album(album_json(5))])
+    monkeypatch.setattr(tidal, "jobs", types.SimpleNamespace(cancelled=lambda: True))
+    tidal.loadAlbumPage("1005")
+    assert [a[0] for a in sent if not a[0].startswith("pythonDebug")] == [
+        "loadingStarted", "loadingFinished"]
+
+
+def test_superseded_page_does_not_wait_for_slow_sections(tidal, sent, monkeypatch):
+    release = threading.Event()
+
+    def fetch(artist, section):
+        if section == "similar":
+            release.wait(5)
+        return []
+
+    monkeypatch.setattr(tidal, "_fetch_artist_section", fetch)
+    monkeypatch.setattr(tidal, "jobs", types.SimpleNamespace(cancelled=lambda: True))
+    start = time.perf_counter()
+    try:
+        tidal.loadArtistPage("7", ["info", "similar"])
+        elapsed = time.perf_counter() - start
+    finally:
+        release.set()
+    assert elapsed < 1
+    assert [a[0] for a in sent if not a[0].startswith("pythonDebug")][-1] == "loadingFinished"
+
+
+def test_artist_bio_is_requested_separately(tidal, sent, monkeypatch):
+    requested, fetched = [], []
+    monkeypatch.setattr(tidal, "bios", types.SimpleNamespace(request=requested.append))
+    monkeypatch.setattr(tidal, "_fetch_artist_section",
+                        lambda artist, section: fetched.append(section) or [])
+    tidal.loadArtistPage("7", ["info", "bio"])
+    assert requested == [["7"]]
+    assert fetched == ["info"]
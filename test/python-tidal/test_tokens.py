@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import datetime
+import json
+import threading
+import time
+import types
+
+import pytest
+import requests
+
+import tidalapi
+from tidalapi import tokens
+from tidalapi.exceptions import AuthenticationError
+
+
+class FakeClock:
+    """Stands in for datetime.datetime in tidalapi.tokens"""
+
+    def __init__(self):
+        self.now = datetime.datetime(2025, 1, 1)
+
+    def utcnow(self):
+        return self.now
+
+
+class FakeTimer:
+    """threading.Timer that only records what it was armed with"""
+
+    armed = []
+
+    def __init__(self, interval, function):
+        self.interval = interval
+        self.function = function
+        self.daemon = False
+        self.started = self.cancelled = False
+
+    def start(self):
+        self.started = True
+        FakeTimer.armed.append(self)
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeApi:
+    """request_session stand-in: the sessions/user calls of a login, 401 for
+    requests with an expired token and 200 for anything else"""
+
+    def __init__(self):
+        self.tokens = []
+
+    def request(self, method, url, params=None, data=None, headers=None):
+        token = (headers or {}).get("authorization")
+        self.tokens.append(token)
+        if url.endswith("/sessions"):
+            return self.response(
+                200, {"sessionId": "s1", "countryCode": "US", "userId": 7}
+            )
+        if url.endswith("/users/7"):
+            return self.response(
+                200,
+                {
+                    "id": 7,
+                    "username": "user",
+                    "email": "user@example.com",
+                    "firstName": "A",
+                    "lastName": "B",
+                },
+            )
+        if token == "Bearer expired":
+            return self.response(401, {"userMessage": "The token has expired."})
+        return self.response(200, {"id": 1})
+
+    @staticmethod
+    def response(status, body):
+        response = requests.Response()
+        response.status_code = status
+        response.url = "https://api.tidal.com/v1/"
+        response.request = requests.Request("GET", response.url).prepare()
+        response._content = json.dumps(body).encode()
+        return response
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(tokens, "datetime", types.SimpleNamespace(datetime=clock))
+    FakeTimer.armed = []
+    monkeypatch.setattr(tokens.threading, "Timer", FakeTimer)
+    return clock
+
+
+def login(clock, expires_in=3600, refresh_token="refresh"):
+    session = tidalapi.Session(tidalapi.Config(identity_map=None))
+    session.request_session = FakeApi()
+    expiry = clock.now + datetime.timedelta(seconds=expires_in)
+    assert session.load_oauth_session("Bearer", "valid", refresh_token, expiry)
+    return session
+
+
+def test_login_schedules_refresh_ahead_of_expiry(clock):
+    session = login(clock)
+    (timer,) = FakeTimer.armed
+    assert timer.started and timer.daemon
+    assert timer.interval == 3600 - session.tokens.margin
+    assert timer.function == session.tokens.refresh
+
+
+def test_no_refresh_is_scheduled_without_refresh_token(clock):
+    login(clock, refresh_token=None)
+    assert FakeTimer.armed == []
+
+
+def test_expired_token_is_refreshed_once_for_concurrent_requests(clock):
+    session = login(clock)
+    clock.now += datetime.timedelta(seconds=3600)
+    session.access_token = "expired"
+    refreshes = []
+
+    def token_refresh(refresh_token):
+        refreshes.append(refresh_token)
+        time.sleep(0.2)
+        session.access_token = "renewed"
+        session.expiry_time = clock.now + datetime.timedelta(seconds=3600)
+        return True
+
+    session.token_refresh = token_refresh
+    responses = []
+    threads = [
+        threading.Thread(
+            target=lambda: responses.append(
+                session.request.basic_request("GET", "albums/1")
+            )
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert refreshes == ["refresh"]
+    assert [response.status_code for response in responses] == [200] * 5
+    assert session.request_session.tokens[-5:] == ["Bearer renewed"] * 5
+    # ...and the timer is re-armed for the new token
+    assert FakeTimer.armed[0].cancelled
+    assert FakeTimer.armed[-1].interval == 3600 - session.tokens.margin
+
+
+def test_failed_refresh_returns_the_expired_response(clock):
+    session = login(clock)
+    clock.now += datetime.timedelta(seconds=3600)
+    session.access_token = "expired"
+    refreshes = []
+
+    def token_refresh(refresh_token):
+        refreshes.append(refresh_token)
+        raise AuthenticationError("Authentication failed")
+
+    session.token_refresh = token_refresh
+    callbacks = []
+    session.tokens.on_refresh.append(callbacks.append)
+
+    assert not session.tokens.ensure_fresh()
+    response = session.request.basic_request("GET", "albums/1")
+    # Tried up front and once more after the 401, but never retried in a loop
+    assert refreshes == ["refresh"] * 3
+    assert response.status_code == 401
+    assert session.request_session.tokens[-1] == "Bearer expired"
+    assert callbacks == []
+    assert len(FakeTimer.armed) == 1
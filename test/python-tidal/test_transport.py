@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from urllib3.util.retry import Retry
+
+import tidalapi
+from tidalapi import transport
+from tidalapi.transport import JitterRetry
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Fails the first `failures` requests to a path with `status`"""
+
+    protocol_version = "HTTP/1.1"
+    status = 503
+    failures = 2
+    hits = {}
+
+    def log_message(self, format, *args):
+        pass
+
+    def _answer(self):
+        hits = FlakyHandler.hits[self.path] = FlakyHandler.hits.get(self.path, 0) + 1
+        status = self.status if hits <= self.failures else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    do_GET = do_POST = _answer
+
+
+@pytest.fixture
+def api():
+    FlakyHandler.hits = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = "http://127.0.0.1:%d/" % server.server_address[1]
+    http = requests.Session()
+    http.mount(base, transport.make_adapter(tidalapi.Config(backoff_factor=0)))
+    yield http, base
+    server.shutdown()
+
+
+def test_config_sets_up_the_pooled_adapter():
+    config = tidalapi.Config(
+        pool_connections=2,
+        pool_maxsize=7,
+        max_retries=4,
+        backoff_factor=0.25,
+        retry_statuses=(503,),
+        retry_after_max=3,
+    )
+    session = tidalapi.Session(config)
+    http = session.request_session
+    adapter = http.get_adapter("https://api.tidal.com/v1/tracks")
+    assert http.get_adapter("https://resources.tidal.com/images/x.jpg") is adapter
+    assert http.get_adapter("https://auth.tidal.com/v1/oauth2/token") is not adapter
+    assert (adapter._pool_connections, adapter._pool_maxsize) == (2, 7)
+    retry = adapter.max_retries
+    assert isinstance(retry, JitterRetry)
+    assert (retry.total, retry.connect, retry.read, retry.status) == (4, 4, 4, 4)
+    assert retry.backoff_factor == 0.25
+    assert retry.status_forcelist == (503,)
+    assert retry.retry_after_max == 3
+
+
+def test_retry_statuses():
+    retry = transport.make_retry(tidalapi.Config())
+    for status in (429, 500, 502, 503, 504):
+        assert retry.is_retry("GET", status)
+    assert not retry.is_retry("GET", 404)
+    assert not retry.is_retry("POST", 503)
+
+
+def test_backoff_is_jittered_below_the_nominal_value():
+    retry = JitterRetry(total=10, backoff_factor=1, backoff_max=60)
+    for _ in range(4):
+        retry = retry.increment("GET", "/", error=ConnectionError())
+    nominal = Retry.get_backoff_time(retry)
+    assert nominal == 8
+    samples = [retry.get_backoff_time() for _ in range(200)]
+    assert all(0 <= sample <= nominal for sample in samples)
+    assert len(set(samples)) > 1
+    assert JitterRetry(total=10, backoff_factor=1).get_backoff_time() == 0
+
+
+def test_retry_after_is_capped():
+    retry = JitterRetry(total=3, retry_after_max=5)
+
+    def response(retry_after):
+        headers = {"Retry-After": retry_after} if retry_after else {}
+        return type("Response", (), {"headers": headers})()
+
+    assert retry.get_retry_after(response("2")) == 2
+    assert retry.get_retry_after(response("3600")) == 5
+    assert retry.get_retry_after(response(None)) is None
+    # The cap survives the copies urllib3 makes on every attempt
+    retry = retry.increment("GET", "/", error=ConnectionError())
+    assert retry.retry_after_max == 5
+
+
+def test_idempotent_requests_are_retried(api):
+    http, base = api
+    response = http.get(base + "tracks/1")
+    assert response.status_code == 200
+    assert FlakyHandler.hits["/tracks/1"] == 3
+
+
+def test_other_requests_are_sent_once(api):
+    http, base = api
+    response = http.post(base + "playlists/1/items")
+    assert response.status_code == 503
+    assert FlakyHandler.hits["/playlists/1/items"] == 1
+
+
+def test_last_response_is_returned_when_retries_run_out(api):
+    http, base = api
+    FlakyHandler.failures = 10
+    try:
+        response = http.get(base + "tracks/2")
+    finally:
+        FlakyHandler.failures = 2
+    assert response.status_code == 503
+    assert FlakyHandler.hits["/tracks/2"] == tidalapi.Config().max_retries + 1
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "qml"))
+
+from backend.typeahead import IncrementalSearch, SearchCache, narrow  # noqa: E402
+
+CATALOGUE = [
+    {"title": "Creep", "artist": "Radiohead", "album": "Pablo Honey"},
+    {"title": "Radio Ga Ga", "artist": "Queen", "album": "The Works"},
+    {"title": "Video Killed the Radio Star", "artist": "The Buggles", "album": "The Age of Plastic"},
+    {"title": "Karma Police", "artist": "Radiohead", "album": "OK Computer"},
+]
+
+
+class FakeApi:
+    """Search backend with network latency, counting the calls"""
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.calls = []
+
+    def search(self, query):
+        self.calls.append(query)
+        time.sleep(self.latency)
+        return narrow({"tracks": CATALOGUE}, query)
+
+
+class Screen:
+    def __init__(self):
+        self.shown = []
+        self.final = threading.Event()
+
+    def emit(self, query, results, final):
+        self.shown.append((query, [t["title"] for t in results["tracks"]], final))
+        if final:
+            self.final.set()
+
+
+def typing(engine, text, interval=0.06):
+    for end in range(1, len(text) + 1):
+        engine.type(text[:end])
+        time.sleep(interval)
+
+
+def test_debounce_collapses_keystrokes():
+    api, screen = FakeApi(), Screen()
+    engine = IncrementalSearch(api.search, screen.emit, delay=0.15)
+    typing(engine, "radiohead")
+    assert screen.final.wait(2)
+
+    print("'radiohead' typed key by key: %d API call(s) for 9 keystrokes" % len(api.calls))
+    assert api.calls == ["radiohead"]
+    assert screen.shown[-1] == ("radiohead", ["Creep", "Karma Police"], True)
+
+
+def test_cache_and_prefix_narrowing():
+    api, screen = FakeApi(), Screen()
+    engine = IncrementalSearch(api.search, screen.emit, delay=0.05)
+    engine.type("radio")
+    assert screen.final.wait(2)
+
+    # a longer query is narrowed locally right away, then confirmed
+    screen.final.clear()
+    start = time.perf_counter()
+    assert engine.type("radio q") == "prefix"
+    latency = time.perf_counter() - start
+    assert screen.shown[-1] == ("radio q", ["Radio Ga Ga"], False)
+    assert screen.final.wait(2)
+
+    # back to an earlier query: no network call at all
+    calls = len(api.calls)
+    assert engine.type("Radio") == "cache"
+    assert len(api.calls) == calls
+    assert screen.shown[-1][2] is True
+    print("narrowed keystroke answered in %.2f ms" % (latency * 1000))
+    assert latency < 0.01
+
+
+def test_stale_results_are_not_shown():
+    api, screen = FakeApi(latency=0.2), Screen()
+    engine = IncrementalSearch(api.search, screen.emit, delay=0.01)
+    engine.type("karma")
+    time.sleep(0.05)        # "karma" is in flight now
+    engine.type("creep")
+    assert screen.final.wait(2)
+    time.sleep(0.25)
+
+    assert [q for q, _, final in screen.shown if final] == ["creep"]
+    # the overtaken query still went into the cache
+    assert engine.cache.get("karma") is not None
+
+
+def test_cache_ttl_and_lru():
+    cache = SearchCache(max_entries=2, ttl=0.05)
+    cache.put("a", 1)
+    cache.put("ab", 2)
+    cache.put("abc", 3)
+    assert cache.get("a") is None
+    assert cache.prefix("abcd") == ("abc", 3)
+    time.sleep(0.06)
+    assert cache.get("abc") is None
+    assert cache.prefix("abcd") == (None, None)
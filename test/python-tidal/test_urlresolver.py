@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023- The Tidalapi Developers
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "qml"))
+
+from backend.urlresolver import UrlResolver, url_expiry  # noqa: E402
+
+
+class SlowApi:
+    """resolve() that takes `latency` seconds and counts its calls"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def resolve(self, track_id, quality):
+        with self.lock:
+            self.calls.append(str(track_id))
+        time.sleep(self.latency)
+        return "https://cdn/%s.m4a?Expires=%d" % (track_id, time.time() + 3600)
+
+
+def test_url_expiry():
+    assert url_expiry("https://cdn/1.m4a?Expires=2000000000", 600, now=1000) == 2000000000
+    assert url_expiry("https://cdn/1.m4a", 600, now=1000) == 1600
+    # an expiry in the past is no expiry
+    assert url_expiry("https://cdn/1.m4a?Expires=1000000000", 600, now=1500000000) == 1500000600
+
+
+def test_get_does_not_wait_for_queued_prefetches():
+    api = SlowApi(latency=0.2)
+    urls = UrlResolver(api.resolve, max_workers=2)
+    urls.prefetch(range(10))
+    start = time.monotonic()
+    assert urls.get(42).startswith("https://cdn/42.m4a")
+    assert time.monotonic() - start < 0.35
+    # a queued prefetch of the requested track is taken over, not repeated
+    assert urls.get(9).startswith("https://cdn/9.m4a")
+    urls._pool.shutdown(wait=True)
+    assert api.calls.count("9") == 1
+    assert urls.get(9) and urls.hits == 1
+
+
+def test_get_shares_a_running_prefetch():
+    api = SlowApi(latency=0.2)
+    urls = UrlResolver(api.resolve)
+    urls.prefetch([5])
+    time.sleep(0.05)
+    assert urls.get(5).startswith("https://cdn/5.m4a")
+    assert api.calls == ["5"]
+
+
+def test_failed_lookup_is_not_cached():
+    attempts = []
+
+    def resolve(track_id, quality):
+        attempts.append(track_id)
+        if len(attempts) == 1:
+            raise IOError("offline")
+        return "https://cdn/%s.m4a" % track_id
+
+    urls = UrlResolver(resolve)
+    with pytest.raises(IOError):
+        urls.get(1)
+    assert urls.get(1) == "https://cdn/1.m4a"